@@ -0,0 +1,122 @@
+"""
+느린 상류(LLM) 호출이 몰릴 때 WSGI 스레드 워커와 ASGI 이벤트 루프의 처리량 비교 (부하 테스트)
+
+    python -m benchmarks.bench_async_serving --requests 32 --workers 4 --latency 1.0
+
+fake LLM 제공자에 latency초 지연을 주고 POST /llm/api/summary-analysis/<id>/를 동시에 requests개 보냅니다.
+
+- wsgi: 워커 스레드 workers개 (gunicorn sync 워커/runserver와 같은 방식).
+  요청마다 LLM 응답을 기다리는 동안 워커를 잡고 있어 약 (requests / workers) * latency초가 걸림
+- asgi: comment_back.asgi의 application을 이벤트 루프 하나에서 실행 (uvicorn 워커 1개와 같은 방식).
+  기다리는 동안 다른 요청을 처리하므로 약 latency초 + DB 시간
+
+서버 없이 프로세스 안에서 실행합니다. (wsgi: django.test.Client, asgi: httpx.ASGITransport)
+sqlite 테스트 DB는 동시 쓰기에서 "database table is locked"(500)가 날 수 있으니 PostgreSQL에서 실행하세요.
+"""
+
+import argparse
+import asyncio
+import queue
+import statistics
+import threading
+import time
+from collections import Counter
+
+from benchmarks.utils import create_sample_comments, setup_django, test_database
+
+
+def print_run(name: str, elapsed: float, results: list[tuple[float, int]]) -> None:
+    latencies = sorted(latency * 1000 for latency, _ in results)
+    statuses = Counter(status for _, status in results)
+    p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+    print(
+        f"{name:<28} total {elapsed:7.2f}s  {len(results) / elapsed:7.1f} req/s  "
+        f"p50 {statistics.median(latencies):8.1f}ms  p95 {p95:8.1f}ms  "
+        f"status {dict(statuses)}"
+    )
+
+
+def run_wsgi(url: str, requests: int, workers: int) -> None:
+    from django.db import connections
+    from django.test import Client
+
+    jobs: queue.SimpleQueue = queue.SimpleQueue()
+    for _ in range(requests):
+        jobs.put(None)
+    results: list[tuple[float, int]] = []
+
+    def worker():
+        client = Client(raise_request_exception=False)
+        try:
+            while True:
+                try:
+                    jobs.get_nowait()
+                except queue.Empty:
+                    return
+                start = time.perf_counter()
+                response = client.post(url)
+                results.append((time.perf_counter() - start, response.status_code))
+        finally:
+            connections.close_all()
+
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print_run(f"wsgi ({workers} threads)", time.perf_counter() - start, results)
+
+
+def run_asgi(url: str, requests: int) -> None:
+    import httpx
+
+    from comment_back.asgi import application
+
+    async def post(client: httpx.AsyncClient) -> tuple[float, int]:
+        start = time.perf_counter()
+        response = await client.post(url)
+        return time.perf_counter() - start, response.status_code
+
+    async def run() -> list[tuple[float, int]]:
+        transport = httpx.ASGITransport(app=application)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://testserver", timeout=None
+        ) as client:
+            return await asyncio.gather(*(post(client) for _ in range(requests)))
+
+    start = time.perf_counter()
+    results = asyncio.run(run())
+    print_run("asgi (1 event loop)", time.perf_counter() - start, results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=32, help="동시 요청 수")
+    parser.add_argument("--workers", type=int, default=4, help="wsgi 워커 스레드 수")
+    parser.add_argument("--latency", type=float, default=1.0, help="fake LLM 지연(초)")
+    parser.add_argument("--rows", type=int, default=100, help="요약할 댓글 수")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+
+    settings.LLM_PROVIDER = "fake"
+    settings.LLM_RECORD_MODE = "off"
+    settings.LLM_FAKE_LATENCY = args.latency
+    settings.ALLOWED_HOSTS = ["*"]
+    settings.DEBUG = False  # 디버그 툴바 없이 운영 설정으로 측정
+
+    with test_database():
+        episode = create_sample_comments(args.rows)
+        url = f"/llm/api/summary-analysis/{episode.id}/"
+        print(
+            f"{args.requests} concurrent requests, fake LLM latency {args.latency}s, "
+            f"{args.rows} comments"
+        )
+        run_wsgi(url, args.requests, args.workers)
+        run_asgi(url, args.requests)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+DB 연결 방식별 CommentListView 처리량 비교 (PostgreSQL 필요)
+
+    DATABASE_HOST=localhost python -m benchmarks.bench_db_pool --requests 2000 --concurrency 8
+
+GET /crawler/episode/<id>/comment?page_size=20을 concurrency개씩 동시에 보내며
+settings.DATABASES의 연결 설정(comment_back/settings.py의 DB_POOL, DB_CONN_MAX_AGE)을 바꿔 측정합니다.
+
+- conn_max_age=0: 요청마다 새로 연결 (기존 기본값)
+- conn_max_age=60: 스레드별 연결 유지. WSGI 워커 스레드에서는 재사용되지만
+  ASGI에서는 요청마다 실행 스레드가 달라 재사용되지 않음
+- pool: psycopg 커넥션 풀 (psycopg[pool] 필요)
+
+wsgi는 워커 스레드 concurrency개가 WSGIHandler를 직접 호출하고 (gunicorn gthread와 같은 방식),
+asgi는 comment_back.asgi의 application을 httpx.ASGITransport로 호출합니다.
+connects는 측정 중 PostgreSQL에 새로 연결한 횟수입니다.
+"""
+
+import argparse
+import asyncio
+import gc
+import io
+import queue
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator
+from unittest.mock import patch
+from wsgiref.util import setup_testing_defaults
+
+from benchmarks.utils import create_sample_comments, setup_django, test_database
+
+
+@contextmanager
+def count_connects() -> Iterator[list]:
+    """psycopg.connect(Django)와 Connection.connect(psycopg_pool) 호출 횟수를 셈"""
+    import psycopg
+
+    connects = []
+    original = psycopg.Connection.connect
+
+    def connect(*args, **kwargs):
+        connects.append(1)
+        return original(*args, **kwargs)
+
+    with patch.object(psycopg, "connect", connect), patch.object(
+        psycopg.Connection, "connect", connect
+    ):
+        yield connects
+
+
+def configure(conn_max_age: int, pool: dict | None) -> None:
+    """이후 새로 만드는 연결부터 적용되도록 기존 연결과 풀을 닫고 설정을 바꿈"""
+    from django.db import connections
+
+    connections.close_all()
+    # ASGI에서 끝난 요청 스레드에 남은 연결(conn_max_age=60)을 정리
+    gc.collect()
+    connection = connections["default"]
+    connection.close_pool()
+    # 모든 스레드의 DatabaseWrapper가 같은 settings_dict를 공유함
+    connection.settings_dict["CONN_MAX_AGE"] = conn_max_age
+    connection.settings_dict["OPTIONS"].pop("pool", None)
+    if pool:
+        connection.settings_dict["OPTIONS"]["pool"] = pool
+
+
+def run_wsgi(path: str, requests: int, concurrency: int) -> Counter:
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.db import connections
+
+    handler = WSGIHandler()
+    jobs: queue.SimpleQueue = queue.SimpleQueue()
+    for _ in range(requests):
+        jobs.put(None)
+    statuses: list[int] = []
+
+    def start_response(status, headers):
+        statuses.append(int(status.split()[0]))
+
+    def worker():
+        try:
+            while True:
+                try:
+                    jobs.get_nowait()
+                except queue.Empty:
+                    return
+                environ = {
+                    "PATH_INFO": path,
+                    "QUERY_STRING": "page_size=20",
+                    "wsgi.input": io.BytesIO(),
+                }
+                setup_testing_defaults(environ)
+                response = handler(environ, start_response)
+                b"".join(response)
+                # WSGI 서버처럼 응답을 닫아야 request_finished(연결 정리)가 실행됨
+                response.close()
+        finally:
+            connections.close_all()
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return Counter(statuses)
+
+
+def run_asgi(path: str, requests: int, concurrency: int) -> Counter:
+    import httpx
+
+    from comment_back.asgi import application
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def get(client: httpx.AsyncClient) -> int:
+        async with semaphore:
+            response = await client.get(path, params={"page_size": 20})
+            return response.status_code
+
+    async def run() -> list[int]:
+        transport = httpx.ASGITransport(app=application)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://testserver", timeout=None
+        ) as client:
+            return await asyncio.gather(*(get(client) for _ in range(requests)))
+
+    return Counter(asyncio.run(run()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--pool-size", type=int, default=10, help="풀 max_size")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.db import connection
+
+    if connection.vendor != "postgresql":
+        sys.exit("PostgreSQL DB가 필요합니다. (DATABASE_HOST 등 환경 변수 확인)")
+
+    settings.ALLOWED_HOSTS = ["*"]
+    settings.DEBUG = False  # 디버그 툴바 없이 운영 설정으로 측정
+
+    modes = {
+        "conn_max_age=0": (0, None),
+        "conn_max_age=60": (60, None),
+        "pool": (0, {"min_size": 2, "max_size": args.pool_size, "timeout": 10}),
+    }
+    servers = {"wsgi": run_wsgi, "asgi": run_asgi}
+
+    with test_database():
+        episode = create_sample_comments(args.rows)
+        path = f"/crawler/episode/{episode.id}/comment"
+        print(
+            f"GET {path}?page_size=20 x {args.requests}, "
+            f"concurrency {args.concurrency}"
+        )
+        try:
+            for server, run in servers.items():
+                for name, (conn_max_age, pool) in modes.items():
+                    configure(conn_max_age, pool)
+                    with count_connects() as connects:
+                        start = time.perf_counter()
+                        statuses = run(path, args.requests, args.concurrency)
+                        elapsed = time.perf_counter() - start
+                    print(
+                        f"{f'{server} {name}':<24} {args.requests / elapsed:8.1f} req/s  "
+                        f"connects {len(connects):5d}  status {dict(statuses)}"
+                    )
+        finally:
+            # 테스트 DB를 지우기 전에 풀의 연결을 모두 닫음
+            configure(0, None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+댓글 감정 분석 파이프라인 벤치마크 (네트워크 없이 fake LLM 제공자 사용)
+
+    python -m benchmarks.bench_emotion_pipeline --rows 2000 --latency 0.5
+
+사전 필터, 로컬 모델, DB 갱신을 포함한 PATCH /llm/api/emotion-analysis/<id>/ 한 번의 시간을 잽니다.
+"""
+
+import argparse
+import statistics
+import time
+
+from benchmarks.utils import create_sample_comments, setup_django, test_database
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0, help="fake LLM 지연(초)")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from rest_framework.test import APIClient
+
+    from crawler.models import Comment
+
+    settings.LLM_PROVIDER = "fake"
+    settings.LLM_RECORD_MODE = "off"
+    settings.LLM_FAKE_LATENCY = args.latency
+    settings.ALLOWED_HOSTS = ["*"]
+
+    with test_database():
+        episode = create_sample_comments(args.rows)
+        client = APIClient()
+        url = f"/llm/api/emotion-analysis/{episode.id}/"
+
+        timings = []
+        for _ in range(args.repeat):
+            Comment.objects.update(
+                is_ai_processed=False, is_spam=None, ai_emotion_score=None
+            )
+            start = time.perf_counter()
+            response = client.patch(url)
+            timings.append((time.perf_counter() - start) * 1000)
+        print(f"{args.rows} comments, fake latency {args.latency}s")
+        print(f"prefilter: {response.json()['prefilter']}")
+        print(
+            f"emotion analysis PATCH  min {min(timings):9.2f}ms  "
+            f"median {statistics.median(timings):9.2f}ms  max {max(timings):9.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+댓글 목록 응답 JSON 렌더러 마이크로 벤치마크
+
+    python -m benchmarks.bench_json_renderer --rows 10000
+"""
+
+import argparse
+
+from benchmarks.utils import (
+    create_sample_comments,
+    measure,
+    print_result,
+    setup_django,
+    test_database,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    from rest_framework.renderers import JSONRenderer
+
+    from crawler.models import Comment
+    from crawler.serializers import CommentSerializer
+    from utils import renderers
+    from utils.renderers import FastJSONRenderer
+
+    with test_database():
+        create_sample_comments(args.rows)
+        data = {
+            "next": "http://localhost/crawler/episode/1/comment?page=2",
+            "previous": None,
+            "results": CommentSerializer(
+                Comment.objects.order_by("id"), many=True
+            ).data,
+        }
+
+    drf_renderer = JSONRenderer()
+    fast_renderer = FastJSONRenderer()
+    backend = "orjson" if renderers.orjson else "json (orjson 미설치)"
+
+    size = len(fast_renderer.render(data))
+    print(
+        f"{args.rows} comments, {size / 1024:.0f}KB, FastJSONRenderer backend: {backend}"
+    )
+    print_result(
+        "JSONRenderer", measure(lambda: drf_renderer.render(data), args.repeat)
+    )
+    print_result(
+        "FastJSONRenderer", measure(lambda: fast_renderer.render(data), args.repeat)
+    )
+
+
+if __name__ == "__main__":
+    main()
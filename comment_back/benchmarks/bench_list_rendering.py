@@ -0,0 +1,65 @@
+"""
+fields= 목록 조회의 Serializer 경로와 values_list 경로 비교
+
+    python -m benchmarks.bench_list_rendering --rows 10000
+"""
+
+import argparse
+
+from benchmarks.utils import (
+    create_sample_comments,
+    measure,
+    print_result,
+    setup_django,
+    test_database,
+)
+
+FIELD_SETS = {
+    "id,content": ["id", "content"],
+    "id,created_at,emoticon,like_count": ["id", "created_at", "emoticon", "like_count"],
+    "all fields": None,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    from rest_framework.renderers import JSONRenderer
+
+    from crawler.mixins import get_values_renderer
+    from crawler.models import Comment
+    from crawler.serializers import CommentSerializer
+
+    with test_database():
+        create_sample_comments(args.rows)
+        queryset = Comment.objects.order_by("id")
+        json_renderer = JSONRenderer()
+
+        for label, fields in FIELD_SETS.items():
+            fields = fields or [field.name for field in Comment._meta.fields]
+
+            def serializer_path():
+                data = CommentSerializer(
+                    queryset.only(*fields), many=True, fields=fields
+                ).data
+                return json_renderer.render(data)
+
+            def values_path():
+                renderer = get_values_renderer(CommentSerializer, tuple(fields))
+                data = renderer.render(queryset.values_list(*renderer.columns))
+                return json_renderer.render(data)
+
+            if serializer_path() != values_path():
+                raise SystemExit(f"[{label}] 출력이 일치하지 않습니다.")
+
+            print(f"\n{args.rows} rows, fields={label} (출력 일치 확인)")
+            print_result("serializer", measure(serializer_path, args.repeat))
+            print_result("values_list", measure(values_path, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+메트릭 기록 비용 마이크로 벤치마크
+
+    python -m benchmarks.bench_metrics --ops 200000
+
+요청/크롤링/LLM 경로에서 호출하는 Counter.inc, Histogram.observe 한 번의 비용(ns)과
+/metrics 응답 생성 시간을 측정합니다. DB는 필요 없습니다.
+"""
+
+import argparse
+import threading
+import time
+
+from benchmarks.utils import measure, print_result, setup_django
+
+
+def per_op_ns(func, ops: int) -> float:
+    start = time.perf_counter_ns()
+    for _ in range(ops):
+        func()
+    return (time.perf_counter_ns() - start) / ops
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ops", type=int, default=200000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--series", type=int, default=500, help="/metrics 라벨 조합 수")
+    args = parser.parse_args()
+
+    setup_django()
+    from utils.metrics import Counter, Gauge, Histogram, render_text
+
+    counter = Counter("bench_total", "벤치마크", ["view", "method", "status"])
+    histogram = Histogram("bench_seconds", "벤치마크", ["view", "method"])
+    gauge = Gauge("bench_depth", "벤치마크", ["queue"])
+    unlabeled = Counter("bench_unlabeled_total", "벤치마크")
+
+    def baseline():
+        pass
+
+    cases = {
+        "(빈 함수 호출)": baseline,
+        "Counter.inc (라벨 없음)": lambda: unlabeled.inc(),
+        "Counter.inc (라벨 3개)": lambda: counter.inc(
+            view="comment", method="GET", status=200
+        ),
+        "Histogram.observe (라벨 2개)": lambda: histogram.observe(
+            0.0123, view="comment", method="GET"
+        ),
+        "Gauge.inc/dec": lambda: (gauge.inc(queue="llm"), gauge.dec(queue="llm")),
+    }
+    print(f"{args.ops} ops, 1 thread")
+    for name, func in cases.items():
+        print(f"{name:<40} {per_op_ns(func, args.ops):8.0f} ns/op")
+
+    # 여러 스레드가 같은 메트릭에 동시에 기록할 때 (락 경합)
+    def worker():
+        for _ in range(args.ops // args.threads):
+            counter.inc(view="comment", method="GET", status=200)
+
+    threads = [threading.Thread(target=worker) for _ in range(args.threads)]
+    start = time.perf_counter_ns()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter_ns() - start
+    print(
+        f"{f'Counter.inc ({args.threads} threads)':<40} {elapsed / args.ops:8.0f} ns/op"
+    )
+
+    for i in range(args.series):
+        histogram.observe(i / 1000, view=f"view-{i}", method="GET")
+    size = len(render_text([counter, histogram, gauge]))
+    print(f"\n/metrics: 라벨 조합 {args.series}개, {size / 1024:.0f}KB")
+    print_result(
+        "render_text", measure(lambda: render_text([counter, histogram, gauge]), 20)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+벤치마크 스크립트 공통 유틸
+
+    python -m benchmarks.<모듈명> [옵션]
+
+DJANGO_SETTINGS_MODULE이 없으면 comment_back.settings를 사용합니다.
+DB가 필요한 벤치마크는 테스트 DB를 만들어 사용하고 끝나면 삭제합니다.
+"""
+
+import os
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterator
+
+import django
+
+
+def setup_django() -> None:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "comment_back.settings")
+    django.setup()
+
+
+@contextmanager
+def test_database() -> Iterator[None]:
+    from django.db import connection
+
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def measure(func: Callable[[], object], repeat: int = 5) -> dict[str, float]:
+    """func를 repeat번 실행하고 ms 단위 통계를 반환"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": min(timings),
+        "median_ms": statistics.median(timings),
+        "max_ms": max(timings),
+    }
+
+
+def print_result(name: str, result: dict[str, float]) -> None:
+    print(
+        f"{name:<40} min {result['min_ms']:9.2f}ms  "
+        f"median {result['median_ms']:9.2f}ms  max {result['max_ms']:9.2f}ms"
+    )
+
+
+def create_sample_comments(count: int):
+    """실제 크롤링 데이터와 비슷한 형태의 시리즈/에피소드/댓글을 생성"""
+    from crawler.models import Comment, Episode, Series
+    from user.models import CustomUser
+
+    user = CustomUser.objects.create(username="bench", name="bench")
+    series = Series.objects.create(
+        id=1, title="벤치마크 시리즈", image_src="https://example.com/s.png", user=user
+    )
+    episode = Episode.objects.create(
+        id=1,
+        name="1화",
+        image_src="https://example.com/e.png",
+        category="웹툰",
+        subcategory="판타지",
+        series=series,
+        user=user,
+    )
+    base_time = datetime(2025, 7, 11, 15, 47, 38, tzinfo=timezone.utc)
+    comments = [
+        Comment(
+            id=i + 1,
+            content=f"이번 화 진짜 미쳤다 ㅋㅋㅋ 다음 화가 너무 기대돼요 {i}",
+            created_at=base_time + timedelta(seconds=i, microseconds=i),
+            is_best=i % 20 == 0,
+            like_count=i % 300,
+            emoticon=(
+                {
+                    "itemSubType": "EMOTICON",
+                    "resourceId": "4412207",
+                    "itemId": i % 24,
+                    "itemVer": 1,
+                }
+                if i % 4 == 0
+                else None
+            ),
+            user_name=f"독자{i % 500}",
+            user_thumbnail_url="https://dn-img-page.kakao.com/download/resource?kid=abc",
+            user_uid=100000 + i % 500,
+            ai_emotion_score=(i * 37) % 101,
+            ai_reason="긍정적인 반응",
+            is_spam=i % 50 == 0,
+            is_ai_processed=True,
+            ai_processed_at=base_time + timedelta(hours=1),
+            series=series,
+            episode=episode,
+        )
+        for i in range(count)
+    ]
+    Comment.objects.bulk_create(comments, batch_size=2000)
+    return episode
@@ -3,14 +3,27 @@ ASGI config for comment_back project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+운영 서버는 uvicorn으로 실행합니다. (comment_back 디렉터리에서)
+
+    uvicorn comment_back.asgi:application --host 0.0.0.0 --port 8000 --workers 2
+
+LLM/크롤링 뷰(utils.async_views.AsyncAPIView)는 상류 응답을 기다리는 동안 워커를 잡지 않습니다.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 """
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'comment_back.settings')
 
 application = get_asgi_application()
+
+# runserver처럼 DEBUG일 때는 정적 파일(Swagger UI, admin)도 서빙
+if settings.DEBUG:
+    from django.contrib.staticfiles.handlers import ASGIStaticFilesHandler
+
+    application = ASGIStaticFilesHandler(application)
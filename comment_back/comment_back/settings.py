@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 from pathlib import Path
 from datetime import timedelta
 from dotenv import load_dotenv
+import os
 
 load_dotenv()
 
@@ -55,6 +56,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",  # GIN/OpClass 인덱스(pg_trgm) 식 처리
     "rest_framework",
     "drf_yasg",  # swgger doc
     "drf_spectacular",  # drf api doc
@@ -67,6 +69,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "utils.metrics.RequestMetricsMiddleware",  # URL별 요청 수/응답 시간 메트릭
+    "utils.profiling.QueryProfilingMiddleware",  # 요청별 SQL/응답 프로파일링
     "corsheaders.middleware.CorsMiddleware",  # CORS 미들웨어 추가
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -101,18 +105,94 @@ WSGI_APPLICATION = "comment_back.wsgi.application"
 
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
+# 연결 재사용: https://docs.djangoproject.com/en/5.1/ref/databases/#connection-pool
+# DB_POOL=1이면 psycopg 커넥션 풀에서 연결을 빌려 씀. ASGI(uvicorn)에서는 요청마다 실행 스레드가 달라
+# 스레드별 지속 연결(CONN_MAX_AGE)이 재사용되지 않으므로 풀을 사용
+# 풀은 워커 프로세스마다 따로 생기므로 WEB_CONCURRENCY * DB_POOL_MAX_SIZE가 PostgreSQL max_connections보다 작아야 함
+# DB_POOL=0이면 DB_CONN_MAX_AGE초 동안 연결을 유지 (0: 요청마다 새로 연결, WSGI용)
+
+DB_POOL = os.getenv("DB_POOL", "0") == "1"
 
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
-        "NAME": "postgres",  # docker-compose.yml의 POSTGRES_DB 값
-        "USER": "postgres",  # docker-compose.yml의 POSTGRES_USER
-        "PASSWORD": "postgres",  # docker-compose.yml의 POSTGRES_PASSWORD
-        "HOST": "db",  # docker-compose의 서비스명 (== 컨테이너 이름)
-        "PORT": "5432",  # PostgreSQL 기본 포트
+        # 기본값은 docker-compose.yml의 POSTGRES_DB/USER/PASSWORD 값과 db 서비스명
+        "NAME": os.getenv("DATABASE_NAME", "postgres"),
+        "USER": os.getenv("DATABASE_USER", "postgres"),
+        "PASSWORD": os.getenv("DATABASE_PASSWORD", "postgres"),
+        "HOST": os.getenv("DATABASE_HOST", "db"),
+        "PORT": os.getenv("DATABASE_PORT", "5432"),
+        # 풀을 쓸 때는 0이어야 함 (연결 반환은 풀이 관리)
+        "CONN_MAX_AGE": 0 if DB_POOL else int(os.getenv("DB_CONN_MAX_AGE", "0")),
+        # 유지하던 연결(풀 사용 시 풀에서 빌린 연결)을 쓰기 전에 확인 (DB 재시작 후 끊어진 연결 방지)
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {},
+    }
+}
+
+if DB_POOL:
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+        "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+        # 풀이 비었을 때 연결을 기다리는 최대 시간(초)
+        "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+    }
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# 기본은 프로세스 로컬 메모리, 여러 워커가 공유해야 하면 CACHE_BACKEND로 교체
+# (docker-compose는 django.core.cache.backends.redis.RedisCache + redis 서비스)
+# 조회 응답/타임라인 캐시는 세대 카운터로 무효화하므로, 워커가 여러 개인데 프로세스 로컬 캐시이면 사용하지 않음
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", "comment-back"),
     }
 }
 
+# 크롤러 메타데이터 캐시 TTL(초)
+METADATA_CACHE_TTL = {
+    "series_info": 60 * 60,
+    "episode_count": 60 * 5,
+    "series_metadata": 60 * 60 * 24,
+    "missing": 60 * 10,  # 존재하지 않는 시리즈
+}
+
+# 시리즈 감정 타임라인 캐시 TTL(초). 댓글이 바뀌면 세대 카운터로 즉시 무효화됨
+# (워커가 여러 개인데 프로세스 로컬 캐시이면 캐시하지 않음)
+TIMELINE_CACHE_TTL = 60 * 60 * 24
+
+# 워커 프로세스 수 (uvicorn --workers의 기본값과 같은 환경 변수)
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+# 시리즈/에피소드/댓글 조회 응답 캐시 TTL(초) (crawler/response_cache.py)
+# 크롤링/분석으로 바뀐 데이터는 세대 카운터로 즉시 무효화되고, TTL은 그 외 경로(admin 등)의 변경에만 적용됨
+RESPONSE_CACHE_TTL = 60 * 10
+
+# 시리즈 전체 댓글 크롤링 작업 (crawler/jobs.py)
+# 작업 하나에서 동시에 크롤링할 에피소드 수 (카카오페이지 요청 제한에 맞춰 조정)
+SERIES_CRAWL_CONCURRENCY = int(os.getenv("SERIES_CRAWL_CONCURRENCY", "4"))
+# 프로세스마다 동시에 실행할 작업 수
+SERIES_CRAWL_WORKERS = int(os.getenv("SERIES_CRAWL_WORKERS", "2"))
+# 이 시간(초) 동안 진행이 없는 작업은 멈춘 것으로 보고 새 작업을 받음
+SERIES_CRAWL_STALE_AFTER = int(os.getenv("SERIES_CRAWL_STALE_AFTER", "600"))
+
+# 분석용 댓글 스냅샷(Parquet) 저장 위치
+COMMENT_SNAPSHOT_DIR = Path(
+    os.getenv("COMMENT_SNAPSHOT_DIR", BASE_DIR / "snapshots" / "comments")
+)
+
+# 로컬 감정 모델(1차 채점기) 파일. 파일이 없으면 모든 댓글을 LLM으로 분석
+LOCAL_SCORER_PATH = Path(
+    os.getenv("LOCAL_SCORER_PATH", BASE_DIR / "models" / "local_scorer.npz")
+)
+# 이 확신도 이상인 댓글만 로컬 모델 점수를 쓰고, 나머지는 LLM으로 보냄
+LOCAL_SCORER_MIN_CONFIDENCE = float(os.getenv("LOCAL_SCORER_MIN_CONFIDENCE", "0.8"))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -193,6 +273,48 @@ SWAGGER_SETTINGS = {
 
 INFER_SERVER_URL = "http://host.docker.internal:8001/infer"
 
+# LLM 제공자 (services/llm_provider.py)
+# gemini: Google Gemini, fake: 네트워크 없이 결정적인 응답을 만드는 로컬 제공자 (테스트/벤치마크용)
+LLM_PROVIDER = os.getenv("LLM_PROVIDER", "gemini")
+GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+LLM_FAKE_LATENCY = float(os.getenv("LLM_FAKE_LATENCY", "0"))  # 초
+LLM_FAKE_FAILURE_RATE = float(os.getenv("LLM_FAKE_FAILURE_RATE", "0"))
+# off: 사용 안 함, record: 응답을 LLM_RECORD_DIR에 녹화, replay: 녹화된 응답만 사용
+LLM_RECORD_MODE = os.getenv("LLM_RECORD_MODE", "off")
+LLM_RECORD_DIR = Path(os.getenv("LLM_RECORD_DIR", BASE_DIR / "llm_recordings"))
+# LLM 호출 안정화 (services/llm_resilience.py)
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "30"))  # 시도 한 번의 제한 시간(초)
+LLM_MAX_ATTEMPTS = int(
+    os.getenv("LLM_MAX_ATTEMPTS", "3")
+)  # 재시도를 포함한 최대 시도 횟수
+LLM_BACKOFF_BASE = float(os.getenv("LLM_BACKOFF_BASE", "0.5"))  # 초
+LLM_BACKOFF_MAX = float(os.getenv("LLM_BACKOFF_MAX", "8"))  # 초
+# 첫 요청이 이 시간(초) 안에 끝나지 않으면 같은 요청을 한 번 더 보냄. 비우면 헤지 요청 안 함
+LLM_HEDGE_AFTER = (
+    float(os.environ["LLM_HEDGE_AFTER"]) if os.getenv("LLM_HEDGE_AFTER") else None
+)
+# 연속 실패가 이 횟수에 도달하면 LLM_CIRCUIT_RESET_TIMEOUT초 동안 호출하지 않음
+LLM_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("LLM_CIRCUIT_FAILURE_THRESHOLD", "5"))
+LLM_CIRCUIT_RESET_TIMEOUT = float(os.getenv("LLM_CIRCUIT_RESET_TIMEOUT", "30"))
+# 모델별 100만 토큰당 가격(USD): (입력, 출력). LLM 호출 기록의 추정 비용 계산에 사용
+LLM_TOKEN_PRICES = {
+    "gemini-2.5-flash-lite": (0.10, 0.40),
+}
+
+# 요청별 SQL/응답 프로파일링 (utils/profiling.py). 기본으로 꺼져 있고 필요할 때 환경 변수로 켬
+QUERY_PROFILING = os.getenv("QUERY_PROFILING", "0") == "1"
+# Server-Timing 헤더는 내부 구간 시간을 클라이언트에 노출하므로 따로 켬
+QUERY_PROFILE_SERVER_TIMING = os.getenv("QUERY_PROFILE_SERVER_TIMING", "0") == "1"
+# 같은 SQL이 이 횟수 이상 실행되면 N+1 의심으로 로그
+QUERY_PROFILE_DUPLICATE_THRESHOLD = int(
+    os.getenv("QUERY_PROFILE_DUPLICATE_THRESHOLD", "5")
+)
+QUERY_PROFILE_SLOW_MS = float(os.getenv("QUERY_PROFILE_SLOW_MS", "500"))
+# 느리지 않은 요청 중 로그로 남길 비율
+QUERY_PROFILE_SAMPLE_RATE = float(os.getenv("QUERY_PROFILE_SAMPLE_RATE", "0.01"))
+# True면 뷰의 query_budget을 넘길 때 예외 발생 (테스트에서 사용, conftest.py)
+QUERY_BUDGET_STRICT = os.getenv("QUERY_BUDGET_STRICT", "0") == "1"
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -210,10 +332,17 @@ LOGGING = {
         },
     },
     "loggers": {
+        # DEBUG=True일 때 실행한 SQL을 하나씩 출력
         "django.db.backends": {
             "handlers": ["console"],
             "level": "DEBUG",
             "propagate": False,
         },
+        # 요청별 프로파일 (QueryProfilingMiddleware, QUERY_PROFILING=1)
+        "utils.profiling": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": False,
+        },
     },
 }
@@ -24,6 +24,7 @@ from django.urls import path, include
 from rest_framework_simplejwt.views import TokenRefreshView
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from user.views import CustomTokenObtainPairView
+from utils.metrics import metrics_view
 from django.conf import settings
 
 schema_view = get_schema_view(
@@ -46,6 +47,7 @@ urlpatterns = [
     path("user/", include("user.urls")),
     path("crawler/", include("crawler.urls")),
     path("llm/", include("llm.urls")),
+    path("metrics", metrics_view, name="metrics"),  # Prometheus 스크레이프
     path(
         "docs/",
         schema_view.with_ui("swagger", cache_timeout=0),
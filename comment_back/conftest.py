@@ -1,8 +1,94 @@
 import os
 import django
+import pytest
+from datetime import datetime, timedelta, timezone
 from django.conf import settings
 
+SERIES_ID = 59071959
+EPISODE_ID = 59114404
+
 
 def pytest_configure():
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", "comment_back.settings")
     django.setup()
+    # 뷰의 query_budget을 넘기면 테스트 실패 (프로파일링이 켜져 있어야 쿼리 수를 셈)
+    settings.QUERY_PROFILING = True
+    settings.QUERY_BUDGET_STRICT = True
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """조회 응답 캐시/세대 카운터가 다른 테스트의 같은 ID 데이터에 남지 않도록 비움"""
+    from django.core.cache import cache
+
+    cache.clear()
+
+
+@pytest.fixture
+def user(db):
+    from user.models import CustomUser
+
+    return CustomUser.objects.create(username="tester", name="tester")
+
+
+@pytest.fixture
+def series(user):
+    from crawler.models import Series
+
+    return Series.objects.create(
+        id=SERIES_ID,
+        title="테스트 시리즈",
+        image_src="https://example.com/s.png",
+        user=user,
+    )
+
+
+@pytest.fixture
+def episode(series, user):
+    from crawler.models import Episode
+
+    return Episode.objects.create(
+        id=EPISODE_ID,
+        name="1화",
+        image_src="https://example.com/e.png",
+        category="웹툰",
+        subcategory="판타지",
+        series=series,
+        user=user,
+    )
+
+
+@pytest.fixture
+def make_comments(episode):
+    """에피소드에 count개의 댓글을 만드는 팩토리. overrides로 필드 값을 덮어씀"""
+    from crawler.models import Comment
+
+    def factory(count: int, start_id: int = 1, target_episode=None, **overrides):
+        target_episode = target_episode or episode
+        base_time = datetime(2025, 7, 11, 15, 47, 38, 123456, tzinfo=timezone.utc)
+        comments = []
+        for i in range(count):
+            fields = dict(
+                id=start_id + i,
+                content=f"재밌어요 {i} 😀",
+                created_at=base_time + timedelta(minutes=i),
+                is_best=i % 10 == 0,
+                like_count=i % 7,
+                emoticon=(
+                    {"itemSubType": "EMOTICON", "resourceId": i} if i % 3 == 0 else None
+                ),
+                user_name=f"독자{i % 50}",
+                user_thumbnail_url="https://example.com/u.png",
+                user_uid=1000 + i % 50,
+                ai_emotion_score=(i * 13) % 101 if i % 2 == 0 else None,
+                is_spam=(i % 11 == 0) if i % 2 == 0 else None,
+                is_ai_processed=i % 2 == 0,
+                ai_processed_at=base_time + timedelta(hours=1) if i % 2 == 0 else None,
+                series=target_episode.series,
+                episode=target_episode,
+            )
+            fields.update(overrides)
+            comments.append(Comment(**fields))
+        return Comment.objects.bulk_create(comments)
+
+    return factory
@@ -0,0 +1,173 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+from gql.transport.exceptions import TransportQueryError
+
+from .crawler import NoSeriesError, get_episode_count_by_series, get_series_info
+from .metadata import get_series_metadata
+
+T = TypeVar("T")
+
+CACHE_KEY_PREFIX = "crawler:meta"
+LOCK_TIMEOUT = 30  # 상류 요청 중임을 다른 프로세스에 알리는 락의 최대 유지 시간(초)
+LOCK_POLL_INTERVAL = 0.1
+
+_FOUND = "found"
+_MISSING = "missing"
+
+# 같은 프로세스 안의 동시 요청은 키 별 락으로 한 번만 상류에 보냄
+# (키 -> [락, 락을 쓰는 요청 수]) 다른 키의 요청은 느린 상류 요청을 기다리지 않음
+_local_locks: dict[str, list] = {}
+_local_locks_guard = threading.Lock()
+
+
+# GraphQL 오류의 extensions에서 '존재하지 않음'을 나타내는 값
+NOT_FOUND_CODES = {"NOT_FOUND"}
+
+
+def get_ttl(kind: str) -> int:
+    """settings.METADATA_CACHE_TTL에 지정된 kind별 TTL"""
+    return settings.METADATA_CACHE_TTL[kind]
+
+
+def make_key(kind: str, object_id: Any) -> str:
+    return f"{CACHE_KEY_PREFIX}:{kind}:{object_id}"
+
+
+def _unwrap(entry: tuple[str, Any]) -> Any:
+    state, value = entry
+    if state == _MISSING:
+        raise NoSeriesError(value)
+    return value
+
+
+@contextmanager
+def _key_lock(key: str) -> Iterator[None]:
+    """키 별 프로세스 락. 락을 쓰는 요청이 없어지면 지움"""
+    with _local_locks_guard:
+        entry = _local_locks.setdefault(key, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _local_locks_guard:
+            entry[1] -= 1
+            if not entry[1]:
+                del _local_locks[key]
+
+
+def _wait_for_other_worker(key: str) -> tuple[str, Any] | None:
+    """다른 프로세스가 같은 키를 채우는 중이면 락이 풀릴 때까지 기다림"""
+    deadline = time.monotonic() + LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        entry = cache.get(key)
+        if entry is not None:
+            return entry
+        if cache.get(f"{key}:lock") is None:
+            return None
+        time.sleep(LOCK_POLL_INTERVAL)
+    return None
+
+
+def get_or_fetch(
+    kind: str,
+    object_id: Any,
+    fetch: Callable[[], T],
+    negative_exceptions: tuple[type[Exception], ...] = (),
+) -> T:
+    """
+    캐시에 값이 있으면 반환하고, 없으면 fetch로 가져와 kind별 TTL로 저장합니다.
+
+    negative_exceptions에 해당하는 예외는 '존재하지 않음'으로 캐시되어
+    TTL 동안 상류 요청 없이 NoSeriesError를 발생시킵니다.
+    동시에 같은 키를 요청하면 한 요청만 상류로 보내고 나머지는 그 결과를 기다립니다.
+    """
+    key = make_key(kind, object_id)
+    entry = cache.get(key)
+    if entry is not None:
+        return _unwrap(entry)
+
+    with _key_lock(key):
+        entry = cache.get(key)
+        if entry is not None:
+            return _unwrap(entry)
+
+        lock_key = f"{key}:lock"
+        has_lock = cache.add(lock_key, 1, LOCK_TIMEOUT)
+        if not has_lock:
+            entry = _wait_for_other_worker(key)
+            if entry is not None:
+                return _unwrap(entry)
+
+        try:
+            value = fetch()
+        except negative_exceptions as e:
+            cache.set(key, (_MISSING, str(e)), get_ttl("missing"))
+            raise NoSeriesError(str(e)) from e
+        else:
+            cache.set(key, (_FOUND, value), get_ttl(kind))
+        finally:
+            if has_lock:
+                cache.delete(lock_key)
+
+        return value
+
+
+def invalidate(kind: str, object_id: Any) -> None:
+    cache.delete(make_key(kind, object_id))
+
+
+def is_not_found_error(error: TransportQueryError) -> bool:
+    """
+    GraphQL 오류가 모두 '존재하지 않음'인지 (extensions의 classification/code/errorType이 NOT_FOUND)
+    요청 제한, 상류 장애 등 다른 오류는 잠시 후 성공할 수 있으므로 negative cache하지 않습니다.
+    """
+    errors = error.errors or []
+    return bool(errors) and all(
+        isinstance(item, dict)
+        and any(
+            str((item.get("extensions") or {}).get(name, "")).upper() in NOT_FOUND_CODES
+            for name in ("classification", "code", "errorType")
+        )
+        for item in errors
+    )
+
+
+def _fetch_series_info(series_id: int) -> Dict:
+    try:
+        return get_series_info(series_id=series_id)
+    except TransportQueryError as e:
+        if is_not_found_error(e):
+            raise NoSeriesError(str(e)) from e
+        raise
+
+
+def get_series_info_cached(series_id: int) -> Dict:
+    return get_or_fetch(
+        "series_info",
+        series_id,
+        lambda: _fetch_series_info(series_id),
+        negative_exceptions=(NoSeriesError,),
+    )
+
+
+def get_episode_count_by_series_cached(series_id: int) -> int:
+    return get_or_fetch(
+        "episode_count",
+        series_id,
+        lambda: get_episode_count_by_series(series_id=series_id),
+        negative_exceptions=(NoSeriesError,),
+    )
+
+
+def get_series_metadata_cached(series_id: int) -> Dict:
+    return get_or_fetch(
+        "series_metadata",
+        series_id,
+        lambda: get_series_metadata(series_id=series_id),
+    )
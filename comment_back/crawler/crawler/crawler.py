@@ -1,7 +1,17 @@
 from gql import gql, Client
+from gql.transport.httpx import HTTPXAsyncTransport
 from gql.transport.requests import RequestsHTTPTransport
 from .queries import COMMENT_QUERY, EPISODE_QUERY, SERIES_QUERY
-from typing import List, Dict
+from typing import AsyncIterator, List, Dict, NamedTuple
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup
+import asyncio
+import httpx
+import requests
+import threading
+import time
+
+from utils.metrics import counter, histogram
 
 
 from pprint import pprint
@@ -18,6 +28,10 @@ class NoSeriesError(Exception):
     """시리즈가 없을때 발생하는 에러"""
 
 
+class SeriesMetaNotFoundError(Exception):
+    """정적 HTML에서 시리즈 정보를 찾지 못했을때 발생하는 에러"""
+
+
 HEADERS = {
     "Accept": "application/json",
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36",
@@ -34,23 +48,136 @@ HEADERS = {
     "sec-fetch-site": "same-site",
 }
 
+HTML_HEADERS = {
+    "User-Agent": HEADERS["User-Agent"],
+    "accept": "text/html,application/xhtml+xml",
+    "accept-language": HEADERS["accept-language"],
+}
+
 # 상수 정의
-transport = RequestsHTTPTransport(
-    url="https://bff-page.kakao.com/graphql", headers=HEADERS
-)
-client = Client(transport=transport, fetch_schema_from_transport=False)
+GRAPHQL_URL = "https://bff-page.kakao.com/graphql"
 comment_query = gql(COMMENT_QUERY)
 episode_query = gql(EPISODE_QUERY)
 series_query = gql(SERIES_QUERY)
 ITEM_PER_PAGE = 25
+HTML_TIMEOUT = 5  # 시리즈 상세 페이지 요청 타임아웃(초)
+GRAPHQL_TIMEOUT = 10  # 비동기 GraphQL 요청 타임아웃(초)
+EPISODE_FETCH_CONCURRENCY = 8  # 에피소드 목록 병렬 요청 시 동시 요청 수 상한
+
+CRAWLER_PAGES = counter(
+    "crawler_pages_fetched_total",
+    "크롤러가 가져온 페이지 수 (comment, episode, series, html)",
+    ["kind"],
+)
+UPSTREAM_RESPONSES = counter(
+    "crawler_upstream_responses_total",
+    "카카오페이지 응답 상태 코드별 개수",
+    ["target", "status"],
+)
+UPSTREAM_BYTES = counter(
+    "crawler_upstream_bytes_total", "카카오페이지 응답 본문 크기(바이트)", ["target"]
+)
+UPSTREAM_DURATION = histogram(
+    "crawler_upstream_request_duration_seconds",
+    "카카오페이지 요청 시간",
+    ["target", "kind"],
+)
+UPSTREAM_FAILURES = counter(
+    "crawler_upstream_failures_total",
+    "실패한 카카오페이지 요청 (예외 종류별: 타임아웃, 연결 실패, HTTP 오류 등)",
+    ["target", "kind", "error"],
+)
+
+_local = threading.local()
+
+
+def _record_graphql_response(response: requests.Response, *args, **kwargs) -> None:
+    """requests 응답 훅: 상태 코드와 본문 크기를 기록"""
+    UPSTREAM_RESPONSES.inc(target="graphql", status=response.status_code)
+    UPSTREAM_BYTES.inc(len(response.content), target="graphql")
+
+
+class InstrumentedRequestsHTTPTransport(RequestsHTTPTransport):
+    """응답 상태 코드/크기를 메트릭으로 기록하는 GraphQL 트랜스포트"""
+
+    def connect(self):
+        super().connect()
+        self.session.hooks["response"].append(_record_graphql_response)
+
+
+def get_client() -> Client:
+    """
+    현재 스레드 전용 GraphQL 클라이언트를 반환합니다.
+    RequestsHTTPTransport는 한 번에 하나의 세션만 연결할 수 있어 스레드 간에 공유할 수 없습니다.
+    """
+    client = getattr(_local, "client", None)
+    if client is None:
+        transport = InstrumentedRequestsHTTPTransport(url=GRAPHQL_URL, headers=HEADERS)
+        client = Client(transport=transport, fetch_schema_from_transport=False)
+        _local.client = client
+    return client
+
+
+def _execute(kind: str, query, variables: Dict) -> Dict:
+    """GraphQL 요청 한 번 (kind: comment, episode, series). 요청 시간과 실패를 기록"""
+    started_at = time.perf_counter()
+    try:
+        result = get_client().execute(query, variable_values=variables)
+    except Exception as e:
+        UPSTREAM_FAILURES.inc(target="graphql", kind=kind, error=type(e).__name__)
+        raise
+    finally:
+        UPSTREAM_DURATION.observe(
+            time.perf_counter() - started_at, target="graphql", kind=kind
+        )
+    CRAWLER_PAGES.inc(kind=kind)
+    return result
+
+
+async def _arecord_graphql_response(response: httpx.Response) -> None:
+    """httpx 응답 훅: 상태 코드와 본문 크기를 기록"""
+    await response.aread()
+    UPSTREAM_RESPONSES.inc(target="graphql", status=response.status_code)
+    UPSTREAM_BYTES.inc(len(response.content), target="graphql")
+
+
+def get_async_client(**httpx_options) -> Client:
+    """
+    비동기 뷰용 GraphQL 클라이언트 (httpx)
+    크롤링 한 번마다 만들어 async with로 세션을 열고, 그 안의 페이지 요청은 같은 연결을 재사용합니다.
+
+        async with get_async_client() as session:
+            data = await _aexecute(session, "comment", comment_query, variables)
+    """
+    transport = HTTPXAsyncTransport(
+        url=GRAPHQL_URL,
+        headers=HEADERS,
+        timeout=GRAPHQL_TIMEOUT,
+        event_hooks={"response": [_arecord_graphql_response]},
+        **httpx_options,
+    )
+    return Client(transport=transport, fetch_schema_from_transport=False)
+
+
+async def _aexecute(session, kind: str, query, variables: Dict) -> Dict:
+    """_execute의 비동기 버전"""
+    started_at = time.perf_counter()
+    try:
+        result = await session.execute(query, variable_values=variables)
+    except Exception as e:
+        UPSTREAM_FAILURES.inc(target="graphql", kind=kind, error=type(e).__name__)
+        raise
+    finally:
+        UPSTREAM_DURATION.observe(
+            time.perf_counter() - started_at, target="graphql", kind=kind
+        )
+    CRAWLER_PAGES.inc(kind=kind)
+    return result
 
 
 def get_series_info(series_id: int) -> Dict:
     """시리즈 정보를 가져오는 함수. 시리즈가 있는지 확인용"""
-    return client.execute(
-        series_query,
-        variable_values={"seriesId": series_id},
-    )
+    return _execute("series", series_query, {"seriesId": series_id})
 
 
 def get_page_count(total_count: int) -> int:
@@ -58,6 +185,19 @@ def get_page_count(total_count: int) -> int:
     return (total_count + ITEM_PER_PAGE - 1) // ITEM_PER_PAGE
 
 
+def _get_comment_variables(
+    series_id: int, product_id: int, page: int, last_comment_uid: int | None
+) -> Dict:
+    return {
+        "commentListInput": {
+            "page": page,
+            "seriesId": series_id,
+            "productId": product_id,
+            "lastCommentUid": last_comment_uid,
+        }
+    }
+
+
 def crawl_episode_comments(
     series_id: int,
     product_id: int,
@@ -65,19 +205,50 @@ def crawl_episode_comments(
     last_comment_uid: int | None = None,
 ) -> Dict:
     """특정 에피소드의 댓글 데이터 크롤링"""
-    return client.execute(
+    return _execute(
+        "comment",
         comment_query,
-        variable_values={
-            "commentListInput": {
-                "page": page,
-                "seriesId": series_id,
-                "productId": product_id,
-                "lastCommentUid": last_comment_uid,
-            }
-        },
+        _get_comment_variables(series_id, product_id, page, last_comment_uid),
     )
 
 
+async def acrawl_episode_comments(
+    session,
+    series_id: int,
+    product_id: int,
+    page: int = 0,
+    last_comment_uid: int | None = None,
+) -> Dict:
+    """crawl_episode_comments의 비동기 버전"""
+    return await _aexecute(
+        session,
+        "comment",
+        comment_query,
+        _get_comment_variables(series_id, product_id, page, last_comment_uid),
+    )
+
+
+def _format_comments(
+    comments: List[Dict], series_id: int, product_id: int
+) -> List[Dict]:
+    return [
+        {
+            "id": comment["commentUid"],
+            "content": comment["comment"],
+            "created_at": comment["createDt"],
+            "is_best": comment["isBest"],
+            "user_name": comment["userName"],
+            "user_thumbnail_url": comment["userThumbnailUrl"],
+            "user_uid": comment["userUid"],
+            "like_count": comment["likeCount"],
+            "emoticon": comment["emoticon"],
+            "series": series_id,
+            "episode": product_id,
+        }
+        for comment in comments
+    ]
+
+
 def get_comments_by_episode(series_id: int, product_id: int) -> List[Dict]:
     """특정 에피소드의 댓글 전체를 가져옴"""
     comments = []
@@ -107,23 +278,63 @@ def get_comments_by_episode(series_id: int, product_id: int) -> List[Dict]:
         if comment_data["commentList"].get("isEnd", False) or page >= page_count:
             break
 
-    comments = [
-        {
-            "id": comment["commentUid"],
-            "content": comment["comment"],
-            "created_at": comment["createDt"],
-            "is_best": comment["isBest"],
-            "user_name": comment["userName"],
-            "user_thumbnail_url": comment["userThumbnailUrl"],
-            "user_uid": comment["userUid"],
-            "like_count": comment["likeCount"],
-            "emoticon": comment["emoticon"],
-            "series": series_id,
-            "episode": product_id,
-        }
-        for comment in comments
-    ]
+    return _format_comments(comments, series_id, product_id)
+
+
+class CommentPage(NamedTuple):
+    comments: List[Dict]  # _format_comments로 변환한 댓글
+    # 다음 페이지를 가져올 때 넘길 값 (중단된 크롤링을 이어서 할 때 사용)
+    next_page: int
+    last_comment_uid: int
+    is_end: bool
 
+
+async def aiter_comment_pages(
+    series_id: int,
+    product_id: int,
+    page: int = 0,
+    last_comment_uid: int | None = None,
+) -> AsyncIterator[CommentPage]:
+    """
+    에피소드 댓글을 한 페이지씩 가져옴. 페이지 요청은 한 연결에서 순서대로 보냄
+    page, last_comment_uid에 이전 크롤링의 마지막 CommentPage 값을 넘기면 그 다음 페이지부터 가져옵니다.
+    """
+    page_count = None
+
+    async with get_async_client() as session:
+        while True:
+            comment_data = await acrawl_episode_comments(
+                session, series_id, product_id, page, last_comment_uid
+            )
+            if not comment_data or "commentList" not in comment_data:
+                raise NoCommentError("댓글이 없습니다.")
+            if page_count is None:
+                page_count = get_page_count(comment_data["commentList"]["totalCount"])
+
+            comment_list = comment_data["commentList"].get("commentList", [])
+            if not comment_list:
+                raise NoCommentError("댓글이 없습니다.")
+
+            last_comment_uid = comment_list[-1]["commentUid"]
+            page += 1
+            is_end = (
+                comment_data["commentList"].get("isEnd", False) or page >= page_count
+            )
+            yield CommentPage(
+                _format_comments(comment_list, series_id, product_id),
+                page,
+                last_comment_uid,
+                is_end,
+            )
+            if is_end:
+                break
+
+
+async def aget_comments_by_episode(series_id: int, product_id: int) -> List[Dict]:
+    """get_comments_by_episode의 비동기 버전. 페이지 요청은 한 연결에서 순서대로 보냄"""
+    comments = []
+    async for comment_page in aiter_comment_pages(series_id, product_id):
+        comments.extend(comment_page.comments)
     return comments
 
 
@@ -135,52 +346,139 @@ def get_comment_count_by_episode(series_id: int, product_id: int) -> int:
     )
 
 
-def get_episode_by_series(series_id: int, after: str | None = None) -> Dict:
-    """특정 시리즈의 에피소드 데이터를 가져옴"""
-    variables = {"seriesId": series_id, "after": after, "sortType": "asc"}
-    data = client.execute(episode_query, variable_values=variables)
+async def aget_comment_count_by_episode(series_id: int, product_id: int) -> int:
+    async with get_async_client() as session:
+        comment_data = await acrawl_episode_comments(session, series_id, product_id)
+    return comment_data.get("commentList", {}).get("totalCount", {})
+
+
+def _get_episode_list(data: Dict) -> Dict:
     if not data.get("contentHomeProductList"):
         raise NoSeriesError("해당 시리즈가 존재하지 않습니다.")
     return data.get("contentHomeProductList", {})
 
 
+def get_episode_by_series(series_id: int, after: str | None = None) -> Dict:
+    """특정 시리즈의 에피소드 데이터를 가져옴"""
+    variables = {"seriesId": series_id, "after": after, "sortType": "asc"}
+    return _get_episode_list(_execute("episode", episode_query, variables))
+
+
+async def aget_episode_by_series(
+    session, series_id: int, after: str | None = None
+) -> Dict:
+    """get_episode_by_series의 비동기 버전"""
+    variables = {"seriesId": series_id, "after": after, "sortType": "asc"}
+    return _get_episode_list(
+        await _aexecute(session, "episode", episode_query, variables)
+    )
+
+
 def get_episode_count_by_series(series_id: int) -> int:
     return get_episode_by_series(series_id=series_id).get("totalCount", 0)
 
 
-def get_all_episodes_by_series(series_id: int) -> List[Dict]:
-    """특정 시리즈의 모든 에피소드를 가져옴"""
+def _fetch_episode_pages_serial(
+    series_id: int, first_page: Dict, page_count: int
+) -> List[Dict]:
+    """after 커서를 순서대로 따라가며 에피소드 페이지를 가져옴"""
+    pages = [first_page]
     after = "0"
-    page = 0
-
-    edges = []
-    while True:
+    content = first_page
+    page = 1
+    while content.get("pageInfo", {}).get("hasNextPage", False) and page < page_count:
+        after = f"{int(after) + ITEM_PER_PAGE}"
         content = get_episode_by_series(series_id=series_id, after=after)
-        if page == 0:
-            total_count = content.get("totalCount", 1)
-            page_count = get_page_count(total_count)
+        pages.append(content)
+        page += 1
+    return pages
+
+
+def _fetch_episode_pages_parallel(
+    series_id: int, first_page: Dict, page_count: int, max_workers: int
+) -> List[Dict]:
+    """
+    첫 페이지의 totalCount로 모든 after 오프셋을 계산한 뒤 나머지 페이지를 동시에 가져옴.
+    결과는 오프셋 순서대로 반환됩니다.
+    """
+    offsets = [f"{page * ITEM_PER_PAGE}" for page in range(1, page_count)]
+    if not offsets:
+        return [first_page]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(offsets))) as executor:
+        rest = executor.map(
+            lambda after: get_episode_by_series(series_id=series_id, after=after),
+            offsets,
+        )
+        return [first_page, *rest]
 
-        has_next_page = content.get("pageInfo", {}).get("hasNextPage", False)
-        edges.extend(content.get("edges", []))
-        after = f"{int(after) + ITEM_PER_PAGE}"
 
-        if not has_next_page or page >= page_count:
-            break
+def get_all_episodes_by_series(
+    series_id: int,
+    parallel: bool = False,
+    max_workers: int = EPISODE_FETCH_CONCURRENCY,
+) -> List[Dict]:
+    """
+    특정 시리즈의 모든 에피소드를 가져옴
+
+    parallel이 True이면 첫 페이지 이후의 페이지를 최대 max_workers개씩 동시에 요청합니다.
+    페이지 경계에서 중복된 에피소드는 제거되고, 결과는 에피소드 순서를 유지합니다.
+    """
+    first_page = get_episode_by_series(series_id=series_id, after="0")
+    page_count = get_page_count(first_page.get("totalCount", 1))
+
+    if parallel:
+        pages = _fetch_episode_pages_parallel(
+            series_id, first_page, page_count, max_workers
+        )
+    else:
+        pages = _fetch_episode_pages_serial(series_id, first_page, page_count)
+    return _collect_episodes(series_id, pages)
+
+
+async def aget_all_episodes_by_series(
+    series_id: int, max_concurrency: int = EPISODE_FETCH_CONCURRENCY
+) -> List[Dict]:
+    """
+    get_all_episodes_by_series(parallel=True)의 비동기 버전
+    스레드 대신 한 연결 풀에서 최대 max_concurrency개의 페이지 요청을 동시에 보냅니다.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async with get_async_client() as session:
+
+        async def fetch(after: str) -> Dict:
+            async with semaphore:
+                return await aget_episode_by_series(session, series_id, after)
+
+        first_page = await fetch("0")
+        page_count = get_page_count(first_page.get("totalCount", 1))
+        rest = await asyncio.gather(
+            *(fetch(f"{page * ITEM_PER_PAGE}") for page in range(1, page_count))
+        )
+    return _collect_episodes(series_id, [first_page, *rest])
+
 
+def _collect_episodes(series_id: int, pages: List[Dict]) -> List[Dict]:
+    """에피소드 페이지들을 순서대로 펼치고 페이지 경계의 중복 에피소드를 제거"""
     episodes = []
-    episodes = [episode["node"]["eventLog"]["eventMeta"] for episode in edges]
-    for edge in edges:
-        meta = edge["node"]["eventLog"]["eventMeta"]
-        episodes.append(
-            {
-                "id": meta["id"],
-                "category": meta["category"],
-                "name": meta["name"],
-                "subcategory": meta["subcategory"],
-                "image_src": edge["node"]["single"]["thumbnail"],
-                "series": series_id,
-            }
-        )
+    seen_ids = set()
+    for content in pages:
+        for edge in content.get("edges", []):
+            meta = edge["node"]["eventLog"]["eventMeta"]
+            if meta["id"] in seen_ids:
+                continue
+            seen_ids.add(meta["id"])
+            episodes.append(
+                {
+                    "id": meta["id"],
+                    "category": meta["category"],
+                    "name": meta["name"],
+                    "subcategory": meta["subcategory"],
+                    "image_src": edge["node"]["single"]["thumbnail"],
+                    "series": series_id,
+                }
+            )
     return episodes
 
 
@@ -199,17 +497,41 @@ def test_get_all_episodes_by_series(series_id: int) -> tuple[List[Dict], int]:
         has_next_page = content.get("pageInfo", {}).get("hasNextPage", False)
         episode_list.extend(content.get("edges", []))
         after = f"{int(after) + ITEM_PER_PAGE}"
+        page += 1
 
         if not has_next_page or page >= page_count:
             break
     return (episode_list, total_count)
 
 
-# def get_series(series_id: int) -> Dict:
-#     url = f"https://page.kakao.com/content/{series_id}"
-#     response = requests.get(url, headers=HEADERS)
-#     soup = BeautifulSoup(response.text, "html.parser")
-#     title = soup.select("span.font-large3-bold.mb-3pxr.text-ellipsis.break-all.text-el-70.line-clamp-2")
-#     print(title)
-#     print(soup)
-#     return soup
+def parse_series_meta(html: str) -> Dict:
+    """시리즈 상세 페이지 HTML의 og 메타 태그에서 제목과 썸네일을 추출"""
+    soup = BeautifulSoup(html, "html.parser")
+    title = soup.find("meta", property="og:title")
+    image = soup.find("meta", property="og:image")
+    if not title or not title.get("content") or not image or not image.get("content"):
+        raise SeriesMetaNotFoundError("시리즈 메타 태그를 찾을 수 없습니다.")
+    return {
+        "title": title["content"].strip(),
+        "image_src": image["content"].strip(),
+    }
+
+
+def get_series_meta_from_html(series_id: int) -> Dict:
+    """브라우저 없이 정적 HTML만으로 시리즈 제목과 썸네일을 가져옴"""
+    url = f"https://page.kakao.com/content/{series_id}"
+    started_at = time.perf_counter()
+    try:
+        response = requests.get(url, headers=HTML_HEADERS, timeout=HTML_TIMEOUT)
+        UPSTREAM_RESPONSES.inc(target="html", status=response.status_code)
+        UPSTREAM_BYTES.inc(len(response.content), target="html")
+        response.raise_for_status()
+    except requests.RequestException as e:
+        UPSTREAM_FAILURES.inc(target="html", kind="series", error=type(e).__name__)
+        raise
+    finally:
+        UPSTREAM_DURATION.observe(
+            time.perf_counter() - started_at, target="html", kind="series"
+        )
+    CRAWLER_PAGES.inc(kind="html")
+    return parse_series_meta(response.text)
@@ -0,0 +1,18 @@
+from typing import Dict
+from loguru import logger
+from requests.exceptions import RequestException
+
+from .crawler import get_series_meta_from_html, SeriesMetaNotFoundError
+from .selenium_crawler import get_title_with_selenium
+
+
+def get_series_metadata(series_id: int) -> Dict:
+    """
+    시리즈 제목과 썸네일을 가져옵니다.
+    정적 HTML 파싱을 먼저 시도하고, 실패했을 때만 브라우저 풀을 사용합니다.
+    """
+    try:
+        return get_series_meta_from_html(series_id)
+    except (RequestException, SeriesMetaNotFoundError) as e:
+        logger.info(f"시리즈 {series_id} 정적 HTML 파싱 실패, 셀레늄으로 재시도: {e}")
+    return get_title_with_selenium(series_id)
@@ -10,12 +10,34 @@ from selenium.common.exceptions import (
     WebDriverException,
 )
 
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
 from dotenv import load_dotenv
+from loguru import logger
+import atexit
 import os
+import threading
+import time
 from ..utils import handle_exception
 
 load_dotenv()
 CHROME_DRIVER_PATH = os.getenv("CHROME_DRIVER_PATH")
+CHROME_BINARY_PATH = os.getenv("CHROME_BINARY_PATH", "/usr/bin/google-chrome")
+
+# 브라우저 풀 설정
+SELENIUM_POOL_SIZE = int(
+    os.getenv("SELENIUM_POOL_SIZE", "2")
+)  # 동시에 띄울 최대 크롬 수
+SELENIUM_MAX_PAGES_PER_DRIVER = int(
+    os.getenv("SELENIUM_MAX_PAGES_PER_DRIVER", "50")
+)  # 이 횟수만큼 사용한 드라이버는 새로 띄움
+SELENIUM_IDLE_TIMEOUT = float(
+    os.getenv("SELENIUM_IDLE_TIMEOUT", "300")
+)  # 초 단위, 이보다 오래 쉰 드라이버는 종료
+SELENIUM_ACQUIRE_TIMEOUT = float(
+    os.getenv("SELENIUM_ACQUIRE_TIMEOUT", "30")
+)  # 초 단위, 빈 드라이버를 기다리는 최대 시간
 
 
 class SeleniumCrawlError(Exception):
@@ -42,41 +64,192 @@ class SeleniumDriverError(SeleniumCrawlError):
     pass
 
 
-def get_title_with_selenium(series_id: int) -> dict:
-    url = f"https://page.kakao.com/content/{series_id}"
-    print(CHROME_DRIVER_PATH)
-    # Selenium 설정
+class SeleniumPoolExhaustedError(SeleniumCrawlError):
+    """대기 시간 안에 사용할 수 있는 드라이버가 없을 때"""
+
+    pass
+
+
+def create_chrome_driver() -> webdriver.Chrome:
+    """headless 크롬 드라이버를 새로 띄웁니다."""
     chrome_options = Options()
-    chrome_options.binary_location = "/usr/bin/google-chrome"
+    chrome_options.binary_location = CHROME_BINARY_PATH
     chrome_options.add_argument("--headless=new")  # Headless 모드 사용
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
+    service = Service(CHROME_DRIVER_PATH)
+    return webdriver.Chrome(service=service, options=chrome_options)
+
+
+@dataclass
+class PooledDriver:
+    driver: webdriver.Chrome
+    pages_used: int = 0
+    last_used_at: float = field(default_factory=time.monotonic)
 
-    driver = None
-    try:
-        service = Service(CHROME_DRIVER_PATH)
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        wait = WebDriverWait(driver, 10)
-        driver.get(url)
 
+class ChromeDriverPool:
+    """
+    재사용 가능한 headless 크롬 드라이버 풀
+
+    - 동시에 존재하는 드라이버는 max_size개로 제한되며, 모두 사용 중이면
+      acquire_timeout초 동안 순서를 기다립니다.
+    - idle_timeout초 이상 사용되지 않은 드라이버는 종료합니다.
+      다음 요청이 없어도 종료되도록 유휴 드라이버가 있는 동안 데몬 타이머가 정리합니다.
+    - max_pages번 사용된 드라이버는 메모리 누수를 막기 위해 종료하고 새로 띄웁니다.
+    - 웹드라이버 오류가 난 드라이버는 풀에 돌려놓지 않습니다.
+    """
+
+    def __init__(
+        self,
+        max_size: int = SELENIUM_POOL_SIZE,
+        max_pages: int = SELENIUM_MAX_PAGES_PER_DRIVER,
+        idle_timeout: float = SELENIUM_IDLE_TIMEOUT,
+        acquire_timeout: float = SELENIUM_ACQUIRE_TIMEOUT,
+        driver_factory: Callable[[], webdriver.Chrome] = create_chrome_driver,
+    ):
+        self.max_size = max_size
+        self.max_pages = max_pages
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        self.driver_factory = driver_factory
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._idle: list[PooledDriver] = []
+        self._lock = threading.Lock()
+        self._reaper: threading.Timer | None = None
+
+    @contextmanager
+    def driver(self) -> Iterator[webdriver.Chrome]:
+        """풀에서 드라이버를 빌려오고, 블록이 끝나면 반납합니다."""
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise SeleniumPoolExhaustedError(
+                f"{self.acquire_timeout}초 안에 사용 가능한 드라이버가 없습니다."
+            )
+
+        pooled = None
+        broken = False
         try:
-            title_element = wait.until(
-                EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "span.font-large3-bold.text-ellipsis")
-                )
+            pooled = self._checkout()
+            yield pooled.driver
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            if pooled is not None:
+                self._checkin(pooled, broken)
+            self._slots.release()
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def reap_idle(self) -> None:
+        """idle_timeout을 넘긴 유휴 드라이버를 종료합니다."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                pooled
+                for pooled in self._idle
+                if now - pooled.last_used_at >= self.idle_timeout
+            ]
+            self._idle = [pooled for pooled in self._idle if pooled not in expired]
+        for pooled in expired:
+            self._quit(pooled)
+
+    def close(self) -> None:
+        """유휴 드라이버를 모두 종료합니다."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            if self._reaper is not None:
+                self._reaper.cancel()
+                self._reaper = None
+        for pooled in idle:
+            self._quit(pooled)
+
+    def _checkout(self) -> PooledDriver:
+        self.reap_idle()
+        with self._lock:
+            pooled = self._idle.pop() if self._idle else None
+        if pooled is None:
+            pooled = PooledDriver(driver=self.driver_factory())
+        pooled.pages_used += 1
+        return pooled
+
+    def _checkin(self, pooled: PooledDriver, broken: bool) -> None:
+        if broken or pooled.pages_used >= self.max_pages:
+            self._quit(pooled)
+            return
+        pooled.last_used_at = time.monotonic()
+        with self._lock:
+            self._idle.append(pooled)
+        self._schedule_reap()
+
+    def _schedule_reap(self) -> None:
+        """가장 먼저 만료되는 유휴 드라이버 시각에 맞춰 정리 타이머를 겁니다. (이미 걸려 있으면 그대로 둠)"""
+        with self._lock:
+            if self._reaper is not None or not self._idle:
+                return
+            expires_at = (
+                min(pooled.last_used_at for pooled in self._idle) + self.idle_timeout
             )
-            image_element = wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'img[alt="썸네일"]'))
+            self._reaper = threading.Timer(
+                max(0.0, expires_at - time.monotonic()), self._run_reaper
             )
-        except TimeoutException as e:
-            handle_exception(e, SeleniumTimeoutError, "요소 로딩 시간 초과")
-        except NoSuchElementException as e:
-            handle_exception(e, SeleniumElementNotFoundError, "요소를 찾을 수 없음")
+            self._reaper.daemon = True
+            self._reaper.start()
+
+    def _run_reaper(self) -> None:
+        with self._lock:
+            self._reaper = None
+        self.reap_idle()
+        # 아직 만료되지 않은 유휴 드라이버가 남아 있으면 다시 예약
+        self._schedule_reap()
+
+    @staticmethod
+    def _quit(pooled: PooledDriver) -> None:
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.warning(f"크롬 드라이버 종료 중 오류: {e}")
+
+
+driver_pool = ChromeDriverPool()
+atexit.register(driver_pool.close)
+
 
-        return {
-            "title": title_element.text.strip(),
-            "image_src": image_element.get_attribute("src"),
-        }
+def get_title_with_selenium(
+    series_id: int, pool: ChromeDriverPool = driver_pool
+) -> dict:
+    url = f"https://page.kakao.com/content/{series_id}"
+
+    try:
+        with pool.driver() as driver:
+            wait = WebDriverWait(driver, 10)
+            driver.get(url)
+
+            try:
+                title_element = wait.until(
+                    EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, "span.font-large3-bold.text-ellipsis")
+                    )
+                )
+                image_element = wait.until(
+                    EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, 'img[alt="썸네일"]')
+                    )
+                )
+            except TimeoutException as e:
+                handle_exception(e, SeleniumTimeoutError, "요소 로딩 시간 초과")
+            except NoSuchElementException as e:
+                handle_exception(e, SeleniumElementNotFoundError, "요소를 찾을 수 없음")
+
+            return {
+                "title": title_element.text.strip(),
+                "image_src": image_element.get_attribute("src"),
+            }
+
+    except SeleniumCrawlError:
+        raise
 
     except WebDriverException as e:
         handle_exception(e, SeleniumDriverError, "웹드라이버 실행 오류")
@@ -85,10 +258,6 @@ def get_title_with_selenium(series_id: int) -> dict:
         # 기타 예상하지 못한 에러
         handle_exception(e, SeleniumCrawlError, "알 수 없는 셀레늄 크롤링 오류")
 
-    finally:
-        if driver:
-            driver.quit()
-
 
 # 사용 예제
 # series_id = 59071959
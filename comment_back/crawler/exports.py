@@ -0,0 +1,234 @@
+"""
+댓글 스트리밍 내보내기
+
+DB에서 서버 사이드 커서(.iterator)로 chunk 단위로 읽어 NDJSON/CSV로 바로 흘려보내므로
+댓글 수와 관계없이 메모리 사용량이 일정합니다. API 뷰와 export_comments 명령이 함께 사용합니다.
+
+StreamingHttpResponse에 동기 이터레이터를 넘기면 ASGI에서는 Django가 sync_to_async(list)로
+전체를 모은 뒤에 보내므로, ASGI 요청에는 chunk마다 sync_to_async로 읽는 astream_comments를 사용합니다.
+"""
+
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from itertools import islice
+from typing import AsyncIterator, Iterable, Iterator
+
+from asgiref.sync import sync_to_async
+from django.db.models import QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from utils.renderers import dumps
+
+from .mixins import get_values_renderer
+from .models import Comment
+from .serializers import CommentSerializer
+
+EXPORT_CHUNK_SIZE = 2000  # 서버 사이드 커서에서 한 번에 가져오는 행 수
+EXPORT_BUFFER_SIZE = 64 * 1024  # 응답으로 내보내는 바이트 묶음 크기
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+EXPORT_FIELDS = tuple(CommentSerializer().fields.keys())
+
+
+class ExportParameterError(ValueError):
+    """내보내기 파라미터가 잘못되었을 때 발생하는 에러"""
+
+
+def parse_since(value: str | None) -> datetime | None:
+    """since 파라미터(ISO 8601)를 aware datetime으로 변환"""
+    if not value:
+        return None
+    try:
+        since = parse_datetime(value)
+    except ValueError:
+        since = None
+    if since is None:
+        raise ExportParameterError(f"since 형식이 잘못되었습니다: {value}")
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since)
+    return since
+
+
+def get_export_queryset(
+    episode_id: int | None = None,
+    series_id: int | None = None,
+    since: datetime | None = None,
+) -> QuerySet:
+    """에피소드 또는 시리즈 전체의 댓글. since가 있으면 그 이후 작성된 댓글만"""
+    queryset = Comment.objects.all()
+    if episode_id is not None:
+        queryset = queryset.filter(episode=episode_id)
+    if series_id is not None:
+        queryset = queryset.filter(series=series_id)
+    if since is not None:
+        queryset = queryset.filter(created_at__gt=since)
+    return queryset.order_by("id")
+
+
+def iter_records(
+    queryset: QuerySet, fields: Iterable[str] = EXPORT_FIELDS
+) -> Iterator[dict]:
+    """API 응답과 같은 형태의 dict를 한 행씩 반환"""
+    renderer = get_values_renderer(CommentSerializer, tuple(fields))
+    rows = queryset.values_list(*renderer.columns).iterator(
+        chunk_size=EXPORT_CHUNK_SIZE
+    )
+    return renderer.iter_render(rows)
+
+
+async def aiter_records(
+    queryset: QuerySet, fields: Iterable[str] = EXPORT_FIELDS
+) -> AsyncIterator[dict]:
+    """
+    iter_records의 비동기 버전. 서버 사이드 커서에서 EXPORT_CHUNK_SIZE행씩 스레드에서 읽어서 변환
+    (values_list().aiterator()는 Django 5.1에서 첫 쿼리를 이벤트 루프에서 실행하므로 사용하지 않음)
+    """
+    renderer = get_values_renderer(CommentSerializer, tuple(fields))
+    rows = None
+
+    def next_chunk() -> list[tuple]:
+        nonlocal rows
+        if rows is None:
+            rows = queryset.values_list(*renderer.columns).iterator(
+                chunk_size=EXPORT_CHUNK_SIZE
+            )
+        return list(islice(rows, EXPORT_CHUNK_SIZE))
+
+    while True:
+        chunk = await sync_to_async(next_chunk)()
+        for record in renderer.iter_render(chunk):
+            yield record
+        if len(chunk) < EXPORT_CHUNK_SIZE:
+            break
+
+
+class ExportEncoder:
+    """
+    레코드를 NDJSON/CSV 한 줄씩 바이트로 바꾸고, EXPORT_BUFFER_SIZE 이상 모이면
+    (gzip이면 압축해서) 내보낼 조각으로 반환합니다. 동기/비동기 스트림이 함께 사용합니다.
+    """
+
+    def __init__(
+        self,
+        export_format: str = "ndjson",
+        compress: bool = False,
+        fields: Iterable[str] = EXPORT_FIELDS,
+    ):
+        if export_format not in EXPORT_FORMATS:
+            raise ExportParameterError(f"지원하지 않는 형식입니다: {export_format}")
+        self.export_format = export_format
+        self.fields = list(fields)
+        self.buffer_size = EXPORT_BUFFER_SIZE
+        self._pending: list[bytes] = []
+        self._pending_size = 0
+        self._compressor = (
+            zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+            if compress
+            else None
+        )
+        if export_format == "csv":
+            self._csv_buffer = io.StringIO()
+            self._csv_writer = csv.writer(self._csv_buffer)
+            self._write(self._encode_csv_row(self.fields))
+
+    def add(self, record: dict) -> bytes | None:
+        """레코드 하나를 추가. 내보낼 조각이 모였으면 반환"""
+        if self.export_format == "csv":
+            data = self._encode_csv_row(
+                [
+                    (
+                        json.dumps(value, ensure_ascii=False)
+                        if isinstance(value, (dict, list))
+                        else value
+                    )
+                    for value in (record[field] for field in self.fields)
+                ]
+            )
+        else:
+            data = dumps(record) + b"\n"
+        return self._write(data)
+
+    def finish(self) -> bytes:
+        """남은 데이터 (gzip이면 압축 마무리 포함)"""
+        data = b"".join(self._pending)
+        self._pending = []
+        self._pending_size = 0
+        if self._compressor is not None:
+            data = self._compressor.compress(data) + self._compressor.flush()
+        return data
+
+    def _encode_csv_row(self, row: list) -> bytes:
+        self._csv_writer.writerow(row)
+        data = self._csv_buffer.getvalue().encode()
+        self._csv_buffer.seek(0)
+        self._csv_buffer.truncate()
+        return data
+
+    def _write(self, data: bytes) -> bytes | None:
+        self._pending.append(data)
+        self._pending_size += len(data)
+        if self._pending_size < self.buffer_size:
+            return None
+        chunk = b"".join(self._pending)
+        self._pending = []
+        self._pending_size = 0
+        if self._compressor is not None:
+            chunk = self._compressor.compress(chunk)
+        return chunk or None
+
+
+def _iter_encoded(encoder: ExportEncoder, records: Iterable[dict]) -> Iterator[bytes]:
+    for record in records:
+        chunk = encoder.add(record)
+        if chunk:
+            yield chunk
+    chunk = encoder.finish()
+    if chunk:
+        yield chunk
+
+
+def stream_comments(
+    queryset: QuerySet,
+    export_format: str = "ndjson",
+    compress: bool = False,
+    fields: Iterable[str] = EXPORT_FIELDS,
+) -> Iterator[bytes]:
+    """댓글 쿼리셋을 지정한 형식의 바이트 스트림으로 변환"""
+    encoder = ExportEncoder(export_format, compress, fields)
+    return _iter_encoded(encoder, iter_records(queryset, fields))
+
+
+async def _aiter_encoded(
+    encoder: ExportEncoder, records: AsyncIterator[dict]
+) -> AsyncIterator[bytes]:
+    async for record in records:
+        chunk = encoder.add(record)
+        if chunk:
+            yield chunk
+    chunk = encoder.finish()
+    if chunk:
+        yield chunk
+
+
+def astream_comments(
+    queryset: QuerySet,
+    export_format: str = "ndjson",
+    compress: bool = False,
+    fields: Iterable[str] = EXPORT_FIELDS,
+) -> AsyncIterator[bytes]:
+    """stream_comments의 비동기 버전 (ASGI 응답용)"""
+    encoder = ExportEncoder(export_format, compress, fields)
+    return _aiter_encoded(encoder, aiter_records(queryset, fields))
+
+
+def get_export_filename(target: str, export_format: str, compress: bool) -> str:
+    """예: comments_episode_61823562_20250711_154738.ndjson.gz"""
+    timestamp = timezone.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"comments_{target}_{timestamp}.{export_format}"
+    return f"{filename}.gz" if compress else filename
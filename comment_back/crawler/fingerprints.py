@@ -0,0 +1,28 @@
+"""
+조건부 조회(utils/conditional.py)용 데이터 지문
+
+응답을 만들지 않고도 데이터가 바뀌었는지 알 수 있는 값을 쿼리 한 번으로 계산합니다.
+"""
+
+from django.db.models import Count, Max
+
+from .models import Comment, Series
+
+
+def comment_fingerprint(**filters) -> tuple:
+    """
+    댓글이 크롤링되면 개수/최대 ID가, AI 분석 결과가 저장되거나 초기화되면
+    분석된 댓글 수/최종 분석 시각이 바뀝니다.
+    """
+    row = Comment.objects.filter(**filters).aggregate(
+        count=Count("id"),
+        max_id=Max("id"),
+        processed_count=Count("ai_processed_at"),
+        processed_at=Max("ai_processed_at"),
+    )
+    return tuple(row.values())
+
+
+def series_fingerprint() -> tuple:
+    """시리즈는 등록만 되고 수정되지 않으므로 개수/최대 ID로 충분"""
+    return tuple(Series.objects.aggregate(count=Count("id"), max_id=Max("id")).values())
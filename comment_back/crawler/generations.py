@@ -0,0 +1,63 @@
+"""
+에피소드/시리즈 데이터 세대(generation) 카운터
+
+크롤링이나 AI 분석으로 댓글이 바뀔 때마다 카운터를 올리고, 캐시 키에 현재 세대를 넣어
+바뀐 에피소드/시리즈의 캐시만 정확히 무효화합니다.
+
+카운터는 기본 캐시(CACHES["default"])에 저장되므로, 워커 프로세스가 여러 개(WEB_CONCURRENCY > 1)이면
+모든 워커가 함께 보는 캐시(Redis 등)여야 합니다. 프로세스 로컬 캐시에서는 한 워커가 올린 세대를
+다른 워커가 보지 못하므로 세대로 무효화하는 캐시는 generations_are_shared()가 False이면 캐시를 쓰지 않습니다.
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+GENERATION_KEY_PREFIX = "generation"
+GENERATION_TIMEOUT = None  # 만료 없음
+# 워커 프로세스마다 따로 저장되는 캐시 백엔드
+PROCESS_LOCAL_CACHE_BACKENDS = ("django.core.cache.backends.locmem.LocMemCache",)
+
+
+def generations_are_shared() -> bool:
+    """모든 워커 프로세스가 같은 세대 카운터를 보는지 (공유 캐시이거나 워커가 하나)"""
+    if settings.CACHES["default"]["BACKEND"] not in PROCESS_LOCAL_CACHE_BACKENDS:
+        return True
+    return settings.WEB_CONCURRENCY <= 1
+
+
+def _key(kind: str, object_id: int) -> str:
+    return f"{GENERATION_KEY_PREFIX}:{kind}:{object_id}"
+
+
+def get_generation(kind: str, object_id: int) -> int:
+    """
+    현재 세대를 반환합니다. 카운터가 없으면(처음이거나 캐시에서 밀려난 경우)
+    현재 시각으로 시작해서 예전 세대 값이 재사용되지 않도록 합니다.
+    """
+    key = _key(kind, object_id)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, time.time_ns(), GENERATION_TIMEOUT)
+        generation = cache.get(key)
+    return generation
+
+
+def bump_generation(kind: str, object_id: int) -> int:
+    key = _key(kind, object_id)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), GENERATION_TIMEOUT)
+        return cache.get(key)
+
+
+def mark_series_changed(series_id: int) -> None:
+    bump_generation("series", series_id)
+
+
+def mark_episode_changed(episode_id: int, series_id: int) -> None:
+    """에피소드의 댓글이 바뀌면 에피소드와 소속 시리즈의 세대를 함께 올림"""
+    bump_generation("episode", episode_id)
+    bump_generation("series", series_id)
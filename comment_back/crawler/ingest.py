@@ -0,0 +1,184 @@
+"""
+크롤링 결과 저장
+
+크롤러가 가져온 데이터를 Serializer로 검증하고 유효한 데이터만 bulk_create로 저장합니다.
+에피소드 댓글 크롤링(CommentCrawlView)과 시리즈 전체 크롤링 작업(jobs.py)이 같은 함수를 사용합니다.
+
+댓글은 페이지마다 저장하고 같은 트랜잭션에서 체크포인트(CommentCrawlCheckpoint)를 갱신하므로
+크롤링이 중간에 실패해도 저장한 페이지는 남고, 다음 크롤링은 체크포인트의 다음 페이지부터 이어서 합니다.
+실패로 잃는 작업은 최대 한 페이지입니다.
+
+같은 에피소드를 동시에 크롤링하면(CommentCrawlView와 시리즈 전체 크롤링 작업 등) 페이지 저장은 에피소드 행 잠금으로
+하나씩 처리되므로, 다른 크롤링이 먼저 저장한 댓글은 검증에서 걸러집니다. (IntegrityError로 페이지가 롤백되지 않음)
+"""
+
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import aclosing
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.db.models import Model
+from rest_framework.serializers import ModelSerializer
+
+from llm.stats import add_new_comments_to_stats
+from utils.metrics import counter, histogram
+
+from .crawler.crawler import (
+    CommentPage,
+    aget_comment_count_by_episode,
+    aiter_comment_pages,
+)
+from .generations import mark_episode_changed
+from .models import Comment, CommentCrawlCheckpoint, Episode
+from .serializers import CommentSerializer
+
+BULK_INSERT_ROWS = histogram(
+    "crawler_bulk_insert_rows",
+    "크롤링 결과 bulk_create 한 번에 저장한 행 수",
+    ["model"],
+    buckets=(1, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000),
+)
+BULK_INSERT_DURATION = histogram(
+    "crawler_bulk_insert_duration_seconds", "크롤링 결과 bulk_create 시간", ["model"]
+)
+CRAWL_INVALID_ROWS = counter(
+    "crawler_invalid_rows_total",
+    "검증에 실패해 저장하지 않은 크롤링 데이터 수",
+    ["model"],
+)
+COMMENT_CRAWL_RESUMES = counter(
+    "crawler_comment_crawl_resumed_total",
+    "체크포인트에서 이어서 시작한 에피소드 댓글 크롤링 수",
+)
+
+
+def validate_and_separate_data(
+    data: list[dict[str, Any]], serializer_class: type[ModelSerializer]
+) -> tuple[list[Model], list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    주어진 데이터 리스트를 검증하고 유효한 데이터와 유효하지 않은 데이터를 분리합니다.
+
+    Args:
+        data (List[Dict[str, Any]]): 검증할 데이터 리스트.
+        serializer_class (Type[ModelSerializer]): 데이터를 검증할 직렬화 클래스.
+
+    Returns:
+        Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+            유효한 데이터 리스트와 유효하지 않은 데이터 리스트.
+    """
+    valid_instances, valid_data, invalid_data = [], [], []
+    model = serializer_class.Meta.model  # type: ignore
+    for item in data:
+        # print(item)
+        serializer = serializer_class(data=item)
+        if serializer.is_valid():
+            valid_instances.append(model(**serializer.validated_data))  # type: ignore
+            valid_data.append(serializer.data)
+        else:
+            invalid_data.append({"data": item, "errors": serializer.errors})
+    return valid_instances, valid_data, invalid_data
+
+
+def bulk_create_crawled(
+    model: type[Model], instances: list, invalid_count: int
+) -> None:
+    """크롤링 결과를 bulk_create로 저장하고 저장 행 수/시간을 기록"""
+    name = model.__name__
+    if invalid_count:
+        CRAWL_INVALID_ROWS.inc(invalid_count, model=name)
+    if not instances:
+        return
+    started_at = time.perf_counter()
+    model.objects.bulk_create(instances)  # type: ignore
+    BULK_INSERT_DURATION.observe(time.perf_counter() - started_at, model=name)
+    BULK_INSERT_ROWS.observe(len(instances), model=name)
+
+
+def save_crawled(
+    model: type[Model], data: list[dict[str, Any]], serializer_class
+) -> tuple[list[Model], list[dict[str, Any]], list[dict[str, Any]]]:
+    """크롤링 결과를 검증하고 유효한 데이터만 저장 (비동기 뷰에서 sync_to_async로 호출)"""
+    valid_instances, valid_data, invalid_data = validate_and_separate_data(
+        data, serializer_class
+    )
+    bulk_create_crawled(model, valid_instances, len(invalid_data))
+    return valid_instances, valid_data, invalid_data
+
+
+def save_comment_page(
+    checkpoint: CommentCrawlCheckpoint, comment_page: CommentPage
+) -> tuple[list[Model], list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    댓글 한 페이지 저장과 체크포인트 갱신을 한 트랜잭션으로 처리. 마지막 페이지면 체크포인트 삭제
+    이미 저장된 댓글은 Serializer 검증에서 걸러져 invalid_data로 반환됩니다.
+    """
+    with transaction.atomic():
+        # 같은 에피소드를 크롤링하는 다른 요청의 페이지 저장이 끝날 때까지 기다림
+        list(
+            Episode.objects.select_for_update()
+            .filter(id=checkpoint.episode_id)
+            .values_list("id")
+        )
+        result = save_crawled(Comment, comment_page.comments, CommentSerializer)
+        if comment_page.is_end:
+            CommentCrawlCheckpoint.objects.filter(pk=checkpoint.pk).delete()
+            return result
+        checkpoint.page = comment_page.next_page
+        checkpoint.last_comment_uid = comment_page.last_comment_uid
+        checkpoint.saved_pages += 1
+        checkpoint.inserted_count += len(result[0])
+        checkpoint.save()
+    return result
+
+
+async def acrawl_and_save_comments(
+    series_id: int,
+    product_id: int,
+    on_page_saved: Callable[[int], Awaitable[None]] | None = None,
+) -> tuple[list[Model], list[dict[str, Any]], list[dict[str, Any]]] | None:
+    """
+    에피소드 댓글을 크롤링해서 새 댓글만 저장하고, 집계와 세대를 갱신합니다.
+    체크포인트가 있으면 그 위치부터 이어서 크롤링합니다.
+    체크포인트가 없고 이미 모든 댓글이 저장되어 있으면 크롤링하지 않고 None을 반환합니다.
+    크롤링 실패(NoCommentError, 네트워크 오류 등)는 그대로 발생하고, 그 전까지 저장한 페이지는 남습니다.
+    on_page_saved가 있으면 페이지를 저장할 때마다 저장한 댓글 수로 호출합니다. (작업 진행 상황 갱신용)
+    """
+    checkpoint = await CommentCrawlCheckpoint.objects.filter(
+        episode=product_id
+    ).afirst()
+    if checkpoint is None:
+        comment_count = await aget_comment_count_by_episode(
+            series_id=series_id, product_id=product_id
+        )
+        if comment_count <= await Comment.objects.filter(episode=product_id).acount():
+            return None
+        # 첫 페이지를 저장할 때 함께 저장됨
+        checkpoint = CommentCrawlCheckpoint(episode_id=product_id)
+    else:
+        COMMENT_CRAWL_RESUMES.inc()
+
+    valid_instances, valid_data, invalid_data = [], [], []
+    try:
+        async with aclosing(
+            aiter_comment_pages(
+                series_id, product_id, checkpoint.page, checkpoint.last_comment_uid
+            )
+        ) as comment_pages:
+            async for comment_page in comment_pages:
+                instances, data, invalid = await sync_to_async(save_comment_page)(
+                    checkpoint, comment_page
+                )
+                valid_instances.extend(instances)
+                valid_data.extend(data)
+                invalid_data.extend(invalid)
+                if on_page_saved is not None:
+                    await on_page_saved(len(instances))
+    finally:
+        # 실패해도 저장한 페이지가 있으면 조회 결과에 반영
+        if valid_instances:
+            # 새 댓글만큼만 집계에 더함 (크롤링 한 번에 한 번, 댓글을 다시 읽지 않음)
+            await sync_to_async(add_new_comments_to_stats)(product_id, valid_instances)
+            await sync_to_async(mark_episode_changed)(product_id, series_id)
+    return valid_instances, valid_data, invalid_data
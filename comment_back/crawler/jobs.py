@@ -0,0 +1,206 @@
+"""
+시리즈 전체 댓글 크롤링 작업
+
+클라이언트가 에피소드마다 댓글 크롤링 API를 호출하는 대신, 작업 하나로 시리즈의 모든 에피소드 댓글을 크롤링합니다.
+작업은 백그라운드 스레드의 이벤트 루프에서 실행되고, 에피소드는 최대 SERIES_CRAWL_CONCURRENCY개씩 동시에 크롤링합니다.
+댓글 페이지를 저장할 때마다 저장한 댓글 수와 갱신 시각(updated_at)을, 에피소드 하나가 끝날 때마다
+완료 에피소드와 오류를 CrawlJob에 기록하므로 작업 조회 API(CrawlJobView)로 진행 상황을 확인할 수 있습니다.
+
+SERIES_CRAWL_STALE_AFTER초 동안 갱신이 없는 작업은 서버 재시작 등으로 멈춘 것으로 보고 FAILED로 기록합니다.
+FAILED로 기록된 작업이 아직 돌고 있었다면 다음 진행 상황을 저장할 때 멈춥니다. (같은 체크포인트를 두 작업이 갱신하지 않도록)
+
+    job, created = create_crawl_job(series_id)
+    if created:
+        transaction.on_commit(partial(submit_crawl_job, job.id))
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from logging import getLogger
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from utils.metrics import QUEUE_DEPTH, counter
+
+from .ingest import acrawl_and_save_comments
+from .models import CrawlJob, Episode, Series
+
+logger = getLogger(__name__)
+
+QUEUE = "series-crawl"
+
+CRAWL_JOB_EPISODES = counter(
+    "crawler_job_episodes_total",
+    "시리즈 크롤링 작업에서 처리한 에피소드 수 (inserted, skipped, error)",
+    ["result"],
+)
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.SERIES_CRAWL_WORKERS, thread_name_prefix=QUEUE
+)
+
+
+ACTIVE_STATUSES = (CrawlJob.Status.PENDING, CrawlJob.Status.RUNNING)
+
+
+class CrawlJobStopped(Exception):
+    """작업이 다른 곳에서 FAILED로 기록되어 더 진행하지 않음"""
+
+
+def _stale_before():
+    return timezone.now() - timedelta(seconds=settings.SERIES_CRAWL_STALE_AFTER)
+
+
+def is_stale(job: CrawlJob) -> bool:
+    """대기/실행 중인데 SERIES_CRAWL_STALE_AFTER초 동안 진행이 없는 작업인지"""
+    return job.status in ACTIVE_STATUSES and job.updated_at < _stale_before()
+
+
+def fail_job(job: CrawlJob, error: str, detail: str) -> None:
+    """작업을 FAILED로 기록"""
+    job.status = CrawlJob.Status.FAILED
+    job.errors.append({"episode": None, "error": error, "detail": detail})
+    job.finished_at = timezone.now()
+    job.save()
+
+
+def fail_stale_job(job: CrawlJob) -> None:
+    fail_job(
+        job,
+        "StaleCrawlJob",
+        f"{settings.SERIES_CRAWL_STALE_AFTER}초 동안 진행이 없어 중단된 것으로 처리했습니다.",
+    )
+
+
+def get_active_job(series_id: int) -> CrawlJob | None:
+    """
+    시리즈의 대기/실행 중인 작업.
+    멈춘 작업은 FAILED로 기록하고 실행 중인 작업으로 보지 않습니다.
+    """
+    active = None
+    for job in CrawlJob.objects.filter(
+        series=series_id, status__in=ACTIVE_STATUSES
+    ).order_by("-id"):
+        if is_stale(job):
+            fail_stale_job(job)
+        elif active is None:
+            active = job
+    return active
+
+
+def create_crawl_job(series_id: int) -> tuple[CrawlJob, bool]:
+    """
+    (작업, 새로 만들었는지)를 반환합니다.
+    같은 시리즈의 작업이 이미 실행 중이면 새로 만들지 않고 그 작업을 반환합니다.
+    """
+    with transaction.atomic():
+        # 같은 시리즈에 대한 동시 요청이 작업을 두 개 만들지 않도록 시리즈 행을 잠금
+        series = Series.objects.select_for_update().get(id=series_id)
+        job = get_active_job(series.id)
+        if job is not None:
+            return job, False
+        job = CrawlJob.objects.create(
+            series=series,
+            total_episodes=Episode.objects.filter(series=series).count(),
+        )
+        return job, True
+
+
+def submit_crawl_job(job_id: int) -> None:
+    """작업을 백그라운드 스레드에서 실행 (트랜잭션 커밋 후에 호출)"""
+
+    def run():
+        try:
+            run_crawl_job(job_id)
+        finally:
+            QUEUE_DEPTH.dec(queue=QUEUE)
+            close_old_connections()
+
+    QUEUE_DEPTH.inc(queue=QUEUE)
+    _executor.submit(run)
+
+
+def run_crawl_job(job_id: int) -> None:
+    try:
+        async_to_sync(arun_crawl_job)(job_id)
+    except CrawlJobStopped:
+        logger.warning(
+            "시리즈 크롤링 작업 %s은 이미 FAILED로 기록되어 중단합니다.", job_id
+        )
+    except Exception as e:
+        logger.exception("시리즈 크롤링 작업 %s 실패", job_id)
+        job = CrawlJob.objects.get(id=job_id)
+        if job.status in ACTIVE_STATUSES:
+            fail_job(job, type(e).__name__, str(e))
+
+
+def _save_progress(job_id: int, **values) -> None:
+    """진행 상황과 갱신 시각 저장. 작업이 더 이상 대기/실행 중이 아니면 CrawlJobStopped"""
+    updated = CrawlJob.objects.filter(id=job_id, status__in=ACTIVE_STATUSES).update(
+        **values, updated_at=timezone.now()
+    )
+    if not updated:
+        raise CrawlJobStopped(job_id)
+
+
+async def arun_crawl_job(job_id: int) -> None:
+    job = await CrawlJob.objects.aget(id=job_id)
+    episode_ids = [
+        episode_id
+        async for episode_id in Episode.objects.filter(series=job.series_id)
+        .order_by("id")
+        .values_list("id", flat=True)
+    ]
+    job.status = CrawlJob.Status.RUNNING
+    job.total_episodes = len(episode_ids)
+    await sync_to_async(_save_progress)(
+        job.id, status=job.status, total_episodes=job.total_episodes
+    )
+
+    semaphore = asyncio.Semaphore(settings.SERIES_CRAWL_CONCURRENCY)
+
+    async def page_saved(inserted: int) -> None:
+        # 에피소드 하나가 오래 걸려도 멈춘 작업으로 보이지 않도록 페이지마다 갱신
+        job.comments_inserted += inserted
+        await sync_to_async(_save_progress)(
+            job.id, comments_inserted=job.comments_inserted
+        )
+
+    async def crawl(episode_id: int) -> None:
+        async with semaphore:
+            try:
+                result = await acrawl_and_save_comments(
+                    job.series_id, episode_id, on_page_saved=page_saved
+                )
+            except CrawlJobStopped:
+                raise
+            except Exception as e:
+                job.errors.append(
+                    {"episode": episode_id, "error": type(e).__name__, "detail": str(e)}
+                )
+                CRAWL_JOB_EPISODES.inc(result="error")
+            else:
+                CRAWL_JOB_EPISODES.inc(
+                    result="skipped" if result is None else "inserted"
+                )
+            job.done_episodes += 1
+            # 진행 상황은 이벤트 루프에서만 바뀌므로 저장할 값을 여기서 복사해서 넘김
+            await sync_to_async(_save_progress)(
+                job.id,
+                done_episodes=job.done_episodes,
+                comments_inserted=job.comments_inserted,
+                errors=list(job.errors),
+            )
+
+    await asyncio.gather(*(crawl(episode_id) for episode_id in episode_ids))
+    # 모든 에피소드가 실패했으면 FAILED, 일부만 실패했으면 DONE (실패한 에피소드는 errors에 기록)
+    all_failed = bool(episode_ids) and len(job.errors) == len(episode_ids)
+    await sync_to_async(_save_progress)(
+        job.id,
+        status=CrawlJob.Status.FAILED if all_failed else CrawlJob.Status.DONE,
+        finished_at=timezone.now(),
+    )
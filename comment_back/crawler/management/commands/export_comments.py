@@ -0,0 +1,63 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from crawler.exports import (
+    EXPORT_FORMATS,
+    ExportParameterError,
+    get_export_filename,
+    get_export_queryset,
+    parse_since,
+    stream_comments,
+)
+
+DEFAULT_EXPORT_DIR = Path(settings.BASE_DIR) / "exports" / "comments"
+
+
+class Command(BaseCommand):
+    help = "에피소드 또는 시리즈의 댓글을 NDJSON/CSV 파일로 내보냅니다."
+
+    def add_arguments(self, parser):
+        target = parser.add_mutually_exclusive_group(required=True)
+        target.add_argument("--episode", type=int, help="에피소드 ID")
+        target.add_argument("--series", type=int, help="시리즈 ID")
+        parser.add_argument("--format", choices=list(EXPORT_FORMATS), default="ndjson")
+        parser.add_argument("--gzip", action="store_true", help="gzip으로 압축")
+        parser.add_argument(
+            "--since", help="이 시각 이후 작성된 댓글만 내보냄 (ISO 8601)"
+        )
+        parser.add_argument(
+            "--output",
+            help=f"저장할 파일 경로 (기본: {DEFAULT_EXPORT_DIR}/comments_<대상>_<시각>.<형식>)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            since = parse_since(options["since"])
+        except ExportParameterError as e:
+            raise CommandError(str(e)) from e
+
+        if options["episode"] is not None:
+            target = f"episode_{options['episode']}"
+            queryset = get_export_queryset(episode_id=options["episode"], since=since)
+        else:
+            target = f"series_{options['series']}"
+            queryset = get_export_queryset(series_id=options["series"], since=since)
+
+        output = Path(
+            options["output"]
+            or DEFAULT_EXPORT_DIR
+            / get_export_filename(target, options["format"], options["gzip"])
+        )
+        output.parent.mkdir(parents=True, exist_ok=True)
+
+        written = 0
+        with output.open("wb") as f:
+            for chunk in stream_comments(queryset, options["format"], options["gzip"]):
+                f.write(chunk)
+                written += len(chunk)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{output} ({written / 1024:.1f}KB) 내보내기 완료")
+        )
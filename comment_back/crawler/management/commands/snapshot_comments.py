@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from crawler.models import Series
+from crawler.snapshots import SnapshotDependencyError, write_series_snapshot
+
+
+class Command(BaseCommand):
+    help = "시리즈 댓글의 분석용 Parquet 스냅샷을 갱신합니다. (변경된 에피소드만 처리)"
+
+    def add_arguments(self, parser):
+        target = parser.add_mutually_exclusive_group(required=True)
+        target.add_argument("--series", type=int, nargs="+", help="시리즈 ID")
+        target.add_argument("--all", action="store_true", help="모든 시리즈")
+        parser.add_argument(
+            "--output-dir", help="스냅샷 디렉터리 (기본: settings.COMMENT_SNAPSHOT_DIR)"
+        )
+
+    def handle(self, *args, **options):
+        series_ids = (
+            list(Series.objects.order_by("id").values_list("id", flat=True))
+            if options["all"]
+            else options["series"]
+        )
+
+        for series_id in series_ids:
+            try:
+                result = write_series_snapshot(series_id, options["output_dir"])
+            except SnapshotDependencyError as e:
+                raise CommandError(str(e)) from e
+
+            self.stdout.write(
+                f"시리즈 {series_id}: "
+                f"추가 {len(result['appended'])}, 재작성 {len(result['rewritten'])}, "
+                f"삭제 {len(result['removed'])}, 변경 없음 {len(result['unchanged'])}"
+            )
+        self.stdout.write(self.style.SUCCESS("스냅샷 갱신 완료"))
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.15 on 2026-10-19 15:00
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("crawler", "0011_comment_is_spam"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="comment",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("content"),
+                    name="gin_trgm_ops",
+                ),
+                name="comment_content_trgm",
+            ),
+        ),
+    ]
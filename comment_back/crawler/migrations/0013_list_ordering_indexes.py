@@ -0,0 +1,36 @@
+# Generated by Django 5.1.15 on 2026-10-19 15:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("crawler", "0012_comment_content_trgm"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(fields=["episode", "id"], name="comment_episode_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["episode", "created_at", "id"],
+                name="comment_episode_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["episode", "like_count", "id"], name="comment_episode_like_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="episode",
+            index=models.Index(fields=["series", "id"], name="episode_series_id_idx"),
+        ),
+    ]
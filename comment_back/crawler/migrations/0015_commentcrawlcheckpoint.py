@@ -0,0 +1,34 @@
+# Generated by Django 5.1.15 on 2026-10-19 15:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("crawler", "0014_crawljob"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CommentCrawlCheckpoint",
+            fields=[
+                (
+                    "episode",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="crawl_checkpoint",
+                        serialize=False,
+                        to="crawler.episode",
+                    ),
+                ),
+                ("page", models.IntegerField(default=0)),
+                ("last_comment_uid", models.IntegerField(null=True)),
+                ("saved_pages", models.IntegerField(default=0)),
+                ("inserted_count", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,126 @@
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+# 값 그대로 JSON에 넣어도 Serializer 출력과 같은 필드들
+PASSTHROUGH_FIELDS = (
+    serializers.IntegerField,
+    serializers.CharField,
+    serializers.BooleanField,
+    serializers.PrimaryKeyRelatedField,
+)
+
+
+class ValuesRenderer:
+    """
+    values_list() 결과를 Serializer와 동일한 dict 목록으로 변환합니다.
+    필드 순서와 필드별 변환 함수는 생성 시 한 번만 계산됩니다.
+    """
+
+    def __init__(self, serializer_class: type[serializers.ModelSerializer], fields):
+        serializer = serializer_class(fields=list(fields))
+        self.names: list[str] = []
+        self.columns: list[str] = []
+        self.converters: list[tuple[int, Callable[[Any], Any]]] = []
+        self.datetime_indexes: list[int] = []
+
+        for index, field in enumerate(serializer._readable_fields):
+            self.names.append(field.field_name)
+            self.columns.append(field.source)
+            if self._is_iso_datetime(field):
+                self.datetime_indexes.append(index)
+            elif not self._is_passthrough(field):
+                self.converters.append((index, field.to_representation))
+
+    @staticmethod
+    def _is_passthrough(field: serializers.Field) -> bool:
+        if isinstance(field, serializers.JSONField):
+            return not field.binary
+        return isinstance(field, PASSTHROUGH_FIELDS)
+
+    @staticmethod
+    def _is_iso_datetime(field: serializers.Field) -> bool:
+        """
+        DateTimeField.to_representation과 같은 결과를 직접 계산할 수 있는 경우.
+        USE_TZ가 켜져 있고 DB 값이 항상 aware datetime이어야 합니다.
+        """
+        if not isinstance(field, serializers.DateTimeField):
+            return False
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        return (
+            settings.USE_TZ
+            and not hasattr(field, "timezone")
+            and isinstance(output_format, str)
+            and output_format.lower() == ISO_8601
+        )
+
+    def render(self, rows: Iterable[tuple]) -> list[dict[str, Any]]:
+        if not self.converters and not self.datetime_indexes:
+            names = self.names
+            return [dict(zip(names, row)) for row in rows]
+        return list(self.iter_render(rows))
+
+    def iter_render(self, rows: Iterable[tuple]) -> Iterator[dict[str, Any]]:
+        """render와 같지만 한 행씩 변환 (스트리밍 응답용)"""
+        names = self.names
+        converters = self.converters
+        datetime_indexes = self.datetime_indexes
+        current_timezone = timezone.get_current_timezone()
+        for row in rows:
+            row = list(row)
+            for index in datetime_indexes:
+                value = row[index]
+                if value:
+                    value = value.astimezone(current_timezone).isoformat()
+                    if value.endswith("+00:00"):
+                        value = value[:-6] + "Z"
+                    row[index] = value
+            for index, convert in converters:
+                value = row[index]
+                if value is not None:
+                    row[index] = convert(value)
+            yield dict(zip(names, row))
+
+
+@lru_cache(maxsize=256)
+def get_values_renderer(
+    serializer_class: type[serializers.ModelSerializer], fields: tuple[str, ...]
+) -> ValuesRenderer | None:
+    """요청한 필드 중 Serializer에 있는 필드가 없으면 None"""
+    renderer = ValuesRenderer(serializer_class, fields)
+    return renderer if renderer.names else None
+
+
+class FieldsValuesListMixin:
+    """
+    fields 파라미터가 있는 목록 조회를 모델 인스턴스와 Serializer 없이 처리합니다.
+    values_list()로 필요한 컬럼만 읽고 ValuesRenderer로 변환하며,
+    응답은 DynamicFieldsModelSerializer를 사용했을 때와 동일합니다.
+    """
+
+    def get_requested_fields(self) -> tuple[str, ...]:
+        fields_param = self.request.query_params.get("fields", None)
+        if not fields_param:
+            return ()
+        return tuple(field for field in fields_param.split(",") if field)
+
+    def list(self, request, *args, **kwargs):
+        fields = self.get_requested_fields()
+        renderer = (
+            get_values_renderer(self.get_serializer_class(), fields) if fields else None
+        )
+        if renderer is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset()).values_list(
+            *renderer.columns
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(renderer.render(page))
+        return Response(renderer.render(queryset))
@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from user.models import CustomUser
 
 
@@ -18,6 +20,12 @@ class Episode(models.Model):
     series = models.ForeignKey(Series, on_delete=models.CASCADE)
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
 
+    class Meta:
+        indexes = [
+            # 시리즈별 에피소드 목록을 정렬 없이 id 순서로 읽기 위한 인덱스 (crawler/ordering.py)
+            models.Index(fields=["series", "id"], name="episode_series_id_idx"),
+        ]
+
 
 class Comment(models.Model):
     id = models.IntegerField(primary_key=True)
@@ -45,3 +53,76 @@ class Comment(models.Model):
 
     series = models.ForeignKey(Series, on_delete=models.CASCADE)
     episode = models.ForeignKey(Episode, on_delete=models.CASCADE)
+
+    class Meta:
+        indexes = [
+            # 댓글 내용 부분 문자열 검색(icontains)용 trigram 인덱스 (crawler/search.py)
+            GinIndex(
+                OpClass(Upper("content"), name="gin_trgm_ops"),
+                name="comment_content_trgm",
+            ),
+            # 에피소드별 댓글 목록 정렬용 인덱스 (crawler/ordering.py)
+            models.Index(fields=["episode", "id"], name="comment_episode_id_idx"),
+            models.Index(
+                fields=["episode", "created_at", "id"],
+                name="comment_episode_created_idx",
+            ),
+            models.Index(
+                fields=["episode", "like_count", "id"],
+                name="comment_episode_like_idx",
+            ),
+        ]
+
+
+class CrawlJob(models.Model):
+    """
+    시리즈 전체 댓글 크롤링 작업 (crawler/jobs.py)
+    댓글 페이지를 저장할 때마다, 에피소드 하나가 끝날 때마다 진행 상황이 갱신됩니다.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending"
+        RUNNING = "running"
+        DONE = "done"  # 모든 에피소드 처리 완료 (일부 에피소드 오류는 errors에 기록)
+        FAILED = "failed"  # 작업이 중단되었거나 모든 에피소드가 실패함
+
+    series = models.ForeignKey(
+        Series, on_delete=models.CASCADE, related_name="crawl_jobs"
+    )
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    total_episodes = models.IntegerField(default=0)
+    done_episodes = models.IntegerField(default=0)  # 오류, 건너뛴 에피소드 포함
+    comments_inserted = models.IntegerField(default=0)
+    # [{"episode": 에피소드 ID, "error": 예외 종류, "detail": 메시지}, ...]
+    errors = models.JSONField(default=list)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"CrawlJob {self.id} (Series {self.series_id}, {self.status})"
+
+
+class CommentCrawlCheckpoint(models.Model):
+    """
+    중단된 에피소드 댓글 크롤링을 이어서 할 위치 (crawler/ingest.py)
+    댓글 한 페이지를 저장할 때 같은 트랜잭션에서 갱신되고, 마지막 페이지를 저장하면 삭제됩니다.
+    """
+
+    episode = models.OneToOneField(
+        Episode,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="crawl_checkpoint",
+    )
+    page = models.IntegerField(default=0)  # 다음에 가져올 페이지
+    last_comment_uid = models.IntegerField(null=True)  # 다음 요청의 lastCommentUid
+    saved_pages = models.IntegerField(default=0)  # 지금까지 저장한 페이지 수
+    inserted_count = models.IntegerField(default=0)  # 지금까지 저장한 댓글 수
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Checkpoint for Episode {self.episode_id} (page {self.page})"
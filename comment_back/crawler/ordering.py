@@ -0,0 +1,205 @@
+"""
+목록 조회의 정렬/필드 선택 허용 목록
+
+ordering, fields 파라미터를 order_by()/only()에 그대로 넘기면 인덱스가 없는 정렬로 큰 테이블을
+읽고 정렬하게 되거나, 없는 필드 이름에서 500이 납니다.
+뷰마다 허용하는 정렬과 그 정렬을 받쳐주는 인덱스(models.py의 Meta.indexes)를 선언해 두고
+
+- 등록된 정렬은 인덱스 순서 그대로(동점 처리용 id 포함) order_by에 넘기고
+- 등록되지 않은 정렬, 없는 필드는 400으로 거절합니다.
+
+OPTIONS 요청 응답의 list_parameters에 허용 정렬과 인덱스 사용 여부(fast)가 들어갑니다.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+from rest_framework.metadata import SimpleMetadata
+from rest_framework.response import Response
+
+
+class ListParameterError(ValueError):
+    """정렬/필드/count_mode 파라미터가 잘못되었을 때 발생하는 에러"""
+
+
+@dataclass(frozen=True)
+class Ordering:
+    order_by: tuple[str, ...]
+    # 필터 조건과 함께 이 순서를 그대로 읽을 수 있는 인덱스. None이면 DB에서 정렬(느림)
+    index: str | None = None
+
+    @property
+    def fast(self) -> bool:
+        return self.index is not None
+
+
+@dataclass(frozen=True)
+class ListQuerySpec:
+    orderings: dict[str, Ordering]
+    default_ordering: str
+    # 선택할 수 있는 필드. None이면 뷰 Serializer의 모든 필드
+    fields: tuple[str, ...] | None = None
+
+    def resolve_ordering(self, param: str | None) -> Ordering:
+        """
+        첫 정렬 필드로 등록된 정렬을 찾습니다.
+        뒤에 오는 필드는 등록된 순서와 같아야 하고, 동점 처리용 id만 방향이 달라도
+        인덱스 방향으로 바꿔서 허용합니다. (순서가 같은 행들 사이의 순서만 다름)
+        """
+        terms = [term.strip() for term in (param or "").split(",") if term.strip()]
+        if not terms:
+            return self.orderings[self.default_ordering]
+
+        ordering = self.orderings.get(terms[0])
+        if ordering is None:
+            raise ListParameterError(
+                f"지원하지 않는 정렬입니다: {terms[0]} "
+                f"(가능한 정렬: {', '.join(self.orderings)})"
+            )
+        rest = terms[1:]
+        if rest and rest != list(ordering.order_by[1 : len(terms)]):
+            if rest not in (["id"], ["-id"]) or len(ordering.order_by) < 2:
+                raise ListParameterError(
+                    f"지원하지 않는 정렬 조합입니다: {','.join(terms)} "
+                    f"({terms[0]} 정렬은 {','.join(ordering.order_by)} 순서로만 가능)"
+                )
+        return ordering
+
+    def resolve_fields(
+        self, param: str | None, allowed: tuple[str, ...]
+    ) -> tuple[str, ...]:
+        fields = tuple(
+            dict.fromkeys(
+                name.strip() for name in (param or "").split(",") if name.strip()
+            )
+        )
+        unknown = [name for name in fields if name not in allowed]
+        if unknown:
+            raise ListParameterError(
+                f"지원하지 않는 필드입니다: {', '.join(unknown)} "
+                f"(가능한 필드: {', '.join(allowed)})"
+            )
+        return fields
+
+    def describe(self, allowed: tuple[str, ...]) -> dict:
+        return {
+            "default_ordering": self.default_ordering,
+            "orderings": [
+                {
+                    "ordering": name,
+                    "order_by": list(ordering.order_by),
+                    "index": ordering.index,
+                    "fast": ordering.fast,
+                }
+                for name, ordering in self.orderings.items()
+            ],
+            "fields": list(allowed),
+        }
+
+
+def indexed(name: str, index: str, *tiebreak: str) -> dict[str, Ordering]:
+    """name 오름차순/내림차순 정렬을 같은 인덱스(정방향/역방향 스캔)로 등록"""
+    ascending = (name, *tiebreak)
+    descending = tuple(f"-{column}" for column in ascending)
+    return {
+        name: Ordering(ascending, index),
+        f"-{name}": Ordering(descending, index),
+    }
+
+
+def unindexed(name: str, *tiebreak: str) -> dict[str, Ordering]:
+    ascending = (name, *tiebreak)
+    return {
+        name: Ordering(ascending),
+        f"-{name}": Ordering(tuple(f"-{column}" for column in ascending)),
+    }
+
+
+SERIES_LIST_SPEC = ListQuerySpec(
+    orderings={
+        **indexed("id", "crawler_series_pkey"),
+        # 시리즈 수가 많지 않아 정렬 비용이 작음
+        **unindexed("title", "id"),
+    },
+    default_ordering="id",
+)
+
+EPISODE_LIST_SPEC = ListQuerySpec(
+    orderings={
+        **indexed("id", "episode_series_id_idx"),
+        # 시리즈 한 개의 에피소드만 정렬
+        **unindexed("name", "id"),
+    },
+    default_ordering="id",
+)
+
+COMMENT_LIST_SPEC = ListQuerySpec(
+    orderings={
+        **indexed("id", "comment_episode_id_idx"),
+        **indexed("created_at", "comment_episode_created_idx", "id"),
+        **indexed("like_count", "comment_episode_like_idx", "id"),
+        **unindexed("ai_emotion_score", "id"),
+    },
+    default_ordering="id",
+)
+
+
+@lru_cache(maxsize=None)
+def serializer_field_names(serializer_class) -> tuple[str, ...]:
+    return tuple(serializer_class().fields)
+
+
+class ListQuerySpecMetadata(SimpleMetadata):
+    def determine_metadata(self, request, view):
+        metadata = super().determine_metadata(request, view)
+        metadata["list_parameters"] = view.list_spec.describe(view.get_allowed_fields())
+        return metadata
+
+
+class ListQuerySpecMixin:
+    """
+    list_spec에 선언된 정렬/필드만 허용하는 목록 조회 뷰 믹스인.
+    get_queryset에서 apply_list_params(queryset)를 호출합니다.
+    """
+
+    list_spec: ListQuerySpec
+    metadata_class = ListQuerySpecMetadata
+
+    def get_allowed_fields(self) -> tuple[str, ...]:
+        return self.list_spec.fields or serializer_field_names(
+            self.get_serializer_class()
+        )
+
+    def get_requested_fields(self) -> tuple[str, ...]:
+        return self.list_spec.resolve_fields(
+            self.request.query_params.get("fields"), self.get_allowed_fields()
+        )
+
+    def apply_list_params(self, queryset):
+        ordering = self.list_spec.resolve_ordering(
+            self.request.query_params.get("ordering")
+        )
+        queryset = queryset.order_by(*ordering.order_by)
+        fields = self.get_requested_fields()
+        if fields:
+            queryset = queryset.only(*fields)
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_requested_fields()
+        if fields:
+            kwargs["fields"] = fields
+        return super().get_serializer(*args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        try:
+            return super().list(request, *args, **kwargs)
+        except ListParameterError as e:
+            return Response(
+                {
+                    "error_code": "INVALID_LIST_PARAMETER",
+                    "message": "목록 조회 파라미터가 잘못되었습니다.",
+                    "detail": str(e),
+                },
+                status=400,
+            )
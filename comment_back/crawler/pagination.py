@@ -1,16 +1,46 @@
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from collections import OrderedDict
+import json
 from typing import Any, Union
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from django.db import connections
 from django.db.models import QuerySet
 from rest_framework.request import Request
 
+from .ordering import ListParameterError
+
+COUNT_MODES = ("exact", "estimated", "cached")
+
+
+def estimate_count(queryset: QuerySet) -> int | None:
+    """
+    PostgreSQL 플래너 통계(EXPLAIN)로 추정한 행 수. 쿼리는 실행하지 않습니다.
+    PostgreSQL이 아니면 None
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
 
 class OptionalCountPagination(PageNumberPagination):
     """
     페이지네이션 클래스로, include_count 파라미터가 있을 때만 전체 개수를 계산합니다.
     count 쿼리 자체를 피하기 위해 커스텀 로직을 구현합니다.
+
+    count_mode 파라미터로 전체 개수를 구하는 방법을 고를 수 있습니다. (지정하면 include_count=true)
+    - exact: COUNT(*) (기본값)
+    - estimated: PostgreSQL 플래너 통계로 추정한 값. 큰 테이블에서도 즉시 응답
+    - cached: 뷰가 관리하는 카운터 값 (뷰의 get_cached_count())
+    사용할 수 없는 방법이면 cached → estimated → exact 순서로 대신 사용하고,
+    응답의 count_mode에 실제로 사용한 방법을 넣습니다. 목록에 없는 count_mode는 400으로 거절합니다.
     """
 
     page_size = 20
@@ -47,14 +77,18 @@ class OptionalCountPagination(PageNumberPagination):
         except (TypeError, ValueError):
             page_number = 1
 
-        # include_count 파라미터 확인
-        include_count = request.query_params.get("include_count", "").lower() in (
-            "true",
-            "1",
-            "yes",
-        )
-
-        if include_count:
+        self.count = None
+        self.count_mode = self.get_count_mode(request)
+        if self.count_mode == "cached":
+            self.count = self._get_cached_count(view)
+            if self.count is None:
+                self.count_mode = "estimated"
+        if self.count_mode == "estimated":
+            self.count = estimate_count(queryset)
+            if self.count is None:
+                self.count_mode = "exact"
+
+        if self.count_mode == "exact":
             # count가 필요한 경우 기본 페이지네이션 사용
             paginator = Paginator(queryset, page_size_int)
             try:
@@ -63,6 +97,7 @@ class OptionalCountPagination(PageNumberPagination):
                 self.page = paginator.page(1)
             except EmptyPage:
                 self.page = paginator.page(paginator.num_pages)
+            self.count = paginator.count
         else:
             # count가 필요하지 않은 경우 커스텀 로직 사용
             self.page = self._get_page_without_count(
@@ -71,6 +106,31 @@ class OptionalCountPagination(PageNumberPagination):
 
         return list(self.page)
 
+    def get_count_mode(self, request: Request) -> str | None:
+        """
+        전체 개수를 구할 방법. 개수가 필요 없으면 None
+        지원하지 않는 count_mode이면 ListParameterError (뷰에서 400 INVALID_LIST_PARAMETER)
+        """
+        count_mode = request.query_params.get("count_mode", "").lower()
+        if count_mode in COUNT_MODES:
+            return count_mode
+        if count_mode:
+            raise ListParameterError(
+                f"지원하지 않는 count_mode입니다: {count_mode} "
+                f"(가능한 값: {', '.join(COUNT_MODES)})"
+            )
+        include_count = request.query_params.get("include_count", "").lower() in (
+            "true",
+            "1",
+            "yes",
+        )
+        return "exact" if include_count else None
+
+    @staticmethod
+    def _get_cached_count(view) -> int | None:
+        get_cached_count = getattr(view, "get_cached_count", None)
+        return get_cached_count() if get_cached_count else None
+
     def _get_page_without_count(self, queryset, page_number: int, page_size: int):
         """
         count 쿼리 없이 페이지를 가져오는 메서드
@@ -93,31 +153,19 @@ class OptionalCountPagination(PageNumberPagination):
         return CustomPage(page_items, page_number, page_size, has_next, start_index > 0)
 
     def get_paginated_response(self, data):
-        # include_count 파라미터 확인
-        include_count = self.request.query_params.get("include_count", "").lower() in (
-            "true",
-            "1",
-            "yes",
-        )
-
         response_data: OrderedDict[str, Any] = OrderedDict(
             [
                 ("next", self.get_next_link()),
                 ("previous", self.get_previous_link()),
-                ("results", data),
             ]
         )
 
-        # include_count가 True일 때만 count 추가 (일반 Django Page 객체인 경우만)
-        if include_count:
-            # CustomPage 객체가 아닌 경우에만 count 추가
-            if (
-                not isinstance(self.page, CustomPage)
-                and hasattr(self.page, "paginator")
-                and hasattr(self.page.paginator, "count")
-            ):
-                response_data["count"] = self.page.paginator.count
-                response_data.move_to_end("results")
+        # 개수를 요청했을 때만 count와 사용한 방법(count_mode) 추가
+        # (orjson은 move_to_end 순서를 따르지 않으므로 results 앞에 먼저 넣음)
+        if self.count is not None:
+            response_data["count"] = self.count
+            response_data["count_mode"] = self.count_mode
+        response_data["results"] = data
 
         return Response(response_data)
 
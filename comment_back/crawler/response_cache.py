@@ -0,0 +1,131 @@
+"""
+읽기 전용 조회 응답 캐시
+
+시리즈/에피소드/댓글 조회 응답(JSON)을 렌더링된 바이트 그대로 캐시합니다.
+캐시 키에 에피소드/시리즈 세대(generations.py)가 들어가므로 크롤링이나 AI 분석으로 데이터가 바뀌면
+바뀐 에피소드/시리즈의 응답만 무효화되고, 그 전까지는 DB를 거치지 않고 응답합니다.
+응답에는 ETag를 붙이고 If-None-Match가 같으면 본문 없이 304를 반환합니다.
+여러 워커가 프로세스 로컬 캐시를 쓰면 다른 워커의 무효화를 알 수 없으므로 캐시하지 않습니다.
+
+    class CommentListView(ListAPIView):
+        @cache_response("episode", "product_id")
+        def get(self, request, *args, **kwargs):
+            return super().get(request, *args, **kwargs)
+"""
+
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, set_response_etag
+
+from utils.metrics import counter
+
+from .generations import generations_are_shared, get_generation
+
+RESPONSE_CACHE_KEY_PREFIX = "response"
+# 응답 내용을 바꾸는 쿼리 파라미터. 나머지 파라미터는 캐시 키에서 무시
+CACHE_QUERY_PARAMS = (
+    "fields",
+    "ordering",
+    "page",
+    "page_size",
+    "include_count",
+    "count_mode",
+)
+
+RESPONSE_CACHE_REQUESTS = counter(
+    "response_cache_requests_total",
+    "조회 응답 캐시 사용 결과 (hit, miss, not_modified, bypass)",
+    ["view", "result"],
+)
+
+
+def _normalize(name: str, value: str) -> str:
+    """같은 응답을 돌려주는 파라미터 값을 하나로 맞춤"""
+    if name == "fields":
+        # 응답의 필드 순서는 요청 순서가 아니라 Serializer 정의 순서를 따름
+        return ",".join(sorted({field for field in value.split(",") if field}))
+    if name == "page":
+        return str(int(value)) if value.isdigit() else value or "1"
+    if name == "page_size":
+        return str(int(value)) if value.isdigit() else value
+    if name == "include_count":
+        return str(value.lower() in ("true", "1", "yes"))
+    if name == "count_mode":
+        return value.lower()
+    return value
+
+
+def make_key(view_name: str, kind: str, object_id: int, request) -> str:
+    # 세대를 먼저 읽으므로 조회 도중 바뀐 데이터는 이전 세대 키에 저장되고 다음 요청에서 새로 조회됨
+    generation = get_generation(kind, object_id)
+    params = "&".join(
+        f"{name}={_normalize(name, request.query_params.get(name, ''))}"
+        for name in CACHE_QUERY_PARAMS
+    )
+    # 페이지 링크(next/previous)가 절대 URL이라 호스트도 키에 포함
+    digest = hashlib.md5(
+        f"{request.scheme}://{request.get_host()}?{params}".encode()
+    ).hexdigest()
+    return f"{RESPONSE_CACHE_KEY_PREFIX}:{view_name}:{object_id}:{generation}:{digest}"
+
+
+def cache_response(kind: str, url_kwarg: str):
+    """
+    GET 핸들러의 200 JSON 응답을 캐시하는 데코레이터.
+    kind는 세대 종류("episode"/"series"), url_kwarg는 그 ID가 들어있는 URL 파라미터 이름입니다.
+    """
+
+    def decorator(get):
+        @wraps(get)
+        def wrapper(view, request, *args, **kwargs):
+            view_name = type(view).__name__
+            # 브라우저블 API(HTML)는 로그인 사용자/CSRF 토큰이 들어가므로 캐시하지 않음
+            # 세대 카운터를 워커끼리 공유하지 않으면 다른 워커의 무효화를 모르므로 캐시하지 않음
+            if (
+                request.accepted_renderer.format != "json"
+                or not generations_are_shared()
+            ):
+                RESPONSE_CACHE_REQUESTS.inc(view=view_name, result="bypass")
+                return get(view, request, *args, **kwargs)
+
+            key = make_key(view_name, kind, kwargs[url_kwarg], request)
+            entry = cache.get(key)
+            if entry is not None:
+                etag, content, content_type = entry
+                response = HttpResponse(content, content_type=content_type)
+                response["ETag"] = etag
+                response = get_conditional_response(
+                    request, etag=etag, response=response
+                )
+                RESPONSE_CACHE_REQUESTS.inc(
+                    view=view_name,
+                    result="not_modified" if response.status_code == 304 else "hit",
+                )
+                return response
+
+            RESPONSE_CACHE_REQUESTS.inc(view=view_name, result="miss")
+            response = get(view, request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+
+            def store(rendered):
+                set_response_etag(rendered)
+                etag = rendered["ETag"]
+                cache.set(
+                    key,
+                    (etag, rendered.content, rendered["Content-Type"]),
+                    settings.RESPONSE_CACHE_TTL,
+                )
+                return get_conditional_response(request, etag=etag, response=rendered)
+
+            # 렌더링은 뷰가 끝난 뒤 Django가 하므로 렌더링된 바이트는 콜백에서 저장
+            response.add_post_render_callback(store)
+            return response
+
+        return wrapper
+
+    return decorator
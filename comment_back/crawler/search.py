@@ -0,0 +1,221 @@
+"""
+댓글 내용 검색
+
+PostgreSQL pg_trgm의 trigram GIN 인덱스(UPPER(content) gin_trgm_ops)로 부분 문자열 검색을 합니다.
+한국어는 형태소 분석 없이는 전문 검색(tsvector) 토큰이 제대로 나뉘지 않기 때문에
+글자 단위 trigram으로 '%검색어%' 조건을 인덱스에서 바로 찾습니다. 3글자 이상 검색어에서 효과가 큽니다.
+
+결과는 keyset(커서) 방식으로 페이지를 나누므로 뒤쪽 페이지도 OFFSET 없이 같은 속도로 조회됩니다.
+"""
+
+import base64
+import binascii
+import json
+import re
+from typing import Any
+
+from django.db import connection
+from django.db.models import F, Q, QuerySet
+
+from .mixins import get_values_renderer
+from .models import Comment
+from .serializers import CommentSerializer
+
+SEARCH_FIELDS = (
+    "id",
+    "content",
+    "created_at",
+    "is_best",
+    "like_count",
+    "user_name",
+    "ai_emotion_score",
+    "is_spam",
+    "episode",
+)
+SEARCH_ORDERINGS = ("recent", "relevance")
+SEARCH_MAX_QUERY_LENGTH = 100
+SEARCH_DEFAULT_PAGE_SIZE = 20
+SEARCH_MAX_PAGE_SIZE = 100
+
+
+class SearchParameterError(ValueError):
+    """검색 파라미터가 잘못되었을 때 발생하는 에러"""
+
+
+def supports_relevance() -> bool:
+    """유사도 정렬은 pg_trgm이 있는 PostgreSQL에서만 가능"""
+    return connection.vendor == "postgresql"
+
+
+def _parse_bool(name: str, value: str | None) -> bool | None:
+    if value is None or value == "":
+        return None
+    if value.lower() in ("true", "1", "yes"):
+        return True
+    if value.lower() in ("false", "0", "no"):
+        return False
+    raise SearchParameterError(f"{name}는 true/false여야 합니다: {value}")
+
+
+def _parse_int(name: str, value: str | None) -> int | None:
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise SearchParameterError(f"{name}는 정수여야 합니다: {value}") from None
+
+
+def encode_cursor(values: list[Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor: str | None) -> list[Any] | None:
+    if not cursor:
+        return None
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError):
+        raise SearchParameterError("cursor가 잘못되었습니다.") from None
+    if not isinstance(values, list) or not all(
+        isinstance(value, (int, float)) for value in values
+    ):
+        raise SearchParameterError("cursor가 잘못되었습니다.")
+    return values
+
+
+def parse_search_params(query_params) -> dict[str, Any]:
+    """요청 쿼리 파라미터를 검증해서 search_comments 인자로 변환"""
+    query = query_params.get("q", "").strip()
+    if not query:
+        raise SearchParameterError("검색어(q)가 필요합니다.")
+    if len(query) > SEARCH_MAX_QUERY_LENGTH:
+        raise SearchParameterError(
+            f"검색어는 {SEARCH_MAX_QUERY_LENGTH}자 이하여야 합니다."
+        )
+
+    ordering = query_params.get("order", "recent")
+    if ordering not in SEARCH_ORDERINGS:
+        raise SearchParameterError(f"지원하지 않는 정렬입니다: {ordering}")
+
+    page_size = _parse_int("page_size", query_params.get("page_size"))
+    if page_size is None:
+        page_size = SEARCH_DEFAULT_PAGE_SIZE
+    if not 1 <= page_size <= SEARCH_MAX_PAGE_SIZE:
+        raise SearchParameterError(
+            f"page_size는 1~{SEARCH_MAX_PAGE_SIZE} 사이여야 합니다."
+        )
+
+    return {
+        "query": query,
+        "ordering": ordering,
+        "page_size": page_size,
+        "cursor": decode_cursor(query_params.get("cursor")),
+        "is_best": _parse_bool("is_best", query_params.get("is_best")),
+        "is_spam": _parse_bool("is_spam", query_params.get("is_spam")),
+        "min_score": _parse_int("min_score", query_params.get("min_score")),
+        "max_score": _parse_int("max_score", query_params.get("max_score")),
+    }
+
+
+def get_search_queryset(
+    query: str,
+    episode_id: int | None = None,
+    series_id: int | None = None,
+    is_best: bool | None = None,
+    is_spam: bool | None = None,
+    min_score: int | None = None,
+    max_score: int | None = None,
+) -> QuerySet:
+    """
+    검색어와 필터를 적용한 쿼리셋.
+    icontains는 PostgreSQL에서 UPPER(content) LIKE UPPER('%검색어%')가 되어
+    comment_content_trgm 인덱스를 사용합니다.
+    """
+    queryset = Comment.objects.filter(content__icontains=query)
+    if episode_id is not None:
+        queryset = queryset.filter(episode=episode_id)
+    if series_id is not None:
+        queryset = queryset.filter(series=series_id)
+    if is_best is not None:
+        queryset = queryset.filter(is_best=is_best)
+    if is_spam is not None:
+        queryset = queryset.filter(is_spam=is_spam)
+    if min_score is not None:
+        queryset = queryset.filter(ai_emotion_score__gte=min_score)
+    if max_score is not None:
+        queryset = queryset.filter(ai_emotion_score__lte=max_score)
+    return queryset
+
+
+def _apply_ordering(
+    queryset: QuerySet, query: str, ordering: str, cursor: list[Any] | None
+) -> QuerySet:
+    if ordering == "relevance" and supports_relevance():
+        from django.contrib.postgres.search import TrigramWordSimilarity
+
+        queryset = queryset.annotate(rank=TrigramWordSimilarity(query, "content"))
+        if cursor is not None:
+            if len(cursor) != 2:
+                raise SearchParameterError("cursor가 정렬 방식과 맞지 않습니다.")
+            rank, last_id = cursor
+            queryset = queryset.filter(Q(rank__lt=rank) | Q(rank=rank, id__lt=last_id))
+        return queryset.order_by(F("rank").desc(), "-id")
+
+    if cursor is not None:
+        if not cursor:
+            raise SearchParameterError("cursor가 잘못되었습니다.")
+        queryset = queryset.filter(id__lt=cursor[-1])
+    return queryset.order_by("-id")
+
+
+def get_highlights(content: str, query: str) -> list[list[int]]:
+    """content에서 검색어가 나오는 [시작, 끝) 위치 목록 (대소문자 무시)"""
+    return [
+        [match.start(), match.end()]
+        for match in re.finditer(re.escape(query), content, re.IGNORECASE)
+    ]
+
+
+def search_comments(
+    query: str,
+    ordering: str = "recent",
+    page_size: int = SEARCH_DEFAULT_PAGE_SIZE,
+    cursor: list[Any] | None = None,
+    **filters,
+) -> dict[str, Any]:
+    """
+    댓글을 검색해서 한 페이지를 반환합니다.
+
+    Returns:
+        {"results": [...], "next_cursor": 다음 페이지 커서 또는 None}
+        각 결과에는 rank(유사도, relevance 정렬일 때만)와 highlights가 포함됩니다.
+    """
+    renderer = get_values_renderer(CommentSerializer, SEARCH_FIELDS)
+    queryset = _apply_ordering(
+        get_search_queryset(query, **filters), query, ordering, cursor
+    )
+    has_rank = "rank" in queryset.query.annotations
+    columns = [*renderer.columns, "rank"] if has_rank else renderer.columns
+
+    rows = list(queryset.values_list(*columns)[: page_size + 1])
+    has_next = len(rows) > page_size
+    rows = rows[:page_size]
+
+    ranks = [row[-1] for row in rows] if has_rank else [None] * len(rows)
+    if has_rank:
+        rows = [row[:-1] for row in rows]
+
+    results = []
+    for record, rank in zip(renderer.iter_render(rows), ranks):
+        record["rank"] = rank
+        record["highlights"] = get_highlights(record["content"], query)
+        results.append(record)
+
+    next_cursor = None
+    if has_next:
+        last = results[-1]
+        next_cursor = encode_cursor(
+            [last["rank"], last["id"]] if has_rank else [last["id"]]
+        )
+    return {"results": results, "next_cursor": next_cursor}
@@ -85,3 +85,9 @@ class CommentCountSerializer(serializers.Serializer):
         if not Episode.objects.filter(id=value).exists():
             raise serializers.ValidationError("해당 에피소드 ID는 존재하지 않습니다.")
         return value
+
+
+class CrawlJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CrawlJob
+        fields = "__all__"
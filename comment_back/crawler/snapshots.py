@@ -0,0 +1,297 @@
+"""
+분석용 댓글 컬럼형 스냅샷 (Parquet)
+
+시리즈마다 에피소드 단위로 파티션된 압축 Parquet 파일을 만듭니다.
+
+    <COMMENT_SNAPSHOT_DIR>/series=<시리즈 ID>/_manifest.json
+    <COMMENT_SNAPSHOT_DIR>/series=<시리즈 ID>/episode=<에피소드 ID>/part-<첫 ID>-<마지막 ID>.parquet
+
+다시 실행하면 변경된 에피소드만 처리합니다. 새 댓글만 늘어난 에피소드는 새 part 파일을 덧붙이고,
+AI 분석 결과가 바뀌었거나 댓글이 삭제된 에피소드는 파티션을 다시 씁니다.
+part 파일은 임시 파일에 쓴 뒤 os.replace로 옮기고, 매니페스트를 갱신한 다음에 더 이상 쓰지 않는 파일을 지우므로
+중간에 실패해도 매니페스트가 가리키는 파일은 항상 남아 있습니다.
+분석 작업은 load_series_snapshot으로 파일을 memory-map해서 읽으므로 API 서버를 거치지 않습니다.
+
+pyarrow는 선택 의존성입니다 (pip install pyarrow).
+"""
+
+import json
+import os
+import shutil
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable
+
+from django.conf import settings
+from django.db.models import Count, Max, Q
+
+from .models import Comment
+
+SNAPSHOT_COLUMNS = (
+    "id",
+    "episode",
+    "created_at",
+    "like_count",
+    "is_best",
+    "ai_emotion_score",
+    "is_spam",
+)
+SNAPSHOT_BATCH_SIZE = 50000  # Parquet row group 하나에 들어가는 행 수
+SNAPSHOT_COMPRESSION = "zstd"
+MANIFEST_NAME = "_manifest.json"
+
+
+class SnapshotDependencyError(ImportError):
+    """pyarrow가 설치되어 있지 않을 때 발생하는 에러"""
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise SnapshotDependencyError(
+            "스냅샷 기능을 사용하려면 pyarrow를 설치해야 합니다."
+        ) from e
+    return pyarrow, pyarrow.parquet
+
+
+def get_schema():
+    pa, _ = _import_pyarrow()
+    return pa.schema(
+        [
+            ("id", pa.int64()),
+            ("episode", pa.int64()),
+            ("created_at", pa.timestamp("us", tz="UTC")),
+            ("like_count", pa.int32()),
+            ("is_best", pa.bool_()),
+            ("ai_emotion_score", pa.int16()),
+            ("is_spam", pa.bool_()),
+        ]
+    )
+
+
+def get_snapshot_dir(series_id: int, base_dir: str | Path | None = None) -> Path:
+    base_dir = Path(base_dir or settings.COMMENT_SNAPSHOT_DIR)
+    return base_dir / f"series={series_id}"
+
+
+def get_episode_fingerprints(series_id: int) -> dict[int, dict[str, Any]]:
+    """에피소드별 변경 감지용 집계 (쿼리 1번)"""
+    rows = (
+        Comment.objects.filter(series=series_id)
+        .values("episode")
+        .annotate(
+            count=Count("id"),
+            max_id=Max("id"),
+            processed_count=Count("id", filter=Q(is_ai_processed=True)),
+            max_ai_processed_at=Max("ai_processed_at"),
+        )
+        .order_by()
+    )
+    return {
+        row["episode"]: {
+            "count": row["count"],
+            "max_id": row["max_id"],
+            "processed_count": row["processed_count"],
+            "max_ai_processed_at": (
+                row["max_ai_processed_at"].isoformat()
+                if row["max_ai_processed_at"]
+                else None
+            ),
+        }
+        for row in rows
+    }
+
+
+def _read_manifest(snapshot_dir: Path) -> dict[str, Any]:
+    path = snapshot_dir / MANIFEST_NAME
+    if not path.exists():
+        return {"episodes": {}}
+    return json.loads(path.read_text())
+
+
+def _write_manifest(snapshot_dir: Path, manifest: dict[str, Any]) -> None:
+    path = snapshot_dir / MANIFEST_NAME
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(tmp_path, path)
+
+
+def _batched(rows: Iterable[tuple], size: int) -> Iterable[list[tuple]]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _write_part(episode_dir: Path, rows: Iterable[tuple]) -> str | None:
+    """행들을 part 파일 하나로 쓰고 파일명을 반환. 행이 없으면 None"""
+    pa, pq = _import_pyarrow()
+    schema = get_schema()
+    tmp_path = episode_dir / "part.tmp"
+    first_id = last_id = None
+
+    writer = None
+    try:
+        for batch in _batched(rows, SNAPSHOT_BATCH_SIZE):
+            columns = list(zip(*batch))
+            table = pa.Table.from_arrays(
+                [
+                    pa.array(column, type=field.type)
+                    for column, field in zip(columns, schema)
+                ],
+                schema=schema,
+            )
+            if writer is None:
+                episode_dir.mkdir(parents=True, exist_ok=True)
+                writer = pq.ParquetWriter(
+                    tmp_path, schema, compression=SNAPSHOT_COMPRESSION
+                )
+                first_id = batch[0][0]
+            writer.write_table(table)
+            last_id = batch[-1][0]
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        return None
+    name = f"part-{first_id}-{last_id}.parquet"
+    os.replace(tmp_path, episode_dir / name)
+    return name
+
+
+def _remove_unused_parts(episode_dir: Path, parts: list[str]) -> None:
+    """매니페스트에 없는 part 파일을 지우고, 남은 파일이 없으면 디렉터리도 지움"""
+    if not episode_dir.exists():
+        return
+    for path in episode_dir.iterdir():
+        if path.name not in parts:
+            path.unlink()
+    if not parts:
+        episode_dir.rmdir()
+
+
+def _iter_episode_rows(episode_id: int, after_id: int | None = None):
+    queryset = Comment.objects.filter(episode=episode_id)
+    if after_id is not None:
+        queryset = queryset.filter(id__gt=after_id)
+    return (
+        queryset.order_by("id")
+        .values_list(*SNAPSHOT_COLUMNS)
+        .iterator(chunk_size=SNAPSHOT_BATCH_SIZE)
+    )
+
+
+def _can_append(episode_id: int, old: dict[str, Any], new: dict[str, Any]) -> bool:
+    """
+    기존 댓글은 그대로이고 새 댓글만 추가된 경우.
+    댓글 삭제와 추가가 함께 일어나면 개수와 최대 ID만으로는 구분되지 않으므로
+    기존 최대 ID 이하의 댓글 수가 그대로인지 한 번 더 확인합니다.
+    """
+    return (
+        new["count"] > old["count"]
+        and new["max_id"] > old["max_id"]
+        and new["processed_count"] == old["processed_count"]
+        and new["max_ai_processed_at"] == old["max_ai_processed_at"]
+        and Comment.objects.filter(episode=episode_id, id__lte=old["max_id"]).count()
+        == old["count"]
+    )
+
+
+def write_series_snapshot(
+    series_id: int, base_dir: str | Path | None = None
+) -> dict[str, list[int]]:
+    """
+    시리즈의 스냅샷을 갱신합니다.
+
+    Returns:
+        {"appended": [...], "rewritten": [...], "removed": [...], "unchanged": [...]}
+        각 목록은 에피소드 ID입니다.
+    """
+    _import_pyarrow()
+    snapshot_dir = get_snapshot_dir(series_id, base_dir)
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    manifest = _read_manifest(snapshot_dir)
+    episodes = manifest["episodes"]
+    fingerprints = get_episode_fingerprints(series_id)
+    result = {"appended": [], "rewritten": [], "removed": [], "unchanged": []}
+
+    for episode_key in list(episodes):
+        if int(episode_key) not in fingerprints:
+            del episodes[episode_key]
+            result["removed"].append(int(episode_key))
+    if result["removed"]:
+        _write_manifest(snapshot_dir, manifest)
+        for episode_id in result["removed"]:
+            shutil.rmtree(snapshot_dir / f"episode={episode_id}", ignore_errors=True)
+
+    for episode_id, fingerprint in sorted(fingerprints.items()):
+        episode_dir = snapshot_dir / f"episode={episode_id}"
+        old = episodes.get(str(episode_id))
+
+        if old and old["fingerprint"] == fingerprint:
+            result["unchanged"].append(episode_id)
+            continue
+
+        if old and _can_append(episode_id, old["fingerprint"], fingerprint):
+            part = _write_part(
+                episode_dir,
+                _iter_episode_rows(episode_id, after_id=old["fingerprint"]["max_id"]),
+            )
+            parts = old["parts"] + ([part] if part else [])
+            result["appended"].append(episode_id)
+        else:
+            # 기존 파일은 새 매니페스트를 기록한 뒤에 지움
+            part = _write_part(episode_dir, _iter_episode_rows(episode_id))
+            parts = [part] if part else []
+            result["rewritten"].append(episode_id)
+
+        episodes[str(episode_id)] = {"fingerprint": fingerprint, "parts": parts}
+        # 에피소드마다 기록해서 중간에 실패해도 처리한 파티션은 다시 쓰지 않음
+        _write_manifest(snapshot_dir, manifest)
+        _remove_unused_parts(episode_dir, parts)
+
+    _write_manifest(snapshot_dir, manifest)
+    return result
+
+
+def load_series_snapshot(
+    series_id: int,
+    columns: Iterable[str] | None = None,
+    episodes: Iterable[int] | None = None,
+    base_dir: str | Path | None = None,
+):
+    """
+    시리즈 스냅샷을 memory-map으로 읽어 pyarrow.Table로 반환합니다.
+
+    Args:
+        columns: 읽을 컬럼 (기본: 전체)
+        episodes: 읽을 에피소드 ID (기본: 전체)
+    """
+    pa, pq = _import_pyarrow()
+    snapshot_dir = get_snapshot_dir(series_id, base_dir)
+    manifest = _read_manifest(snapshot_dir)
+    episode_keys = (
+        [str(episode_id) for episode_id in episodes]
+        if episodes is not None
+        else sorted(manifest["episodes"], key=int)
+    )
+    columns = list(columns) if columns is not None else None
+
+    tables = [
+        pq.read_table(
+            snapshot_dir / f"episode={episode_key}" / part,
+            columns=columns,
+            memory_map=True,
+        )
+        for episode_key in episode_keys
+        if episode_key in manifest["episodes"]
+        for part in manifest["episodes"][episode_key]["parts"]
+    ]
+    if not tables:
+        schema = get_schema()
+        if columns is not None:
+            schema = pa.schema([schema.field(name) for name in columns])
+        return schema.empty_table()
+    return pa.concat_tables(tables)
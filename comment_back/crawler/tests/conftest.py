@@ -0,0 +1,75 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from crawler.crawler import crawler
+
+
+def make_page(product_id: int, page: int, total: int) -> dict:
+    """에피소드마다 겹치지 않는 댓글 ID로 한 페이지(25개)를 만듦"""
+    base = (product_id % 1000) * 1000
+    start = page * crawler.ITEM_PER_PAGE
+    count = min(crawler.ITEM_PER_PAGE, total - start)
+    return {
+        "commentList": {
+            "totalCount": total,
+            "isEnd": start + count >= total,
+            "commentList": [
+                {
+                    "commentUid": base + start + i + 1,
+                    "comment": f"댓글 {start + i}",
+                    "createDt": "2025-07-11T15:47:38Z",
+                    "isBest": False,
+                    "userName": "독자",
+                    "userThumbnailUrl": "https://example.com/u.png",
+                    "userUid": 1,
+                    "likeCount": 0,
+                    "emoticon": None,
+                }
+                for i in range(count)
+            ],
+        }
+    }
+
+
+@pytest.fixture
+def fake_graphql():
+    """
+    에피소드별 댓글 수(totals)대로 응답하는 가짜 GraphQL 서버.
+    failing에 넣은 에피소드는 항상, fail_once에 넣은 (에피소드, page)는 한 번만 500을 반환합니다.
+    요청한 (에피소드, page, lastCommentUid)와 동시에 처리 중인 요청 수의 최댓값을 기록합니다.
+    """
+    state = {
+        "totals": {},
+        "failing": set(),
+        "fail_once": set(),
+        "requested": [],
+        "in_flight": 0,
+        "max_in_flight": 0,
+    }
+    get_async_client = crawler.get_async_client
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        variables = json.loads(request.content)["variables"]["commentListInput"]
+        product_id, page = variables["productId"], variables["page"]
+        state["requested"].append((product_id, page, variables["lastCommentUid"]))
+        if product_id in state["failing"] or (product_id, page) in state["fail_once"]:
+            state["fail_once"].discard((product_id, page))
+            return httpx.Response(500, json={"errors": [{"message": "down"}]})
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        return httpx.Response(
+            200, json={"data": make_page(product_id, page, state["totals"][product_id])}
+        )
+
+    with patch.object(
+        crawler,
+        "get_async_client",
+        lambda: get_async_client(transport=httpx.MockTransport(handler)),
+    ):
+        yield state
@@ -0,0 +1,128 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.management import call_command
+from django.test import AsyncClient
+from rest_framework.test import APIClient
+
+from crawler import exports
+from crawler.models import Comment
+from crawler.serializers import CommentSerializer
+
+
+def read_stream(response) -> bytes:
+    return b"".join(response.streaming_content)
+
+
+@pytest.mark.django_db
+class TestCommentExportView:
+    def test_ndjson_matches_serializer(self, episode, make_comments):
+        make_comments(30)
+        response = APIClient().get(f"/crawler/episode/{episode.id}/comment/export")
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert "comments_episode_" in response["Content-Disposition"]
+        lines = read_stream(response).decode().splitlines()
+        expected = CommentSerializer(Comment.objects.order_by("id"), many=True).data
+        assert [json.loads(line) for line in lines] == json.loads(json.dumps(expected))
+
+    def test_csv_gzip(self, series, episode, make_comments):
+        make_comments(12)
+        response = APIClient().get(
+            f"/crawler/series/{series.id}/comment/export",
+            {"export_format": "csv", "gzip": "true"},
+        )
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/gzip"
+        rows = list(
+            csv.DictReader(io.StringIO(gzip.decompress(read_stream(response)).decode()))
+        )
+        assert len(rows) == 12
+        assert rows[0]["content"] == "재밌어요 0 😀"
+        assert json.loads(rows[0]["emoticon"]) == {
+            "itemSubType": "EMOTICON",
+            "resourceId": 0,
+        }
+
+    def test_since_filter(self, episode, make_comments):
+        comments = make_comments(10)
+        since = comments[6].created_at.isoformat()
+        response = APIClient().get(
+            f"/crawler/episode/{episode.id}/comment/export", {"since": since}
+        )
+
+        ids = [json.loads(line)["id"] for line in read_stream(response).splitlines()]
+        assert ids == [comment.id for comment in comments[7:]]
+
+    def test_invalid_parameters(self, episode):
+        client = APIClient()
+        url = f"/crawler/episode/{episode.id}/comment/export"
+        assert client.get(url, {"since": "yesterday"}).status_code == 400
+        assert client.get(url, {"export_format": "xml"}).status_code == 400
+
+    def test_missing_episode(self, db):
+        response = APIClient().get("/crawler/episode/1/comment/export")
+        assert response.status_code == 404
+        assert response.data["error_code"] == "EPISODE_NOT_FOUND"
+
+
+@pytest.mark.django_db
+class TestCommentExportUnderASGI:
+    def test_streams_without_buffering(self, episode, make_comments, monkeypatch):
+        make_comments(30)
+        monkeypatch.setattr(exports, "EXPORT_CHUNK_SIZE", 10)
+        monkeypatch.setattr(exports, "EXPORT_BUFFER_SIZE", 1)
+        encoded = []
+        dumps = exports.dumps
+        monkeypatch.setattr(
+            exports, "dumps", lambda record: encoded.append(record) or dumps(record)
+        )
+
+        async def export():
+            response = await AsyncClient().get(
+                f"/crawler/episode/{episode.id}/comment/export"
+            )
+            chunks, encoded_before = [], []
+            async for chunk in response.streaming_content:
+                encoded_before.append(len(encoded))
+                chunks.append(chunk)
+            return response, chunks, encoded_before
+
+        response, chunks, encoded_before = async_to_sync(export)()
+
+        # 동기 이터레이터면 ASGI 핸들러가 sync_to_async(list)로 전체를 모은 뒤에 보냄
+        assert response.is_async
+        # 첫 조각은 첫 레코드만 변환한 시점에 나감
+        assert encoded_before[0] == 1
+        assert len(chunks) == 30
+        ids = [json.loads(line)["id"] for line in b"".join(chunks).splitlines()]
+        assert ids == list(range(1, 31))
+
+    def test_wsgi_uses_sync_stream(self, episode, make_comments):
+        make_comments(3)
+        response = APIClient().get(f"/crawler/episode/{episode.id}/comment/export")
+        assert not response.is_async
+        assert len(read_stream(response).splitlines()) == 3
+
+
+@pytest.mark.django_db
+def test_export_comments_command(tmp_path, episode, make_comments):
+    make_comments(5)
+    output = tmp_path / "comments.ndjson.gz"
+    call_command(
+        "export_comments",
+        "--episode",
+        str(episode.id),
+        "--gzip",
+        "--output",
+        str(output),
+    )
+
+    lines = gzip.decompress(output.read_bytes()).splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [1, 2, 3, 4, 5]
@@ -0,0 +1,102 @@
+import pytest
+from django.db import connection
+from rest_framework.test import APIClient
+
+from crawler.search import (
+    SearchParameterError,
+    decode_cursor,
+    encode_cursor,
+    get_highlights,
+    search_comments,
+)
+
+
+def test_highlights_ignore_case():
+    assert get_highlights("Abc 재밌 abc", "abc") == [[0, 3], [7, 10]]
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor([0.5, 10])) == [0.5, 10]
+    with pytest.raises(SearchParameterError):
+        decode_cursor("not-a-cursor")
+
+
+@pytest.mark.django_db
+class TestSearchComments:
+    def test_keyset_pages_cover_all_matches(self, episode, make_comments):
+        make_comments(25)
+        make_comments(5, start_id=100, content="다른 내용")
+
+        ids, cursor = [], None
+        while True:
+            page = search_comments("재밌어요", page_size=10, cursor=cursor)
+            ids += [row["id"] for row in page["results"]]
+            if page["next_cursor"] is None:
+                break
+            cursor = decode_cursor(page["next_cursor"])
+
+        assert ids == list(range(25, 0, -1))
+
+    def test_filters(self, episode, make_comments):
+        comments = make_comments(40)
+        results = search_comments(
+            "재밌어요", page_size=100, is_best=True, min_score=10
+        )["results"]
+
+        expected = {
+            c.id
+            for c in comments
+            if c.is_best and c.ai_emotion_score is not None and c.ai_emotion_score >= 10
+        }
+        assert {row["id"] for row in results} == expected
+
+    def test_result_shape(self, episode, make_comments):
+        make_comments(1, start_id=7)
+        [row] = search_comments("어요 0")["results"]
+        assert row["content"] == "재밌어요 0 😀"
+        assert row["highlights"] == [[2, 6]]
+        assert row["episode"] == episode.id
+
+    @pytest.mark.skipif(connection.vendor != "postgresql", reason="pg_trgm 유사도 정렬")
+    def test_relevance_ordering(self, episode, make_comments):
+        make_comments(1, start_id=1, content="주인공 최고")
+        make_comments(1, start_id=2, content="오늘 주인공이 나온 장면이 정말 길었다")
+        page = search_comments("주인공 최고", ordering="relevance")
+        assert [row["id"] for row in page["results"]] == [1]
+        assert page["results"][0]["rank"] > 0
+
+    @pytest.mark.skipif(connection.vendor != "postgresql", reason="pg_trgm GIN 인덱스")
+    def test_trigram_index_definition(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexdef FROM pg_indexes WHERE indexname = %s",
+                ["comment_content_trgm"],
+            )
+            [(indexdef,)] = cursor.fetchall()
+        assert "USING gin (upper(content) gin_trgm_ops)" in indexdef
+
+
+@pytest.mark.django_db
+class TestCommentSearchView:
+    def test_series_search(self, series, episode, make_comments):
+        make_comments(5)
+        response = APIClient().get(
+            f"/crawler/series/{series.id}/comment/search", {"q": "재밌"}
+        )
+        assert response.status_code == 200
+        assert len(response.json()["results"]) == 5
+
+    @pytest.mark.parametrize(
+        "params",
+        [{}, {"q": "a", "order": "random"}, {"q": "a", "min_score": "x"}],
+    )
+    def test_invalid_parameters(self, episode, params):
+        response = APIClient().get(
+            f"/crawler/episode/{episode.id}/comment/search", params
+        )
+        assert response.status_code == 400
+        assert response.json()["error_code"] == "INVALID_SEARCH_PARAMETER"
+
+    def test_missing_episode(self, db):
+        response = APIClient().get("/crawler/episode/1/comment/search", {"q": "a"})
+        assert response.status_code == 404
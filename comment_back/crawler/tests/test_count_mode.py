@@ -0,0 +1,126 @@
+import json
+from unittest import mock
+
+import pytest
+from django.db import connection
+from rest_framework.test import APIClient
+
+from crawler.models import Comment
+from crawler.pagination import estimate_count
+from llm.stats import refresh_episode_sentiment_stats
+
+
+def analyze_comments():
+    """테스트 트랜잭션 안에서 넣은 댓글로 플래너 통계를 갱신"""
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {Comment._meta.db_table}")
+
+
+@pytest.mark.django_db
+class TestCountMode:
+    def url(self, episode):
+        return f"/crawler/episode/{episode.id}/comment"
+
+    def test_include_count_is_exact(self, episode, make_comments):
+        make_comments(25)
+        data = APIClient().get(self.url(episode), {"include_count": "true"}).json()
+
+        assert data["count"] == 25
+        assert data["count_mode"] == "exact"
+        assert list(data)[-1] == "results"
+
+    def test_no_count_by_default(self, episode, make_comments):
+        make_comments(3)
+        data = APIClient().get(self.url(episode)).json()
+
+        assert "count" not in data
+        assert "count_mode" not in data
+
+    def test_cached_uses_episode_stats(
+        self, episode, make_comments, django_assert_num_queries
+    ):
+        make_comments(5)
+        refresh_episode_sentiment_stats(episode.id)
+        # 집계 갱신 전에 추가된 댓글은 cached 개수에 반영되지 않음
+        make_comments(2, start_id=100)
+
+        with django_assert_num_queries(2):
+            data = APIClient().get(self.url(episode), {"count_mode": "cached"}).json()
+        assert data["count"] == 5
+        assert data["count_mode"] == "cached"
+        assert len(data["results"]) == 7
+
+    def test_cached_falls_back_without_stats(self, episode, make_comments):
+        make_comments(4)
+        # 플래너 추정이 없는 DB라면 exact까지 내려감
+        with mock.patch("crawler.pagination.estimate_count", return_value=None):
+            data = APIClient().get(self.url(episode), {"count_mode": "cached"}).json()
+
+        assert data["count"] == 4
+        assert data["count_mode"] == "exact"
+
+    @pytest.mark.skipif(connection.vendor != "postgresql", reason="플래너 추정")
+    def test_cached_falls_back_to_estimated(self, episode, make_comments):
+        make_comments(4)
+        analyze_comments()
+        data = APIClient().get(self.url(episode), {"count_mode": "cached"}).json()
+
+        assert data["count"] == 4
+        assert data["count_mode"] == "estimated"
+
+    def test_estimated_on_postgresql(self, episode, make_comments):
+        make_comments(3)
+        queryset = Comment.objects.filter(episode=episode)
+        plan = json.dumps([{"Plan": {"Plan Rows": 1234}}])
+        connection = mock.MagicMock(vendor="postgresql")
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = (plan,)
+        with mock.patch("crawler.pagination.connections", {queryset.db: connection}):
+            assert estimate_count(queryset) == 1234
+        sql, params = cursor.execute.call_args.args
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+        assert "ORDER BY" not in sql
+        assert params == (episode.id,)
+
+    def test_estimated_without_postgresql(self, episode, make_comments):
+        make_comments(3)
+        queryset = Comment.objects.filter(episode=episode)
+        backend = mock.MagicMock(vendor="sqlite")
+        with mock.patch("crawler.pagination.connections", {queryset.db: backend}):
+            assert estimate_count(queryset) is None
+        backend.cursor.assert_not_called()
+
+        with mock.patch("crawler.pagination.estimate_count", return_value=None):
+            data = (
+                APIClient().get(self.url(episode), {"count_mode": "estimated"}).json()
+            )
+        assert data["count"] == 3
+        assert data["count_mode"] == "exact"
+
+    @pytest.mark.skipif(connection.vendor != "postgresql", reason="플래너 추정")
+    def test_estimated_from_postgresql_planner(self, episode, make_comments):
+        make_comments(3)
+        analyze_comments()
+
+        assert estimate_count(Comment.objects.filter(episode=episode)) == 3
+        assert estimate_count(Comment.objects.filter(episode=episode.id + 1)) <= 1
+        data = APIClient().get(self.url(episode), {"count_mode": "estimated"}).json()
+        assert data["count"] == 3
+        assert data["count_mode"] == "estimated"
+
+    def test_unknown_mode_is_rejected(self, series, episode):
+        response = APIClient().get("/crawler/series/", {"count_mode": "fast"})
+
+        assert response.status_code == 400
+        assert response.json()["error_code"] == "INVALID_LIST_PARAMETER"
+        assert "count_mode" in response.json()["detail"]
+
+    def test_mode_is_part_of_cache_key(self, episode, make_comments):
+        make_comments(5)
+        refresh_episode_sentiment_stats(episode.id)
+        make_comments(1, start_id=100)
+        client = APIClient()
+
+        exact = client.get(self.url(episode), {"count_mode": "exact"}).json()
+        cached = client.get(self.url(episode), {"count_mode": "cached"}).json()
+        assert (exact["count"], cached["count"]) == (6, 5)
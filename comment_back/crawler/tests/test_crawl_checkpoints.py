@@ -0,0 +1,124 @@
+import threading
+
+import pytest
+from django.db import connection
+from rest_framework.test import APIClient
+
+from crawler.crawler.crawler import CommentPage, _format_comments
+from crawler.ingest import COMMENT_CRAWL_RESUMES, save_comment_page
+from crawler.models import Comment, CommentCrawlCheckpoint
+from llm.models import EpisodeSentimentStats
+
+
+@pytest.mark.django_db
+class TestCommentCrawlCheckpoint:
+    def crawl(self, episode):
+        return APIClient().post(f"/crawler/episode/{episode.id}/comment/crawl")
+
+    def test_failed_crawl_keeps_saved_pages(self, episode, fake_graphql):
+        # 5페이지 중 4번째 페이지(page=3)에서 실패
+        fake_graphql["totals"] = {episode.id: 120}
+        fake_graphql["fail_once"] = {(episode.id, 3)}
+
+        response = self.crawl(episode)
+        assert response.status_code == 500
+        assert response.json()["error_code"] == "COMMENT_CRAWL_FAILED"
+
+        assert Comment.objects.filter(episode=episode).count() == 75
+        checkpoint = CommentCrawlCheckpoint.objects.get(episode=episode)
+        assert (checkpoint.page, checkpoint.saved_pages) == (3, 3)
+        assert checkpoint.inserted_count == 75
+        assert checkpoint.last_comment_uid == (
+            Comment.objects.filter(episode=episode).latest("id").id
+        )
+        # 실패 전에 저장한 댓글도 집계에 반영됨
+        assert EpisodeSentimentStats.objects.get(episode=episode).comment_count == 75
+
+    def test_retry_resumes_from_checkpoint(self, episode, fake_graphql):
+        fake_graphql["totals"] = {episode.id: 120}
+        fake_graphql["fail_once"] = {(episode.id, 3)}
+        self.crawl(episode)
+        checkpoint = CommentCrawlCheckpoint.objects.get(episode=episode)
+        fake_graphql["requested"].clear()
+        resumes = COMMENT_CRAWL_RESUMES.get()
+
+        response = self.crawl(episode)
+
+        assert response.status_code == 207
+        assert len(response.json()["created_data"]) == 45
+        assert response.json()["errors"] == []
+        # 댓글 수 확인 요청 없이 체크포인트의 다음 페이지부터 요청
+        assert fake_graphql["requested"] == [
+            (episode.id, 3, checkpoint.last_comment_uid),
+            (episode.id, 4, checkpoint.last_comment_uid + 25),
+        ]
+        assert Comment.objects.filter(episode=episode).count() == 120
+        assert not CommentCrawlCheckpoint.objects.exists()
+        assert COMMENT_CRAWL_RESUMES.get() == resumes + 1
+
+    def test_completed_crawl_leaves_no_checkpoint(self, episode, fake_graphql):
+        fake_graphql["totals"] = {episode.id: 60}
+
+        response = self.crawl(episode)
+
+        assert response.status_code == 207
+        assert len(response.json()["created_data"]) == 60
+        assert not CommentCrawlCheckpoint.objects.exists()
+        assert self.crawl(episode).json()["error_code"] == "NO_NEW_COMMENTS"
+
+    def test_first_page_failure_saves_nothing(self, episode, fake_graphql):
+        fake_graphql["totals"] = {episode.id: 60}
+        fake_graphql["failing"] = {episode.id}
+
+        assert self.crawl(episode).status_code == 500
+        assert not Comment.objects.exists()
+        assert not CommentCrawlCheckpoint.objects.exists()
+
+
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="행 잠금")
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_page_saves(episode):
+    comments = [
+        {
+            "commentUid": uid,
+            "comment": f"댓글 {uid}",
+            "createDt": "2025-07-11T15:47:38Z",
+            "isBest": False,
+            "userName": "독자",
+            "userThumbnailUrl": "https://example.com/u.png",
+            "userUid": 1,
+            "likeCount": 0,
+            "emoticon": None,
+        }
+        for uid in range(1, 26)
+    ]
+    barrier = threading.Barrier(2)
+    results, errors = [], []
+
+    def save():
+        page = CommentPage(
+            _format_comments(comments, episode.series_id, episode.id),
+            next_page=1,
+            last_comment_uid=comments[-1]["commentUid"],
+            is_end=False,
+        )
+        barrier.wait()
+        try:
+            instances, _, _ = save_comment_page(
+                CommentCrawlCheckpoint(episode_id=episode.id), page
+            )
+            results.append(len(instances))
+        except Exception as e:
+            errors.append(e)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=save) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert sorted(results) == [0, 25]
+    assert Comment.objects.filter(episode=episode).count() == 25
@@ -0,0 +1,189 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from crawler import jobs
+from crawler.models import Comment, CrawlJob, Episode
+from llm.models import EpisodeSentimentStats
+
+
+@pytest.fixture
+def episodes(series, user, episode):
+    extra = [
+        Episode(
+            id=episode.id + i,
+            name=f"{i + 1}화",
+            image_src="https://example.com/e.png",
+            category="웹툰",
+            subcategory="판타지",
+            series=series,
+            user=user,
+        )
+        for i in range(1, 4)
+    ]
+    return [episode, *Episode.objects.bulk_create(extra)]
+
+
+@pytest.fixture
+def run_inline():
+    """백그라운드 스레드 대신 요청 스레드에서 바로 작업을 실행 (테스트는 트랜잭션 안이라 커밋 콜백도 바로 실행)"""
+    with (
+        patch("crawler.views.submit_crawl_job", jobs.run_crawl_job),
+        patch("django.db.transaction.on_commit", lambda func: func()),
+    ):
+        yield
+
+
+@pytest.mark.django_db
+class TestSeriesCommentCrawlJob:
+    def test_crawls_all_episodes(self, series, episodes, fake_graphql, run_inline):
+        fake_graphql["totals"] = {e.id: 10 * (i + 1) for i, e in enumerate(episodes)}
+        fake_graphql["failing"] = {episodes[2].id}
+
+        response = APIClient().post(f"/crawler/series/{series.id}/comment/crawl")
+        assert response.status_code == 202
+        assert response.json()["total_episodes"] == 4
+
+        job = APIClient().get(f"/crawler/crawl/jobs/{response.json()['id']}/").json()
+        assert job["status"] == "done"
+        assert job["done_episodes"] == 4
+        assert job["comments_inserted"] == 10 + 20 + 40
+        assert [error["episode"] for error in job["errors"]] == [episodes[2].id]
+        assert job["finished_at"] is not None
+
+        assert Comment.objects.filter(episode=episodes[3]).count() == 40
+        # 에피소드별 집계도 함께 갱신됨
+        assert (
+            EpisodeSentimentStats.objects.get(episode=episodes[1]).comment_count == 20
+        )
+
+    def test_all_episodes_failed(self, series, episodes, fake_graphql, run_inline):
+        fake_graphql["failing"] = {e.id for e in episodes}
+
+        job_id = (
+            APIClient().post(f"/crawler/series/{series.id}/comment/crawl").json()["id"]
+        )
+
+        job = CrawlJob.objects.get(id=job_id)
+        assert (job.status, job.done_episodes, len(job.errors)) == ("failed", 4, 4)
+        assert job.finished_at is not None
+
+    def test_bounded_concurrency(
+        self, settings, series, episodes, fake_graphql, run_inline
+    ):
+        settings.SERIES_CRAWL_CONCURRENCY = 2
+        fake_graphql["totals"] = {e.id: 5 for e in episodes}
+
+        APIClient().post(f"/crawler/series/{series.id}/comment/crawl")
+
+        assert fake_graphql["max_in_flight"] == 2
+        assert Comment.objects.count() == 20
+
+    def test_skips_up_to_date_episodes(
+        self, series, episode, make_comments, fake_graphql, run_inline
+    ):
+        make_comments(3)
+        fake_graphql["totals"] = {episode.id: 3}
+
+        job_id = (
+            APIClient().post(f"/crawler/series/{series.id}/comment/crawl").json()["id"]
+        )
+
+        job = CrawlJob.objects.get(id=job_id)
+        assert (job.status, job.done_episodes, job.comments_inserted) == ("done", 1, 0)
+
+    def test_returns_running_job(self, series, episode):
+        running = CrawlJob.objects.create(series=series, status=CrawlJob.Status.RUNNING)
+        with patch("crawler.views.submit_crawl_job") as submit:
+            response = APIClient().post(f"/crawler/series/{series.id}/comment/crawl")
+
+        assert response.status_code == 200
+        assert response.json()["id"] == running.id
+        submit.assert_not_called()
+
+    def test_stale_job_is_replaced(self, settings, series, episode):
+        stale = CrawlJob.objects.create(series=series, status=CrawlJob.Status.RUNNING)
+        CrawlJob.objects.filter(id=stale.id).update(
+            updated_at=timezone.now()
+            - timedelta(seconds=settings.SERIES_CRAWL_STALE_AFTER + 1)
+        )
+        with patch("crawler.views.submit_crawl_job"):
+            response = APIClient().post(f"/crawler/series/{series.id}/comment/crawl")
+
+        assert response.status_code == 202
+        assert response.json()["id"] != stale.id
+        stale.refresh_from_db()
+        assert stale.status == CrawlJob.Status.FAILED
+        assert stale.errors[0]["error"] == "StaleCrawlJob"
+        assert stale.finished_at is not None
+
+    def test_stale_job_is_reported_failed(self, settings, series, episode):
+        stale = CrawlJob.objects.create(series=series, status=CrawlJob.Status.RUNNING)
+        CrawlJob.objects.filter(id=stale.id).update(
+            updated_at=timezone.now()
+            - timedelta(seconds=settings.SERIES_CRAWL_STALE_AFTER + 1)
+        )
+
+        job = APIClient().get(f"/crawler/crawl/jobs/{stale.id}/").json()
+        assert job["status"] == "failed"
+        assert CrawlJob.objects.get(id=stale.id).status == CrawlJob.Status.FAILED
+
+    def test_progress_is_saved_per_page(self, series, episode, fake_graphql):
+        fake_graphql["totals"] = {episode.id: 60}
+        job = CrawlJob.objects.create(series=series)
+        with patch.object(
+            jobs, "_save_progress", wraps=jobs._save_progress
+        ) as save_progress:
+            jobs.run_crawl_job(job.id)
+
+        # 에피소드가 끝나기 전에도 페이지마다 갱신 시각(heartbeat)이 바뀜
+        per_page = [
+            call.kwargs["comments_inserted"]
+            for call in save_progress.call_args_list
+            if set(call.kwargs) == {"comments_inserted"}
+        ]
+        assert per_page == [25, 50, 60]
+        job.refresh_from_db()
+        assert (job.status, job.comments_inserted) == ("done", 60)
+
+    def test_failed_job_stops_crawling(self, series, episode, fake_graphql):
+        fake_graphql["totals"] = {episode.id: 60}
+        job = CrawlJob.objects.create(series=series)
+        save_progress = jobs._save_progress
+
+        def fail_after_first_page(job_id, **values):
+            # 첫 페이지를 저장하는 동안 다른 요청이 이 작업을 멈춘 작업으로 처리
+            if "comments_inserted" in values:
+                CrawlJob.objects.filter(id=job_id).update(status=CrawlJob.Status.FAILED)
+            save_progress(job_id, **values)
+
+        with patch.object(jobs, "_save_progress", fail_after_first_page):
+            jobs.run_crawl_job(job.id)
+
+        # 댓글 수 확인 + 첫 페이지만 요청
+        assert fake_graphql["requested"] == [(episode.id, 0, None)] * 2
+        assert Comment.objects.count() == 25
+        job.refresh_from_db()
+        assert (job.status, job.errors) == ("failed", [])
+
+    def test_job_failure_is_recorded(self, series, episode):
+        job = CrawlJob.objects.create(series=series)
+        with patch.object(jobs, "arun_crawl_job", side_effect=RuntimeError("boom")):
+            jobs.run_crawl_job(job.id)
+
+        job.refresh_from_db()
+        assert job.status == CrawlJob.Status.FAILED
+        assert job.errors == [
+            {"episode": None, "error": "RuntimeError", "detail": "boom"}
+        ]
+
+    def test_errors(self, series):
+        client = APIClient()
+        assert client.post("/crawler/series/1/comment/crawl").status_code == 404
+        response = client.post(f"/crawler/series/{series.id}/comment/crawl")
+        assert response.status_code == 400
+        assert response.json()["error_code"] == "NO_EPISODES"
+        assert client.get("/crawler/crawl/jobs/1/").status_code == 404
@@ -0,0 +1,84 @@
+from unittest.mock import patch
+
+from crawler.crawler import crawler
+from crawler.crawler.crawler import ITEM_PER_PAGE, get_all_episodes_by_series
+
+SERIES_ID = 59071959
+
+
+def make_edge(episode_id: int) -> dict:
+    return {
+        "node": {
+            "eventLog": {
+                "eventMeta": {
+                    "id": episode_id,
+                    "category": "웹툰",
+                    "name": f"{episode_id}화",
+                    "subcategory": "판타지",
+                }
+            },
+            "single": {"thumbnail": f"https://example.com/{episode_id}.png"},
+        }
+    }
+
+
+def make_fake_episode_fetcher(total_count: int, overlap: int = 0):
+    """after 오프셋마다 ITEM_PER_PAGE개(+경계 중복 overlap개)의 에피소드를 반환하는 가짜 요청 함수"""
+    calls = []
+
+    def fake_get_episode_by_series(series_id: int, after: str | None = None):
+        calls.append(after)
+        start = int(after or 0)
+        end = min(start + ITEM_PER_PAGE + overlap, total_count)
+        return {
+            "totalCount": total_count,
+            "pageInfo": {"hasNextPage": start + ITEM_PER_PAGE < total_count},
+            "edges": [make_edge(episode_id) for episode_id in range(start, end)],
+        }
+
+    return fake_get_episode_by_series, calls
+
+
+class TestGetAllEpisodesBySeries:
+    """get_all_episodes_by_series 직렬/병렬 모드 테스트"""
+
+    def test_serial_fetch_stops_at_last_page(self):
+        fetcher, calls = make_fake_episode_fetcher(total_count=60)
+        with patch.object(crawler, "get_episode_by_series", fetcher):
+            episodes = get_all_episodes_by_series(SERIES_ID)
+
+        assert calls == ["0", "25", "50"]
+        assert [episode["id"] for episode in episodes] == list(range(60))
+
+    def test_parallel_fetch_requests_every_offset_once(self):
+        fetcher, calls = make_fake_episode_fetcher(total_count=310)
+        with patch.object(crawler, "get_episode_by_series", fetcher):
+            episodes = get_all_episodes_by_series(SERIES_ID, parallel=True)
+
+        assert sorted(calls, key=int) == [f"{i * ITEM_PER_PAGE}" for i in range(13)]
+        assert [episode["id"] for episode in episodes] == list(range(310))
+
+    def test_parallel_fetch_deduplicates_page_boundaries(self):
+        fetcher, _ = make_fake_episode_fetcher(total_count=100, overlap=3)
+        with patch.object(crawler, "get_episode_by_series", fetcher):
+            episodes = get_all_episodes_by_series(
+                SERIES_ID, parallel=True, max_workers=2
+            )
+
+        assert [episode["id"] for episode in episodes] == list(range(100))
+        assert episodes[0] == {
+            "id": 0,
+            "category": "웹툰",
+            "name": "0화",
+            "subcategory": "판타지",
+            "image_src": "https://example.com/0.png",
+            "series": SERIES_ID,
+        }
+
+    def test_parallel_fetch_single_page(self):
+        fetcher, calls = make_fake_episode_fetcher(total_count=10)
+        with patch.object(crawler, "get_episode_by_series", fetcher):
+            episodes = get_all_episodes_by_series(SERIES_ID, parallel=True)
+
+        assert calls == ["0"]
+        assert len(episodes) == 10
@@ -0,0 +1,71 @@
+import pytest
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from crawler.mixins import get_values_renderer
+from crawler.models import Comment, Episode
+from crawler.serializers import CommentSerializer, EpisodeSerializer
+
+COMMENT_FIELD_SETS = [
+    ("id", "content"),
+    ("id", "created_at", "emoticon", "ai_processed_at"),
+    ("content", "is_best", "series", "episode", "ai_emotion_score", "is_spam"),
+    tuple(field.name for field in Comment._meta.fields),
+]
+
+
+def render(data) -> bytes:
+    return JSONRenderer().render(data)
+
+
+@pytest.mark.django_db
+class TestValuesRenderer:
+    @pytest.mark.parametrize("fields", COMMENT_FIELD_SETS)
+    def test_matches_serializer_bytes(self, make_comments, fields):
+        make_comments(30)
+        queryset = Comment.objects.order_by("id")
+
+        expected = CommentSerializer(
+            queryset.only(*fields), many=True, fields=list(fields)
+        ).data
+        renderer = get_values_renderer(CommentSerializer, fields)
+        actual = renderer.render(queryset.values_list(*renderer.columns))
+
+        assert render(actual) == render(expected)
+
+    def test_unknown_fields_only(self):
+        assert get_values_renderer(EpisodeSerializer, ("bogus",)) is None
+
+
+@pytest.mark.django_db
+class TestListViewsWithFields:
+    def test_comment_list(self, episode, make_comments):
+        make_comments(25)
+        fields = "id,created_at,emoticon,is_spam"
+        response = APIClient().get(
+            f"/crawler/episode/{episode.id}/comment",
+            {"fields": fields, "ordering": "-created_at", "page_size": 10},
+        )
+
+        expected = CommentSerializer(
+            Comment.objects.order_by("-created_at")[:10],
+            many=True,
+            fields=fields.split(","),
+        ).data
+        assert response.status_code == 200
+        assert render(response.data["results"]) == render(expected)
+        assert response.data["next"] is not None
+
+    def test_episode_list(self, series, episode):
+        response = APIClient().get(
+            f"/crawler/series/{series.id}/episode/", {"fields": "id,name,series"}
+        )
+        assert response.status_code == 200
+        assert response.data["results"] == [
+            {"id": episode.id, "name": episode.name, "series": series.id}
+        ]
+
+    def test_series_list_without_fields_uses_serializer(self, series):
+        response = APIClient().get("/crawler/series/")
+        assert response.status_code == 200
+        assert response.data["results"][0]["title"] == series.title
@@ -0,0 +1,102 @@
+import pytest
+from django.db import connection
+from rest_framework.test import APIClient
+
+from crawler.models import Comment, Episode
+from crawler.ordering import (
+    COMMENT_LIST_SPEC,
+    EPISODE_LIST_SPEC,
+    SERIES_LIST_SPEC,
+    ListParameterError,
+)
+
+
+@pytest.mark.django_db
+class TestListOrdering:
+    def test_registered_ordering(self, episode, make_comments):
+        make_comments(5)
+        Comment.objects.filter(id=3).update(like_count=10)
+        Comment.objects.filter(id=5).update(like_count=10)
+        response = APIClient().get(
+            f"/crawler/episode/{episode.id}/comment", {"ordering": "-like_count"}
+        )
+
+        assert response.status_code == 200
+        # 좋아요 수가 같으면 id 내림차순 (인덱스 순서)
+        assert [c["id"] for c in response.json()["results"]] == [5, 3, 4, 2, 1]
+
+    def test_tiebreak_direction_follows_index(self):
+        ordering = COMMENT_LIST_SPEC.resolve_ordering("-created_at,id")
+        assert ordering.order_by == ("-created_at", "-id")
+        assert ordering.index == "comment_episode_created_idx"
+
+    def test_default_ordering(self):
+        assert COMMENT_LIST_SPEC.resolve_ordering(None).order_by == ("id",)
+        assert SERIES_LIST_SPEC.resolve_ordering("").order_by == ("id",)
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"ordering": "content"},
+            {"ordering": "created_at,like_count"},
+            {"ordering": "id,-id"},
+            {"fields": "id,password"},
+        ],
+    )
+    def test_unsupported_params(self, episode, make_comments, params):
+        make_comments(2)
+        response = APIClient().get(f"/crawler/episode/{episode.id}/comment", params)
+
+        assert response.status_code == 400
+        assert response.json()["error_code"] == "INVALID_LIST_PARAMETER"
+        assert "ETag" not in response
+
+    def test_unsupported_series_ordering(self, series):
+        response = APIClient().get("/crawler/series/", {"ordering": "image_src"})
+
+        assert response.status_code == 400
+        assert "title" in response.json()["detail"]
+
+    def test_fields_are_validated(self):
+        with pytest.raises(ListParameterError):
+            EPISODE_LIST_SPEC.resolve_fields("id,comments", ("id", "name"))
+        assert EPISODE_LIST_SPEC.resolve_fields("name,id,name", ("id", "name")) == (
+            "name",
+            "id",
+        )
+
+    def test_options_lists_fast_orderings(self, episode):
+        response = APIClient().options(f"/crawler/episode/{episode.id}/comment")
+        parameters = response.json()["list_parameters"]
+        orderings = {item["ordering"]: item for item in parameters["orderings"]}
+
+        assert parameters["default_ordering"] == "id"
+        assert orderings["-created_at"]["fast"] is True
+        assert orderings["-created_at"]["order_by"] == ["-created_at", "-id"]
+        assert orderings["ai_emotion_score"]["fast"] is False
+        assert "content" in parameters["fields"]
+
+    @pytest.mark.parametrize(
+        "spec, model",
+        [
+            (SERIES_LIST_SPEC, None),
+            (EPISODE_LIST_SPEC, Episode),
+            (COMMENT_LIST_SPEC, Comment),
+        ],
+    )
+    def test_fast_orderings_have_declared_index(self, spec, model):
+        declared = {index.name for index in model._meta.indexes} if model else set()
+        for ordering in spec.orderings.values():
+            if ordering.index and not ordering.index.endswith("_pkey"):
+                assert ordering.index in declared
+
+    def test_indexes_exist_in_database(self):
+        with connection.cursor() as cursor:
+            comment_indexes = connection.introspection.get_constraints(
+                cursor, Comment._meta.db_table
+            )
+        assert {
+            "comment_episode_id_idx",
+            "comment_episode_created_idx",
+            "comment_episode_like_idx",
+        } <= set(comment_indexes)
@@ -0,0 +1,141 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from gql.transport.exceptions import TransportQueryError
+
+from crawler.crawler import cache as metadata_cache
+from crawler.crawler.crawler import NoSeriesError
+
+SERIES_ID = 59071959
+
+
+class TestMetadataCache:
+    def test_repeated_lookup_hits_upstream_once(self):
+        with patch.object(
+            metadata_cache, "get_series_info", return_value={"ok": True}
+        ) as upstream:
+            for _ in range(3):
+                assert metadata_cache.get_series_info_cached(SERIES_ID) == {"ok": True}
+        assert upstream.call_count == 1
+
+    def test_missing_series_is_negatively_cached(self):
+        not_found = TransportQueryError(
+            "not found",
+            errors=[
+                {"message": "not found", "extensions": {"classification": "NOT_FOUND"}}
+            ],
+        )
+        with patch.object(
+            metadata_cache, "get_series_info", side_effect=not_found
+        ) as upstream:
+            for _ in range(2):
+                with pytest.raises(NoSeriesError):
+                    metadata_cache.get_series_info_cached(SERIES_ID)
+        assert upstream.call_count == 1
+
+    def test_other_query_errors_are_not_cached(self):
+        rate_limited = TransportQueryError(
+            "too many requests",
+            errors=[{"message": "too many requests", "extensions": {"code": "429"}}],
+        )
+        with patch.object(
+            metadata_cache,
+            "get_series_info",
+            side_effect=[rate_limited, {"ok": True}],
+        ) as upstream:
+            with pytest.raises(TransportQueryError):
+                metadata_cache.get_series_info_cached(SERIES_ID)
+            assert metadata_cache.get_series_info_cached(SERIES_ID) == {"ok": True}
+        assert upstream.call_count == 2
+
+    def test_other_errors_are_not_cached(self):
+        with patch.object(
+            metadata_cache,
+            "get_series_metadata",
+            side_effect=[RuntimeError("boom"), {"title": "t", "image_src": "i"}],
+        ) as upstream:
+            with pytest.raises(RuntimeError):
+                metadata_cache.get_series_metadata_cached(SERIES_ID)
+            assert metadata_cache.get_series_metadata_cached(SERIES_ID)["title"] == "t"
+        assert upstream.call_count == 2
+
+    def test_ttl_is_per_kind(self, settings):
+        settings.METADATA_CACHE_TTL = {
+            **settings.METADATA_CACHE_TTL,
+            "episode_count": 1,
+        }
+        with patch.object(cache, "set", wraps=cache.set) as cache_set, patch.object(
+            metadata_cache, "get_episode_count_by_series", return_value=42
+        ):
+            assert metadata_cache.get_episode_count_by_series_cached(SERIES_ID) == 42
+        assert cache_set.call_args.args[2] == 1
+
+    def test_concurrent_misses_are_coalesced(self):
+        calls = []
+
+        def slow_upstream(series_id: int) -> int:
+            calls.append(series_id)
+            time.sleep(0.05)
+            return 7
+
+        results = []
+        with patch.object(
+            metadata_cache, "get_episode_count_by_series", side_effect=slow_upstream
+        ):
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(
+                        metadata_cache.get_episode_count_by_series_cached(SERIES_ID)
+                    )
+                )
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert results == [7] * 8
+        assert len(calls) == 1
+
+    def test_slow_fetch_does_not_block_other_keys(self):
+        started, release = threading.Event(), threading.Event()
+
+        def slow_upstream(series_id: int) -> int:
+            started.set()
+            release.wait(5)
+            return 1
+
+        with patch.object(
+            metadata_cache, "get_episode_count_by_series", side_effect=slow_upstream
+        ):
+            slow = threading.Thread(
+                target=metadata_cache.get_episode_count_by_series_cached,
+                args=(SERIES_ID,),
+            )
+            slow.start()
+            started.wait(5)
+            try:
+                # 같은 키의 요청이 상류를 기다리는 동안 다른 키는 바로 처리됨
+                for series_id in range(SERIES_ID + 1, SERIES_ID + 257):
+                    with patch.object(
+                        metadata_cache, "get_series_info", return_value={"ok": True}
+                    ):
+                        metadata_cache.get_series_info_cached(series_id)
+                assert slow.is_alive()
+            finally:
+                release.set()
+                slow.join()
+
+        assert metadata_cache._local_locks == {}
+
+    def test_invalidate(self):
+        with patch.object(
+            metadata_cache, "get_episode_count_by_series", side_effect=[1, 2]
+        ):
+            assert metadata_cache.get_episode_count_by_series_cached(SERIES_ID) == 1
+            metadata_cache.invalidate("episode_count", SERIES_ID)
+            assert metadata_cache.get_episode_count_by_series_cached(SERIES_ID) == 2
@@ -0,0 +1,127 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from crawler.generations import generations_are_shared, mark_episode_changed
+from crawler.models import Episode
+from crawler.response_cache import RESPONSE_CACHE_REQUESTS
+
+
+@pytest.mark.django_db
+class TestResponseCache:
+    def test_hit_skips_database(
+        self, episode, make_comments, django_assert_num_queries
+    ):
+        make_comments(5)
+        url = f"/crawler/episode/{episode.id}/comment"
+        client = APIClient()
+        first = client.get(url, {"fields": "id,content"})
+        hits = RESPONSE_CACHE_REQUESTS.get(view="CommentListView", result="hit")
+
+        with django_assert_num_queries(0):
+            second = client.get(url, {"fields": "content,id", "page": "1"})
+
+        assert second.status_code == 200
+        assert second.content == first.content
+        assert second["ETag"] == first["ETag"]
+        assert (
+            RESPONSE_CACHE_REQUESTS.get(view="CommentListView", result="hit")
+            == hits + 1
+        )
+
+    def test_if_none_match(self, episode, django_assert_num_queries):
+        url = f"/crawler/episode/{episode.id}/"
+        client = APIClient()
+        etag = client.get(url)["ETag"]
+
+        with django_assert_num_queries(0):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response["ETag"] == etag
+
+        # 캐시가 비어 있어도 렌더링한 응답이 같으면 304
+        cache.clear()
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+        assert client.get(url, HTTP_IF_NONE_MATCH='"stale"').status_code == 200
+
+    def test_generation_bump_invalidates(self, episode, make_comments):
+        make_comments(3)
+        url = f"/crawler/episode/{episode.id}/comment"
+        client = APIClient()
+        assert len(client.get(url).json()["results"]) == 3
+
+        make_comments(2, start_id=100)
+        assert len(client.get(url).json()["results"]) == 3
+
+        mark_episode_changed(episode.id, episode.series_id)
+        assert len(client.get(url).json()["results"]) == 5
+
+    def test_params_are_part_of_key(self, episode, make_comments):
+        make_comments(30)
+        url = f"/crawler/episode/{episode.id}/comment"
+        client = APIClient()
+
+        page_1 = client.get(url, {"page_size": 10}).json()["results"]
+        page_2 = client.get(url, {"page_size": 10, "page": 2}).json()["results"]
+        newest = client.get(url, {"page_size": 10, "ordering": "-id"}).json()
+
+        assert [c["id"] for c in page_1] == list(range(1, 11))
+        assert [c["id"] for c in page_2] == list(range(11, 21))
+        assert newest["results"][0]["id"] == 30
+
+    def test_errors_are_not_cached(self, episode):
+        url = f"/crawler/episode/{episode.id + 1}/"
+        client = APIClient()
+        assert client.get(url).status_code == 404
+
+        Episode.objects.create(
+            id=episode.id + 1,
+            name="2화",
+            image_src="https://example.com/e.png",
+            category="웹툰",
+            subcategory="판타지",
+            series=episode.series,
+            user=episode.user,
+        )
+        assert client.get(url).status_code == 200
+
+    def test_browsable_api_is_not_cached(self, series):
+        url = f"/crawler/series/{series.id}/"
+        response = APIClient().get(url, HTTP_ACCEPT="text/html")
+
+        assert response.status_code == 200
+        assert "ETag" not in response
+
+    def test_process_local_cache_with_workers_is_bypassed(
+        self, settings, episode, make_comments
+    ):
+        settings.WEB_CONCURRENCY = 2
+        make_comments(3)
+        url = f"/crawler/episode/{episode.id}/comment"
+        client = APIClient()
+        bypass = RESPONSE_CACHE_REQUESTS.get(view="CommentListView", result="bypass")
+        assert len(client.get(url).json()["results"]) == 3
+
+        # 다른 워커가 댓글을 추가하고 세대를 올린 상황: 이 워커의 캐시로 응답하지 않음
+        make_comments(2, start_id=100)
+        assert len(client.get(url).json()["results"]) == 5
+        assert (
+            RESPONSE_CACHE_REQUESTS.get(view="CommentListView", result="bypass")
+            == bypass + 2
+        )
+
+    @pytest.mark.parametrize(
+        "backend, workers, shared",
+        [
+            ("django.core.cache.backends.locmem.LocMemCache", 1, True),
+            ("django.core.cache.backends.locmem.LocMemCache", 2, False),
+            ("django.core.cache.backends.redis.RedisCache", 2, True),
+        ],
+    )
+    def test_generations_are_shared(self, settings, backend, workers, shared):
+        settings.WEB_CONCURRENCY = workers
+        with mock.patch.dict(settings.CACHES["default"], BACKEND=backend):
+            assert generations_are_shared() is shared
@@ -0,0 +1,157 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from crawler.crawler import metadata
+from crawler.crawler.crawler import SeriesMetaNotFoundError, parse_series_meta
+from crawler.crawler.selenium_crawler import (
+    ChromeDriverPool,
+    SeleniumPoolExhaustedError,
+)
+
+SERIES_HTML = """
+<html><head>
+<meta property="og:title" content=" 나 혼자만 레벨업 ">
+<meta property="og:image" content="https://example.com/thumb.png">
+</head><body></body></html>
+"""
+
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_count = 0
+
+    def quit(self):
+        self.quit_count += 1
+
+
+class TestParseSeriesMeta:
+    def test_parses_og_tags(self):
+        assert parse_series_meta(SERIES_HTML) == {
+            "title": "나 혼자만 레벨업",
+            "image_src": "https://example.com/thumb.png",
+        }
+
+    def test_missing_tags_raise(self):
+        with pytest.raises(SeriesMetaNotFoundError):
+            parse_series_meta("<html><head></head></html>")
+
+
+class TestGetSeriesMetadata:
+    def test_html_success_skips_browser(self):
+        with patch.object(
+            metadata, "get_series_meta_from_html", return_value={"title": "t"}
+        ), patch.object(metadata, "get_title_with_selenium") as selenium:
+            assert metadata.get_series_metadata(1) == {"title": "t"}
+        selenium.assert_not_called()
+
+    def test_falls_back_to_browser(self):
+        with patch.object(
+            metadata,
+            "get_series_meta_from_html",
+            side_effect=SeriesMetaNotFoundError("no meta"),
+        ), patch.object(
+            metadata, "get_title_with_selenium", return_value={"title": "s"}
+        ):
+            assert metadata.get_series_metadata(1) == {"title": "s"}
+
+
+class TestChromeDriverPool:
+    def make_pool(self, **kwargs):
+        created = []
+
+        def factory():
+            driver = FakeDriver()
+            created.append(driver)
+            return driver
+
+        return ChromeDriverPool(driver_factory=factory, **kwargs), created
+
+    def test_reuses_warm_driver(self):
+        pool, created = self.make_pool(max_size=1)
+        with pool.driver() as first:
+            pass
+        with pool.driver() as second:
+            pass
+        assert first is second
+        assert len(created) == 1
+
+    def test_recycles_after_max_pages(self):
+        pool, created = self.make_pool(max_size=1, max_pages=2)
+        for _ in range(3):
+            with pool.driver():
+                pass
+        assert len(created) == 2
+        assert created[0].quit_count == 1
+
+    def test_idle_driver_expires(self):
+        pool, created = self.make_pool(max_size=1, idle_timeout=0)
+        with pool.driver():
+            pass
+        with pool.driver():
+            pass
+        assert len(created) == 2
+        assert created[0].quit_count == 1
+
+    def test_idle_driver_is_reaped_without_checkout(self):
+        pool, created = self.make_pool(max_size=1, idle_timeout=0.05)
+        with pool.driver():
+            pass
+        assert pool.idle_count() == 1
+
+        # 다음 요청 없이도 타이머가 유휴 드라이버를 종료
+        for _ in range(100):
+            if created[0].quit_count:
+                break
+            threading.Event().wait(0.02)
+        assert created[0].quit_count == 1
+        assert pool.idle_count() == 0
+
+    def test_close_cancels_reaper(self):
+        pool, created = self.make_pool(max_size=1)
+        with pool.driver():
+            pass
+        pool.close()
+        assert created[0].quit_count == 1
+        assert pool._reaper is None
+
+    def test_broken_driver_is_discarded(self):
+        pool, created = self.make_pool(max_size=1)
+        with pytest.raises(WebDriverException):
+            with pool.driver():
+                raise WebDriverException("crashed")
+        assert created[0].quit_count == 1
+        assert pool.idle_count() == 0
+
+    def test_waits_for_free_slot_and_times_out(self):
+        pool, _ = self.make_pool(max_size=1, acquire_timeout=0.05)
+        with pool.driver():
+            with pytest.raises(SeleniumPoolExhaustedError):
+                with pool.driver():
+                    pass
+
+    def test_bounds_concurrent_drivers(self):
+        pool, created = self.make_pool(max_size=2, acquire_timeout=5)
+        in_use = []
+        peak = []
+        lock = threading.Lock()
+
+        def work():
+            with pool.driver():
+                with lock:
+                    in_use.append(1)
+                    peak.append(len(in_use))
+                threading.Event().wait(0.01)
+                with lock:
+                    in_use.pop()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) <= 2
+        assert len(created) <= 2
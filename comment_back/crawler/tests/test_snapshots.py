@@ -0,0 +1,128 @@
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from crawler.models import Comment
+from crawler.snapshots import (
+    SNAPSHOT_COLUMNS,
+    load_series_snapshot,
+    write_series_snapshot,
+)
+
+
+@pytest.mark.django_db
+class TestSeriesSnapshot:
+    def test_initial_snapshot(self, tmp_path, series, make_comments):
+        make_comments(20)
+        result = write_series_snapshot(series.id, tmp_path)
+        table = load_series_snapshot(series.id, base_dir=tmp_path)
+
+        assert result["rewritten"] == [59114404]
+        assert table.column_names == list(SNAPSHOT_COLUMNS)
+        assert table.num_rows == 20
+        assert table.column("id").to_pylist() == list(range(1, 21))
+        assert table.column("ai_emotion_score").null_count == 10
+
+        expected = Comment.objects.get(id=3)
+        row = table.slice(2, 1).to_pylist()[0]
+        assert row["created_at"] == expected.created_at
+        assert row["is_spam"] == expected.is_spam
+
+    def test_new_comments_are_appended(self, tmp_path, series, make_comments):
+        make_comments(10)
+        write_series_snapshot(series.id, tmp_path)
+        make_comments(
+            5,
+            start_id=100,
+            ai_emotion_score=None,
+            is_spam=None,
+            is_ai_processed=False,
+            ai_processed_at=None,
+        )
+
+        result = write_series_snapshot(series.id, tmp_path)
+        parts = list(
+            (tmp_path / f"series={series.id}").glob("episode=*/part-*.parquet")
+        )
+
+        assert result["appended"] == [59114404]
+        assert len(parts) == 2
+        assert load_series_snapshot(series.id, base_dir=tmp_path).num_rows == 15
+
+    def test_delete_and_insert_rewrites_episode(self, tmp_path, series, make_comments):
+        make_comments(10)
+        write_series_snapshot(series.id, tmp_path)
+        # 기존 댓글 하나를 지우고 새 댓글 두 개 추가: 개수와 최대 ID는 append와 같은 모양
+        Comment.objects.filter(id=4).delete()
+        make_comments(2, start_id=100, is_ai_processed=False, ai_processed_at=None)
+
+        result = write_series_snapshot(series.id, tmp_path)
+        ids = load_series_snapshot(series.id, columns=["id"], base_dir=tmp_path)
+
+        assert result["rewritten"] == [59114404]
+        assert 4 not in ids.column("id").to_pylist()
+        assert ids.num_rows == 11
+
+    def test_analysis_changes_rewrite_episode(self, tmp_path, series, make_comments):
+        make_comments(10)
+        write_series_snapshot(series.id, tmp_path)
+        Comment.objects.filter(id=2).update(
+            ai_emotion_score=99, is_ai_processed=True, ai_processed_at=timezone.now()
+        )
+
+        result = write_series_snapshot(series.id, tmp_path)
+        table = load_series_snapshot(
+            series.id, columns=["id", "ai_emotion_score"], base_dir=tmp_path
+        )
+
+        assert result["rewritten"] == [59114404]
+        assert table.slice(1, 1).to_pylist() == [{"id": 2, "ai_emotion_score": 99}]
+
+    def test_failed_rewrite_keeps_previous_snapshot(
+        self, tmp_path, series, make_comments
+    ):
+        make_comments(10)
+        write_series_snapshot(series.id, tmp_path)
+        Comment.objects.filter(id=4).delete()
+
+        with mock.patch(
+            "crawler.snapshots._write_part", side_effect=OSError("disk full")
+        ):
+            with pytest.raises(OSError):
+                write_series_snapshot(series.id, tmp_path)
+        ids = load_series_snapshot(series.id, columns=["id"], base_dir=tmp_path)
+
+        assert ids.num_rows == 10
+        assert 4 in ids.column("id").to_pylist()
+
+    def test_rewrite_removes_unused_parts(self, tmp_path, series, make_comments):
+        make_comments(10)
+        write_series_snapshot(series.id, tmp_path)
+        make_comments(2, start_id=100, is_ai_processed=False, ai_processed_at=None)
+        write_series_snapshot(series.id, tmp_path)
+        Comment.objects.filter(id=4).delete()
+
+        write_series_snapshot(series.id, tmp_path)
+        parts = (tmp_path / f"series={series.id}").glob("episode=*/*")
+
+        assert [path.name for path in parts] == ["part-1-101.parquet"]
+
+    def test_unchanged_episode_is_skipped(self, tmp_path, series, make_comments):
+        make_comments(3)
+        write_series_snapshot(series.id, tmp_path)
+        assert write_series_snapshot(series.id, tmp_path)["unchanged"] == [59114404]
+
+    def test_empty_snapshot(self, tmp_path, series):
+        table = load_series_snapshot(series.id, columns=["id"], base_dir=tmp_path)
+        assert table.num_rows == 0
+        assert table.column_names == ["id"]
+
+    def test_command(self, tmp_path, series, make_comments):
+        make_comments(4)
+        call_command("snapshot_comments", "--all", "--output-dir", str(tmp_path))
+        assert load_series_snapshot(series.id, base_dir=tmp_path).num_rows == 4
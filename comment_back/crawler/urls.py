@@ -36,4 +36,30 @@ urlpatterns = [
         CommentCountView.as_view(),
         name="comment-count",
     ),
+    path(
+        "episode/<int:product_id>/comment/export",
+        EpisodeCommentExportView.as_view(),
+        name="episode-comment-export",
+    ),
+    path(
+        "series/<int:series_id>/comment/export",
+        SeriesCommentExportView.as_view(),
+        name="series-comment-export",
+    ),
+    path(
+        "episode/<int:product_id>/comment/search",
+        EpisodeCommentSearchView.as_view(),
+        name="episode-comment-search",
+    ),
+    path(
+        "series/<int:series_id>/comment/crawl",
+        SeriesCommentCrawlView.as_view(),
+        name="series-comment-crawl",
+    ),
+    path("crawl/jobs/<int:job_id>/", CrawlJobView.as_view(), name="crawl-job"),
+    path(
+        "series/<int:series_id>/comment/search",
+        SeriesCommentSearchView.as_view(),
+        name="series-comment-search",
+    ),
 ]
@@ -1,98 +1,88 @@
+from asgiref.sync import sync_to_async
 from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework.views import APIView
 from rest_framework.generics import ListAPIView, RetrieveAPIView
-from rest_framework.serializers import ModelSerializer
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework.permissions import AllowAny
-from django.db.models import Model
-from typing import Any
+from rest_framework.renderers import BrowsableAPIRenderer
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from functools import partial
 
 from .models import Series
 from .serializers import *
 from .pagination import OptionalCountPagination
-from .crawler.selenium_crawler import get_title_with_selenium
-from .crawler.crawler import (
-    get_series_info,
-    get_all_episodes_by_series,
-    get_episode_count_by_series,
-    get_comment_count_by_episode,
-    get_comments_by_episode,
+from .mixins import FieldsValuesListMixin
+from .ingest import acrawl_and_save_comments, save_crawled
+from .jobs import create_crawl_job, fail_stale_job, is_stale, submit_crawl_job
+from .ordering import (
+    COMMENT_LIST_SPEC,
+    EPISODE_LIST_SPEC,
+    SERIES_LIST_SPEC,
+    ListQuerySpecMixin,
 )
+from .search import SearchParameterError, parse_search_params, search_comments
+from .generations import mark_series_changed
+from .response_cache import cache_response
+from .fingerprints import comment_fingerprint, series_fingerprint
+from .exports import (
+    EXPORT_FORMATS,
+    ExportParameterError,
+    astream_comments,
+    get_export_filename,
+    get_export_queryset,
+    parse_since,
+    stream_comments,
+)
+from .crawler.cache import (
+    get_series_info_cached,
+    get_episode_count_by_series_cached,
+    get_series_metadata_cached,
+)
+from .crawler.crawler import aget_all_episodes_by_series
 from utils.swagger import (
+    get_count_mode_parameter,
     get_fields_query_parameter,
     get_path_parameter,
     get_ordering_query_parameter,
     get_page_parameter,
     DEFAULT_EPISODE_ID,
+    DEFAULT_SERIES_ID,
 )
+from utils.async_views import AsyncAPIView
+from utils.conditional import conditional_response
 from utils.serializers import ErrorResponseSerializer
-
-DEFAULT_SERIES_ID = "61822163"  # 기본 시리즈 ID
+from utils.renderers import FastJSONRenderer
+from llm.models import EpisodeSentimentStats
 
 
-def validate_and_separate_data(
-    data: list[dict[str, Any]], serializer_class: type[ModelSerializer]
-) -> tuple[list[Model], list[dict[str, Any]], list[dict[str, Any]]]:
+def run_cached_lookup(func, **kwargs):
     """
-    주어진 데이터 리스트를 검증하고 유효한 데이터와 유효하지 않은 데이터를 분리합니다.
+    캐시를 거치는 상류 조회(시리즈 정보/메타데이터/에피소드 수)는 동기 코드라 스레드에서 실행.
+    요청의 DB 스레드(thread_sensitive)를 막지 않도록 별도 스레드 풀을 사용합니다.
+    """
+    return sync_to_async(func, thread_sensitive=False)(**kwargs)
 
-    Args:
-        data (List[Dict[str, Any]]): 검증할 데이터 리스트.
-        serializer_class (Type[ModelSerializer]): 데이터를 검증할 직렬화 클래스.
 
-    Returns:
-        Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
-            유효한 데이터 리스트와 유효하지 않은 데이터 리스트.
-    """
-    valid_instances, valid_data, invalid_data = [], [], []
-    model = serializer_class.Meta.model  # type: ignore
-    for item in data:
-        # print(item)
-        serializer = serializer_class(data=item)
-        if serializer.is_valid():
-            valid_instances.append(model(**serializer.validated_data))  # type: ignore
-            valid_data.append(serializer.data)
-        else:
-            invalid_data.append({"data": item, "errors": serializer.errors})
-    return valid_instances, valid_data, invalid_data
-
-
-class SeriesListView(ListAPIView):
+class SeriesListView(ListQuerySpecMixin, FieldsValuesListMixin, ListAPIView):
     serializer_class = SeriesSerializer
+    list_spec = SERIES_LIST_SPEC
     request: Request
     pagination_class = OptionalCountPagination
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    query_budget = 3  # 지문(ETag) + 목록 + 전체 개수
 
     def get_queryset(self):
-        queryset = Series.objects.all()
-
-        # 정렬 처리
-        ordering_param = self.request.query_params.get("ordering", None)
-        if ordering_param:
-            ordering_fields = ordering_param.split(",")
-            queryset = queryset.order_by(*ordering_fields)
-
-        # 필드 선택 처리
-        field_params = self.request.query_params.get("fields", None)
-        if field_params:
-            fields = field_params.split(",")
-            queryset = queryset.only(*fields)
-
-        return queryset
-
-    def get_serializer(self, *args, **kwargs):
-        field_params = self.request.query_params.get("fields", None)
-        if field_params:
-            fields = field_params.split(",")
-            kwargs["fields"] = fields
-        return super().get_serializer(*args, **kwargs)
+        return self.apply_list_params(Series.objects.all())
 
     @swagger_auto_schema(
         operation_description="Retrieve a list of series",
         manual_parameters=[
             get_fields_query_parameter(),
-            get_ordering_query_parameter("id,-created_at,title"),
+            get_ordering_query_parameter("-id"),
             openapi.Parameter(
                 "include_count",
                 openapi.IN_QUERY,
@@ -100,6 +90,7 @@ class SeriesListView(ListAPIView):
                 type=openapi.TYPE_BOOLEAN,
                 default=False,
             ),
+            get_count_mode_parameter(),
             openapi.Parameter(
                 "page",
                 openapi.IN_QUERY,
@@ -110,11 +101,12 @@ class SeriesListView(ListAPIView):
             get_page_parameter(),
         ],
     )
+    @conditional_response(series_fingerprint)
     def get(self, request: Request) -> Response:
         return super().get(request)
 
 
-class SeriesView(APIView):
+class SeriesView(AsyncAPIView):
     @swagger_auto_schema(
         operation_description="Create a series",
         request_body=SeriesCreateSerializer,  # Serializer를 직접 사용
@@ -124,15 +116,15 @@ class SeriesView(APIView):
             500: ErrorResponseSerializer,
         },
     )
-    def post(self, request: Request) -> Response:
+    async def post(self, request: Request) -> Response:
         serializer = SeriesCreateSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
 
         series_id = serializer.validated_data[  # type: ignore
             "id"
         ]  # is_valid를 하면 validated_data attr가 생김.
         try:
-            get_series_info(series_id=series_id)
+            await run_cached_lookup(get_series_info_cached, series_id=series_id)
         except Exception as e:
             return Response(
                 {
@@ -144,7 +136,9 @@ class SeriesView(APIView):
             )
         user = request.user
         try:
-            title, image_src = get_title_with_selenium(series_id=series_id).values()
+            metadata = await run_cached_lookup(
+                get_series_metadata_cached, series_id=series_id
+            )
         except Exception as e:
             return Response(
                 {
@@ -158,13 +152,13 @@ class SeriesView(APIView):
         serializer = SeriesSerializer(
             data={
                 "id": series_id,
-                "title": title,
-                "image_src": image_src,
+                "title": metadata["title"],
+                "image_src": metadata["image_src"],
                 "user": user.id,
             }
         )
-        if serializer.is_valid(raise_exception=True):
-            serializer.save()
+        if await sync_to_async(serializer.is_valid)(raise_exception=True):
+            await sync_to_async(serializer.save)()
         return Response(
             {"message": "Series created successfully", "data": serializer.data},
             status=200,
@@ -186,6 +180,7 @@ class SeriesDetailView(APIView):
             ),
         ],
     )
+    @cache_response("series", "series_id")
     def get(self, request: Request, series_id: int) -> Response:
         try:
             series = Series.objects.get(id=series_id)
@@ -203,7 +198,7 @@ class SeriesDetailView(APIView):
         return Response(serializer.data)
 
 
-class EpisodeCrawlView(APIView):
+class EpisodeCrawlView(AsyncAPIView):
     pass
 
     @swagger_auto_schema(
@@ -214,10 +209,12 @@ class EpisodeCrawlView(APIView):
             500: ErrorResponseSerializer,  # EPISODE_CRAWL_FAILED
         },
     )
-    def post(self, request: Request, series_id: int) -> Response:
+    async def post(self, request: Request, series_id: int) -> Response:
 
-        episode_count = get_episode_count_by_series(series_id=series_id)
-        if episode_count <= Episode.objects.filter(series=series_id).count():
+        episode_count = await run_cached_lookup(
+            get_episode_count_by_series_cached, series_id=series_id
+        )
+        if episode_count <= await Episode.objects.filter(series=series_id).acount():
             return Response(
                 {
                     "error_code": "NO_NEW_EPISODES",
@@ -231,7 +228,7 @@ class EpisodeCrawlView(APIView):
         try:
             data = [
                 {**item, "user": user.id}
-                for item in get_all_episodes_by_series(series_id=series_id)
+                for item in await aget_all_episodes_by_series(series_id=series_id)
             ]
         except Exception as e:
             return Response(
@@ -243,54 +240,36 @@ class EpisodeCrawlView(APIView):
                 status=500,
             )
 
-        valid_instances, valid_data, invalid_data = validate_and_separate_data(
-            data, EpisodeSerializer
+        valid_instances, valid_data, invalid_data = await sync_to_async(save_crawled)(
+            Episode, data, EpisodeSerializer
         )
         if valid_instances:
-            Episode.objects.bulk_create(valid_instances)  # type: ignore
+            await sync_to_async(mark_series_changed)(series_id)
         return Response(
             {"created_data": valid_data, "errors": invalid_data}, status=207
         )
 
 
-class EpisodeListView(ListAPIView):
+class EpisodeListView(ListQuerySpecMixin, FieldsValuesListMixin, ListAPIView):
     """
     에피소드 목록을 조회하는 API 뷰입니다.
     """
 
     serializer_class = EpisodeSerializer
+    list_spec = EPISODE_LIST_SPEC
     pagination_class = OptionalCountPagination
     request: Request
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    query_budget = 2
 
     def get_queryset(self):
         series_id = self.kwargs.get("series_id")
-        queryset = Episode.objects.filter(series=series_id)
-
-        # 정렬 처리
-        ordering_param = self.request.query_params.get("ordering", None)
-        if ordering_param:
-            ordering_fields = ordering_param.split(",")
-            queryset = queryset.order_by(*ordering_fields)
-
-        # 필드 선택 처리
-        fields_param = self.request.query_params.get("fields", None)
-        if fields_param:
-            fields = fields_param.split(",")
-            queryset = queryset.only(*fields)
-
-        return queryset
-
-    def get_serializer(self, *args, **kwargs):
-        fields_param = self.request.query_params.get("fields", None)
-        if fields_param:
-            fields = fields_param.split(",")
-            kwargs["fields"] = fields
-        return super().get_serializer(*args, **kwargs)
+        return self.apply_list_params(Episode.objects.filter(series=series_id))
 
     @swagger_auto_schema(
         manual_parameters=[
             get_fields_query_parameter(),
-            get_ordering_query_parameter("id,-created_at,name"),
+            get_ordering_query_parameter("-id"),
             get_path_parameter(
                 name="series_id",
                 description="에피소드가 속한 시리즈의 ID",
@@ -303,6 +282,7 @@ class EpisodeListView(ListAPIView):
                 type=openapi.TYPE_BOOLEAN,
                 default=False,
             ),
+            get_count_mode_parameter(),
             openapi.Parameter(
                 "page",
                 openapi.IN_QUERY,
@@ -313,6 +293,7 @@ class EpisodeListView(ListAPIView):
             get_page_parameter(),
         ]
     )
+    @cache_response("series", "series_id")
     def get(self, request, series_id: int, *args, **kwargs):
         return super().get(request, series_id, *args, **kwargs)
 
@@ -332,6 +313,7 @@ class EpisodeDetailView(APIView):
             ),
         ],
     )
+    @cache_response("episode", "product_id")
     def get(self, request: Request, product_id: int) -> Response:
         try:
             episode = Episode.objects.get(id=product_id)
@@ -349,7 +331,7 @@ class EpisodeDetailView(APIView):
         return Response(serializer.data)
 
 
-class CommentCrawlView(APIView):
+class CommentCrawlView(AsyncAPIView):
     @swagger_auto_schema(
         operation_description="에피소드의 댓글을 크롤링하여 db에 저장합니다.",
         manual_parameters=[
@@ -365,22 +347,10 @@ class CommentCrawlView(APIView):
             500: ErrorResponseSerializer,  # COMMENT_CRAWL_FAILED
         },
     )
-    def post(self, request: Request, product_id: int) -> Response:
-        series_id = Episode.objects.get(id=product_id).series.id
-        comment_count = get_comment_count_by_episode(
-            series_id=series_id, product_id=product_id
-        )
-        if comment_count <= Comment.objects.filter(id=product_id).count():
-            return Response(
-                {
-                    "error_code": "NO_NEW_COMMENTS",
-                    "message": "댓글을 크롤링할 필요가 없습니다.",
-                    "detail": "모든 댓글이 이미 수집되었습니다.",
-                }
-            )
-
+    async def post(self, request: Request, product_id: int) -> Response:
+        series_id = (await Episode.objects.aget(id=product_id)).series_id
         try:
-            data = get_comments_by_episode(series_id=series_id, product_id=product_id)
+            result = await acrawl_and_save_comments(series_id, product_id)
         except Exception as e:
             return Response(
                 {
@@ -390,55 +360,123 @@ class CommentCrawlView(APIView):
                 },
                 status=500,
             )
+        if result is None:
+            return Response(
+                {
+                    "error_code": "NO_NEW_COMMENTS",
+                    "message": "댓글을 크롤링할 필요가 없습니다.",
+                    "detail": "모든 댓글이 이미 수집되었습니다.",
+                }
+            )
 
-        valid_instances, valid_data, invalid_data = validate_and_separate_data(
-            data, CommentSerializer
-        )
-        if valid_instances:
-            Comment.objects.bulk_create(valid_instances)  # type: ignore
+        _, valid_data, invalid_data = result
         return Response(
             {"created_data": valid_data, "errors": invalid_data}, status=207
         )
 
 
-class CommentListView(ListAPIView):
+class SeriesCommentCrawlView(APIView):
+    @swagger_auto_schema(
+        operation_description="시리즈의 모든 에피소드 댓글을 백그라운드에서 크롤링하는 작업을 시작합니다. "
+        "진행 상황은 crawl/jobs/<job_id>/ 에서 조회합니다. 같은 시리즈의 작업이 실행 중이면 그 작업을 반환합니다.",
+        manual_parameters=[
+            get_path_parameter(
+                name="series_id",
+                description="댓글을 크롤링할 시리즈의 ID",
+                default=DEFAULT_SERIES_ID,
+            ),
+        ],
+        responses={
+            202: CrawlJobSerializer,  # 새 작업 시작
+            200: CrawlJobSerializer,  # 이미 실행 중인 작업
+            400: ErrorResponseSerializer,  # NO_EPISODES
+            404: ErrorResponseSerializer,  # SERIES_NOT_FOUND
+        },
+    )
+    def post(self, request: Request, series_id: int) -> Response:
+        if not Series.objects.filter(id=series_id).exists():
+            return Response(
+                {
+                    "error_code": "SERIES_NOT_FOUND",
+                    "message": "시리즈를 찾을 수 없습니다.",
+                    "detail": f"ID {series_id}에 해당하는 시리즈가 존재하지 않습니다.",
+                },
+                status=404,
+            )
+        if not Episode.objects.filter(series=series_id).exists():
+            return Response(
+                {
+                    "error_code": "NO_EPISODES",
+                    "message": "크롤링할 에피소드가 없습니다.",
+                    "detail": "에피소드를 먼저 크롤링해 주세요.",
+                },
+                status=400,
+            )
+
+        job, created = create_crawl_job(series_id)
+        if created:
+            transaction.on_commit(partial(submit_crawl_job, job.id))
+        return Response(CrawlJobSerializer(job).data, status=202 if created else 200)
+
+
+class CrawlJobView(APIView):
+    query_budget = 2  # 작업 조회 + 멈춘 작업을 FAILED로 기록
+
+    @swagger_auto_schema(
+        operation_description="시리즈 댓글 크롤링 작업의 진행 상황을 조회합니다.",
+        manual_parameters=[
+            get_path_parameter(name="job_id", description="크롤링 작업 ID"),
+        ],
+        responses={
+            200: CrawlJobSerializer,
+            404: ErrorResponseSerializer,
+        },
+    )
+    def get(self, request: Request, job_id: int) -> Response:
+        try:
+            job = CrawlJob.objects.get(id=job_id)
+        except CrawlJob.DoesNotExist:
+            return Response(
+                {
+                    "error_code": "CRAWL_JOB_NOT_FOUND",
+                    "message": "크롤링 작업을 찾을 수 없습니다.",
+                    "detail": f"ID {job_id}에 해당하는 작업이 존재하지 않습니다.",
+                },
+                status=404,
+            )
+        if is_stale(job):
+            fail_stale_job(job)
+        return Response(CrawlJobSerializer(job).data)
+
+
+class CommentListView(ListQuerySpecMixin, FieldsValuesListMixin, ListAPIView):
     """
     에피소드 댓글 목록을 조회하는 API 뷰입니다.
     """
 
     serializer_class = CommentSerializer
+    list_spec = COMMENT_LIST_SPEC
     request: Request
     pagination_class = OptionalCountPagination  # 커스텀 페이지네이션 클래스 사용
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    query_budget = 3  # 목록 + 전체 개수 + 댓글 수 집계(count_mode=cached)
 
     def get_queryset(self):
         product_id = self.kwargs.get("product_id")
-        queryset = Comment.objects.filter(episode=product_id)
-
-        # 정렬 처리
-        ordering_param = self.request.query_params.get("ordering", None)
-        if ordering_param:
-            ordering_fields = ordering_param.split(",")
-            queryset = queryset.order_by(*ordering_fields)
-
-        # 필드 선택 처리
-        fields_param = self.request.query_params.get("fields", None)
-        if fields_param:
-            fields = fields_param.split(",")
-            queryset = queryset.only(*fields)
-
-        return queryset
-
-    def get_serializer(self, *args, **kwargs):
-        fields_param = self.request.query_params.get("fields", None)
-        if fields_param:
-            fields = fields_param.split(",")
-            kwargs["fields"] = fields
-        return super().get_serializer(*args, **kwargs)
+        return self.apply_list_params(Comment.objects.filter(episode=product_id))
+
+    def get_cached_count(self) -> int | None:
+        """count_mode=cached: 크롤링/분석 때마다 갱신되는 에피소드 집계의 댓글 수"""
+        return (
+            EpisodeSentimentStats.objects.filter(episode=self.kwargs["product_id"])
+            .values_list("comment_count", flat=True)
+            .first()
+        )
 
     @swagger_auto_schema(
         manual_parameters=[
             get_fields_query_parameter(),
-            get_ordering_query_parameter("id,-created_at,content"),
+            get_ordering_query_parameter("-created_at"),
             get_path_parameter(
                 name="product_id",
                 description="댓글이 속한 에피소드의 ID",
@@ -451,6 +489,7 @@ class CommentListView(ListAPIView):
                 type=openapi.TYPE_BOOLEAN,
                 default=False,
             ),
+            get_count_mode_parameter(),
             openapi.Parameter(
                 "page",
                 openapi.IN_QUERY,
@@ -461,6 +500,7 @@ class CommentListView(ListAPIView):
             get_page_parameter(),
         ]
     )
+    @cache_response("episode", "product_id")
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
 
@@ -484,6 +524,7 @@ class CommentCountView(APIView):
             404: ErrorResponseSerializer,
         },
     )
+    @conditional_response(lambda product_id: comment_fingerprint(episode=product_id))
     def get(self, request: Request, product_id: int) -> Response:
 
         count = Comment.objects.filter(episode=product_id).count()
@@ -491,8 +532,9 @@ class CommentCountView(APIView):
         not_spam_count = Comment.objects.filter(
             episode=product_id, is_spam=False
         ).count()
+        # 로컬 감정 모델로 채점한 댓글은 스팸 여부가 비어 있어도 처리된 댓글
         unprocessed_count = Comment.objects.filter(
-            episode=product_id, is_spam=None
+            episode=product_id, is_ai_processed=False
         ).count()
         serializer = CommentCountSerializer(
             data={
@@ -505,3 +547,275 @@ class CommentCountView(APIView):
         )
         serializer.is_valid(raise_exception=True)
         return Response(serializer.data)
+
+
+COMMENT_EXPORT_PARAMETERS = [
+    openapi.Parameter(
+        "export_format",
+        openapi.IN_QUERY,
+        description="내보내기 형식 (ndjson/csv)",
+        type=openapi.TYPE_STRING,
+        enum=list(EXPORT_FORMATS),
+        default="ndjson",
+    ),
+    openapi.Parameter(
+        "gzip",
+        openapi.IN_QUERY,
+        description="gzip 압축 여부 (true/false)",
+        type=openapi.TYPE_BOOLEAN,
+        default=False,
+    ),
+    openapi.Parameter(
+        "since",
+        openapi.IN_QUERY,
+        description="이 시각 이후 작성된 댓글만 내보냄 (ISO 8601, 증분 내보내기용)",
+        type=openapi.TYPE_STRING,
+        format=openapi.FORMAT_DATETIME,
+    ),
+]
+
+
+class CommentExportBaseView(APIView):
+    """
+    댓글을 NDJSON/CSV 스트림으로 내보내는 공통 뷰입니다.
+    서버 사이드 커서로 읽어 바로 흘려보내므로 댓글 수와 관계없이 메모리 사용량이 일정합니다.
+    ASGI(uvicorn) 요청은 비동기 스트림으로, WSGI 요청은 동기 스트림으로 응답합니다.
+    (반대로 넘기면 Django가 전체를 메모리에 모은 뒤에 보냄)
+    """
+
+    def export(self, request: Request, target: str, **filters) -> Response:
+        export_format = request.query_params.get("export_format", "ndjson")
+        compress = request.query_params.get("gzip", "").lower() in (
+            "true",
+            "1",
+            "yes",
+        )
+        try:
+            since = parse_since(request.query_params.get("since"))
+            if export_format not in EXPORT_FORMATS:
+                raise ExportParameterError(f"지원하지 않는 형식입니다: {export_format}")
+        except ExportParameterError as e:
+            return Response(
+                {
+                    "error_code": "INVALID_EXPORT_PARAMETER",
+                    "message": "내보내기 파라미터가 잘못되었습니다.",
+                    "detail": str(e),
+                },
+                status=400,
+            )
+
+        queryset = get_export_queryset(since=since, **filters)
+        stream = (
+            astream_comments
+            if isinstance(request._request, ASGIRequest)
+            else stream_comments
+        )
+        response = StreamingHttpResponse(
+            stream(queryset, export_format, compress),
+            content_type=(
+                "application/gzip" if compress else EXPORT_FORMATS[export_format]
+            ),
+        )
+        filename = get_export_filename(target, export_format, compress)
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+
+class EpisodeCommentExportView(CommentExportBaseView):
+    @swagger_auto_schema(
+        operation_description="에피소드의 댓글을 NDJSON/CSV로 내보냅니다.",
+        manual_parameters=[
+            get_path_parameter(
+                name="product_id",
+                description="댓글을 내보낼 에피소드의 ID",
+                default=DEFAULT_EPISODE_ID,
+            ),
+            *COMMENT_EXPORT_PARAMETERS,
+        ],
+        responses={
+            200: "댓글 스트림",
+            400: ErrorResponseSerializer,
+            404: ErrorResponseSerializer,
+        },
+    )
+    def get(self, request: Request, product_id: int) -> Response:
+        if not Episode.objects.filter(id=product_id).exists():
+            return Response(
+                {
+                    "error_code": "EPISODE_NOT_FOUND",
+                    "message": "에피소드를 찾을 수 없습니다.",
+                    "detail": f"ID {product_id}에 해당하는 에피소드가 존재하지 않습니다.",
+                },
+                status=404,
+            )
+        return self.export(request, f"episode_{product_id}", episode_id=product_id)
+
+
+class SeriesCommentExportView(CommentExportBaseView):
+    @swagger_auto_schema(
+        operation_description="시리즈 전체 댓글을 NDJSON/CSV로 내보냅니다.",
+        manual_parameters=[
+            get_path_parameter(
+                name="series_id",
+                description="댓글을 내보낼 시리즈의 ID",
+                default=DEFAULT_SERIES_ID,
+            ),
+            *COMMENT_EXPORT_PARAMETERS,
+        ],
+        responses={
+            200: "댓글 스트림",
+            400: ErrorResponseSerializer,
+            404: ErrorResponseSerializer,
+        },
+    )
+    def get(self, request: Request, series_id: int) -> Response:
+        if not Series.objects.filter(id=series_id).exists():
+            return Response(
+                {
+                    "error_code": "SERIES_NOT_FOUND",
+                    "message": "시리즈를 찾을 수 없습니다.",
+                    "detail": f"ID {series_id}에 해당하는 시리즈가 존재하지 않습니다.",
+                },
+                status=404,
+            )
+        return self.export(request, f"series_{series_id}", series_id=series_id)
+
+
+COMMENT_SEARCH_PARAMETERS = [
+    openapi.Parameter(
+        "q",
+        openapi.IN_QUERY,
+        description="검색어 (댓글 내용 부분 일치, 대소문자 무시)",
+        type=openapi.TYPE_STRING,
+        required=True,
+    ),
+    openapi.Parameter(
+        "order",
+        openapi.IN_QUERY,
+        description="정렬 (recent: 최신순, relevance: 유사도순)",
+        type=openapi.TYPE_STRING,
+        enum=["recent", "relevance"],
+        default="recent",
+    ),
+    openapi.Parameter(
+        "is_best",
+        openapi.IN_QUERY,
+        description="베스트 댓글 여부",
+        type=openapi.TYPE_BOOLEAN,
+    ),
+    openapi.Parameter(
+        "is_spam",
+        openapi.IN_QUERY,
+        description="스팸 여부",
+        type=openapi.TYPE_BOOLEAN,
+    ),
+    openapi.Parameter(
+        "min_score",
+        openapi.IN_QUERY,
+        description="최소 AI 감정 점수",
+        type=openapi.TYPE_INTEGER,
+    ),
+    openapi.Parameter(
+        "max_score",
+        openapi.IN_QUERY,
+        description="최대 AI 감정 점수",
+        type=openapi.TYPE_INTEGER,
+    ),
+    openapi.Parameter(
+        "page_size",
+        openapi.IN_QUERY,
+        description="페이지당 항목 수 (최대 100)",
+        type=openapi.TYPE_INTEGER,
+        default=20,
+    ),
+    openapi.Parameter(
+        "cursor",
+        openapi.IN_QUERY,
+        description="이전 응답의 next_cursor 값",
+        type=openapi.TYPE_STRING,
+    ),
+]
+
+
+class CommentSearchBaseView(APIView):
+    """댓글 내용 검색 공통 뷰 (trigram 인덱스 + keyset 페이지네이션)"""
+
+    query_budget = 3  # 지문(ETag) + 존재 확인 + 검색
+
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+
+    def search(self, request: Request, **filters) -> Response:
+        try:
+            params = parse_search_params(request.query_params)
+            return Response(search_comments(**params, **filters))
+        except SearchParameterError as e:
+            return Response(
+                {
+                    "error_code": "INVALID_SEARCH_PARAMETER",
+                    "message": "검색 파라미터가 잘못되었습니다.",
+                    "detail": str(e),
+                },
+                status=400,
+            )
+
+
+class EpisodeCommentSearchView(CommentSearchBaseView):
+    @swagger_auto_schema(
+        operation_description="에피소드의 댓글 내용을 검색합니다.",
+        manual_parameters=[
+            get_path_parameter(
+                name="product_id",
+                description="검색할 에피소드의 ID",
+                default=DEFAULT_EPISODE_ID,
+            ),
+            *COMMENT_SEARCH_PARAMETERS,
+        ],
+        responses={
+            200: "검색 결과 (results, next_cursor)",
+            400: ErrorResponseSerializer,
+            404: ErrorResponseSerializer,
+        },
+    )
+    @conditional_response(lambda product_id: comment_fingerprint(episode=product_id))
+    def get(self, request: Request, product_id: int) -> Response:
+        if not Episode.objects.filter(id=product_id).exists():
+            return Response(
+                {
+                    "error_code": "EPISODE_NOT_FOUND",
+                    "message": "에피소드를 찾을 수 없습니다.",
+                    "detail": f"ID {product_id}에 해당하는 에피소드가 존재하지 않습니다.",
+                },
+                status=404,
+            )
+        return self.search(request, episode_id=product_id)
+
+
+class SeriesCommentSearchView(CommentSearchBaseView):
+    @swagger_auto_schema(
+        operation_description="시리즈 전체 댓글 내용을 검색합니다.",
+        manual_parameters=[
+            get_path_parameter(
+                name="series_id",
+                description="검색할 시리즈의 ID",
+                default=DEFAULT_SERIES_ID,
+            ),
+            *COMMENT_SEARCH_PARAMETERS,
+        ],
+        responses={
+            200: "검색 결과 (results, next_cursor)",
+            400: ErrorResponseSerializer,
+            404: ErrorResponseSerializer,
+        },
+    )
+    @conditional_response(lambda series_id: comment_fingerprint(series=series_id))
+    def get(self, request: Request, series_id: int) -> Response:
+        if not Series.objects.filter(id=series_id).exists():
+            return Response(
+                {
+                    "error_code": "SERIES_NOT_FOUND",
+                    "message": "시리즈를 찾을 수 없습니다.",
+                    "detail": f"ID {series_id}에 해당하는 시리즈가 존재하지 않습니다.",
+                },
+                status=404,
+            )
+        return self.search(request, series_id=series_id)
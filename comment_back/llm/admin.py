@@ -1,3 +1,24 @@
 from django.contrib import admin
 
+from .models import LLMCallLog
+
+
 # Register your models here.
+@admin.register(LLMCallLog)
+class LLMCallLogAdmin(admin.ModelAdmin):
+    list_display = (
+        "created_at",
+        "task",
+        "model",
+        "prompt_version",
+        "episode",
+        "comment_count",
+        "input_tokens",
+        "output_tokens",
+        "latency_ms",
+        "attempts",
+        "outcome",
+    )
+    list_filter = ("task", "model", "outcome", "cached")
+    raw_id_fields = ("episode",)
+    date_hierarchy = "created_at"
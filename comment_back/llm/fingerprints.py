@@ -0,0 +1,34 @@
+"""
+조건부 조회(utils/conditional.py)용 데이터 지문
+
+감정 분석 집계(EpisodeSentimentStats)는 댓글 크롤링/분석/초기화 때마다 다시 저장되므로
+updated_at이 에피소드/시리즈 댓글 데이터의 지문 역할을 합니다. (에피소드당 1행이라 조회가 작음)
+"""
+
+from django.db.models import Count, Max
+
+from .models import CommentsSummaryResult, EpisodeSentimentStats
+
+
+def episode_stats_fingerprint(episode_id: int):
+    """집계가 아직 없으면 None (뷰에서 계산해서 저장)"""
+    return (
+        EpisodeSentimentStats.objects.filter(episode_id=episode_id)
+        .values_list("updated_at", flat=True)
+        .first()
+    )
+
+
+def series_stats_fingerprint(series_id: int) -> tuple:
+    row = EpisodeSentimentStats.objects.filter(episode__series=series_id).aggregate(
+        count=Count("episode"), updated_at=Max("updated_at")
+    )
+    return tuple(row.values())
+
+
+def summary_fingerprint(episode_id: int) -> tuple:
+    """요약은 생성/전체 삭제만 되므로 개수와 최근 생성 시각으로 충분"""
+    row = CommentsSummaryResult.objects.filter(episode=episode_id).aggregate(
+        count=Count("id"), created_at=Max("created_at")
+    )
+    return tuple(row.values())
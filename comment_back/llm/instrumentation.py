@@ -0,0 +1,307 @@
+"""
+LLM 호출 계측
+
+한 번의 LLM 호출마다 모델, 프롬프트 버전, 토큰 수, 추정 비용, 지연 시간, 재시도 횟수,
+파싱 실패 여부, 에피소드를 LLMCallLog에 저장합니다.
+
+    with LLMCallRecorder("emotion", episode=episode, comment_count=len(comments)) as call:
+        text = generate_comment_emotion(comments, call.provider)
+        try:
+            parse(text)
+        except ValueError as e:
+            call.mark_parse_failure(e)
+
+비동기 뷰에서는 async with와 agenerate_* 함수를 사용합니다.
+
+기록을 저장하다 실패해도 분석 요청은 실패시키지 않습니다.
+"""
+
+import hashlib
+import time
+from logging import getLogger
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from crawler.models import Episode
+from services.llm_provider import (
+    LLMProvider,
+    LLMRequest,
+    LLMResponse,
+    get_llm_provider,
+)
+from services.llm_resilience import LLMCircuitOpenError, LLMTimeoutError
+from .models import LLMCallLog
+from .stats import percentile_from_counts
+
+logger = getLogger(__name__)
+
+
+def get_prompt_version(request: LLMRequest) -> str:
+    """시스템 프롬프트와 응답 형식의 해시. 프롬프트를 고치면 자동으로 바뀜"""
+    payload = "\0".join(
+        [
+            request.system_instruction,
+            request.response_mime_type,
+            str(request.response_schema),
+        ]
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=6).hexdigest()
+
+
+def estimate_cost(
+    model: str, input_tokens: int | None, output_tokens: int | None
+) -> float | None:
+    """settings.LLM_TOKEN_PRICES (100만 토큰당 USD) 기준 추정 비용"""
+    prices = settings.LLM_TOKEN_PRICES.get(model)
+    if prices is None or input_tokens is None or output_tokens is None:
+        return None
+    input_price, output_price = prices
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+
+class _RecordingProvider(LLMProvider):
+    """현재 설정의 제공자로 호출하면서 요청/응답을 기록기에 남김"""
+
+    def __init__(self, recorder: "LLMCallRecorder", inner: LLMProvider | None):
+        self.recorder = recorder
+        self.inner = inner
+
+    def _start(self, request: LLMRequest) -> LLMProvider:
+        inner = self.inner or get_llm_provider()
+        self.recorder.provider_name = inner.name
+        self.recorder.request = request
+        return inner
+
+    def generate(self, request: LLMRequest) -> LLMResponse:
+        inner = self._start(request)
+        started_at = time.perf_counter()
+        try:
+            self.recorder.response = inner.generate(request)
+        finally:
+            # 파싱 시간은 빼고 제공자 호출 시간(재시도 포함)만 기록
+            self.recorder.latency_ms = (time.perf_counter() - started_at) * 1000
+        return self.recorder.response
+
+    async def agenerate(self, request: LLMRequest) -> LLMResponse:
+        inner = self._start(request)
+        started_at = time.perf_counter()
+        try:
+            self.recorder.response = await inner.agenerate(request)
+        finally:
+            self.recorder.latency_ms = (time.perf_counter() - started_at) * 1000
+        return self.recorder.response
+
+
+class LLMCallRecorder:
+    def __init__(
+        self,
+        task: str,
+        episode: Episode | int | None = None,
+        comment_count: int = 0,
+        provider: LLMProvider | None = None,
+    ):
+        self.task = task
+        self.episode_id = episode.id if isinstance(episode, Episode) else episode
+        self.comment_count = comment_count
+        self.provider = _RecordingProvider(self, provider)
+        self.provider_name = ""
+        self.request: LLMRequest | None = None
+        self.response: LLMResponse | None = None
+        self.latency_ms = 0.0
+        self.parse_error: str | None = None
+        self.log: LLMCallLog | None = None
+
+    def mark_parse_failure(self, error: Exception | str) -> None:
+        self.parse_error = str(error)
+
+    def __enter__(self) -> "LLMCallRecorder":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if self.request is None:
+            return False  # LLM을 호출하지 않음
+
+        if exc is None and self.parse_error is None:
+            outcome, error_message = LLMCallLog.Outcome.SUCCESS, ""
+        elif exc is None:
+            outcome, error_message = LLMCallLog.Outcome.PARSE_ERROR, self.parse_error
+        elif isinstance(exc, LLMTimeoutError):
+            outcome, error_message = LLMCallLog.Outcome.TIMEOUT, str(exc)
+        elif isinstance(exc, LLMCircuitOpenError):
+            outcome, error_message = LLMCallLog.Outcome.CIRCUIT_OPEN, str(exc)
+        else:
+            outcome, error_message = LLMCallLog.Outcome.ERROR, str(exc)
+
+        response = self.response
+        input_tokens = response.input_tokens if response else None
+        output_tokens = response.output_tokens if response else None
+        try:
+            self.log = LLMCallLog.objects.create(
+                task=self.task,
+                provider=self.provider_name,
+                model=response.model if response else self.request.model,
+                prompt_version=get_prompt_version(self.request),
+                episode_id=self.episode_id,
+                comment_count=self.comment_count,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cost_usd=estimate_cost(self.request.model, input_tokens, output_tokens),
+                latency_ms=self.latency_ms,
+                attempts=(
+                    response.attempts if response else getattr(exc, "attempts", 0)
+                ),
+                hedged=response.hedged if response else False,
+                cached=response.cached if response else False,
+                outcome=outcome,
+                error_message=error_message[:1000],
+            )
+        except Exception as e:
+            logger.warning(f"LLM 호출 기록 저장 실패: {e}")
+        return False
+
+    async def __aenter__(self) -> "LLMCallRecorder":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return await sync_to_async(self.__exit__)(exc_type, exc, tb)
+
+
+REPORT_PERCENTILES = {"p50": 0.50, "p90": 0.90, "p95": 0.95, "p99": 0.99}
+# 배치 크기(한 번에 보낸 댓글 수) 구간. 배치 크기 조정용
+BATCH_SIZE_BUCKETS = ((1, 10), (11, 25), (26, 50), (51, 100), (101, None))
+
+
+def _percentiles(values: list[float]) -> dict[str, float | None]:
+    value_counts = [(value, 1) for value in sorted(values)]
+    return {
+        name: percentile_from_counts(value_counts, len(values), q)
+        for name, q in REPORT_PERCENTILES.items()
+    }
+
+
+def _mean(values: list[float]) -> float | None:
+    return sum(values) / len(values) if values else None
+
+
+def _summarize(calls: list[dict]) -> dict:
+    """호출 기록 목록의 지연 시간 백분위수, 토큰/비용 합계, 실패율"""
+    count = len(calls)
+    outcomes = {outcome: 0 for outcome in LLMCallLog.Outcome.values}
+    for call in calls:
+        outcomes[call["outcome"]] += 1
+
+    answered = [
+        call
+        for call in calls
+        if call["outcome"]
+        in (LLMCallLog.Outcome.SUCCESS, LLMCallLog.Outcome.PARSE_ERROR)
+    ]
+    latencies = [call["latency_ms"] for call in answered]
+    comment_count = sum(call["comment_count"] for call in answered)
+    input_tokens = sum(call["input_tokens"] or 0 for call in answered)
+    output_tokens = sum(call["output_tokens"] or 0 for call in answered)
+    costs = [call["cost_usd"] for call in calls if call["cost_usd"] is not None]
+    total_cost = sum(costs) if costs else None
+
+    return {
+        "count": count,
+        "outcomes": outcomes,
+        "error_rate": (count - outcomes[LLMCallLog.Outcome.SUCCESS]) / count,
+        "parse_failure_rate": (
+            outcomes[LLMCallLog.Outcome.PARSE_ERROR] / len(answered)
+            if answered
+            else None
+        ),
+        "retries": sum(max(call["attempts"] - 1, 0) for call in calls),
+        "hedged": sum(call["hedged"] for call in calls),
+        "cache_hits": sum(call["cached"] for call in calls),
+        "latency_ms": {
+            **_percentiles(latencies),
+            "mean": _mean(latencies),
+            "max": max(latencies, default=None),
+        },
+        "latency_ms_per_comment": (
+            sum(latencies) / comment_count if comment_count else None
+        ),
+        "comment_count_mean": _mean([call["comment_count"] for call in answered]),
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "tokens_per_comment": (
+            (input_tokens + output_tokens) / comment_count if comment_count else None
+        ),
+        "cost_usd": total_cost,
+        "cost_usd_per_comment": (
+            total_cost / comment_count
+            if total_cost is not None and comment_count
+            else None
+        ),
+    }
+
+
+def _batch_size_bucket(comment_count: int) -> int:
+    for index, (_, high) in enumerate(BATCH_SIZE_BUCKETS):
+        if high is None or comment_count <= high:
+            return index
+
+
+def _batch_size_label(index: int) -> str:
+    low, high = BATCH_SIZE_BUCKETS[index]
+    return f"{low}+" if high is None else f"{low}-{high}"
+
+
+def build_llm_call_report(since, task: str | None = None) -> dict:
+    """
+    since 이후 LLM 호출을 (작업, 모델, 프롬프트 버전)별, 그리고 배치 크기 구간별로 집계합니다.
+    호출 기록은 하루 수천 건 수준이라 한 번에 읽어서 파이썬에서 백분위수를 계산합니다.
+    """
+    queryset = LLMCallLog.objects.filter(created_at__gte=since)
+    if task:
+        queryset = queryset.filter(task=task)
+    calls = list(
+        queryset.order_by("created_at").values(
+            "task",
+            "model",
+            "prompt_version",
+            "comment_count",
+            "input_tokens",
+            "output_tokens",
+            "cost_usd",
+            "latency_ms",
+            "attempts",
+            "hedged",
+            "cached",
+            "outcome",
+        )
+    )
+
+    groups: dict[tuple, list[dict]] = {}
+    batch_sizes: dict[tuple, list[dict]] = {}
+    for call in calls:
+        key = (call["task"], call["model"], call["prompt_version"])
+        groups.setdefault(key, []).append(call)
+        if call["comment_count"]:
+            batch_key = (call["task"], _batch_size_bucket(call["comment_count"]))
+            batch_sizes.setdefault(batch_key, []).append(call)
+
+    return {
+        "since": since,
+        "total": _summarize(calls) if calls else None,
+        "groups": [
+            {
+                "task": task,
+                "model": model,
+                "prompt_version": prompt_version,
+                **_summarize(group_calls),
+            }
+            for (task, model, prompt_version), group_calls in sorted(groups.items())
+        ],
+        "batch_sizes": [
+            {
+                "task": task,
+                "batch_size": _batch_size_label(bucket),
+                **_summarize(batch_calls),
+            }
+            for (task, bucket), batch_calls in sorted(batch_sizes.items())
+        ],
+    }
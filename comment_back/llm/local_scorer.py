@@ -0,0 +1,281 @@
+"""
+로컬 감정 점수 모델 (1차 채점기)
+
+LLM이 매긴 ai_emotion_score로 학습하는 CPU 전용 경량 모델입니다.
+정규화한 댓글의 글자 1~3-gram을 해시해서 특징으로 쓰고, 특징별 평균 점수(스무딩된 어휘 사전)를
+구한 뒤 댓글 점수를 특징 평균의 가중 평균으로 계산합니다. 학습과 채점 모두 NumPy 배열 연산으로
+한 번에 처리하므로 댓글 하나당 수 마이크로초 수준입니다.
+
+확신도(confidence)가 낮은 댓글만 LLM으로 보내도록 감정 분석 파이프라인에서 사용합니다.
+numpy는 선택 의존성입니다 (pip install numpy).
+"""
+
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Sequence
+
+from django.conf import settings
+from django.db.models.functions import Mod
+
+from crawler.models import Comment
+from .prefilter import normalize_content
+
+FEATURE_DIM = 1 << 18
+NGRAM_SIZES = (1, 2, 3)
+SMOOTHING = 5.0  # 특징별 평균을 전체 평균 쪽으로 당기는 가상 표본 수
+SPREAD_SCALE = 50.0  # 특징 평균 점수의 표준편차가 이 값이면 확신도 0
+LOCAL_REASON_PREFIX = "[로컬 모델]"
+
+# 평가 시 감정 구간: 0~39 부정, 40~60 중립, 61~100 긍정
+NEGATIVE_MAX = 39
+POSITIVE_MIN = 61
+
+
+class ScorerDependencyError(ImportError):
+    """numpy가 설치되어 있지 않을 때 발생하는 에러"""
+
+
+class ScorerNotTrainedError(Exception):
+    """학습된 모델 파일이 없을 때 발생하는 에러"""
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ScorerDependencyError(
+            "로컬 감정 모델을 사용하려면 numpy를 설치해야 합니다."
+        ) from e
+    return numpy
+
+
+def get_features(content: str) -> list[int]:
+    """댓글의 해시된 글자 n-gram 특징 인덱스 (중복 제거)"""
+    text = normalize_content(content)
+    features = {
+        zlib.crc32(f"{size}:{text[i : i + size]}".encode()) % FEATURE_DIM
+        for size in NGRAM_SIZES
+        for i in range(len(text) - size + 1)
+    }
+    return sorted(features)
+
+
+def _flatten_features(contents: Sequence[str]):
+    """댓글별 특징을 한 배열로 이어 붙이고 댓글 경계(offsets)와 개수를 반환"""
+    np = _import_numpy()
+    feature_lists = [get_features(content) for content in contents]
+    lengths = np.fromiter(map(len, feature_lists), dtype=np.int64, count=len(contents))
+    indices = np.fromiter(
+        (index for features in feature_lists for index in features),
+        dtype=np.int64,
+        count=int(lengths.sum()),
+    )
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    return indices, offsets, lengths
+
+
+def _segment_sum(values, offsets, lengths):
+    """댓글별 구간 합. 특징이 없는 댓글은 0"""
+    np = _import_numpy()
+    sums = np.zeros(len(lengths), dtype=np.float64)
+    if len(values):
+        non_empty = lengths > 0
+        sums[non_empty] = np.add.reduceat(values, offsets[non_empty])
+    return sums
+
+
+@dataclass
+class ScoreResult:
+    scores: Any  # numpy.ndarray[int]
+    confidences: Any  # numpy.ndarray[float]
+
+
+class LocalSentimentScorer:
+    def __init__(
+        self,
+        feature_means,
+        feature_reliability,
+        mean: float,
+        slope: float,
+        intercept: float,
+    ):
+        self.feature_means = feature_means
+        self.feature_reliability = feature_reliability
+        self.mean = mean
+        self.slope = slope
+        self.intercept = intercept
+
+    @classmethod
+    def train(
+        cls, contents: Sequence[str], scores: Sequence[int]
+    ) -> "LocalSentimentScorer":
+        np = _import_numpy()
+        if not len(contents):
+            raise ValueError("학습할 댓글이 없습니다.")
+
+        labels = np.asarray(scores, dtype=np.float64)
+        indices, _, lengths = _flatten_features(contents)
+        repeated_labels = np.repeat(labels, lengths)
+
+        counts = np.bincount(indices, minlength=FEATURE_DIM)
+        sums = np.bincount(indices, weights=repeated_labels, minlength=FEATURE_DIM)
+        mean = float(labels.mean())
+
+        scorer = cls(
+            feature_means=((sums + SMOOTHING * mean) / (counts + SMOOTHING)).astype(
+                np.float32
+            ),
+            feature_reliability=(counts / (counts + SMOOTHING)).astype(np.float32),
+            mean=mean,
+            slope=1.0,
+            intercept=0.0,
+        )
+        # 가중 평균은 전체 평균 쪽으로 줄어들기 때문에 학습 데이터로 1차 보정
+        raw, _ = scorer._predict_raw(contents)
+        if np.ptp(raw) > 0:
+            scorer.slope, scorer.intercept = map(float, np.polyfit(raw, labels, 1))
+        return scorer
+
+    def _predict_raw(self, contents: Sequence[str]):
+        np = _import_numpy()
+        indices, offsets, lengths = _flatten_features(contents)
+        reliability = self.feature_reliability[indices].astype(np.float64)
+        means = self.feature_means[indices].astype(np.float64)
+
+        weight_sum = _segment_sum(reliability, offsets, lengths)
+        safe_weight_sum = np.where(weight_sum > 0, weight_sum, 1.0)
+        raw = np.where(
+            weight_sum > 0,
+            _segment_sum(reliability * means, offsets, lengths) / safe_weight_sum,
+            self.mean,
+        )
+
+        # 확신도 = 아는 특징 비율 x 특징들이 같은 점수를 가리키는 정도
+        per_feature_mean = np.repeat(raw, lengths)
+        spread = np.sqrt(
+            _segment_sum(
+                reliability * (means - per_feature_mean) ** 2, offsets, lengths
+            )
+            / safe_weight_sum
+        )
+        coverage = weight_sum / np.maximum(lengths, 1)
+        confidences = np.clip(coverage * (1 - spread / SPREAD_SCALE), 0.0, 1.0)
+        return raw, confidences
+
+    def predict(self, contents: Sequence[str]) -> ScoreResult:
+        np = _import_numpy()
+        raw, confidences = self._predict_raw(contents)
+        scores = np.clip(np.rint(self.slope * raw + self.intercept), 0, 100).astype(
+            np.int64
+        )
+        return ScoreResult(scores=scores, confidences=confidences)
+
+    def save(self, path: str | Path) -> None:
+        np = _import_numpy()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as f:
+            np.savez_compressed(
+                f,
+                feature_means=self.feature_means,
+                feature_reliability=self.feature_reliability,
+                calibration=np.array([self.mean, self.slope, self.intercept]),
+            )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "LocalSentimentScorer":
+        np = _import_numpy()
+        if not Path(path).exists():
+            raise ScorerNotTrainedError(f"로컬 감정 모델 파일이 없습니다: {path}")
+        with np.load(path) as data:
+            mean, slope, intercept = map(float, data["calibration"])
+            return cls(
+                feature_means=data["feature_means"],
+                feature_reliability=data["feature_reliability"],
+                mean=mean,
+                slope=slope,
+                intercept=intercept,
+            )
+
+
+_loaded_scorer: tuple[Path, float, LocalSentimentScorer] | None = None
+
+
+def get_local_scorer() -> LocalSentimentScorer | None:
+    """
+    settings.LOCAL_SCORER_PATH의 모델을 반환합니다. 모델 파일이나 numpy가 없으면 None.
+    파일이 바뀌면(재학습) 다시 읽습니다.
+    """
+    global _loaded_scorer
+    path = Path(settings.LOCAL_SCORER_PATH)
+    try:
+        modified_at = path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    if _loaded_scorer is None or _loaded_scorer[:2] != (path, modified_at):
+        try:
+            _loaded_scorer = (path, modified_at, LocalSentimentScorer.load(path))
+        except ScorerDependencyError:
+            return None
+    return _loaded_scorer[2]
+
+
+def get_training_data(holdout: bool | None = None) -> tuple[list[str], list[int]]:
+    """
+    LLM이 채점한 (스팸이 아닌) 댓글과 점수.
+    holdout이 True면 평가용(ID % 5 == 0), False면 학습용, None이면 전체
+    """
+    queryset = Comment.objects.filter(
+        is_ai_processed=True, is_spam=False, ai_emotion_score__isnull=False
+    ).exclude(ai_reason__startswith=LOCAL_REASON_PREFIX)
+    if holdout is not None:
+        queryset = queryset.annotate(split=Mod("id", 5))
+        queryset = queryset.filter(split=0) if holdout else queryset.exclude(split=0)
+    rows = list(queryset.order_by("id").values_list("content", "ai_emotion_score"))
+    return [row[0] for row in rows], [row[1] for row in rows]
+
+
+def _sentiment_class(scores):
+    np = _import_numpy()
+    return np.digitize(scores, [NEGATIVE_MAX + 0.5, POSITIVE_MIN - 0.5])
+
+
+def evaluate(
+    scorer: LocalSentimentScorer,
+    contents: Sequence[str],
+    labels: Sequence[int],
+    min_confidence: float,
+) -> dict[str, float]:
+    """저장된 LLM 점수와의 일치도와 채점 속도"""
+    np = _import_numpy()
+    if not len(contents):
+        raise ValueError("평가할 댓글이 없습니다.")
+    labels = np.asarray(labels)
+
+    started_at = time.perf_counter()
+    result = scorer.predict(contents)
+    elapsed = time.perf_counter() - started_at
+
+    errors = np.abs(result.scores - labels)
+    agree = _sentiment_class(result.scores) == _sentiment_class(labels)
+    confident = result.confidences >= min_confidence
+    correlation = (
+        float(np.corrcoef(result.scores, labels)[0, 1])
+        if np.std(result.scores) > 0 and np.std(labels) > 0
+        else 0.0
+    )
+    return {
+        "count": len(contents),
+        "mae": float(errors.mean()),
+        "pearson": correlation,
+        "class_agreement": float(agree.mean()),
+        "confident_ratio": float(confident.mean()),
+        "confident_mae": float(errors[confident].mean()) if confident.any() else 0.0,
+        "confident_class_agreement": (
+            float(agree[confident].mean()) if confident.any() else 0.0
+        ),
+        "comments_per_second": len(contents) / elapsed if elapsed else float("inf"),
+        "microseconds_per_comment": elapsed / len(contents) * 1e6,
+    }
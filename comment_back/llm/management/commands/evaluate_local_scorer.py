@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from llm.local_scorer import (
+    LocalSentimentScorer,
+    ScorerDependencyError,
+    ScorerNotTrainedError,
+    evaluate,
+    get_training_data,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "로컬 감정 모델을 평가 데이터(댓글 ID % 5 == 0)의 LLM 점수와 비교합니다. "
+        "기본으로 나머지 댓글로 새로 학습한 모델을 평가합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            help="새로 학습하지 않고 이 모델 파일을 평가 (저장된 모델은 평가 데이터도 학습했을 수 있음)",
+        )
+        parser.add_argument(
+            "--min-confidence",
+            type=float,
+            default=settings.LOCAL_SCORER_MIN_CONFIDENCE,
+            help="LLM으로 보내지 않는 확신도 기준",
+        )
+
+    def handle(self, *args, **options):
+        contents, labels = get_training_data(holdout=True)
+        if not contents:
+            raise CommandError("평가할 LLM 채점 댓글이 없습니다.")
+
+        try:
+            if options["model"]:
+                scorer = LocalSentimentScorer.load(options["model"])
+            else:
+                train_contents, train_scores = get_training_data(holdout=False)
+                if not train_contents:
+                    raise CommandError("학습할 LLM 채점 댓글이 없습니다.")
+                scorer = LocalSentimentScorer.train(train_contents, train_scores)
+            result = evaluate(scorer, contents, labels, options["min_confidence"])
+        except (ScorerDependencyError, ScorerNotTrainedError) as e:
+            raise CommandError(str(e)) from e
+
+        self.stdout.write(
+            f"평가 댓글 {result['count']}개\n"
+            f"  평균 절대 오차: {result['mae']:.2f}\n"
+            f"  피어슨 상관계수: {result['pearson']:.3f}\n"
+            f"  감정 구간(부정/중립/긍정) 일치율: {result['class_agreement']:.1%}\n"
+            f"  확신도 {options['min_confidence']} 이상 비율: {result['confident_ratio']:.1%}"
+            f" (LLM 호출 {1 - result['confident_ratio']:.1%}로 감소)\n"
+            f"  확신 댓글 평균 절대 오차: {result['confident_mae']:.2f}, "
+            f"구간 일치율: {result['confident_class_agreement']:.1%}\n"
+            f"  속도: {result['comments_per_second']:,.0f}개/초 "
+            f"({result['microseconds_per_comment']:.1f}us/댓글)"
+        )
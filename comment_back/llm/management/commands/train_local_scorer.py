@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from llm.local_scorer import (
+    LocalSentimentScorer,
+    ScorerDependencyError,
+    get_training_data,
+)
+
+
+class Command(BaseCommand):
+    help = "LLM이 채점한 댓글로 로컬 감정 모델을 학습해서 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output", help="모델 파일 경로 (기본: settings.LOCAL_SCORER_PATH)"
+        )
+
+    def handle(self, *args, **options):
+        contents, scores = get_training_data()
+        if not contents:
+            raise CommandError("학습할 LLM 채점 댓글이 없습니다.")
+
+        try:
+            scorer = LocalSentimentScorer.train(contents, scores)
+        except ScorerDependencyError as e:
+            raise CommandError(str(e)) from e
+
+        output = options["output"] or settings.LOCAL_SCORER_PATH
+        scorer.save(output)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"댓글 {len(contents)}개로 학습한 모델을 {output}에 저장"
+            )
+        )
@@ -0,0 +1,47 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("crawler", "0011_comment_is_spam"),
+        ("llm", "0005_remove_commentssummaryresult_comments_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EpisodeSentimentStats",
+            fields=[
+                (
+                    "episode",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="sentiment_stats",
+                        serialize=False,
+                        to="crawler.episode",
+                    ),
+                ),
+                ("comment_count", models.IntegerField(default=0)),
+                ("processed_count", models.IntegerField(default=0)),
+                ("spam_count", models.IntegerField(default=0)),
+                ("best_count", models.IntegerField(default=0)),
+                ("scored_count", models.IntegerField(default=0)),
+                ("score_mean", models.FloatField(null=True)),
+                ("score_p10", models.FloatField(null=True)),
+                ("score_p25", models.FloatField(null=True)),
+                ("score_p50", models.FloatField(null=True)),
+                ("score_p75", models.FloatField(null=True)),
+                ("score_p90", models.FloatField(null=True)),
+                ("score_histogram", models.JSONField(default=list)),
+                ("like_weighted_score", models.FloatField(null=True)),
+                ("best_score_mean", models.FloatField(null=True)),
+                ("spam_ratio", models.FloatField(null=True)),
+                ("processed_ratio", models.FloatField(null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 5.1.15 on 2026-10-19 15:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("crawler", "0012_comment_content_trgm"),
+        ("llm", "0006_episodesentimentstats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LLMCallLog",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("task", models.CharField(max_length=20)),
+                ("provider", models.CharField(max_length=50)),
+                ("model", models.CharField(max_length=100)),
+                ("prompt_version", models.CharField(max_length=16)),
+                ("comment_count", models.IntegerField(default=0)),
+                ("input_tokens", models.IntegerField(null=True)),
+                ("output_tokens", models.IntegerField(null=True)),
+                ("cost_usd", models.FloatField(null=True)),
+                ("latency_ms", models.FloatField()),
+                ("attempts", models.IntegerField(default=1)),
+                ("hedged", models.BooleanField(default=False)),
+                ("cached", models.BooleanField(default=False)),
+                (
+                    "outcome",
+                    models.CharField(
+                        choices=[
+                            ("success", "Success"),
+                            ("parse_error", "Parse Error"),
+                            ("timeout", "Timeout"),
+                            ("circuit_open", "Circuit Open"),
+                            ("error", "Error"),
+                        ],
+                        default="success",
+                        max_length=20,
+                    ),
+                ),
+                ("error_message", models.TextField(blank=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "episode",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="llm_calls",
+                        to="crawler.episode",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["created_at"], name="llm_call_created_at"),
+                    models.Index(
+                        fields=["task", "created_at"], name="llm_call_task_created_at"
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -39,3 +39,97 @@ class GenAICommentSummaryResult(models.Model):
 
     def __str__(self):
         return f"GenAI Summary for Episode {self.episode.id} - Summary: {self.summary[:50]}"
+
+
+class EpisodeSentimentStats(models.Model):
+    """
+    에피소드별 감정 분석 집계 (대시보드용 롤업)
+    감정 분석 결과가 저장될 때마다 llm.stats.refresh_episode_sentiment_stats로 다시 계산하고,
+    크롤링으로 댓글이 추가되면 llm.stats.add_new_comments_to_stats로 추가된 만큼만 갱신합니다.
+    """
+
+    episode = models.OneToOneField(
+        Episode,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="sentiment_stats",
+    )
+    comment_count = models.IntegerField(default=0)
+    processed_count = models.IntegerField(default=0)
+    spam_count = models.IntegerField(default=0)
+    best_count = models.IntegerField(default=0)
+    scored_count = models.IntegerField(default=0)  # 감정 점수가 있는 댓글 수
+
+    score_mean = models.FloatField(null=True)
+    score_p10 = models.FloatField(null=True)
+    score_p25 = models.FloatField(null=True)
+    score_p50 = models.FloatField(null=True)
+    score_p75 = models.FloatField(null=True)
+    score_p90 = models.FloatField(null=True)
+    # 0-9, 10-19, ..., 90-100 구간별 댓글 수 (10개)
+    score_histogram = models.JSONField(default=list)
+    # 좋아요 수 + 1을 가중치로 한 평균 감정 점수
+    like_weighted_score = models.FloatField(null=True)
+    best_score_mean = models.FloatField(null=True)  # 베스트 댓글 평균 감정 점수
+
+    spam_ratio = models.FloatField(null=True)  # 스팸 / 스팸 여부를 판정한 댓글
+    processed_ratio = models.FloatField(null=True)  # 처리된 댓글 / 전체 댓글
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return (
+            f"Sentiment stats for Episode {self.episode_id} - Mean: {self.score_mean}"
+        )
+
+
+class LLMCallLog(models.Model):
+    """
+    LLM 호출 기록 (호출 1번당 1행)
+    llm.instrumentation.LLMCallRecorder가 저장하고, LLMCallReportView에서 집계합니다.
+    """
+
+    class Outcome(models.TextChoices):
+        SUCCESS = "success"
+        PARSE_ERROR = "parse_error"  # 응답은 받았지만 파싱 실패
+        TIMEOUT = "timeout"
+        CIRCUIT_OPEN = "circuit_open"
+        ERROR = "error"
+
+    task = models.CharField(max_length=20)  # summary, emotion
+    provider = models.CharField(max_length=50)
+    model = models.CharField(max_length=100)
+    prompt_version = models.CharField(max_length=16)  # 시스템 프롬프트/스키마 해시
+    episode = models.ForeignKey(
+        Episode,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="llm_calls",
+    )
+    comment_count = models.IntegerField(default=0)  # 한 번에 보낸 댓글 수
+    input_tokens = models.IntegerField(null=True)
+    output_tokens = models.IntegerField(null=True)
+    cost_usd = models.FloatField(null=True)  # settings.LLM_TOKEN_PRICES 기준 추정 비용
+    latency_ms = models.FloatField()  # 재시도를 포함한 호출 시간
+    attempts = models.IntegerField(default=1)
+    hedged = models.BooleanField(default=False)
+    cached = models.BooleanField(default=False)
+    outcome = models.CharField(
+        max_length=20, choices=Outcome.choices, default=Outcome.SUCCESS
+    )
+    error_message = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at"], name="llm_call_created_at"),
+            models.Index(
+                fields=["task", "created_at"], name="llm_call_task_created_at"
+            ),
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.task} call ({self.model}) - {self.outcome}, {self.latency_ms:.0f}ms"
+        )
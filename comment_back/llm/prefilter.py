@@ -0,0 +1,249 @@
+"""
+감정 분석 전 댓글 사전 필터
+
+LLM에 보내기 전에 댓글을 로컬에서 묶고 걸러서 호출량을 줄입니다.
+
+1. 명백한 스팸(링크/연락처 홍보, 같은 독자의 같은 글 도배)은 LLM 없이 스팸으로 처리
+2. 정규화한 내용이 같은 댓글은 하나로 묶음 (완전 중복)
+3. 글자 3-gram MinHash + LSH로 거의 같은 댓글을 찾아 Jaccard 유사도로 확인 후 묶음 (유사 중복)
+
+각 묶음의 대표 댓글 하나만 LLM에 보내고, 결과는 나머지 댓글에 그대로 복사합니다.
+"""
+
+import hashlib
+import re
+import unicodedata
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Iterable
+
+from crawler.models import Comment
+
+SHINGLE_SIZE = 3
+MINHASH_PERMUTATIONS = 64
+MINHASH_CHUNK_SIZE = 500  # numpy로 한 번에 계산하는 댓글 수 (메모리 사용량 제한)
+LSH_BANDS = 16  # 밴드당 4행. Jaccard 0.8 이상이면 후보가 될 확률이 매우 높음
+NEAR_DUPLICATE_THRESHOLD = 0.8
+# 짧은 댓글은 몇 글자만 달라도 의미가 달라서 완전 중복만 묶음
+NEAR_DUPLICATE_MIN_LENGTH = 20
+SPAM_REPEAT_THRESHOLD = 3  # 같은 독자가 같은 내용을 이 횟수 이상 쓰면 도배로 판단
+PREFILTER_REASON_PREFIX = "[사전 필터]"  # LLM 없이 처리한 댓글의 ai_reason 앞에 붙음
+
+SPAM_PATTERNS = [
+    (
+        re.compile(r"https?://|www\.|\.(com|net|kr|io|ly|me)\b", re.IGNORECASE),
+        "링크 포함",
+    ),
+    (
+        re.compile(
+            r"open\.kakao|t\.me/|텔레그램|카톡\s*아이디|오픈\s*채팅", re.IGNORECASE
+        ),
+        "연락처 홍보",
+    ),
+    (re.compile(r"010[-\s.]?\d{3,4}[-\s.]?\d{4}"), "전화번호 포함"),
+]
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_REPEATED_CHARS = re.compile(r"(.)\1{2,}")
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def _make_permutations(count: int) -> list[tuple[int, int]]:
+    """MinHash용 (a, b) 계수. 실행할 때마다 같아야 하므로 고정된 시드로 만듦"""
+    permutations = []
+    for i in range(count):
+        digest = hashlib.blake2b(f"minhash:{i}".encode(), digest_size=16).digest()
+        # a < 2^31이면 a * (32비트 shingle) + b가 uint64 안에 들어가서 NumPy로도 같은 값을 계산할 수 있음
+        a = int.from_bytes(digest[:8], "big") % ((1 << 31) - 1) + 1
+        b = int.from_bytes(digest[8:], "big") % _MERSENNE_PRIME
+        permutations.append((a, b))
+    return permutations
+
+
+_PERMUTATIONS = _make_permutations(MINHASH_PERMUTATIONS)
+
+
+def normalize_content(content: str) -> str:
+    """
+    비교용 정규화: 호환 문자 통일, 소문자, 기호/이모지 제거, 공백 정리,
+    3번 이상 반복되는 글자는 2번으로 줄임 (ㅋㅋㅋㅋㅋ -> ㅋㅋ)
+    """
+    content = unicodedata.normalize("NFKC", content).lower()
+    content = _NON_WORD.sub(" ", content).replace("_", " ")
+    content = _REPEATED_CHARS.sub(r"\1\1", content)
+    return " ".join(content.split())
+
+
+def get_shingles(text: str, size: int = SHINGLE_SIZE) -> set[int]:
+    if len(text) <= size:
+        return {zlib.crc32(text.encode())}
+    return {
+        zlib.crc32(text[i : i + size].encode()) for i in range(len(text) - size + 1)
+    }
+
+
+def get_minhash(shingles: set[int]) -> tuple[int, ...]:
+    return tuple(
+        min(((a * shingle + b) % _MERSENNE_PRIME) & _MAX_HASH for shingle in shingles)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def get_minhash_signatures(shingle_sets: list[set[int]]) -> list[tuple[int, ...]]:
+    """
+    여러 댓글의 MinHash를 한 번에 계산합니다. numpy가 있으면 MINHASH_CHUNK_SIZE개씩 행렬 연산으로,
+    없으면 get_minhash로 하나씩 계산합니다. (결과는 같음)
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return [get_minhash(shingles) for shingles in shingle_sets]
+
+    a = np.array([a for a, _ in _PERMUTATIONS], dtype=np.uint64)[:, None]
+    b = np.array([b for _, b in _PERMUTATIONS], dtype=np.uint64)[:, None]
+    signatures = []
+    for start in range(0, len(shingle_sets), MINHASH_CHUNK_SIZE):
+        chunk = shingle_sets[start : start + MINHASH_CHUNK_SIZE]
+        lengths = np.fromiter(map(len, chunk), dtype=np.int64, count=len(chunk))
+        values = np.fromiter(
+            chain.from_iterable(chunk), dtype=np.uint64, count=int(lengths.sum())
+        )
+        hashed = ((a * values + b) % np.uint64(_MERSENNE_PRIME)) & np.uint64(_MAX_HASH)
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        minimums = np.minimum.reduceat(hashed, offsets, axis=1)
+        signatures.extend(map(tuple, minimums.T.tolist()))
+    return signatures
+
+
+def jaccard(a: set[int], b: set[int]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def get_spam_reason(content: str) -> str | None:
+    """휴리스틱으로 명백한 스팸이면 이유를, 아니면 None을 반환"""
+    for pattern, reason in SPAM_PATTERNS:
+        if pattern.search(content):
+            return reason
+    return None
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> None:
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i != root_j:
+            # 먼저 나온 댓글이 대표가 되도록 작은 인덱스를 루트로 둠
+            self.parent[max(root_i, root_j)] = min(root_i, root_j)
+
+
+@dataclass
+class PrefilterPlan:
+    """
+    representatives: LLM에 보낼 대표 댓글
+    duplicates: 대표 댓글 ID -> 결과를 복사받을 중복 댓글 목록
+    spam: LLM 없이 스팸으로 처리할 댓글 ID -> 이유
+    """
+
+    representatives: list[Comment] = field(default_factory=list)
+    duplicates: dict[int, list[Comment]] = field(default_factory=dict)
+    spam: dict[int, str] = field(default_factory=dict)
+
+    @property
+    def duplicate_count(self) -> int:
+        return sum(len(members) for members in self.duplicates.values())
+
+    def summary(self) -> dict[str, int]:
+        return {
+            "total": len(self.representatives) + self.duplicate_count + len(self.spam),
+            "llm_requested": len(self.representatives),
+            "duplicates": self.duplicate_count,
+            "heuristic_spam": len(self.spam),
+        }
+
+
+def _cluster(normalized: list[str]) -> list[int]:
+    """댓글마다 속한 묶음의 루트 인덱스를 반환"""
+    union_find = _UnionFind(len(normalized))
+
+    first_by_text: dict[str, int] = {}
+    for i, text in enumerate(normalized):
+        if text in first_by_text:
+            union_find.union(first_by_text[text], i)
+        else:
+            first_by_text[text] = i
+
+    candidates = [
+        i
+        for i in first_by_text.values()
+        if len(normalized[i]) >= NEAR_DUPLICATE_MIN_LENGTH
+    ]
+    shingles = {i: get_shingles(normalized[i]) for i in candidates}
+    rows_per_band = MINHASH_PERMUTATIONS // LSH_BANDS
+    buckets: dict[tuple, list[int]] = {}
+    signatures = get_minhash_signatures([shingles[i] for i in candidates])
+    for i, signature in zip(candidates, signatures):
+        for band in range(LSH_BANDS):
+            key = (band, signature[band * rows_per_band : (band + 1) * rows_per_band])
+            buckets.setdefault(key, []).append(i)
+
+    # 버킷마다 지금까지 나온 묶음의 대표와만 비교해서 비슷한 댓글이 많아도 비교 횟수가 선형으로 늘어남
+    for members in buckets.values():
+        cluster_heads: list[int] = []
+        for i in members:
+            for head in cluster_heads:
+                if union_find.find(i) == union_find.find(head):
+                    break
+                if jaccard(shingles[i], shingles[head]) >= NEAR_DUPLICATE_THRESHOLD:
+                    union_find.union(i, head)
+                    break
+            else:
+                cluster_heads.append(i)
+
+    return [union_find.find(i) for i in range(len(normalized))]
+
+
+def build_prefilter_plan(comments: Iterable[Comment]) -> PrefilterPlan:
+    """댓글 목록(작성 순)을 스팸/대표/중복으로 나눔"""
+    plan = PrefilterPlan()
+    comments = list(comments)
+    normalized_by_id = {
+        comment.id: normalize_content(comment.content) for comment in comments
+    }
+    repeat_counts = Counter(
+        (comment.user_uid, normalized_by_id[comment.id]) for comment in comments
+    )
+
+    not_spam = []
+    for comment in comments:
+        reason = get_spam_reason(comment.content)
+        if reason is None and (
+            repeat_counts[(comment.user_uid, normalized_by_id[comment.id])]
+            >= SPAM_REPEAT_THRESHOLD
+        ):
+            reason = "같은 내용 반복 작성"
+        if reason is not None:
+            plan.spam[comment.id] = reason
+        else:
+            not_spam.append(comment)
+
+    roots = _cluster([normalized_by_id[comment.id] for comment in not_spam])
+    for i, comment in enumerate(not_spam):
+        root = not_spam[roots[i]]
+        if roots[i] == i:
+            plan.representatives.append(comment)
+        else:
+            plan.duplicates.setdefault(root.id, []).append(comment)
+    return plan
@@ -2,12 +2,17 @@ import json
 import os
 from datetime import datetime
 from rest_framework import serializers
-from .models import CommentAnalysisResult, CommentsSummaryResult
+from .models import (
+    CommentAnalysisResult,
+    CommentsSummaryResult,
+    EpisodeSentimentStats,
+)
 import requests
 from requests.exceptions import RequestException
 from django.conf import settings
 from crawler.models import Comment
-from services.llm_service import generate_comment_summary
+from services.llm_service import agenerate_comment_summary, generate_comment_summary
+from .instrumentation import LLMCallRecorder
 
 
 class CommentEmotionAnalysisSerializer(serializers.ModelSerializer):
@@ -62,16 +67,43 @@ class CommentsSummarySerializer(serializers.ModelSerializer):
         fields = "__all__"
         read_only_fields = ["summary"]
 
-    def create(self, validated_data):
-        comment_contents = validated_data.get("source_comments", [])
-        summary = generate_comment_summary(comment_contents)
-        summary_instance = CommentsSummaryResult.objects.create(
-            summary=summary,
-            **validated_data,
+    def _get_recorder(self, validated_data) -> LLMCallRecorder:
+        return LLMCallRecorder(
+            "summary",
+            episode=validated_data.get("episode"),
+            comment_count=len(validated_data.get("source_comments", [])),
         )
+
+    async def agenerate_summary(self) -> str:
+        """
+        is_valid() 이후 비동기 뷰에서 요약을 미리 생성합니다.
+        결과는 save(summary=...)로 넘기면 create에서 다시 생성하지 않습니다.
+        LLM 호출 실패(LLMError)는 그대로 발생하고, 뷰에서 응답으로 변환합니다. (llm_error_response)
+        """
+        recorder = self._get_recorder(self.validated_data)
+        async with recorder:
+            return await agenerate_comment_summary(
+                self.validated_data.get("source_comments", []), recorder.provider
+            )
+
+    def create(self, validated_data):
+        if "summary" not in validated_data:
+            comment_contents = validated_data.get("source_comments", [])
+            recorder = self._get_recorder(validated_data)
+            with recorder:
+                validated_data["summary"] = generate_comment_summary(
+                    comment_contents, recorder.provider
+                )
+        summary_instance = CommentsSummaryResult.objects.create(**validated_data)
         return summary_instance
 
 
+class EpisodeSentimentStatsSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = EpisodeSentimentStats
+        fields = "__all__"
+
+
 def handle_infer_response(response, context="추론 서버"):
     if response.status_code == 400:
         raise serializers.ValidationError(f"{context}에 잘못된 요청입니다.")
@@ -0,0 +1,156 @@
+from django.db.models import Avg, Count, F, FloatField, Q, Sum
+from django.db.models.functions import Cast
+from django.utils import timezone
+
+from crawler.models import Comment
+from .models import EpisodeSentimentStats
+
+PERCENTILES = {
+    "score_p10": 0.10,
+    "score_p25": 0.25,
+    "score_p50": 0.50,
+    "score_p75": 0.75,
+    "score_p90": 0.90,
+}
+HISTOGRAM_BUCKETS = 10  # 0-9, 10-19, ..., 90-100
+
+
+def percentile_from_counts(
+    score_counts: list[tuple[int, int]], total: int, q: float
+) -> float | None:
+    """
+    (점수, 개수) 목록에서 선형 보간 백분위수를 계산합니다. (numpy.percentile 기본 방식과 동일)
+    score_counts는 점수 오름차순이어야 합니다.
+    """
+    if total == 0:
+        return None
+
+    position = q * (total - 1)
+    lower_rank = int(position)
+    upper_rank = min(lower_rank + 1, total - 1)
+    lower = upper = None
+    seen = 0
+    for score, count in score_counts:
+        seen += count
+        if lower is None and lower_rank < seen:
+            lower = score
+        if upper_rank < seen:
+            upper = score
+            break
+    return lower + (upper - lower) * (position - lower_rank)
+
+
+def get_histogram(score_counts: list[tuple[int, int]]) -> list[int]:
+    histogram = [0] * HISTOGRAM_BUCKETS
+    for score, count in score_counts:
+        bucket = min(max(score, 0) // 10, HISTOGRAM_BUCKETS - 1)
+        histogram[bucket] += count
+    return histogram
+
+
+def refresh_episode_sentiment_stats(episode_id: int) -> EpisodeSentimentStats:
+    """
+    에피소드의 감정 분석 집계를 다시 계산해서 저장합니다.
+    집계 쿼리 1번과 점수별 GROUP BY 1번(최대 101행), 저장 UPDATE 1번(처음이면 INSERT 1번 더)을 실행합니다.
+    """
+    comments = Comment.objects.filter(episode=episode_id)
+    scored = Q(ai_emotion_score__isnull=False)
+    totals = comments.aggregate(
+        comment_count=Count("id"),
+        processed_count=Count("id", filter=Q(is_ai_processed=True)),
+        spam_count=Count("id", filter=Q(is_spam=True)),
+        # 로컬 감정 모델로 채점한 댓글은 스팸 여부를 판정하지 않으므로 비율에서 제외
+        spam_checked_count=Count("id", filter=Q(is_spam__isnull=False)),
+        best_count=Count("id", filter=Q(is_best=True)),
+        scored_count=Count("id", filter=scored),
+        score_sum=Sum("ai_emotion_score"),
+        weighted_score_sum=Sum(
+            F("ai_emotion_score") * (F("like_count") + 1), filter=scored
+        ),
+        weight_sum=Sum(F("like_count") + 1, filter=scored),
+        best_score_mean=Avg("ai_emotion_score", filter=Q(is_best=True)),
+    )
+    score_counts = list(
+        comments.filter(scored)
+        .values_list("ai_emotion_score")
+        .annotate(count=Count("id"))
+        .order_by("ai_emotion_score")
+    )
+
+    scored_count = totals["scored_count"]
+    processed_count = totals["processed_count"]
+    comment_count = totals["comment_count"]
+    defaults = {
+        "comment_count": comment_count,
+        "processed_count": processed_count,
+        "spam_count": totals["spam_count"],
+        "best_count": totals["best_count"],
+        "scored_count": scored_count,
+        "score_mean": totals["score_sum"] / scored_count if scored_count else None,
+        "score_histogram": get_histogram(score_counts),
+        "like_weighted_score": (
+            totals["weighted_score_sum"] / totals["weight_sum"]
+            if totals["weight_sum"]
+            else None
+        ),
+        "best_score_mean": totals["best_score_mean"],
+        "spam_ratio": (
+            totals["spam_count"] / totals["spam_checked_count"]
+            if totals["spam_checked_count"]
+            else None
+        ),
+        "processed_ratio": (processed_count / comment_count if comment_count else None),
+        **{
+            field: percentile_from_counts(score_counts, scored_count, q)
+            for field, q in PERCENTILES.items()
+        },
+    }
+    stats = EpisodeSentimentStats(
+        episode_id=episode_id, updated_at=timezone.now(), **defaults
+    )
+    # 대부분 이미 행이 있으므로 UPDATE 한 번으로 끝냄 (update_or_create는 SELECT와 savepoint가 추가됨)
+    updated = EpisodeSentimentStats.objects.filter(episode_id=episode_id).update(
+        updated_at=stats.updated_at, **defaults
+    )
+    if not updated:
+        # 동시에 다른 요청이 먼저 만들었으면 그 값을 그대로 둠 (같은 시점의 집계)
+        EpisodeSentimentStats.objects.bulk_create([stats], ignore_conflicts=True)
+    return stats
+
+
+def add_new_comments_to_stats(episode_id: int, comments: list[Comment]) -> None:
+    """
+    크롤링으로 새로 저장한 (아직 분석 전인) 댓글만큼 집계를 갱신합니다.
+    댓글 수, 베스트 댓글 수, 처리 비율만 바뀌므로 에피소드의 댓글을 다시 읽지 않고 UPDATE 한 번으로 끝냅니다.
+    집계가 아직 없거나 분석 결과가 있는 댓글이 섞여 있으면 전체를 다시 계산합니다.
+    """
+    if not comments:
+        return
+    if any(
+        comment.is_ai_processed
+        or comment.ai_emotion_score is not None
+        or comment.is_spam is not None
+        for comment in comments
+    ):
+        refresh_episode_sentiment_stats(episode_id)
+        return
+
+    added = len(comments)
+    updated = EpisodeSentimentStats.objects.filter(episode_id=episode_id).update(
+        comment_count=F("comment_count") + added,
+        best_count=F("best_count") + sum(bool(c.is_best) for c in comments),
+        # 오른쪽의 F()는 갱신 전 값
+        processed_ratio=Cast("processed_count", FloatField())
+        / (F("comment_count") + added),
+        updated_at=timezone.now(),
+    )
+    if not updated:
+        refresh_episode_sentiment_stats(episode_id)
+
+
+def get_episode_sentiment_stats(episode_id: int) -> EpisodeSentimentStats:
+    """저장된 집계를 반환하고, 아직 없으면 계산해서 저장"""
+    try:
+        return EpisodeSentimentStats.objects.get(episode_id=episode_id)
+    except EpisodeSentimentStats.DoesNotExist:
+        return refresh_episode_sentiment_stats(episode_id)
@@ -0,0 +1,116 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from rest_framework.test import APIClient
+
+from crawler.models import Comment
+from llm.prefilter import build_prefilter_plan, normalize_content
+
+LONG_TEXT = "이번 화에서 주인공이 드디어 각성하는 장면 작화가 정말 미쳤다"
+
+
+def make(comment_id: int, content: str, user_uid: int | None = None) -> Comment:
+    return Comment(id=comment_id, content=content, user_uid=user_uid or comment_id)
+
+
+def test_normalize_content():
+    assert normalize_content("ㅋㅋㅋㅋㅋ  재밌어요!!! 😀") == normalize_content(
+        "ㅋㅋ 재밌어요"
+    )
+    assert normalize_content("ＡＢＣ") == "abc"
+
+
+class TestBuildPrefilterPlan:
+    def test_exact_duplicates_share_representative(self):
+        plan = build_prefilter_plan(
+            [make(1, "재밌어요!"), make(2, "재밌어요 ㅎ"), make(3, "재밌어요!!")]
+        )
+        assert [c.id for c in plan.representatives] == [1, 2]
+        assert [c.id for c in plan.duplicates[1]] == [3]
+
+    def test_near_duplicates(self):
+        plan = build_prefilter_plan(
+            [
+                make(1, LONG_TEXT),
+                make(2, LONG_TEXT + " ㅠㅠ"),
+                make(3, "완전히 다른 이야기를 하는 꽤 긴 댓글입니다 다음 화 기대"),
+            ]
+        )
+        assert [c.id for c in plan.representatives] == [1, 3]
+        assert [c.id for c in plan.duplicates[1]] == [2]
+
+    def test_heuristic_spam(self):
+        plan = build_prefilter_plan(
+            [
+                make(1, "무료 웹툰 보기 https://spam.example"),
+                make(2, "도배", user_uid=7),
+                make(3, "도배", user_uid=7),
+                make(4, "도배", user_uid=7),
+                make(5, "도배", user_uid=8),
+            ]
+        )
+        assert set(plan.spam) == {1, 2, 3, 4}
+        assert [c.id for c in plan.representatives] == [5]
+        assert plan.summary() == {
+            "total": 5,
+            "llm_requested": 1,
+            "duplicates": 0,
+            "heuristic_spam": 4,
+        }
+
+
+@pytest.mark.django_db
+def test_emotion_analysis_sends_only_representatives(episode, make_comments):
+    unprocessed = dict(is_ai_processed=False, is_spam=None, ai_emotion_score=None)
+    make_comments(3, content="정주행 완료!", **unprocessed)
+    make_comments(1, start_id=10, content="카톡 아이디 abc 로 연락", **unprocessed)
+    llm_response = json.dumps(
+        {"response": [{"id": 1, "score": 90, "reason": "좋음", "is_spam": False}]}
+    )
+
+    with patch(
+        "llm.views.agenerate_comment_emotion", return_value=llm_response
+    ) as generate:
+        response = APIClient().patch(f"/llm/api/emotion-analysis/{episode.id}/")
+
+    assert response.status_code == 200
+    assert generate.call_args.args[0] == [{"id": 1, "content": "정주행 완료!"}]
+    assert response.json()["prefilter"]["llm_requested"] == 1
+    assert set(
+        Comment.objects.filter(ai_emotion_score=90).values_list("id", flat=True)
+    ) == {1, 2, 3}
+    assert Comment.objects.get(id=10).is_spam is True
+
+
+@pytest.mark.django_db
+def test_emotion_analysis_reports_only_sent_comments(episode, make_comments):
+    unprocessed = dict(is_ai_processed=False, is_spam=None, ai_emotion_score=None)
+    make_comments(1, start_id=1, content=LONG_TEXT, **unprocessed)
+    make_comments(1, start_id=2, content="정주행 완료!", **unprocessed)
+    # 한 번에 보낼 수 있는 수를 넘는 대표 댓글과 그 중복 댓글
+    make_comments(2, start_id=3, content="다음 화 언제 나오나요", **unprocessed)
+    llm_response = json.dumps(
+        {
+            "response": [
+                {"id": 1, "score": 90, "reason": "좋음", "is_spam": False},
+                {"id": 2, "score": 70, "reason": "좋음", "is_spam": False},
+            ]
+        }
+    )
+
+    with (
+        patch("llm.views.MAX_EMOTION_COMMENTS", 2),
+        patch(
+            "llm.views.agenerate_comment_emotion", return_value=llm_response
+        ) as generate,
+    ):
+        response = APIClient().patch(f"/llm/api/emotion-analysis/{episode.id}/")
+
+    assert response.status_code == 200
+    assert [c["id"] for c in generate.call_args.args[0]] == [1, 2]
+    assert response.json()["prefilter"]["llm_requested"] == 2
+    assert response.json()["prefilter"]["duplicates"] == 0
+    assert set(
+        Comment.objects.filter(is_ai_processed=False).values_list("id", flat=True)
+    ) == {3, 4}
@@ -0,0 +1,142 @@
+import json
+import statistics
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from crawler.models import Comment
+from llm.models import EpisodeSentimentStats
+from llm.stats import (
+    add_new_comments_to_stats,
+    percentile_from_counts,
+    refresh_episode_sentiment_stats,
+)
+
+
+class TestPercentileFromCounts:
+    @pytest.mark.parametrize("q", [0.0, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0])
+    def test_matches_numpy(self, q):
+        np = pytest.importorskip("numpy")
+        scores = [0, 5, 5, 20, 50, 50, 50, 77, 90, 100, 100]
+        counts = sorted({s: scores.count(s) for s in scores}.items())
+        assert percentile_from_counts(counts, len(scores), q) == pytest.approx(
+            np.percentile(scores, q * 100)
+        )
+
+    def test_empty(self):
+        assert percentile_from_counts([], 0, 0.5) is None
+
+
+@pytest.mark.django_db
+class TestRefreshEpisodeSentimentStats:
+    def test_rollup_values(self, episode, make_comments):
+        comments = make_comments(40)
+        stats = refresh_episode_sentiment_stats(episode.id)
+
+        scored = [c for c in comments if c.ai_emotion_score is not None]
+        scores = [c.ai_emotion_score for c in scored]
+        weights = [c.like_count + 1 for c in scored]
+        processed = [c for c in comments if c.is_ai_processed]
+
+        assert stats.comment_count == 40
+        assert stats.processed_count == len(processed)
+        assert stats.scored_count == len(scored)
+        # inclusive 방식은 numpy.percentile 기본(linear)과 같음
+        deciles = statistics.quantiles(scores, n=10, method="inclusive")
+        assert stats.score_mean == pytest.approx(statistics.fmean(scores))
+        assert stats.score_p50 == pytest.approx(deciles[4])
+        assert stats.score_p90 == pytest.approx(deciles[8])
+        assert sum(stats.score_histogram) == len(scores)
+        assert stats.like_weighted_score == pytest.approx(
+            sum(s * w for s, w in zip(scores, weights)) / sum(weights)
+        )
+        assert stats.spam_ratio == pytest.approx(
+            sum(c.is_spam is True for c in comments)
+            / sum(c.is_spam is not None for c in comments)
+        )
+        assert stats.processed_ratio == pytest.approx(len(processed) / 40)
+
+    def test_spam_ratio_ignores_locally_scored(self, episode, make_comments):
+        make_comments(10)  # 처리 5개 중 스팸 1개
+        # 로컬 감정 모델로 채점한 댓글: 처리됐지만 스팸 여부는 판정하지 않음
+        make_comments(5, start_id=100, is_ai_processed=True, is_spam=None)
+        stats = refresh_episode_sentiment_stats(episode.id)
+
+        assert stats.processed_count == 10
+        assert stats.spam_ratio == pytest.approx(1 / 5)
+
+    def test_episode_without_comments(self, episode):
+        stats = refresh_episode_sentiment_stats(episode.id)
+        assert stats.comment_count == 0
+        assert stats.score_mean is None
+        assert stats.score_histogram == [0] * 10
+
+    def test_new_comments_are_added_without_rescan(
+        self, episode, make_comments, django_assert_num_queries
+    ):
+        make_comments(10)
+        refresh_episode_sentiment_stats(episode.id)
+        unprocessed = dict(is_ai_processed=False, is_spam=None, ai_emotion_score=None)
+        new_comments = make_comments(5, start_id=100, **unprocessed)
+
+        with django_assert_num_queries(1):
+            add_new_comments_to_stats(episode.id, new_comments)
+
+        stats = EpisodeSentimentStats.objects.get(episode=episode)
+        expected = refresh_episode_sentiment_stats(episode.id)
+        for field in ("comment_count", "best_count", "processed_count", "score_p50"):
+            assert getattr(stats, field) == getattr(expected, field)
+        assert stats.processed_ratio == pytest.approx(expected.processed_ratio)
+
+    def test_new_comments_create_missing_stats(self, episode, make_comments):
+        comments = make_comments(3)
+        add_new_comments_to_stats(episode.id, comments)
+        assert EpisodeSentimentStats.objects.get(episode=episode).comment_count == 3
+
+    def test_endpoint_query_count(
+        self, episode, make_comments, django_assert_num_queries
+    ):
+        make_comments(10)
+        client = APIClient()
+        # 지문 + 에피소드 + 집계 조회 + 집계 계산 2 + UPDATE + INSERT
+        with django_assert_num_queries(7):
+            client.get(f"/llm/api/sentiment-stats/{episode.id}/")
+        # 조건부 요청 캐시를 비우고 다시 조회하면 저장된 집계만 읽음
+        cache.clear()
+        with django_assert_num_queries(3):
+            client.get(f"/llm/api/sentiment-stats/{episode.id}/")
+
+    def test_endpoint_reads_single_row(self, episode, make_comments):
+        make_comments(10)
+        client = APIClient()
+        response = client.get(f"/llm/api/sentiment-stats/{episode.id}/")
+
+        assert response.status_code == 200
+        assert response.data["comment_count"] == 10
+        assert EpisodeSentimentStats.objects.count() == 1
+
+        response = client.get(f"/llm/api/sentiment-stats/series/{episode.series_id}/")
+        assert [row["episode"] for row in response.data] == [episode.id]
+
+    def test_emotion_analysis_refreshes_rollup(self, episode, make_comments):
+        make_comments(4, is_ai_processed=False, is_spam=None, ai_emotion_score=None)
+        refresh_episode_sentiment_stats(episode.id)
+        llm_response = json.dumps(
+            {
+                "response": [
+                    {"id": i, "score": 80, "reason": "좋음", "is_spam": False}
+                    for i in range(1, 5)
+                ]
+            }
+        )
+
+        with patch("llm.views.agenerate_comment_emotion", return_value=llm_response):
+            response = APIClient().patch(f"/llm/api/emotion-analysis/{episode.id}/")
+
+        assert response.status_code == 200
+        stats = EpisodeSentimentStats.objects.get(episode=episode)
+        assert stats.processed_count == 4
+        assert stats.score_mean == 80
+        assert Comment.objects.filter(is_ai_processed=True).count() == 4
@@ -0,0 +1,178 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from llm.instrumentation import LLMCallRecorder, build_llm_call_report
+from llm.models import LLMCallLog
+from services.llm_provider import (
+    FakeLLMProvider,
+    LLMProvider,
+    LLMProviderError,
+    LLMResponse,
+)
+from services.llm_service import MODEL, generate_comment_emotion
+
+COMMENTS = [{"id": 1, "content": "재밌어요"}, {"id": 2, "content": "별로예요"}]
+
+
+class BrokenJSONProvider(LLMProvider):
+    name = "broken"
+
+    def generate(self, request):
+        return LLMResponse(text="{not json", model=request.model)
+
+
+@pytest.fixture
+def fake_provider(settings):
+    settings.LLM_PROVIDER = "fake"
+    settings.LLM_RECORD_MODE = "off"
+    settings.LOCAL_SCORER_PATH = "/nonexistent/local_scorer.npz"
+
+
+def make_log(**overrides) -> LLMCallLog:
+    values = {
+        "task": "emotion",
+        "provider": "fake",
+        "model": MODEL,
+        "prompt_version": "v1",
+        "comment_count": 20,
+        "input_tokens": 1000,
+        "output_tokens": 200,
+        "cost_usd": 0.0002,
+        "latency_ms": 100,
+        **overrides,
+    }
+    return LLMCallLog.objects.create(**values)
+
+
+@pytest.mark.django_db
+class TestLLMCallRecorder:
+    def test_records_successful_call(self, episode):
+        with LLMCallRecorder(
+            "emotion", episode=episode, comment_count=2, provider=FakeLLMProvider()
+        ) as call:
+            generate_comment_emotion(COMMENTS, call.provider)
+
+        log = LLMCallLog.objects.get()
+        assert log.outcome == LLMCallLog.Outcome.SUCCESS
+        assert log.episode_id == episode.id
+        assert (log.task, log.provider, log.model) == ("emotion", "fake", MODEL)
+        assert log.comment_count == 2
+        assert log.input_tokens > 0 and log.output_tokens > 0
+        assert log.cost_usd == pytest.approx(
+            (log.input_tokens * 0.10 + log.output_tokens * 0.40) / 1_000_000
+        )
+        assert len(log.prompt_version) == 12
+
+    def test_records_provider_error(self):
+        with pytest.raises(LLMProviderError):
+            with LLMCallRecorder(
+                "emotion", provider=FakeLLMProvider(failure_rate=1.0)
+            ) as call:
+                generate_comment_emotion(COMMENTS, call.provider)
+
+        log = LLMCallLog.objects.get()
+        assert log.outcome == LLMCallLog.Outcome.ERROR
+        assert log.input_tokens is None
+
+    def test_skips_when_llm_is_not_called(self):
+        with LLMCallRecorder("emotion"):
+            pass
+        assert not LLMCallLog.objects.exists()
+
+
+@pytest.mark.django_db
+class TestEmotionAnalysisLogging:
+    def test_logs_call(self, fake_provider, episode, make_comments):
+        make_comments(5, is_ai_processed=False, is_spam=None, ai_emotion_score=None)
+
+        response = APIClient().patch(f"/llm/api/emotion-analysis/{episode.id}/")
+
+        assert response.status_code == 200
+        log = LLMCallLog.objects.get()
+        assert log.outcome == LLMCallLog.Outcome.SUCCESS
+        assert log.episode_id == episode.id
+        assert log.comment_count == 5
+        assert log.attempts == 1
+
+    def test_logs_parse_failure(
+        self, fake_provider, episode, make_comments, monkeypatch
+    ):
+        make_comments(5, is_ai_processed=False, is_spam=None, ai_emotion_score=None)
+        monkeypatch.setattr(
+            "llm.instrumentation.get_llm_provider", lambda: BrokenJSONProvider()
+        )
+
+        response = APIClient().patch(f"/llm/api/emotion-analysis/{episode.id}/")
+
+        assert response.status_code == 500
+        log = LLMCallLog.objects.get()
+        assert log.outcome == LLMCallLog.Outcome.PARSE_ERROR
+        assert log.provider == "broken"
+        assert log.error_message
+
+
+@pytest.mark.django_db
+class TestLLMCallReport:
+    def test_percentiles_and_totals(self):
+        for latency in range(1, 101):
+            make_log(latency_ms=latency)
+        make_log(outcome=LLMCallLog.Outcome.PARSE_ERROR, latency_ms=50)
+        make_log(outcome=LLMCallLog.Outcome.TIMEOUT, latency_ms=30000, attempts=3)
+
+        report = build_llm_call_report(timezone.now() - timedelta(days=1))
+
+        total = report["total"]
+        assert total["count"] == 102
+        assert total["outcomes"]["parse_error"] == 1
+        assert total["retries"] == 2
+        # 응답을 받지 못한 호출(timeout)은 지연 시간 분포에서 제외
+        assert total["latency_ms"]["p50"] == pytest.approx(50)
+        assert total["latency_ms"]["p99"] == pytest.approx(99)
+        assert total["input_tokens"] == 101 * 1000
+        assert total["tokens_per_comment"] == pytest.approx(1200 / 20)
+        assert [group["prompt_version"] for group in report["groups"]] == ["v1"]
+
+    def test_batch_size_buckets(self):
+        make_log(comment_count=5, latency_ms=100)
+        make_log(comment_count=80, latency_ms=800)
+        make_log(comment_count=100, latency_ms=1000)
+
+        report = build_llm_call_report(timezone.now() - timedelta(days=1))
+
+        assert [(row["batch_size"], row["count"]) for row in report["batch_sizes"]] == [
+            ("1-10", 1),
+            ("51-100", 2),
+        ]
+        assert report["batch_sizes"][1]["latency_ms_per_comment"] == pytest.approx(
+            1800 / 180
+        )
+
+    @pytest.fixture
+    def admin_client(self, user):
+        user.is_staff = True
+        user.save()
+        client = APIClient()
+        client.force_authenticate(user)
+        return client
+
+    def test_endpoint(self, admin_client):
+        make_log(task="summary")
+        make_log(task="emotion")
+
+        response = admin_client.get("/llm/api/llm-calls/report/?days=1&task=summary")
+
+        assert response.status_code == 200
+        assert response.json()["total"]["count"] == 1
+
+    def test_endpoint_requires_admin(self, user):
+        assert APIClient().get("/llm/api/llm-calls/report/").status_code == 401
+        client = APIClient()
+        client.force_authenticate(user)
+        assert client.get("/llm/api/llm-calls/report/").status_code == 403
+
+    def test_endpoint_rejects_bad_days(self, admin_client):
+        response = admin_client.get("/llm/api/llm-calls/report/?days=abc")
+        assert response.status_code == 400
@@ -0,0 +1,91 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from rest_framework.test import APIClient
+
+from crawler.models import Comment
+from llm.local_scorer import LocalSentimentScorer, evaluate, get_training_data
+
+POSITIVE = [
+    "이번 화 진짜 최고",
+    "작화 최고 명작",
+    "명작이다 재밌다",
+    "최고의 전개 재밌다",
+]
+NEGATIVE = ["노잼 실망이다", "전개 별로 실망", "너무 별로 노잼", "실망스러운 노잼 전개"]
+
+
+@pytest.fixture
+def scorer():
+    contents = POSITIVE * 5 + NEGATIVE * 5
+    scores = [90] * len(POSITIVE) * 5 + [10] * len(NEGATIVE) * 5
+    return LocalSentimentScorer.train(contents, scores)
+
+
+class TestLocalSentimentScorer:
+    def test_separates_sentiment(self, scorer):
+        result = scorer.predict(["최고 명작 재밌다", "실망 노잼 별로"])
+        assert result.scores[0] > 70
+        assert result.scores[1] < 30
+
+    def test_unknown_text_has_low_confidence(self, scorer):
+        result = scorer.predict(["최고 명작", "qzxw vbnm"])
+        assert result.confidences[0] > result.confidences[1]
+        assert result.confidences[1] < 0.1
+
+    def test_save_and_load(self, scorer, tmp_path):
+        path = tmp_path / "scorer.npz"
+        scorer.save(path)
+        loaded = LocalSentimentScorer.load(path)
+        contents = POSITIVE + NEGATIVE
+        assert list(loaded.predict(contents).scores) == list(
+            scorer.predict(contents).scores
+        )
+
+    def test_evaluate(self, scorer):
+        result = evaluate(scorer, POSITIVE + NEGATIVE, [90] * 4 + [10] * 4, 0.0)
+        assert result["class_agreement"] == 1.0
+        assert result["confident_ratio"] == 1.0
+        assert result["comments_per_second"] > 0
+
+
+@pytest.mark.django_db
+def test_training_data_holdout_split(episode, make_comments):
+    make_comments(20)
+    train_contents, _ = get_training_data(holdout=False)
+    test_contents, _ = get_training_data(holdout=True)
+    all_contents, _ = get_training_data()
+    assert len(train_contents) + len(test_contents) == len(all_contents)
+    assert test_contents and train_contents
+
+
+@pytest.mark.django_db
+def test_only_low_confidence_comments_go_to_llm(
+    episode, make_comments, scorer, tmp_path, settings
+):
+    settings.LOCAL_SCORER_PATH = tmp_path / "scorer.npz"
+    settings.LOCAL_SCORER_MIN_CONFIDENCE = 0.3
+    scorer.save(settings.LOCAL_SCORER_PATH)
+    unprocessed = dict(is_ai_processed=False, is_spam=None, ai_emotion_score=None)
+    make_comments(1, start_id=1, content="최고 명작 재밌다", **unprocessed)
+    make_comments(1, start_id=2, content="qzxw vbnm", **unprocessed)
+    llm_response = json.dumps(
+        {"response": [{"id": 2, "score": 50, "reason": "중립", "is_spam": False}]}
+    )
+
+    with patch(
+        "llm.views.agenerate_comment_emotion", return_value=llm_response
+    ) as generate:
+        response = APIClient().patch(f"/llm/api/emotion-analysis/{episode.id}/")
+
+    assert response.status_code == 200
+    assert generate.call_args.args[0] == [{"id": 2, "content": "qzxw vbnm"}]
+    assert response.json()["prefilter"]["local_scored"] == 1
+    local = Comment.objects.get(id=1)
+    assert local.ai_emotion_score > 70
+    # 로컬 모델은 스팸 여부를 판정하지 않음
+    assert local.is_spam is None
+    assert Comment.objects.get(id=2).ai_emotion_score == 50
+    counts = APIClient().get(f"/crawler/episode/{episode.id}/comment/count").json()
+    assert counts["unprocessed_count"] == 0
@@ -0,0 +1,74 @@
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from crawler.generations import mark_episode_changed
+from llm.timeline import build_series_timeline, get_series_timeline
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+class TestSeriesTimeline:
+    def test_aggregates(self, series, episode, make_comments):
+        comments = make_comments(30)
+        timeline = build_series_timeline(series.id, "day")
+
+        scores = [
+            c.ai_emotion_score for c in comments if c.ai_emotion_score is not None
+        ]
+        [row] = timeline["episodes"]
+        assert row["episode"] == episode.id
+        assert row["comment_count"] == 30
+        assert row["avg_score"] == pytest.approx(sum(scores) / len(scores))
+        assert row["best_count"] == sum(c.is_best for c in comments)
+
+        assert [b["start"] for b in timeline["buckets"]] == ["2025-07-11"]
+        assert timeline["buckets"][0]["comment_count"] == 30
+
+    def test_month_granularity(self, series, make_comments):
+        make_comments(5)
+        timeline = build_series_timeline(series.id, "month")
+        assert [b["start"] for b in timeline["buckets"]] == ["2025-07-01"]
+
+    def test_cached_until_generation_bump(
+        self, series, episode, make_comments, django_assert_num_queries
+    ):
+        make_comments(10)
+        first = get_series_timeline(series.id)
+        with django_assert_num_queries(0):
+            assert get_series_timeline(series.id) == first
+
+        make_comments(5, start_id=100)
+        assert get_series_timeline(series.id) == first
+
+        mark_episode_changed(episode.id, series.id)
+        assert get_series_timeline(series.id)["episodes"][0]["comment_count"] == 15
+
+    def test_not_cached_with_process_local_cache_and_workers(
+        self, settings, series, episode, make_comments
+    ):
+        settings.WEB_CONCURRENCY = 2
+        make_comments(10)
+        get_series_timeline(series.id)
+
+        # 다른 워커가 댓글을 추가하고 세대를 올린 상황
+        make_comments(5, start_id=100)
+        assert get_series_timeline(series.id)["episodes"][0]["comment_count"] == 15
+
+    def test_endpoint(self, series, make_comments):
+        make_comments(10)
+        client = APIClient()
+        url = f"/llm/api/sentiment-timeline/series/{series.id}/"
+
+        response = client.get(url, {"granularity": "week"})
+        assert response.status_code == 200
+        assert response.json()["granularity"] == "week"
+
+        assert client.get(url, {"granularity": "year"}).status_code == 400
+        assert client.get("/llm/api/sentiment-timeline/series/1/").status_code == 404
@@ -0,0 +1,82 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Avg, Count, Q
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
+
+from crawler.generations import generations_are_shared, get_generation
+from crawler.models import Comment
+
+TIMELINE_GRANULARITIES = {
+    "day": TruncDay,
+    "week": TruncWeek,
+    "month": TruncMonth,
+}
+
+
+def _bucket_stats():
+    return {
+        "comment_count": Count("id"),
+        "avg_score": Avg("ai_emotion_score"),
+        "best_count": Count("id", filter=Q(is_best=True)),
+    }
+
+
+def build_series_timeline(series_id: int, granularity: str = "day") -> dict:
+    """
+    시리즈 전체 댓글을 에피소드별, 기간별로 DB에서 GROUP BY 집계합니다.
+    (PostgreSQL에서는 기간 버킷이 date_trunc로 계산됩니다.)
+    """
+    trunc = TIMELINE_GRANULARITIES[granularity]
+    comments = Comment.objects.filter(series=series_id)
+
+    episodes = (
+        comments.values("episode", "episode__name")
+        .annotate(**_bucket_stats())
+        .order_by("episode")
+    )
+    buckets = (
+        comments.annotate(bucket=trunc("created_at"))
+        .values("bucket")
+        .annotate(**_bucket_stats())
+        .order_by("bucket")
+    )
+    return {
+        "series": series_id,
+        "granularity": granularity,
+        "episodes": [
+            {
+                "episode": row["episode"],
+                "name": row["episode__name"],
+                "comment_count": row["comment_count"],
+                "avg_score": row["avg_score"],
+                "best_count": row["best_count"],
+            }
+            for row in episodes
+        ],
+        "buckets": [
+            {
+                "start": row["bucket"].date().isoformat(),
+                "comment_count": row["comment_count"],
+                "avg_score": row["avg_score"],
+                "best_count": row["best_count"],
+            }
+            for row in buckets
+        ],
+    }
+
+
+def get_series_timeline(series_id: int, granularity: str = "day") -> dict:
+    """
+    시리즈 타임라인을 캐시에서 반환합니다.
+    캐시 키에 시리즈 세대가 들어가므로 크롤링/분석으로 댓글이 바뀌면 자동으로 다시 계산됩니다.
+    워커끼리 세대 카운터를 공유하지 않으면 다른 워커의 무효화를 모르므로 매번 계산합니다.
+    """
+    if not generations_are_shared():
+        return build_series_timeline(series_id, granularity)
+    generation = get_generation("series", series_id)
+    key = f"sentiment-timeline:{series_id}:{generation}:{granularity}"
+    timeline = cache.get(key)
+    if timeline is None:
+        timeline = build_series_timeline(series_id, granularity)
+        cache.set(key, timeline, settings.TIMELINE_CACHE_TTL)
+    return timeline
@@ -18,4 +18,24 @@ urlpatterns = [
         CommentsSummaryResultView.as_view(),
         name="summary",
     ),
+    path(
+        "api/sentiment-stats/<int:episode_id>/",
+        EpisodeSentimentStatsView.as_view(),
+        name="sentiment-stats",
+    ),
+    path(
+        "api/sentiment-stats/series/<int:series_id>/",
+        SeriesSentimentStatsView.as_view(),
+        name="series-sentiment-stats",
+    ),
+    path(
+        "api/sentiment-timeline/series/<int:series_id>/",
+        SeriesSentimentTimelineView.as_view(),
+        name="series-sentiment-timeline",
+    ),
+    path(
+        "api/llm-calls/report/",
+        LLMCallReportView.as_view(),
+        name="llm-call-report",
+    ),
 ]
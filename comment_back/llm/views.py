@@ -1,23 +1,80 @@
-from django.shortcuts import get_object_or_404
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.shortcuts import aget_object_or_404, get_object_or_404
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.generics import DestroyAPIView
+from rest_framework.permissions import IsAdminUser
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 
-from crawler.models import Comment, Episode
-from services.llm_service import generate_comment_emotion
-from utils.swagger import get_path_parameter, DEFAULT_EPISODE_ID
-from .models import CommentAnalysisResult, CommentsSummaryResult
-from .serializers import CommentEmotionAnalysisSerializer, CommentsSummarySerializer
+from crawler.models import Comment, Episode, Series
+from services.llm_provider import LLMError, LLMProviderError
+from services.llm_resilience import LLMCircuitOpenError, LLMTimeoutError
+from services.llm_service import MAX_EMOTION_COMMENTS, agenerate_comment_emotion
+from utils.async_views import AsyncAPIView
+from utils.conditional import conditional_response
+from utils.swagger import get_path_parameter, DEFAULT_EPISODE_ID, DEFAULT_SERIES_ID
+from utils.renderers import FastJSONRenderer
+from utils.metrics import counter
+from .models import (
+    CommentAnalysisResult,
+    CommentsSummaryResult,
+    EpisodeSentimentStats,
+)
+from .serializers import (
+    CommentEmotionAnalysisSerializer,
+    CommentsSummarySerializer,
+    EpisodeSentimentStatsSerializer,
+)
+from .fingerprints import (
+    episode_stats_fingerprint,
+    series_stats_fingerprint,
+    summary_fingerprint,
+)
+from .instrumentation import LLMCallRecorder, build_llm_call_report
+from .local_scorer import LOCAL_REASON_PREFIX, get_local_scorer
+from .prefilter import PREFILTER_REASON_PREFIX, PrefilterPlan, build_prefilter_plan
+from .stats import get_episode_sentiment_stats, refresh_episode_sentiment_stats
+from .timeline import TIMELINE_GRANULARITIES, get_series_timeline
+from crawler.fingerprints import comment_fingerprint
+from crawler.generations import mark_episode_changed
 from logging import getLogger
+from datetime import timedelta
 import json
 from typing import TypedDict, List
 
 logger = getLogger(__name__)
 
+EMOTION_COMMENTS = counter(
+    "llm_emotion_comments_total",
+    "감정 분석한 댓글 수 (처리 경로별: heuristic_spam, duplicate, local, llm)",
+    ["source"],
+)
+
+
+def llm_error_response(error: LLMError) -> Response:
+    """
+    LLM 호출 실패를 응답으로 변환 (요약/감정 분석 공통)
+    - 503: 서킷 브레이커가 열려 있거나 시간 초과. 잠시 후 다시 시도하면 되는 상태
+    - 502: LLM 제공자가 오류를 반환함
+    - 500: 설정 오류 등 서버 쪽 문제
+    """
+    if isinstance(error, (LLMCircuitOpenError, LLMTimeoutError)):
+        logger.warning(f"LLM 호출 실패: {error}")
+        status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    elif isinstance(error, LLMProviderError):
+        logger.error(f"LLM 호출 실패: {error}")
+        status_code = status.HTTP_502_BAD_GATEWAY
+    else:
+        logger.error(f"LLM 호출 실패: {error}")
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    return Response({"error": str(error)}, status=status_code)
+
 
 # Type definitions
 class EmotionResult(TypedDict):
@@ -54,23 +111,28 @@ class CommentAnalysisResultDestroyView(DestroyAPIView):
         return super().delete(request, comment_id=comment_id, *args, **kwargs)
 
 
-class CommentClassificationView(APIView):
+class CommentClassificationView(AsyncAPIView):
     """
     댓글 유형을 분류하는 View 입니다.
     """
 
+    @conditional_response(lambda episode_id: comment_fingerprint(episode=episode_id))
     async def get(self, request: Request, episode_id: int):
         """
         Retrieve the classification result for comments in a specific episode.
         """
-        episode = get_object_or_404(Episode, id=episode_id)
-        comments = Comment.objects.filter(episode=episode)
+        episode = await aget_object_or_404(Episode, id=episode_id)
+        comments = [
+            comment async for comment in Comment.objects.filter(episode=episode)
+        ]
         serializer = CommentsSummarySerializer(comments, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
-class CommentsSummaryResultView(APIView):
-    """댓글 요약 결과 관리 API 뷰"""
+class CommentsSummaryResultView(AsyncAPIView):
+    """댓글 요약 결과 관리 API 뷰 (LLM 응답을 기다리는 동안 워커를 잡지 않도록 비동기)"""
+
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
 
     def _prepare_source_comments(self, episode_id: int) -> List[dict]:
         """에피소드의 댓글을 요약용 데이터로 변환"""
@@ -98,21 +160,28 @@ class CommentsSummaryResultView(APIView):
             201: CommentsSummarySerializer(),
             400: "Bad Request - 잘못된 요청 데이터",
             404: "Not Found - 에피소드를 찾을 수 없음",
+            500: "Internal Server Error - LLM 설정 오류",
+            502: "Bad Gateway - LLM 호출 실패",
+            503: "Service Unavailable - LLM 일시 장애 (서킷 열림, 시간 초과)",
         },
     )
-    def post(self, request: Request, episode_id: int):
+    async def post(self, request: Request, episode_id: int):
         """댓글 요약 생성"""
-        get_object_or_404(Episode, id=episode_id)
+        await aget_object_or_404(Episode, id=episode_id)
 
-        source_comments = self._prepare_source_comments(episode_id)
+        source_comments = await sync_to_async(self._prepare_source_comments)(episode_id)
         data = {
             "episode": episode_id,
             "source_comments": source_comments,
         }
 
         serializer = CommentsSummarySerializer(data=data)
-        if serializer.is_valid():
-            serializer.save()
+        if await sync_to_async(serializer.is_valid)():
+            try:
+                summary = await serializer.agenerate_summary()
+            except LLMError as e:
+                return llm_error_response(e)
+            await sync_to_async(serializer.save)(summary=summary)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -131,11 +200,15 @@ class CommentsSummaryResultView(APIView):
             404: "Not Found - 에피소드를 찾을 수 없음",
         },
     )
-    def get(self, request: Request, episode_id: int):
+    @conditional_response(summary_fingerprint)
+    async def get(self, request: Request, episode_id: int):
         """댓글 요약 목록 조회"""
-        get_object_or_404(Episode, id=episode_id)
+        await aget_object_or_404(Episode, id=episode_id)
 
-        summary_results = CommentsSummaryResult.objects.filter(episode=episode_id)
+        summary_results = [
+            result
+            async for result in CommentsSummaryResult.objects.filter(episode=episode_id)
+        ]
         serializer = CommentsSummarySerializer(summary_results, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -154,27 +227,34 @@ class CommentsSummaryResultView(APIView):
             404: "Not Found - 삭제할 요약이 없음",
         },
     )
-    def delete(self, request: Request, episode_id: int):
+    async def delete(self, request: Request, episode_id: int):
         """댓글 요약 전체 삭제"""
         summary_results = CommentsSummaryResult.objects.filter(episode=episode_id)
-        if not summary_results.exists():
+        if not await summary_results.aexists():
             return Response(
                 {"detail": "No summaries found for this episode."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        summary_results.delete()
+        await summary_results.adelete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class CommentEmotionAnalysisView(APIView):
-    """댓글 감정 분석 API 뷰"""
+class CommentEmotionAnalysisView(AsyncAPIView):
+    """
+    댓글 감정 분석 API 뷰
+
+    LLM 응답을 기다리는 동안 워커를 잡지 않도록 비동기로 처리합니다.
+    DB 조회/저장과 사전 필터, 로컬 모델 채점(CPU 작업)은 sync_to_async로 이벤트 루프 밖에서 실행합니다.
+    """
+
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
 
     def _get_unprocessed_comments(self, episode: Episode) -> tuple[List[Comment], dict]:
         """미처리 댓글 조회 및 맵핑 딕셔너리 생성"""
         comments = Comment.objects.filter(
             episode=episode, is_ai_processed=False, is_spam=None
-        )
+        ).order_by("created_at", "id")
         comments_map = {comment.id: comment for comment in comments}
         return list(comments), comments_map
 
@@ -214,8 +294,70 @@ class CommentEmotionAnalysisView(APIView):
 
         return comments_to_update
 
-    def _bulk_update_comments(self, comments_to_update: List[Comment]) -> None:
-        """댓글 정보 일괄 업데이트"""
+    def _apply_prefilter_spam(
+        self, plan: PrefilterPlan, comments_map: dict
+    ) -> List[Comment]:
+        """사전 필터에서 스팸으로 판단한 댓글을 LLM 없이 처리"""
+        processed_at = timezone.now()
+        spam_comments = []
+        for comment_id, reason in plan.spam.items():
+            comment = comments_map[comment_id]
+            comment.ai_emotion_score = None
+            comment.ai_reason = f"{PREFILTER_REASON_PREFIX} {reason}"
+            comment.is_spam = True
+            comment.is_ai_processed = True
+            comment.ai_processed_at = processed_at
+            spam_comments.append(comment)
+        return spam_comments
+
+    def _score_locally(
+        self, comments: List[Comment]
+    ) -> tuple[List[Comment], List[Comment]]:
+        """
+        로컬 감정 모델로 먼저 채점합니다.
+        확신도가 높은 댓글은 점수를 바로 기록하고, 나머지는 LLM으로 보낼 목록으로 반환합니다.
+        """
+        scorer = get_local_scorer()
+        if scorer is None or not comments:
+            return [], comments
+
+        result = scorer.predict([comment.content for comment in comments])
+        processed_at = timezone.now()
+        scored_comments, escalated_comments = [], []
+        for comment, score, confidence in zip(
+            comments, result.scores, result.confidences
+        ):
+            if confidence < settings.LOCAL_SCORER_MIN_CONFIDENCE:
+                escalated_comments.append(comment)
+                continue
+            comment.ai_emotion_score = int(score)
+            comment.ai_reason = f"{LOCAL_REASON_PREFIX} 확신도 {confidence:.2f}"
+            # 감정 모델은 스팸을 판정하지 않으므로 스팸 여부는 비워 둠 (규칙 스팸은 사전 필터에서 이미 분리됨)
+            comment.is_spam = None
+            comment.is_ai_processed = True
+            comment.ai_processed_at = processed_at
+            scored_comments.append(comment)
+        return scored_comments, escalated_comments
+
+    def _fan_out_to_duplicates(
+        self, plan: PrefilterPlan, analyzed_comments: List[Comment]
+    ) -> List[Comment]:
+        """대표 댓글의 분석 결과를 같은 묶음의 중복 댓글에 복사"""
+        duplicates = []
+        for representative in analyzed_comments:
+            for comment in plan.duplicates.get(representative.id, []):
+                comment.ai_emotion_score = representative.ai_emotion_score
+                comment.ai_reason = representative.ai_reason
+                comment.is_spam = representative.is_spam
+                comment.is_ai_processed = True
+                comment.ai_processed_at = representative.ai_processed_at
+                duplicates.append(comment)
+        return duplicates
+
+    def _bulk_update_comments(
+        self, episode: Episode, comments_to_update: List[Comment]
+    ) -> None:
+        """댓글 정보 일괄 업데이트 후 에피소드 감정 집계 갱신"""
         if not comments_to_update:
             return
 
@@ -230,6 +372,8 @@ class CommentEmotionAnalysisView(APIView):
             ],
         )
         logger.info(f"{len(comments_to_update)}개 댓글 감정 분석 완료")
+        refresh_episode_sentiment_stats(episode.id)
+        mark_episode_changed(episode.id, episode.series_id)
 
     def _reset_comments_analysis(self, episode: Episode) -> int:
         """에피소드의 댓글 AI 분석 결과 초기화"""
@@ -246,6 +390,8 @@ class CommentEmotionAnalysisView(APIView):
                 is_ai_processed=False,
                 ai_processed_at=None,
             )
+            refresh_episode_sentiment_stats(episode.id)
+            mark_episode_changed(episode.id, episode.series_id)
 
         return reset_count
 
@@ -263,47 +409,92 @@ class CommentEmotionAnalysisView(APIView):
             200: "분석 성공",
             404: "Not Found - 에피소드를 찾을 수 없음",
             500: "Internal Server Error - 분석 처리 오류",
+            502: "Bad Gateway - LLM 호출 실패",
+            503: "Service Unavailable - LLM 일시 장애 (서킷 열림, 시간 초과)",
         },
     )
-    def patch(self, request: Request, episode_id: int):
+    async def patch(self, request: Request, episode_id: int):
         """댓글 감정 분석 실행"""
-        episode = get_object_or_404(Episode, id=episode_id)
+        episode = await aget_object_or_404(Episode, id=episode_id)
 
         # 미처리 댓글 조회
-        comments, comments_map = self._get_unprocessed_comments(episode)
+        comments, comments_map = await sync_to_async(self._get_unprocessed_comments)(
+            episode
+        )
 
         if not comments:
             return Response(
                 {"message": "처리할 댓글이 없습니다."}, status=status.HTTP_200_OK
             )
 
-        # LLM 분석 요청
-        source_comments = self._prepare_source_comments(comments)
-        analysis_result = generate_comment_emotion(source_comments)
+        # 사전 필터: 명백한 스팸은 제외하고 중복 댓글은 대표 댓글만 분석
+        plan = await sync_to_async(build_prefilter_plan)(comments)
+        comments_to_update = self._apply_prefilter_spam(plan, comments_map)
 
-        if not analysis_result:
-            logger.error("LLM에서 분석 결과를 받지 못했습니다.")
-            return Response(
-                {"error": "No analysis result generated."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        # 로컬 모델로 1차 채점, 확신도가 낮은 댓글만 LLM으로 보냄
+        analyzed_comments, llm_comments = await sync_to_async(self._score_locally)(
+            plan.representatives
+        )
+        # 한 번에 분석하는 수를 넘는 대표 댓글(과 그 중복 댓글)은 미처리로 남아 다음 요청에서 분석
+        llm_comments = llm_comments[:MAX_EMOTION_COMMENTS]
+        summary = {
+            **plan.summary(),
+            "local_scored": len(analyzed_comments),
+            "llm_requested": len(llm_comments),
+        }
+        parsed_result: EmotionResponse = {"response": []}
+
+        if llm_comments:
+            # LLM 분석 요청
+            source_comments = self._prepare_source_comments(llm_comments)
+            recorder = LLMCallRecorder(
+                "emotion",
+                episode=episode,
+                comment_count=len(source_comments),
             )
-
-        # 결과 파싱 및 업데이트
-        try:
-            logger.debug(f"LLM 응답 수신: {analysis_result}")
-            parsed_result = self._parse_analysis_result(analysis_result)
-            comments_to_update = self._update_comments_with_analysis(
+            try:
+                async with recorder:
+                    analysis_result = await agenerate_comment_emotion(
+                        source_comments, recorder.provider
+                    )
+                    # 결과 파싱 (실패도 호출 기록에 남김)
+                    try:
+                        if not analysis_result:
+                            raise ValueError("No analysis result generated.")
+                        logger.debug(f"LLM 응답 수신: {analysis_result}")
+                        parsed_result = self._parse_analysis_result(analysis_result)
+                    except ValueError as e:
+                        recorder.mark_parse_failure(e)
+            except LLMError as e:
+                return llm_error_response(e)
+
+            if recorder.parse_error is not None:
+                logger.error(f"LLM 응답 처리 실패: {recorder.parse_error}")
+                return Response(
+                    {"error": recorder.parse_error},
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                )
+            analyzed_comments += self._update_comments_with_analysis(
                 parsed_result, comments_map
             )
-            self._bulk_update_comments(comments_to_update)
 
-            return Response(parsed_result, status=status.HTTP_200_OK)
+        duplicates = self._fan_out_to_duplicates(plan, analyzed_comments)
+        # 대표 댓글이 분석된 중복 댓글만 처리한 것으로 셈
+        summary["duplicates"] = len(duplicates)
+        comments_to_update += analyzed_comments + duplicates
+        await sync_to_async(self._bulk_update_comments)(episode, comments_to_update)
+        logger.info(f"사전 필터 결과: {summary}")
+        for source, count in (
+            ("heuristic_spam", summary["heuristic_spam"]),
+            ("duplicate", summary["duplicates"]),
+            ("local", summary["local_scored"]),
+            ("llm", summary["llm_requested"]),
+        ):
+            EMOTION_COMMENTS.inc(count, source=source)
 
-        except ValueError as e:
-            return Response(
-                {"error": str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        return Response(
+            {**parsed_result, "prefilter": summary}, status=status.HTTP_200_OK
+        )
 
     @swagger_auto_schema(
         operation_description="댓글 감정 분석 결과 초기화",
@@ -320,12 +511,12 @@ class CommentEmotionAnalysisView(APIView):
             404: "Not Found - 에피소드를 찾을 수 없음",
         },
     )
-    def delete(self, request: Request, episode_id: int):
+    async def delete(self, request: Request, episode_id: int):
         """댓글 감정 분석 결과 초기화"""
-        episode = get_object_or_404(Episode, id=episode_id)
+        episode = await aget_object_or_404(Episode, id=episode_id)
 
         # AI 분석 결과 초기화
-        reset_count = self._reset_comments_analysis(episode)
+        reset_count = await sync_to_async(self._reset_comments_analysis)(episode)
 
         logger.info(
             f"에피소드 {episode_id}의 {reset_count}개 댓글 분석 결과 초기화 완료"
@@ -339,3 +530,161 @@ class CommentEmotionAnalysisView(APIView):
             },
             status=status.HTTP_200_OK,
         )
+
+
+class EpisodeSentimentStatsView(APIView):
+    """에피소드 감정 분석 집계 조회 API 뷰"""
+
+    # 지문(ETag) + 에피소드 + 집계 (집계가 없으면 계산: 집계 2 + UPDATE + INSERT)
+    query_budget = 7
+
+    @swagger_auto_schema(
+        operation_description="에피소드 감정 분석 집계 조회",
+        operation_summary="평균/백분위 감정 점수, 점수 히스토그램, 스팸 비율 등을 조회합니다.",
+        manual_parameters=[
+            get_path_parameter(
+                "episode_id",
+                description="조회할 에피소드의 ID",
+                default=DEFAULT_EPISODE_ID,
+            ),
+        ],
+        responses={
+            200: EpisodeSentimentStatsSerializer(),
+            404: "Not Found - 에피소드를 찾을 수 없음",
+        },
+    )
+    @conditional_response(episode_stats_fingerprint)
+    def get(self, request: Request, episode_id: int):
+        """에피소드 감정 분석 집계 조회"""
+        get_object_or_404(Episode, id=episode_id)
+        stats = get_episode_sentiment_stats(episode_id)
+        return Response(
+            EpisodeSentimentStatsSerializer(stats).data, status=status.HTTP_200_OK
+        )
+
+
+class SeriesSentimentStatsView(APIView):
+    """시리즈의 에피소드별 감정 분석 집계 조회 API 뷰"""
+
+    query_budget = 2  # 지문(ETag) + 집계 목록
+
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+
+    @swagger_auto_schema(
+        operation_description="시리즈 에피소드별 감정 분석 집계 조회",
+        operation_summary="시리즈에 속한 에피소드들의 감정 분석 집계를 한 번에 조회합니다.",
+        manual_parameters=[
+            get_path_parameter(
+                "series_id",
+                description="조회할 시리즈의 ID",
+                default=DEFAULT_SERIES_ID,
+            ),
+        ],
+        responses={200: EpisodeSentimentStatsSerializer(many=True)},
+    )
+    @conditional_response(series_stats_fingerprint)
+    def get(self, request: Request, series_id: int):
+        """시리즈 에피소드별 감정 분석 집계 조회"""
+        stats = EpisodeSentimentStats.objects.filter(
+            episode__series=series_id
+        ).order_by("episode_id")
+        return Response(
+            EpisodeSentimentStatsSerializer(stats, many=True).data,
+            status=status.HTTP_200_OK,
+        )
+
+
+class SeriesSentimentTimelineView(APIView):
+    """시리즈 감정 타임라인 조회 API 뷰"""
+
+    query_budget = 4  # 지문(ETag) + 시리즈 확인 + 타임라인 집계 2번
+
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+
+    @swagger_auto_schema(
+        operation_description="시리즈 감정 타임라인 조회",
+        operation_summary="시리즈의 에피소드별, 기간별 댓글 수/평균 감정 점수/베스트 댓글 수를 조회합니다.",
+        manual_parameters=[
+            get_path_parameter(
+                "series_id",
+                description="조회할 시리즈의 ID",
+                default=DEFAULT_SERIES_ID,
+            ),
+            openapi.Parameter(
+                "granularity",
+                openapi.IN_QUERY,
+                description="기간 버킷 단위 (day/week/month)",
+                type=openapi.TYPE_STRING,
+                enum=list(TIMELINE_GRANULARITIES),
+                default="day",
+            ),
+        ],
+        responses={
+            200: "타임라인",
+            400: "Bad Request - 지원하지 않는 granularity",
+            404: "Not Found - 시리즈를 찾을 수 없음",
+        },
+    )
+    @conditional_response(series_stats_fingerprint)
+    def get(self, request: Request, series_id: int):
+        """시리즈 감정 타임라인 조회"""
+        get_object_or_404(Series, id=series_id)
+        granularity = request.query_params.get("granularity", "day")
+        if granularity not in TIMELINE_GRANULARITIES:
+            return Response(
+                {"error": f"지원하지 않는 granularity입니다: {granularity}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(
+            get_series_timeline(series_id, granularity), status=status.HTTP_200_OK
+        )
+
+
+class LLMCallReportView(APIView):
+    """LLM 호출 기록 리포트 API 뷰"""
+
+    query_budget = 1
+
+    # 호출 비용/오류 내역이 들어 있으므로 관리자만 조회
+    permission_classes = [IsAdminUser]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    MAX_DAYS = 90
+
+    @swagger_auto_schema(
+        operation_description="LLM 호출 리포트 조회",
+        operation_summary="최근 LLM 호출의 지연 시간 백분위수, 토큰/비용, 재시도/파싱 실패 횟수를 작업/모델/프롬프트 버전별, 배치 크기별로 조회합니다.",
+        manual_parameters=[
+            openapi.Parameter(
+                "days",
+                openapi.IN_QUERY,
+                description=f"최근 며칠간의 호출을 집계할지 (1~{MAX_DAYS})",
+                type=openapi.TYPE_INTEGER,
+                default=7,
+            ),
+            openapi.Parameter(
+                "task",
+                openapi.IN_QUERY,
+                description="작업 종류로 필터 (summary/emotion)",
+                type=openapi.TYPE_STRING,
+                required=False,
+            ),
+        ],
+        responses={
+            200: "LLM 호출 리포트",
+            400: "Bad Request - 잘못된 days",
+        },
+    )
+    def get(self, request: Request):
+        """LLM 호출 리포트 조회"""
+        try:
+            days = int(request.query_params.get("days", 7))
+        except ValueError:
+            days = 0
+        if not 1 <= days <= self.MAX_DAYS:
+            return Response(
+                {"error": f"days는 1~{self.MAX_DAYS} 사이의 정수여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        since = timezone.now() - timedelta(days=days)
+        report = build_llm_call_report(since, request.query_params.get("task"))
+        return Response(report, status=status.HTTP_200_OK)
@@ -0,0 +1,410 @@
+"""
+LLM 제공자(provider) 추상화
+
+llm_service의 프롬프트/스키마는 그대로 두고 실제 호출만 제공자에 맡깁니다.
+settings.LLM_PROVIDER로 고르고, 처음 호출할 때 만들어집니다.
+
+- gemini: Google Gemini (GOOGLE_API_KEY 필요, 첫 호출 때 클라이언트 생성)
+- fake: 네트워크 없이 결정적인 응답을 만드는 로컬 제공자. 지연 시간과 실패율을 설정할 수 있어
+  부하 테스트/벤치마크에 사용
+- LLM_RECORD_MODE=record/replay: 위 제공자의 응답을 파일로 녹화하거나 녹화된 응답을 재생
+
+모든 제공자는 동기(generate)와 비동기(agenerate) 호출을 모두 지원합니다.
+비동기 뷰는 agenerate를 사용해 응답을 기다리는 동안 워커 스레드를 잡고 있지 않습니다.
+"""
+
+import ast
+import asyncio
+import hashlib
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+
+
+class LLMError(Exception):
+    """LLM 호출 실패의 공통 부모 에러"""
+
+
+class LLMConfigurationError(LLMError):
+    """LLM 제공자 설정이 잘못되었을 때 발생하는 에러"""
+
+
+class LLMProviderError(LLMError):
+    """LLM 제공자 호출이 실패했을 때 발생하는 에러"""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class LLMReplayMissError(LLMError):
+    """재생 모드에서 녹화된 응답이 없을 때 발생하는 에러"""
+
+
+@dataclass(frozen=True)
+class LLMRequest:
+    task: str  # "summary", "emotion" 등 호출 목적
+    model: str
+    system_instruction: str
+    prompt: str
+    response_mime_type: str = "text/plain"
+    response_schema: Any = None  # 제공자에 그대로 전달 (fake/녹화 키에는 사용하지 않음)
+    temperature: float = 0
+
+
+@dataclass
+class LLMResponse:
+    text: str
+    model: str
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    attempts: int = 1  # 재시도를 포함한 시도 횟수 (llm_resilience)
+    hedged: bool = False  # 헤지 요청의 응답인지
+    cached: bool = False  # 녹화된 응답을 재생했는지
+
+
+class LLMProvider:
+    name = "base"
+
+    def generate(self, request: LLMRequest) -> LLMResponse:
+        raise NotImplementedError
+
+    async def agenerate(self, request: LLMRequest) -> LLMResponse:
+        """비동기 호출. 기본 구현은 generate를 별도 스레드에서 실행 (비동기 클라이언트가 있으면 재정의)"""
+        return await asyncio.to_thread(self.generate, request)
+
+
+class GeminiProvider(LLMProvider):
+    name = "gemini"
+
+    # 재시도할 만한 HTTP 상태 코드 (요청 시간 초과, 요청 한도 초과, 서버 오류)
+    RETRYABLE_STATUS_CODES = (408, 429, 500, 502, 503, 504)
+
+    def __init__(self, api_key: str | None, timeout: float | None = None):
+        self.api_key = api_key
+        self.timeout = timeout
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    if not self.api_key:
+                        raise LLMConfigurationError(
+                            "GOOGLE_API_KEY environment variable not set."
+                        )
+                    from google import genai
+                    from google.genai import types
+
+                    http_options = (
+                        types.HttpOptions(timeout=int(self.timeout * 1000))
+                        if self.timeout
+                        else None
+                    )
+                    self._client = genai.Client(
+                        api_key=self.api_key, http_options=http_options
+                    )
+        return self._client
+
+    def _get_generate_content_args(self, request: LLMRequest) -> dict:
+        from google.genai import types
+
+        config = types.GenerateContentConfig(
+            temperature=request.temperature,
+            thinking_config=types.ThinkingConfig(thinking_budget=0),
+            response_mime_type=request.response_mime_type,
+            response_schema=request.response_schema,
+            system_instruction=[types.Part.from_text(text=request.system_instruction)],
+        )
+        contents = [
+            types.Content(
+                role="user", parts=[types.Part.from_text(text=request.prompt)]
+            )
+        ]
+        return {"model": request.model, "contents": contents, "config": config}
+
+    @contextmanager
+    def _translate_errors(self):
+        """Gemini/httpx 에러를 재시도 여부가 담긴 LLMProviderError로 변환"""
+        import httpx
+        from google.genai import errors
+
+        try:
+            yield
+        except errors.APIError as e:
+            raise LLMProviderError(
+                f"Gemini API 오류 ({e.code}): {e.message}",
+                retryable=e.code in self.RETRYABLE_STATUS_CODES,
+            ) from e
+        except httpx.TransportError as e:
+            raise LLMProviderError(f"Gemini 네트워크 오류: {e!r}") from e
+
+    def _to_response(self, request: LLMRequest, response) -> LLMResponse:
+        usage = response.usage_metadata
+        return LLMResponse(
+            text=response.text or "",
+            model=request.model,
+            input_tokens=usage.prompt_token_count if usage else None,
+            output_tokens=usage.candidates_token_count if usage else None,
+        )
+
+    def generate(self, request: LLMRequest) -> LLMResponse:
+        args = self._get_generate_content_args(request)
+        with self._translate_errors():
+            response = self.client.models.generate_content(**args)
+        return self._to_response(request, response)
+
+    async def agenerate(self, request: LLMRequest) -> LLMResponse:
+        args = self._get_generate_content_args(request)
+        with self._translate_errors():
+            response = await self.client.aio.models.generate_content(**args)
+        return self._to_response(request, response)
+
+
+def _stable_hash(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big")
+
+
+def _estimate_tokens(text: str) -> int:
+    """한국어 기준 대략 글자 2개당 토큰 1개"""
+    return max(1, len(text) // 2)
+
+
+class FakeLLMProvider(LLMProvider):
+    """
+    네트워크 없이 같은 입력에 항상 같은 응답을 돌려주는 제공자.
+    latency초 만큼 기다리고, failure_rate 확률로 LLMProviderError를 발생시킵니다.
+    """
+
+    name = "fake"
+
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _parse_comments(self, prompt: str) -> list[dict]:
+        try:
+            comments = ast.literal_eval(prompt)
+        except (ValueError, SyntaxError):
+            return []
+        return (
+            [c for c in comments if isinstance(c, dict)]
+            if isinstance(comments, list)
+            else []
+        )
+
+    def _emotion(self, prompt: str) -> str:
+        response = []
+        for comment in self._parse_comments(prompt):
+            content = str(comment.get("content", ""))
+            response.append(
+                {
+                    "id": comment.get("id"),
+                    "score": _stable_hash(content) % 101,
+                    "reason": "fake 응답",
+                    "is_spam": False,
+                }
+            )
+        return json.dumps({"response": response}, ensure_ascii=False)
+
+    def _summary(self, prompt: str) -> str:
+        comments = self._parse_comments(prompt)
+        best_count = sum(1 for c in comments if c.get("is_best"))
+        return (
+            f"**1. 총평 (Executive Summary)**\n"
+            f"fake 요약: 댓글 {len(comments)}개, 베스트 댓글 {best_count}개"
+        )
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            return self._random.random() < self.failure_rate
+
+    def _respond(self, request: LLMRequest, should_fail: bool) -> LLMResponse:
+        if should_fail:
+            raise LLMProviderError("fake 제공자 실패 (LLM_FAKE_FAILURE_RATE)")
+
+        text = (
+            self._emotion(request.prompt)
+            if request.task == "emotion"
+            else self._summary(request.prompt)
+        )
+        return LLMResponse(
+            text=text,
+            model=request.model,
+            input_tokens=_estimate_tokens(request.system_instruction + request.prompt),
+            output_tokens=_estimate_tokens(text),
+        )
+
+    def generate(self, request: LLMRequest) -> LLMResponse:
+        should_fail = self._should_fail()
+        if self.latency:
+            time.sleep(self.latency)
+        return self._respond(request, should_fail)
+
+    async def agenerate(self, request: LLMRequest) -> LLMResponse:
+        should_fail = self._should_fail()
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._respond(request, should_fail)
+
+
+class RecordReplayProvider(LLMProvider):
+    """
+    record: 내부 제공자 응답을 요청 해시별 JSON 파일로 저장
+    replay: 저장된 응답만 돌려주고, 없으면 LLMReplayMissError
+    """
+
+    def __init__(self, inner: LLMProvider | None, directory: str | Path, mode: str):
+        if mode not in ("record", "replay"):
+            raise LLMConfigurationError(f"지원하지 않는 녹화 모드입니다: {mode}")
+        if mode == "record" and inner is None:
+            raise LLMConfigurationError("녹화하려면 내부 제공자가 필요합니다.")
+        self.inner = inner
+        self.directory = Path(directory)
+        self.mode = mode
+        self.name = f"{mode}:{inner.name if inner else 'none'}"
+
+    @staticmethod
+    def get_key(request: LLMRequest) -> str:
+        payload = json.dumps(
+            [
+                request.task,
+                request.model,
+                request.system_instruction,
+                request.prompt,
+                request.response_mime_type,
+                request.temperature,
+            ],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, request: LLMRequest) -> Path:
+        return self.directory / request.task / f"{self.get_key(request)}.json"
+
+    def _replay(self, request: LLMRequest) -> LLMResponse:
+        path = self._path(request)
+        if not path.exists():
+            raise LLMReplayMissError(f"녹화된 응답이 없습니다: {path}")
+        response = LLMResponse(**json.loads(path.read_text())["response"])
+        return replace(response, cached=True)
+
+    def _record(self, request: LLMRequest, response: LLMResponse) -> None:
+        path = self._path(request)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "request": {**asdict(request), "response_schema": None},
+                    "response": asdict(response),
+                },
+                ensure_ascii=False,
+                indent=2,
+            )
+        )
+        tmp_path.replace(path)
+
+    def generate(self, request: LLMRequest) -> LLMResponse:
+        if self.mode == "replay":
+            return self._replay(request)
+        response = self.inner.generate(request)
+        self._record(request, response)
+        return response
+
+    async def agenerate(self, request: LLMRequest) -> LLMResponse:
+        if self.mode == "replay":
+            return self._replay(request)
+        response = await self.inner.agenerate(request)
+        self._record(request, response)
+        return response
+
+
+def build_llm_provider() -> LLMProvider:
+    """settings로 제공자를 만듦"""
+    record_mode = settings.LLM_RECORD_MODE
+    if record_mode == "replay":
+        return RecordReplayProvider(None, settings.LLM_RECORD_DIR, "replay")
+
+    if settings.LLM_PROVIDER == "gemini":
+        provider: LLMProvider = GeminiProvider(
+            settings.GOOGLE_API_KEY, timeout=settings.LLM_TIMEOUT
+        )
+    elif settings.LLM_PROVIDER == "fake":
+        provider = FakeLLMProvider(
+            latency=settings.LLM_FAKE_LATENCY,
+            failure_rate=settings.LLM_FAKE_FAILURE_RATE,
+        )
+    else:
+        raise LLMConfigurationError(
+            f"지원하지 않는 LLM_PROVIDER입니다: {settings.LLM_PROVIDER}"
+        )
+
+    if record_mode == "record":
+        provider = RecordReplayProvider(provider, settings.LLM_RECORD_DIR, "record")
+    elif record_mode not in ("", "off"):
+        raise LLMConfigurationError(
+            f"지원하지 않는 LLM_RECORD_MODE입니다: {record_mode}"
+        )
+
+    from .llm_resilience import CircuitBreaker, ResilientLLMProvider
+
+    return ResilientLLMProvider(
+        provider,
+        timeout=settings.LLM_TIMEOUT,
+        max_attempts=settings.LLM_MAX_ATTEMPTS,
+        backoff_base=settings.LLM_BACKOFF_BASE,
+        backoff_max=settings.LLM_BACKOFF_MAX,
+        hedge_after=settings.LLM_HEDGE_AFTER,
+        circuit_breaker=CircuitBreaker(
+            provider.name,
+            failure_threshold=settings.LLM_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=settings.LLM_CIRCUIT_RESET_TIMEOUT,
+        ),
+    )
+
+
+_provider: tuple[tuple, LLMProvider] | None = None
+_provider_lock = threading.Lock()
+
+
+def _settings_key() -> tuple:
+    return (
+        settings.LLM_PROVIDER,
+        settings.LLM_RECORD_MODE,
+        str(settings.LLM_RECORD_DIR),
+        settings.LLM_FAKE_LATENCY,
+        settings.LLM_FAKE_FAILURE_RATE,
+        settings.GOOGLE_API_KEY,
+        settings.LLM_TIMEOUT,
+        settings.LLM_MAX_ATTEMPTS,
+        settings.LLM_BACKOFF_BASE,
+        settings.LLM_BACKOFF_MAX,
+        settings.LLM_HEDGE_AFTER,
+        settings.LLM_CIRCUIT_FAILURE_THRESHOLD,
+        settings.LLM_CIRCUIT_RESET_TIMEOUT,
+    )
+
+
+def get_llm_provider() -> LLMProvider:
+    """현재 설정의 제공자. 처음 호출할 때 만들고, 설정이 바뀌면 다시 만듦"""
+    global _provider
+    key = _settings_key()
+    provider = _provider
+    if provider is None or provider[0] != key:
+        with _provider_lock:
+            if _provider is None or _provider[0] != key:
+                _provider = (key, build_llm_provider())
+            provider = _provider
+    return provider[1]
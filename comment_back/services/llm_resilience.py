@@ -0,0 +1,352 @@
+"""
+LLM 호출 안정화 계층
+
+제공자를 감싸서 다음을 처리합니다.
+
+- 호출 시간 제한(deadline): 시간을 넘기면 LLMTimeoutError로 바로 반환 (워커가 무한정 묶이지 않음)
+- 재시도: 재시도 가능한 에러(타임아웃, 429, 5xx 등)는 지수 백오프 + jitter 후 다시 시도
+- 헤지 요청(hedged request): 첫 요청이 hedge_after초 안에 끝나지 않으면 같은 요청을 하나 더 보내고
+  먼저 끝난 응답을 사용 (꼬리 지연 감소, 비용은 늘어남)
+- 서킷 브레이커: 연속 실패가 쌓이면 일정 시간 동안 호출하지 않고 LLMCircuitOpenError로 바로 실패
+
+모든 결과는 utils.metrics의 llm_* 메트릭으로 기록됩니다.
+
+비동기 호출(agenerate)도 같은 정책을 따릅니다. 스레드 풀 대신 asyncio 태스크를 쓰고,
+제한 시간을 넘긴 요청과 헤지 경쟁에서 진 요청은 취소됩니다.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import replace
+
+from utils.metrics import QUEUE_DEPTH, counter, gauge, histogram
+
+from .llm_provider import (
+    LLMError,
+    LLMProvider,
+    LLMProviderError,
+    LLMRequest,
+    LLMResponse,
+)
+
+LLM_CALLS = counter(
+    "llm_calls_total",
+    "LLM 호출 결과 (success, timeout, error, circuit_open)",
+    ["provider", "task", "outcome"],
+)
+LLM_ATTEMPTS = counter(
+    "llm_attempts_total",
+    "LLM 제공자로 보낸 시도 수 (재시도/헤지 포함)",
+    ["provider", "task", "outcome"],
+)
+LLM_RETRIES = counter("llm_retries_total", "LLM 재시도 수", ["provider", "task"])
+LLM_HEDGES = counter(
+    "llm_hedges_total",
+    "헤지 요청 수와 헤지 요청이 먼저 끝난 횟수",
+    ["provider", "task", "result"],
+)
+LLM_CALL_DURATION = histogram(
+    "llm_call_duration_seconds", "재시도를 포함한 LLM 호출 시간", ["provider", "task"]
+)
+LLM_CIRCUIT_STATE = gauge(
+    "llm_circuit_state",
+    "LLM 서킷 브레이커 상태 (0: closed, 1: half_open, 2: open)",
+    ["provider"],
+)
+
+
+class LLMTimeoutError(LLMProviderError):
+    """LLM 호출이 제한 시간 안에 끝나지 않았을 때 발생하는 에러"""
+
+
+class LLMCircuitOpenError(LLMError):
+    """서킷 브레이커가 열려 있어 LLM을 호출하지 않았을 때 발생하는 에러"""
+
+
+def is_retryable(error: Exception) -> bool:
+    return isinstance(error, LLMProviderError) and error.retryable
+
+
+class CircuitBreaker:
+    """
+    연속 failure_threshold번 실패하면 열리고(open), reset_timeout초 뒤 한 번의 시험 호출을 허용합니다(half_open).
+    시험 호출이 성공하면 닫히고(closed), 실패하면 다시 열립니다.
+    """
+
+    CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+    _STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+        self._set_state(self.CLOSED)
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        LLM_CIRCUIT_STATE.set(self._STATE_VALUES[state], provider=self.name)
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self._set_state(self.HALF_OPEN)
+            if self.state == self.HALF_OPEN:
+                if self._trial_in_flight:
+                    return False
+                self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._trial_in_flight = False
+            self._set_state(self.CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                self._set_state(self.OPEN)
+
+    def release(self) -> None:
+        """제공자 상태와 무관한 실패(잘못된 요청 등). 상태는 그대로 두고 시험 호출만 끝냄"""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+class ResilientLLMProvider(LLMProvider):
+    def __init__(
+        self,
+        inner: LLMProvider,
+        timeout: float,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        hedge_after: float | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        max_workers: int = 16,
+    ):
+        self.inner = inner
+        self.name = inner.name
+        self.timeout = timeout
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.hedge_after = hedge_after
+        self.circuit_breaker = circuit_breaker
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"llm-{inner.name}"
+        )
+
+    def _backoff(self, attempt: int) -> float:
+        """full jitter: 0 ~ min(backoff_max, backoff_base * 2^attempt)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def _count_attempt(self, request: LLMRequest, error: Exception | None) -> None:
+        if error is None:
+            outcome = "success"
+        else:
+            outcome = "timeout" if isinstance(error, LLMTimeoutError) else "error"
+        LLM_ATTEMPTS.inc(provider=self.name, task=request.task, outcome=outcome)
+
+    def _submit(self, request: LLMRequest) -> Future:
+        queue = f"llm-{self.name}"
+
+        def call():
+            try:
+                response = self.inner.generate(request)
+            except Exception as e:
+                self._count_attempt(request, e)
+                raise
+            finally:
+                QUEUE_DEPTH.dec(queue=queue)
+            self._count_attempt(request, None)
+            return response
+
+        QUEUE_DEPTH.inc(queue=queue)
+        return self._executor.submit(call)
+
+    def _attempt(self, request: LLMRequest) -> tuple[LLMResponse, bool]:
+        """한 번의 시도 (헤지 포함). (응답, 헤지 요청이 이겼는지)를 반환"""
+        deadline = time.monotonic() + self.timeout
+        futures = [self._submit(request)]
+
+        if self.hedge_after is not None and self.hedge_after < self.timeout:
+            done, _ = wait(futures, timeout=self.hedge_after)
+            if not done:
+                LLM_HEDGES.inc(provider=self.name, task=request.task, result="sent")
+                futures.append(self._submit(request))
+
+        last_error: Exception | None = None
+        pending = set(futures)
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(
+                pending, timeout=remaining, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    hedge_won = len(futures) > 1 and future is futures[1]
+                    if hedge_won:
+                        LLM_HEDGES.inc(
+                            provider=self.name, task=request.task, result="won"
+                        )
+                    return future.result(), hedge_won
+                last_error = error
+
+        for future in pending:
+            future.cancel()
+        if pending or last_error is None:
+            raise LLMTimeoutError(
+                f"LLM 호출이 {self.timeout}초 안에 끝나지 않았습니다."
+            )
+        raise last_error
+
+    async def _acall(self, request: LLMRequest) -> LLMResponse:
+        try:
+            response = await self.inner.agenerate(request)
+        except Exception as e:
+            self._count_attempt(request, e)
+            raise
+        self._count_attempt(request, None)
+        return response
+
+    async def _aattempt(self, request: LLMRequest) -> tuple[LLMResponse, bool]:
+        """_attempt의 비동기 버전. 끝나지 않은 요청은 반환하기 전에 취소"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        tasks = [asyncio.ensure_future(self._acall(request))]
+        pending = set(tasks)
+        last_error: Exception | None = None
+        try:
+            if self.hedge_after is not None and self.hedge_after < self.timeout:
+                done, _ = await asyncio.wait(tasks, timeout=self.hedge_after)
+                if not done:
+                    LLM_HEDGES.inc(provider=self.name, task=request.task, result="sent")
+                    tasks.append(asyncio.ensure_future(self._acall(request)))
+                    pending.add(tasks[1])
+
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        hedge_won = len(tasks) > 1 and task is tasks[1]
+                        if hedge_won:
+                            LLM_HEDGES.inc(
+                                provider=self.name, task=request.task, result="won"
+                            )
+                        return task.result(), hedge_won
+                    last_error = error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # 읽지 않은 실패로 경고가 남지 않도록
+
+        if pending or last_error is None:
+            raise LLMTimeoutError(
+                f"LLM 호출이 {self.timeout}초 안에 끝나지 않았습니다."
+            )
+        raise last_error
+
+    def _check_circuit(self, labels: dict) -> None:
+        if self.circuit_breaker is not None and not self.circuit_breaker.allow():
+            LLM_CALLS.inc(**labels, outcome="circuit_open")
+            raise LLMCircuitOpenError(
+                f"{self.name} 제공자 상태가 좋지 않아 잠시 호출을 중단했습니다."
+            )
+
+    def _record_failure(self, error: Exception, attempt: int, labels: dict) -> None:
+        error.attempts = attempt  # 호출 기록용 (llm.instrumentation)
+        if self.circuit_breaker is not None:
+            if is_retryable(error):
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.release()
+        outcome = "timeout" if isinstance(error, LLMTimeoutError) else "error"
+        LLM_CALLS.inc(**labels, outcome=outcome)
+
+    def _record_success(
+        self, response: LLMResponse, attempt: int, hedged: bool, labels: dict
+    ) -> LLMResponse:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_success()
+        LLM_CALLS.inc(**labels, outcome="success")
+        return replace(response, attempts=attempt, hedged=hedged)
+
+    def generate(self, request: LLMRequest) -> LLMResponse:
+        labels = {"provider": self.name, "task": request.task}
+        self._check_circuit(labels)
+
+        started_at = time.perf_counter()
+        attempt = 0
+        try:
+            while True:
+                attempt += 1
+                try:
+                    response, hedged = self._attempt(request)
+                    break
+                except Exception as e:
+                    if not is_retryable(e) or attempt >= self.max_attempts:
+                        raise
+                    LLM_RETRIES.inc(**labels)
+                    time.sleep(self._backoff(attempt - 1))
+        except Exception as e:
+            self._record_failure(e, attempt, labels)
+            raise
+        finally:
+            LLM_CALL_DURATION.observe(time.perf_counter() - started_at, **labels)
+
+        return self._record_success(response, attempt, hedged, labels)
+
+    async def agenerate(self, request: LLMRequest) -> LLMResponse:
+        labels = {"provider": self.name, "task": request.task}
+        self._check_circuit(labels)
+
+        started_at = time.perf_counter()
+        attempt = 0
+        try:
+            while True:
+                attempt += 1
+                try:
+                    response, hedged = await self._aattempt(request)
+                    break
+                except Exception as e:
+                    if not is_retryable(e) or attempt >= self.max_attempts:
+                        raise
+                    LLM_RETRIES.inc(**labels)
+                    await asyncio.sleep(self._backoff(attempt - 1))
+        except asyncio.CancelledError:
+            # 클라이언트가 연결을 끊어 요청이 취소됨. 시험 호출(half_open)이 계속 잡혀 있지 않도록 풀어줌
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.release()
+            raise
+        except Exception as e:
+            self._record_failure(e, attempt, labels)
+            raise
+        finally:
+            LLM_CALL_DURATION.observe(time.perf_counter() - started_at, **labels)
+
+        return self._record_success(response, attempt, hedged, labels)
@@ -1,40 +1,14 @@
 # myapp/services/llm_service.py
-import os
-from google import genai
 from google.genai import types
 
-API_KEY = os.getenv("GOOGLE_API_KEY")
+from utils.metrics import counter, histogram
 
-if not API_KEY:
-    raise ValueError("GOOGLE_API_KEY environment variable not set.")
+from .llm_provider import LLMProvider, LLMRequest, LLMResponse, get_llm_provider
 
+MODEL = "gemini-2.5-flash-lite"
+MAX_EMOTION_COMMENTS = 100  # 한 번에 감정 분석하는 최대 댓글 수
 
-llm_client = genai.Client(api_key=API_KEY)
-
-
-def generate_comment_summary(
-    comment_contents: dict, client: genai.Client = llm_client
-) -> str:
-
-    comment_contents_str = str(comment_contents)
-    model = "gemini-2.5-flash-lite"
-    contents = [
-        types.Content(
-            role="user",
-            parts=[
-                types.Part.from_text(text=comment_contents_str),
-            ],
-        ),
-    ]
-    generate_content_config = types.GenerateContentConfig(
-        temperature=0,
-        thinking_config=types.ThinkingConfig(
-            thinking_budget=0,
-        ),
-        response_mime_type="text/plain",
-        system_instruction=[
-            types.Part.from_text(
-                text="""
+SUMMARY_SYSTEM_INSTRUCTION = """
 너는 웹툰 작가에게 독자 피드백을 보고하는 전문 데이터 분석가야. 이제부터 제공될 독자 댓글 목록(JSON 형식)을 분석해서, 작가가 다음 스토리를 구상하는 데 실질적인 도움이 될 유의미한 피드백 보고서를 작성해 줘.
 
 [분석 시 핵심 준수 사항]
@@ -56,77 +30,148 @@ def generate_comment_summary(
 **4. 독자들이 가장 궁금해하는 점 (Top Questions & Theories)**
 독자들이 가장 활발하게 추측하고 질문하는 내용(떡밥)이 무엇인지 분석해 줘. 독자들의 호기심을 가장 잘 보여주는 베스트 댓글이나 대표적인 질문을 직접 인용해 줘. 이러한 독자들의 궁금증이 향후 스토리에 어떤 기회를 제공하는지 설명하고, 이를 어떻게 활용하면 좋을지 전략을 제언해 줘. (예: "OOO에 대한 높은 궁금증은 향후 스토리의 중요한 클라이맥스로 활용할 수 있는 좋은 기회입니다.")
 """
-            )
-        ],
+
+EMOTION_SYSTEM_INSTRUCTION = """너는 감정 분석 전문가야. 댓글을 보고 '긍정', '부정', '중립' 중 하나로 분류하고, 0~100 사이의 감정 점수(긍정일수록 100, 부정일수록 0, 중립은 50)와 그렇게 반환한 이유를 JSON으로 반환해줘.
+                또한 스팸 여부를 판단하여 'is_spam' 필드에 true/false 값을 포함시켜줘. 만약 스팸으로 분류된 경우에는 reason 필드에 스팸으로 분류한 이유를 적어줘.
+"""
+
+LLM_TOKENS = counter(
+    "llm_tokens_total", "LLM 입력/출력 토큰 수", ["task", "model", "direction"]
+)
+LLM_BATCH_COMMENTS = histogram(
+    "llm_batch_comments",
+    "LLM 요청 한 번에 보낸 댓글 수",
+    ["task"],
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+
+EMOTION_RESPONSE_SCHEMA = types.Schema(
+    type=types.Type.OBJECT,
+    properties={
+        "response": types.Schema(
+            type=types.Type.ARRAY,
+            items=types.Schema(
+                type=types.Type.OBJECT,
+                required=["score", "id", "reason", "is_spam"],
+                properties={
+                    "score": types.Schema(
+                        type=types.Type.INTEGER,
+                    ),
+                    "id": types.Schema(
+                        type=types.Type.NUMBER,
+                    ),
+                    "reason": types.Schema(
+                        type=types.Type.STRING,
+                    ),
+                    "is_spam": types.Schema(
+                        type=types.Type.BOOLEAN,
+                    ),
+                },
+            ),
+        ),
+    },
+)
+
+
+def _record_usage(
+    request: LLMRequest, response: LLMResponse, comment_count: int
+) -> None:
+    """토큰 수/배치 크기를 기록 (지연 시간은 llm_resilience에서 기록)"""
+    LLM_BATCH_COMMENTS.observe(comment_count, task=request.task)
+    if response.input_tokens:
+        LLM_TOKENS.inc(
+            response.input_tokens,
+            task=request.task,
+            model=response.model,
+            direction="input",
+        )
+    if response.output_tokens:
+        LLM_TOKENS.inc(
+            response.output_tokens,
+            task=request.task,
+            model=response.model,
+            direction="output",
+        )
+
+
+def _generate(
+    request: LLMRequest, provider: LLMProvider | None, comment_count: int
+) -> LLMResponse:
+    response = (provider or get_llm_provider()).generate(request)
+    _record_usage(request, response, comment_count)
+    return response
+
+
+async def _agenerate(
+    request: LLMRequest, provider: LLMProvider | None, comment_count: int
+) -> LLMResponse:
+    response = await (provider or get_llm_provider()).agenerate(request)
+    _record_usage(request, response, comment_count)
+    return response
+
+
+def _get_summary_request(comment_contents: dict) -> LLMRequest:
+    return LLMRequest(
+        task="summary",
+        model=MODEL,
+        system_instruction=SUMMARY_SYSTEM_INSTRUCTION,
+        prompt=str(comment_contents),
+        response_mime_type="text/plain",
     )
-    response = client.models.generate_content(
-        model=model, contents=contents, config=generate_content_config
+
+
+def _get_emotion_request(batch: list[dict]) -> LLMRequest:
+    return LLMRequest(
+        task="emotion",
+        model=MODEL,
+        system_instruction=EMOTION_SYSTEM_INSTRUCTION,
+        prompt=str(batch),
+        response_mime_type="application/json",
+        response_schema=EMOTION_RESPONSE_SCHEMA,
     )
+
+
+def generate_comment_summary(
+    comment_contents: dict, provider: LLMProvider | None = None
+) -> str:
+    request = _get_summary_request(comment_contents)
+    response = _generate(request, provider, len(comment_contents))
     return response.text or "No response generated."
 
 
-def generate_comment_emotion(comments: list[dict], client: genai.Client = llm_client):
+async def agenerate_comment_summary(
+    comment_contents: dict, provider: LLMProvider | None = None
+) -> str:
+    """generate_comment_summary의 비동기 버전"""
+    request = _get_summary_request(comment_contents)
+    response = await _agenerate(request, provider, len(comment_contents))
+    return response.text or "No response generated."
+
+
+def generate_comment_emotion(
+    comments: list[dict], provider: LLMProvider | None = None
+) -> str:
     """
     댓글의 감정 점수를 생성하는 함수 (예시: 긍정/부정/중립 및 점수 반환)
     comment: {"id": ..., "content": ..., "is_best": ...}
     """
-    model = "gemini-2.5-flash-lite"
-    comment_contents = str(comments[:100])  # 최대 100개 댓글만 처리
-    contents = [
-        types.Content(
-            role="user",
-            parts=[
-                types.Part.from_text(text=comment_contents),
-            ],
-        ),
-    ]
-    generate_content_config = types.GenerateContentConfig(
-        temperature=0,
-        thinking_config=types.ThinkingConfig(
-            thinking_budget=0,
-        ),
-        response_mime_type="application/json",
-        response_schema=types.Schema(
-            type=types.Type.OBJECT,
-            properties={
-                "response": types.Schema(
-                    type=types.Type.ARRAY,
-                    items=types.Schema(
-                        type=types.Type.OBJECT,
-                        required=["score", "id", "reason", "is_spam"],
-                        properties={
-                            "score": types.Schema(
-                                type=types.Type.INTEGER,
-                            ),
-                            "id": types.Schema(
-                                type=types.Type.NUMBER,
-                            ),
-                            "reason": types.Schema(
-                                type=types.Type.STRING,
-                            ),
-                            "is_spam": types.Schema(
-                                type=types.Type.BOOLEAN,
-                            ),
-                        },
-                    ),
-                ),
-            },
-        ),
-        system_instruction=[
-            types.Part.from_text(
-                text="""너는 감정 분석 전문가야. 댓글을 보고 '긍정', '부정', '중립' 중 하나로 분류하고, 0~100 사이의 감정 점수(긍정일수록 100, 부정일수록 0, 중립은 50)와 그렇게 반환한 이유를 JSON으로 반환해줘.
-                또한 스팸 여부를 판단하여 'is_spam' 필드에 true/false 값을 포함시켜줘. 만약 스팸으로 분류된 경우에는 reason 필드에 스팸으로 분류한 이유를 적어줘.
-"""
-            ),
-        ],
-    )
-    response = client.models.generate_content(
-        model=model, contents=contents, config=generate_content_config
-    )
+    batch = comments[:MAX_EMOTION_COMMENTS]
+    return _generate(_get_emotion_request(batch), provider, len(batch)).text
 
+
+async def agenerate_comment_emotion(
+    comments: list[dict], provider: LLMProvider | None = None
+) -> str:
+    """generate_comment_emotion의 비동기 버전"""
+    batch = comments[:MAX_EMOTION_COMMENTS]
+    response = await _agenerate(_get_emotion_request(batch), provider, len(batch))
     return response.text
 
 
 __all__ = [
-    "llm_client",
+    "generate_comment_summary",
+    "generate_comment_emotion",
+    "agenerate_comment_summary",
+    "agenerate_comment_emotion",
+    "get_llm_provider",
 ]
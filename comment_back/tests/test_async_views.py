@@ -0,0 +1,150 @@
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+from asgiref.sync import async_to_sync
+from django.conf import settings as django_settings
+from django.test import AsyncClient
+from django.utils.module_loading import import_string
+from rest_framework.test import APIClient
+
+from crawler.crawler import crawler
+from crawler.models import Comment
+from crawler.views import CommentCrawlView, EpisodeCrawlView, SeriesView
+from llm.models import CommentsSummaryResult
+from llm.views import CommentEmotionAnalysisView, CommentsSummaryResultView
+
+
+def test_middleware_chain_is_async_capable():
+    # 동기 전용 미들웨어가 하나라도 있으면 ASGI에서 요청마다 스레드로 전환됨
+    for path in django_settings.MIDDLEWARE:
+        assert getattr(import_string(path), "async_capable", False), path
+
+
+@pytest.mark.parametrize(
+    "view",
+    [
+        SeriesView,
+        EpisodeCrawlView,
+        CommentCrawlView,
+        CommentsSummaryResultView,
+        CommentEmotionAnalysisView,
+    ],
+)
+def test_upstream_views_are_async(view):
+    assert view.view_is_async
+
+
+@pytest.mark.django_db
+class TestConcurrentLLMRequests:
+    def test_slow_llm_calls_overlap(self, settings, episode, make_comments):
+        settings.LLM_PROVIDER = "fake"
+        settings.LLM_RECORD_MODE = "off"
+        settings.LLM_FAKE_LATENCY = 0.3
+        make_comments(3)
+        client = AsyncClient()
+
+        async def post_all():
+            return await asyncio.gather(
+                *(
+                    client.post(f"/llm/api/summary-analysis/{episode.id}/")
+                    for _ in range(5)
+                )
+            )
+
+        started_at = time.perf_counter()
+        responses = async_to_sync(post_all)()
+        elapsed = time.perf_counter() - started_at
+
+        assert [response.status_code for response in responses] == [201] * 5
+        assert CommentsSummaryResult.objects.count() == 5
+        # 순서대로 처리하면 1.5초 이상 걸림
+        assert elapsed < 1.0
+
+    def test_summary_error_is_bad_gateway(self, settings, episode, make_comments):
+        settings.LLM_PROVIDER = "fake"
+        settings.LLM_RECORD_MODE = "off"
+        settings.LLM_FAKE_FAILURE_RATE = 1.0
+        settings.LLM_MAX_ATTEMPTS = 1
+        make_comments(3)
+
+        response = APIClient().post(f"/llm/api/summary-analysis/{episode.id}/")
+
+        # 감정 분석과 같은 규칙: 제공자 오류는 502
+        assert response.status_code == 502
+        assert "error" in response.json()
+        assert not CommentsSummaryResult.objects.exists()
+
+
+def make_comment_page(start: int, count: int, total: int, is_end: bool) -> dict:
+    return {
+        "commentList": {
+            "totalCount": total,
+            "isEnd": is_end,
+            "commentList": [
+                {
+                    "commentUid": uid,
+                    "comment": f"댓글 {uid}",
+                    "createDt": "2025-07-11T15:47:38Z",
+                    "isBest": False,
+                    "userName": "독자",
+                    "userThumbnailUrl": "https://example.com/u.png",
+                    "userUid": 1,
+                    "likeCount": 0,
+                    "emoticon": None,
+                }
+                for uid in range(start, start + count)
+            ],
+        }
+    }
+
+
+@pytest.fixture
+def graphql_pages():
+    """page 번호별 응답을 돌려주는 가짜 GraphQL 서버 (httpx.MockTransport)"""
+    pages = {
+        0: make_comment_page(1, 25, 30, is_end=False),
+        1: make_comment_page(26, 5, 30, is_end=True),
+    }
+    requested = []
+    get_async_client = crawler.get_async_client
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = json.loads(request.content)["variables"]["commentListInput"]["page"]
+        requested.append(page)
+        return httpx.Response(200, json={"data": pages[page]})
+
+    with patch.object(
+        crawler,
+        "get_async_client",
+        lambda: get_async_client(transport=httpx.MockTransport(handler)),
+    ):
+        yield requested
+
+
+class TestAsyncCrawler:
+    def test_follows_comment_pages(self, graphql_pages):
+        pages_before = crawler.CRAWLER_PAGES.get(kind="comment")
+        responses_before = crawler.UPSTREAM_RESPONSES.get(target="graphql", status=200)
+
+        comments = async_to_sync(crawler.aget_comments_by_episode)(1, 2)
+
+        assert [comment["id"] for comment in comments] == list(range(1, 31))
+        assert (comments[0]["series"], comments[0]["episode"]) == (1, 2)
+        assert graphql_pages == [0, 1]
+        assert crawler.CRAWLER_PAGES.get(kind="comment") == pages_before + 2
+        assert (
+            crawler.UPSTREAM_RESPONSES.get(target="graphql", status=200)
+            == responses_before + 2
+        )
+
+    @pytest.mark.django_db
+    def test_comment_crawl_view(self, graphql_pages, episode):
+        response = APIClient().post(f"/crawler/episode/{episode.id}/comment/crawl")
+
+        assert response.status_code == 207
+        assert len(response.json()["created_data"]) == 30
+        assert Comment.objects.filter(episode=episode).count() == 30
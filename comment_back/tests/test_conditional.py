@@ -0,0 +1,95 @@
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from crawler.models import Comment
+from llm.models import CommentsSummaryResult
+from llm.stats import refresh_episode_sentiment_stats
+from utils.conditional import CONDITIONAL_REQUESTS
+
+
+@pytest.mark.django_db
+class TestConditionalResponse:
+    def test_summary_not_modified(self, episode, django_assert_num_queries):
+        CommentsSummaryResult.objects.create(
+            episode=episode, source_comments=[], summary="요약"
+        )
+        url = f"/llm/api/summary-analysis/{episode.id}/"
+        client = APIClient()
+        first = client.get(url)
+        assert first.status_code == 200
+        etag = first["ETag"]
+
+        # 지문 쿼리 한 번으로 끝나고 요약 조회/직렬화는 하지 않음
+        with django_assert_num_queries(1):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+
+        CommentsSummaryResult.objects.create(
+            episode=episode, source_comments=[], summary="새 요약"
+        )
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+        assert len(response.json()) == 2
+
+    def test_comment_analysis_changes_etag(self, episode, make_comments):
+        make_comments(4)
+        url = f"/crawler/episode/{episode.id}/comment/count"
+        client = APIClient()
+        etag = client.get(url)["ETag"]
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        Comment.objects.filter(id=2).update(
+            is_spam=False, is_ai_processed=True, ai_processed_at=timezone.now()
+        )
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response.json()["not_spam_count"] == 2
+
+    def test_series_stats_single_query(
+        self, series, episode, make_comments, django_assert_num_queries
+    ):
+        make_comments(10)
+        refresh_episode_sentiment_stats(episode.id)
+        url = f"/llm/api/sentiment-stats/series/{series.id}/"
+        client = APIClient()
+        etag = client.get(url)["ETag"]
+        before = CONDITIONAL_REQUESTS.get(view="SeriesSentimentStatsView", result="304")
+
+        with django_assert_num_queries(1):
+            assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+        assert (
+            CONDITIONAL_REQUESTS.get(view="SeriesSentimentStatsView", result="304")
+            == before + 1
+        )
+
+    def test_query_params_are_part_of_etag(self, series, episode):
+        url = f"/llm/api/sentiment-timeline/series/{series.id}/"
+        client = APIClient()
+        day = client.get(url, {"granularity": "day"})["ETag"]
+        month = client.get(url, {"granularity": "month"})
+
+        assert month["ETag"] != day
+        assert (
+            client.get(
+                url, {"granularity": "month"}, HTTP_IF_NONE_MATCH=day
+            ).status_code
+            == 200
+        )
+
+    def test_errors_have_no_etag(self, series):
+        response = APIClient().get(
+            f"/llm/api/sentiment-timeline/series/{series.id}/",
+            {"granularity": "year"},
+        )
+        assert response.status_code == 400
+        assert "ETag" not in response
+
+    def test_browsable_api_is_not_conditional(self, series):
+        response = APIClient().get(
+            f"/llm/api/sentiment-stats/series/{series.id}/", HTTP_ACCEPT="text/html"
+        )
+        assert response.status_code == 200
+        assert "ETag" not in response
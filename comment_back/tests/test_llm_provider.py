@@ -0,0 +1,94 @@
+import json
+from dataclasses import replace
+
+import pytest
+from rest_framework.test import APIClient
+
+from crawler.models import Comment
+from services.llm_provider import (
+    FakeLLMProvider,
+    GeminiProvider,
+    LLMConfigurationError,
+    LLMProviderError,
+    LLMReplayMissError,
+    LLMRequest,
+    RecordReplayProvider,
+    get_llm_provider,
+)
+from services.llm_resilience import ResilientLLMProvider
+from services.llm_service import generate_comment_emotion, generate_comment_summary
+
+COMMENTS = [
+    {"id": 1, "content": "재밌어요", "is_best": True},
+    {"id": 2, "content": "별로예요 'ㅅ'", "is_best": False},
+]
+
+
+def make_request(prompt: str = "안녕") -> LLMRequest:
+    return LLMRequest(
+        task="summary", model="test", system_instruction="요약해줘", prompt=prompt
+    )
+
+
+class TestFakeLLMProvider:
+    def test_emotion_is_deterministic(self):
+        first = json.loads(generate_comment_emotion(COMMENTS, FakeLLMProvider()))
+        second = json.loads(generate_comment_emotion(COMMENTS, FakeLLMProvider()))
+        assert first == second
+        assert [item["id"] for item in first["response"]] == [1, 2]
+        assert all(0 <= item["score"] <= 100 for item in first["response"])
+
+    def test_summary(self):
+        summary = generate_comment_summary(COMMENTS, FakeLLMProvider())
+        assert "댓글 2개, 베스트 댓글 1개" in summary
+
+    def test_failure_rate(self):
+        with pytest.raises(LLMProviderError):
+            FakeLLMProvider(failure_rate=1.0).generate(make_request())
+
+
+class TestRecordReplayProvider:
+    def test_replays_recorded_response(self, tmp_path):
+        recorder = RecordReplayProvider(FakeLLMProvider(), tmp_path, "record")
+        recorded = recorder.generate(make_request())
+
+        player = RecordReplayProvider(None, tmp_path, "replay")
+        replayed = player.generate(make_request())
+        assert replayed == replace(recorded, cached=True)
+        with pytest.raises(LLMReplayMissError):
+            player.generate(make_request("다른 입력"))
+
+
+class TestGetLLMProvider:
+    def test_follows_settings(self, settings):
+        settings.LLM_PROVIDER = "fake"
+        settings.LLM_RECORD_MODE = "off"
+        provider = get_llm_provider()
+        assert isinstance(provider, ResilientLLMProvider)
+        assert isinstance(provider.inner, FakeLLMProvider)
+        assert get_llm_provider() is provider
+
+        settings.LLM_FAKE_LATENCY = 0.001
+        assert get_llm_provider() is not provider
+
+    def test_unknown_provider(self, settings):
+        settings.LLM_PROVIDER = "unknown"
+        with pytest.raises(LLMConfigurationError):
+            get_llm_provider()
+
+    def test_gemini_client_is_created_lazily(self):
+        provider = GeminiProvider(api_key=None)
+        with pytest.raises(LLMConfigurationError):
+            provider.generate(make_request())
+
+
+@pytest.mark.django_db
+def test_emotion_analysis_with_fake_provider(settings, episode, make_comments):
+    settings.LLM_PROVIDER = "fake"
+    settings.LLM_RECORD_MODE = "off"
+    make_comments(5, is_ai_processed=False, is_spam=None, ai_emotion_score=None)
+
+    response = APIClient().patch(f"/llm/api/emotion-analysis/{episode.id}/")
+
+    assert response.status_code == 200
+    assert Comment.objects.filter(is_ai_processed=True).count() == 5
@@ -0,0 +1,231 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from asgiref.sync import async_to_sync
+from rest_framework.test import APIClient
+
+from services.llm_provider import (
+    FakeLLMProvider,
+    LLMProvider,
+    LLMProviderError,
+    LLMRequest,
+    LLMResponse,
+)
+from services.llm_resilience import (
+    LLM_CALLS,
+    LLM_HEDGES,
+    LLM_RETRIES,
+    CircuitBreaker,
+    LLMCircuitOpenError,
+    LLMTimeoutError,
+    ResilientLLMProvider,
+)
+from utils.metrics import histogram
+
+
+def make_request(task: str = "summary") -> LLMRequest:
+    return LLMRequest(
+        task=task, model="test", system_instruction="요약해줘", prompt="[]"
+    )
+
+
+class ScriptedProvider(LLMProvider):
+    """호출 순서대로 지연 시간/에러를 정해 둔 제공자"""
+
+    def __init__(self, name: str, script: list):
+        self.name = name
+        self.script = list(script)
+        self.calls = 0
+        self.cancelled = 0
+        self._lock = threading.Lock()
+
+    def _next_step(self) -> tuple:
+        with self._lock:
+            step = self.script[min(self.calls, len(self.script) - 1)]
+            self.calls += 1
+        return step
+
+    def generate(self, request: LLMRequest) -> LLMResponse:
+        delay, error = self._next_step()
+        time.sleep(delay)
+        if error is not None:
+            raise error
+        return LLMResponse(text="ok", model=request.model)
+
+    async def agenerate(self, request: LLMRequest) -> LLMResponse:
+        delay, error = self._next_step()
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if error is not None:
+            raise error
+        return LLMResponse(text="ok", model=request.model)
+
+
+def make_resilient(inner: LLMProvider, **kwargs) -> ResilientLLMProvider:
+    options = {"timeout": 1.0, "backoff_base": 0.001, "backoff_max": 0.001}
+    return ResilientLLMProvider(inner, **{**options, **kwargs})
+
+
+class TestResilientLLMProvider:
+    def test_retries_retryable_errors(self):
+        inner = ScriptedProvider(
+            "retry",
+            [(0, LLMProviderError("503")), (0, LLMProviderError("429")), (0, None)],
+        )
+        response = make_resilient(inner, max_attempts=3).generate(make_request())
+
+        assert response.text == "ok"
+        assert response.attempts == 3
+        assert LLM_RETRIES.get(provider="retry", task="summary") == 2
+        assert LLM_CALLS.get(provider="retry", task="summary", outcome="success") == 1
+
+    def test_does_not_retry_non_retryable_errors(self):
+        inner = ScriptedProvider(
+            "no-retry", [(0, LLMProviderError("400", retryable=False)), (0, None)]
+        )
+        with pytest.raises(LLMProviderError):
+            make_resilient(inner, max_attempts=3).generate(make_request())
+        assert inner.calls == 1
+
+    def test_timeout(self):
+        inner = ScriptedProvider("slow", [(0.5, None)])
+        started_at = time.monotonic()
+        with pytest.raises(LLMTimeoutError):
+            make_resilient(inner, timeout=0.05, max_attempts=2).generate(make_request())
+
+        assert time.monotonic() - started_at < 0.4
+        assert inner.calls == 2
+        assert LLM_CALLS.get(provider="slow", task="summary", outcome="timeout") == 1
+
+    def test_hedged_request_wins(self):
+        inner = ScriptedProvider("hedge", [(0.5, None), (0, None)])
+        response = make_resilient(inner, hedge_after=0.02).generate(make_request())
+
+        assert response.hedged is True
+        assert LLM_HEDGES.get(provider="hedge", task="summary", result="sent") == 1
+        assert LLM_HEDGES.get(provider="hedge", task="summary", result="won") == 1
+
+    def test_records_duration(self):
+        provider = make_resilient(FakeLLMProvider())
+        provider.generate(make_request("emotion"))
+        duration = histogram("llm_call_duration_seconds", "")
+        assert duration.get_count(provider="fake", task="emotion") >= 1
+
+
+class TestAsyncResilientLLMProvider:
+    def test_retries_retryable_errors(self):
+        inner = ScriptedProvider(
+            "async-retry", [(0, LLMProviderError("503")), (0, None)]
+        )
+        provider = make_resilient(inner, max_attempts=2)
+
+        response = async_to_sync(provider.agenerate)(make_request())
+
+        assert response.attempts == 2
+        assert LLM_RETRIES.get(provider="async-retry", task="summary") == 1
+
+    def test_timeout_cancels_request(self):
+        inner = ScriptedProvider("async-slow", [(0.5, None)])
+        provider = make_resilient(inner, timeout=0.05, max_attempts=1)
+
+        with pytest.raises(LLMTimeoutError):
+            async_to_sync(provider.agenerate)(make_request())
+        assert inner.cancelled == 1
+
+    def test_hedged_request_wins_and_cancels_loser(self):
+        inner = ScriptedProvider("async-hedge", [(0.5, None), (0, None)])
+        provider = make_resilient(inner, hedge_after=0.02)
+
+        response = async_to_sync(provider.agenerate)(make_request())
+
+        assert response.hedged is True
+        assert inner.cancelled == 1
+        assert LLM_HEDGES.get(provider="async-hedge", task="summary", result="won") == 1
+
+
+class TestCircuitBreaker:
+    def test_opens_and_half_opens(self):
+        breaker = CircuitBreaker("breaker", failure_threshold=2, reset_timeout=0.05)
+        inner = ScriptedProvider(
+            "breaker",
+            [(0, LLMProviderError("503")), (0, LLMProviderError("503")), (0, None)],
+        )
+        provider = make_resilient(inner, max_attempts=1, circuit_breaker=breaker)
+
+        for _ in range(2):
+            with pytest.raises(LLMProviderError):
+                provider.generate(make_request())
+        assert breaker.state == CircuitBreaker.OPEN
+
+        with pytest.raises(LLMCircuitOpenError):
+            provider.generate(make_request())
+        assert inner.calls == 2
+
+        time.sleep(0.06)
+        assert provider.generate(make_request()).text == "ok"
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert (
+            LLM_CALLS.get(provider="breaker", task="summary", outcome="circuit_open")
+            == 1
+        )
+
+    def test_failed_trial_reopens(self):
+        breaker = CircuitBreaker("trial", failure_threshold=1, reset_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        assert breaker.allow() is True
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow() is False  # 시험 호출은 한 번만
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_non_retryable_errors_do_not_trip(self):
+        breaker = CircuitBreaker("bad-request", failure_threshold=1, reset_timeout=60)
+        inner = ScriptedProvider(
+            "bad-request", [(0, LLMProviderError("400", retryable=False))]
+        )
+        provider = make_resilient(inner, circuit_breaker=breaker)
+
+        with pytest.raises(LLMProviderError):
+            provider.generate(make_request())
+        assert breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.django_db
+def test_open_circuit_returns_503(settings, episode, make_comments, monkeypatch):
+    settings.LLM_PROVIDER = "fake"
+    settings.LLM_RECORD_MODE = "off"
+    settings.LOCAL_SCORER_PATH = "/nonexistent/local_scorer.npz"
+    make_comments(3, is_ai_processed=False, is_spam=None, ai_emotion_score=None)
+
+    async def agenerate(self, request):
+        raise LLMCircuitOpenError("열림")
+
+    monkeypatch.setattr(ResilientLLMProvider, "agenerate", agenerate)
+    response = APIClient().patch(f"/llm/api/emotion-analysis/{episode.id}/")
+
+    assert response.status_code == 503
+
+
+@pytest.mark.django_db
+def test_summary_open_circuit_returns_503(
+    settings, episode, make_comments, monkeypatch
+):
+    settings.LLM_PROVIDER = "fake"
+    settings.LLM_RECORD_MODE = "off"
+    make_comments(3)
+
+    async def agenerate(self, request):
+        raise LLMCircuitOpenError("열림")
+
+    monkeypatch.setattr(ResilientLLMProvider, "agenerate", agenerate)
+    response = APIClient().post(f"/llm/api/summary-analysis/{episode.id}/")
+
+    assert response.status_code == 503
+    assert response.json() == {"error": "열림"}
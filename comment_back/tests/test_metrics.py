@@ -0,0 +1,135 @@
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from rest_framework.test import APIClient
+
+from crawler.crawler import crawler
+from utils.metrics import (
+    HTTP_REQUESTS,
+    Counter,
+    Gauge,
+    Histogram,
+    counter,
+    histogram,
+    render_text,
+)
+
+
+class TestMetrics:
+    def test_counter_labels(self):
+        metric = counter("test_metric_total", "테스트", ["outcome"])
+        metric.inc(outcome="success")
+        metric.inc(2, outcome="success")
+
+        assert metric.get(outcome="success") == 3
+        assert counter("test_metric_total", "테스트", ["outcome"]) is metric
+        with pytest.raises(ValueError):
+            metric.inc(result="success")
+        with pytest.raises(ValueError):
+            metric.inc(outcome="success", extra="x")
+
+    def test_histogram_buckets_are_cumulative(self):
+        metric = histogram("test_metric_seconds", "테스트", buckets=(0.1, 1))
+        for value in (0.05, 0.5, 5):
+            metric.observe(value)
+
+        samples = {
+            (name, key[-1] if key else ""): value
+            for name, key, value in metric.samples()
+        }
+        assert samples[("test_metric_seconds_bucket", "0.1")] == 1
+        assert samples[("test_metric_seconds_bucket", "1")] == 2
+        assert samples[("test_metric_seconds_bucket", "+Inf")] == 3
+        assert samples[("test_metric_seconds_count", "")] == 3
+
+    def test_render_text(self):
+        requests_total = Counter("demo_requests_total", "요청 수", ["view", "status"])
+        requests_total.inc(view='say "hi"', status=200)
+        depth = Gauge("demo_queue_depth", "큐 길이")
+        depth.set(3)
+        latency = Histogram("demo_seconds", "응답 시간", ["view"], buckets=(0.5,))
+        latency.observe(0.25, view="list")
+
+        assert render_text([requests_total, depth, latency]).splitlines() == [
+            "# HELP demo_requests_total 요청 수",
+            "# TYPE demo_requests_total counter",
+            'demo_requests_total{view="say \\"hi\\"",status="200"} 1',
+            "# HELP demo_queue_depth 큐 길이",
+            "# TYPE demo_queue_depth gauge",
+            "demo_queue_depth 3",
+            "# HELP demo_seconds 응답 시간",
+            "# TYPE demo_seconds histogram",
+            'demo_seconds_bucket{view="list",le="0.5"} 1',
+            'demo_seconds_bucket{view="list",le="+Inf"} 1',
+            'demo_seconds_sum{view="list"} 0.25',
+            'demo_seconds_count{view="list"} 1',
+        ]
+
+
+@pytest.mark.django_db
+class TestMetricsEndpoint:
+    def test_records_requests_by_url_name(self, series):
+        before = HTTP_REQUESTS.get(
+            view="series-sentiment-stats", method="GET", status=200
+        )
+        APIClient().get(f"/llm/api/sentiment-stats/series/{series.id}/")
+
+        assert (
+            HTTP_REQUESTS.get(view="series-sentiment-stats", method="GET", status=200)
+            == before + 1
+        )
+        response = APIClient().get("/metrics")
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+        body = response.content.decode()
+        assert "# TYPE http_request_duration_seconds histogram" in body
+        assert (
+            'http_requests_total{view="series-sentiment-stats",method="GET",status="200"}'
+            in body
+        )
+        assert 'view="metrics"' not in body
+
+
+class TestCrawlerMetrics:
+    def test_graphql_failures_and_pages(self):
+        client = Mock()
+        client.execute.side_effect = [
+            {"commentList": {"totalCount": 3}},
+            requests.ConnectionError("연결 실패"),
+        ]
+        pages = crawler.CRAWLER_PAGES.get(kind="comment")
+        failures = crawler.UPSTREAM_FAILURES.get(
+            target="graphql", kind="comment", error="ConnectionError"
+        )
+
+        with patch.object(crawler, "get_client", return_value=client):
+            assert crawler.get_comment_count_by_episode(1, 2) == 3
+            with pytest.raises(requests.ConnectionError):
+                crawler.get_comment_count_by_episode(1, 2)
+
+        assert crawler.CRAWLER_PAGES.get(kind="comment") == pages + 1
+        assert (
+            crawler.UPSTREAM_FAILURES.get(
+                target="graphql", kind="comment", error="ConnectionError"
+            )
+            == failures + 1
+        )
+
+    def test_response_hook(self):
+        transport = crawler.InstrumentedRequestsHTTPTransport(url=crawler.GRAPHQL_URL)
+        transport.connect()
+        response = requests.Response()
+        response.status_code = 429
+        response._content = b'{"errors": []}'
+        before = crawler.UPSTREAM_RESPONSES.get(target="graphql", status=429)
+        bytes_before = crawler.UPSTREAM_BYTES.get(target="graphql")
+
+        for hook in transport.session.hooks["response"]:
+            hook(response)
+
+        assert (
+            crawler.UPSTREAM_RESPONSES.get(target="graphql", status=429) == before + 1
+        )
+        assert crawler.UPSTREAM_BYTES.get(target="graphql") == bytes_before + 14
+        transport.close()
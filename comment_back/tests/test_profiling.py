@@ -0,0 +1,84 @@
+import json
+import logging
+
+import pytest
+from rest_framework.serializers import BaseSerializer
+from rest_framework.test import APIClient
+
+from llm.views import SeriesSentimentStatsView
+from utils.profiling import QueryBudgetExceeded, RequestProfile
+
+
+class TestRequestProfile:
+    def test_detects_duplicate_queries(self):
+        profile = RequestProfile()
+        for _ in range(5):
+            profile.record_query('SELECT * FROM "comment" WHERE "id" = %s', 0.001)
+        profile.record_query('SELECT * FROM "episode"', 0.002)
+
+        [duplicate] = profile.get_duplicates(threshold=5)
+        assert duplicate["count"] == 5
+        assert duplicate["duration_ms"] == pytest.approx(5)
+        assert profile.query_count == 6
+
+    def test_nested_sections_are_counted_once(self):
+        profile = RequestProfile()
+        with profile.section("serialize"):
+            with profile.section("serialize"):
+                pass
+        assert list(profile.sections) == ["serialize"]
+
+    def test_server_timing(self):
+        profile = RequestProfile()
+        profile.record_query("SELECT 1", 0.0125)
+        profile.sections["render"] = 0.002
+
+        header = profile.server_timing()
+        assert header.startswith('db;dur=12.5;desc="1 queries", render;dur=2.0, ')
+        assert "total;dur=" in header
+
+
+@pytest.mark.django_db
+class TestQueryProfilingMiddleware:
+    def test_server_timing_header(self, settings, series, episode):
+        settings.QUERY_PROFILE_SERVER_TIMING = True
+        response = APIClient().get(f"/llm/api/sentiment-stats/series/{series.id}/")
+
+        assert response.status_code == 200
+        timing = response["Server-Timing"]
+        # 지문(ETag) + 집계 목록
+        assert 'desc="2 queries"' in timing
+        assert "view;dur=" in timing
+        assert "render;dur=" in timing
+
+    def test_server_timing_is_opt_in(self, series):
+        response = APIClient().get(f"/llm/api/sentiment-stats/series/{series.id}/")
+        assert "Server-Timing" not in response
+
+    def test_serializers_are_not_patched(self, series):
+        APIClient().get(f"/llm/api/sentiment-stats/series/{series.id}/")
+        assert BaseSerializer.data.fget.__module__ == "rest_framework.serializers"
+
+    def test_query_budget(self, series, monkeypatch):
+        monkeypatch.setattr(SeriesSentimentStatsView, "query_budget", 0)
+        with pytest.raises(QueryBudgetExceeded):
+            APIClient().get(f"/llm/api/sentiment-stats/series/{series.id}/")
+
+    def test_sampled_log(self, settings, series, caplog, monkeypatch):
+        settings.QUERY_PROFILE_SAMPLE_RATE = 1.0
+        # settings.LOGGING에서 propagate=False라서 caplog로 받도록 켬
+        monkeypatch.setattr(logging.getLogger("utils.profiling"), "propagate", True)
+        with caplog.at_level(logging.INFO, logger="utils.profiling"):
+            APIClient().get(f"/llm/api/sentiment-stats/series/{series.id}/")
+
+        record = json.loads(caplog.records[-1].getMessage())
+        assert record["view"] == "llm.views.SeriesSentimentStatsView"
+        assert record["query_count"] == 2
+        assert record["query_budget"] == 2
+        assert record["duplicates"] == []
+
+    def test_disabled(self, settings, series):
+        settings.QUERY_PROFILING = False
+        settings.QUERY_PROFILE_SERVER_TIMING = True
+        response = APIClient().get(f"/llm/api/sentiment-stats/series/{series.id}/")
+        assert "Server-Timing" not in response
@@ -0,0 +1,70 @@
+import json
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from utils import renderers
+from utils.renderers import FastJSONRenderer
+
+PAYLOAD = {
+    "next": None,
+    "results": [
+        {
+            "id": 165999266,
+            "content": "이번 화 진짜 미쳤다 ㅋㅋㅋ 😀",
+            "created_at": datetime(
+                2025, 7, 11, 15, 47, 38, 123456, tzinfo=timezone.utc
+            ),
+            "like_count": 12,
+            "emoticon": {"itemSubType": "EMOTICON", "resourceId": "4412207"},
+            "score": Decimal("12.50"),
+            "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "is_spam": None,
+        }
+    ],
+}
+
+
+def stdlib_reference(data) -> bytes:
+    renderer = JSONRenderer()
+    renderer.ensure_ascii = False
+    return renderer.render(data)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+class TestFastJSONRenderer:
+    def render(self, use_orjson: bool, data, **kwargs) -> bytes:
+        orjson_module = renderers.orjson if use_orjson else None
+        if use_orjson and orjson_module is None:
+            pytest.skip("orjson이 설치되어 있지 않습니다.")
+        with patch.object(renderers, "orjson", orjson_module):
+            return FastJSONRenderer().render(data, **kwargs)
+
+    def test_matches_drf_encoding(self, use_orjson):
+        assert self.render(use_orjson, PAYLOAD) == stdlib_reference(PAYLOAD)
+
+    def test_non_ascii_is_not_escaped(self, use_orjson):
+        ret = self.render(use_orjson, {"content": "재밌어요"})
+        assert "재밌어요".encode() in ret
+        assert b"\\u" not in ret
+
+    def test_datetime_and_decimal(self, use_orjson):
+        decoded = json.loads(self.render(use_orjson, PAYLOAD))
+        assert decoded["results"][0]["created_at"] == "2025-07-11T15:47:38.123456Z"
+        assert decoded["results"][0]["score"] == 12.5
+
+    def test_line_separators_are_escaped(self, use_orjson):
+        assert self.render(use_orjson, {"c": "a b"}) == b'{"c":"a\\u2028b"}'
+
+    def test_indent_falls_back_to_stdlib(self, use_orjson):
+        ret = self.render(
+            use_orjson, {"a": 1}, accepted_media_type="application/json; indent=4"
+        )
+        assert ret == b'{\n    "a": 1\n}'
+
+    def test_none(self, use_orjson):
+        assert self.render(use_orjson, None) == b""
@@ -0,0 +1,55 @@
+"""
+비동기 DRF 뷰
+
+LLM 호출이나 크롤링처럼 상류 응답을 오래 기다리는 뷰의 기반 클래스입니다.
+ASGI 서버(uvicorn, comment_back/asgi.py)에서 실행하면 기다리는 동안 워커 스레드를 잡고 있지 않아
+느린 상류 요청이 몰려도 다른 요청을 계속 처리할 수 있습니다.
+WSGI(runserver)에서도 그대로 동작합니다. (Django가 요청마다 이벤트 루프를 만들어 실행)
+
+핸들러(get/post/...)는 모두 async def여야 하고, ORM은 async ORM(aget, acount 등)이나
+sync_to_async로 감싸서 호출합니다.
+
+    class CommentCrawlView(AsyncAPIView):
+        async def post(self, request, product_id):
+            data = await aget_comments_by_episode(series_id, product_id)
+            await sync_to_async(save)(data)
+"""
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    dispatch만 async로 바꾼 APIView.
+    인증/권한/스로틀 확인(initial)은 세션/DB를 읽을 수 있어 동기 코드로 실행합니다.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            # options, http_method_not_allowed는 APIView의 동기 메서드
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
@@ -0,0 +1,88 @@
+"""
+조건부 조회(ETag/If-None-Match)
+
+폴링하는 대시보드가 이미 최신 응답을 갖고 있으면 뷰를 실행하지 않고 304를 반환합니다.
+ETag는 응답 본문이 아니라 데이터 지문(fingerprint)으로 만듭니다.
+지문은 데이터가 바뀌면 함께 바뀌는 작은 값(개수, 최대 ID, 최종 분석/생성 시각 등)을 쿼리 한 번으로 계산한 것이라
+304 응답은 지문 쿼리 한 번으로 끝나고 조회/직렬화는 하지 않습니다.
+
+    class CommentCountView(APIView):
+        @conditional_response(lambda product_id: comment_fingerprint(episode=product_id))
+        def get(self, request, product_id):
+            ...
+
+fingerprint는 URL 파라미터를 키워드 인자로 받고, None을 반환하면(대상이 없는 경우 등) 조건부 처리를 하지 않습니다.
+동기/비동기(async def) 핸들러 모두에 사용할 수 있습니다.
+"""
+
+import hashlib
+from functools import wraps
+from typing import Any, Callable
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.utils.cache import get_conditional_response, quote_etag
+
+from utils.metrics import counter
+
+CONDITIONAL_REQUESTS = counter(
+    "conditional_requests_total",
+    "지문 ETag를 계산한 조회 요청 수 (modified: 뷰 실행, 304/412: 조건부 응답)",
+    ["view", "result"],
+)
+
+
+def make_etag(view_name: str, request, fingerprint: Any) -> str:
+    """같은 데이터라도 쿼리 파라미터(fields, page 등)가 다르면 응답이 다르므로 함께 해시"""
+    params = sorted(request.query_params.lists())
+    raw = f"{view_name}:{params}:{fingerprint!r}"
+    return quote_etag(hashlib.md5(raw.encode()).hexdigest())
+
+
+def conditional_response(fingerprint: Callable[..., Any]):
+    def decorator(get):
+        def check(view, request, kwargs):
+            """(ETag, 304/412 응답 또는 None)"""
+            # 브라우저블 API(HTML)는 로그인 사용자/CSRF 토큰이 들어가므로 제외
+            if request.accepted_renderer.format != "json":
+                return None, None
+            value = fingerprint(**kwargs)
+            if value is None:
+                return None, None
+            etag = make_etag(type(view).__name__, request, value)
+            # If-None-Match가 같으면 304, If-Match가 다르면 412, 아니면 None
+            response = get_conditional_response(request, etag=etag)
+            if response is None:
+                CONDITIONAL_REQUESTS.inc(view=type(view).__name__, result="modified")
+                return etag, None
+            CONDITIONAL_REQUESTS.inc(
+                view=type(view).__name__, result=str(response.status_code)
+            )
+            response["ETag"] = etag
+            return etag, response
+
+        def finish(response, etag):
+            if etag and response.status_code == 200:
+                response.headers.setdefault("ETag", etag)
+            return response
+
+        if iscoroutinefunction(get):
+
+            @wraps(get)
+            async def async_wrapper(view, request, *args, **kwargs):
+                etag, response = await sync_to_async(check)(view, request, kwargs)
+                if response is not None:
+                    return response
+                return finish(await get(view, request, *args, **kwargs), etag)
+
+            return async_wrapper
+
+        @wraps(get)
+        def wrapper(view, request, *args, **kwargs):
+            etag, response = check(view, request, kwargs)
+            if response is not None:
+                return response
+            return finish(get(view, request, *args, **kwargs), etag)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,250 @@
+"""
+프로세스 내 메트릭 (카운터/게이지/히스토그램)
+
+라벨별 값을 메모리에 모읍니다. 값은 프로세스(워커)마다 따로 쌓입니다.
+/metrics에서 Prometheus 텍스트 형식으로 내보냅니다 (metrics_view).
+
+    LLM_CALLS = counter("llm_calls_total", "LLM 호출 결과", ["provider", "task", "outcome"])
+    LLM_CALLS.inc(provider="gemini", task="emotion", outcome="success")
+
+기록 비용은 호출 한 번에 1~2마이크로초 수준입니다 (benchmarks/bench_metrics.py).
+"""
+
+import bisect
+import threading
+import time
+from operator import itemgetter
+from typing import Iterable
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpResponse
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+_registry: dict[str, "Metric"] = {}
+_registry_lock = threading.Lock()
+
+
+class Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        # 라벨 dict -> 키 튜플 (기록할 때마다 호출되므로 itemgetter로 빠르게)
+        if not self.labelnames:
+            self._get_key = lambda labels: ()
+        elif len(self.labelnames) == 1:
+            name = self.labelnames[0]
+            self._get_key = lambda labels: (labels[name],)
+        else:
+            self._get_key = itemgetter(*self.labelnames)
+
+    def _key(self, labels: dict) -> tuple:
+        """라벨 값은 그대로 키로 사용하고 내보낼 때 문자열로 변환"""
+        if len(labels) == len(self.labelnames):
+            try:
+                return self._get_key(labels)
+            except KeyError:
+                pass
+        raise ValueError(
+            f"{self.name} 라벨이 맞지 않습니다: {sorted(labels)} != {sorted(self.labelnames)}"
+        )
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> list[tuple[str, tuple, float]]:
+        with self._lock:
+            return [(self.name, key, value) for key, value in self._values.items()]
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(self, *args, buckets: Iterable[float] = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 -> [버킷별 개수..., 합계, 전체 개수]
+        self._values: dict[tuple, list[float]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            values = self._values.setdefault(key, [0] * (len(self.buckets) + 2))
+            if index < len(self.buckets):
+                values[index] += 1
+            values[-2] += value
+            values[-1] += 1
+
+    def get_count(self, **labels) -> int:
+        values = self._values.get(self._key(labels))
+        return int(values[-1]) if values else 0
+
+    def samples(self) -> list[tuple[str, tuple, float]]:
+        """Prometheus 형식처럼 누적 버킷(le), _sum, _count 샘플을 반환"""
+        samples = []
+        with self._lock:
+            items = [(key, list(values)) for key, values in self._values.items()]
+        for key, values in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, values):
+                cumulative += count
+                samples.append(
+                    (f"{self.name}_bucket", (*key, _format_value(bound)), cumulative)
+                )
+            samples.append((f"{self.name}_bucket", (*key, "+Inf"), values[-1]))
+            samples.append((f"{self.name}_sum", key, values[-2]))
+            samples.append((f"{self.name}_count", key, values[-1]))
+        return samples
+
+
+def _register(metric_class, name: str, *args, **kwargs):
+    with _registry_lock:
+        metric = _registry.get(name)
+        if metric is None:
+            metric = _registry[name] = metric_class(name, *args, **kwargs)
+        elif not isinstance(metric, metric_class):
+            raise ValueError(f"{name}은 이미 다른 종류의 메트릭으로 등록되어 있습니다.")
+        return metric
+
+
+def counter(name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+    return _register(Counter, name, documentation, labelnames)
+
+
+def gauge(name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+    return _register(Gauge, name, documentation, labelnames)
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: Iterable[str] = (),
+    buckets: Iterable[float] = DEFAULT_BUCKETS,
+) -> Histogram:
+    return _register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+
+def get_registry() -> list[Metric]:
+    with _registry_lock:
+        return sorted(_registry.values(), key=lambda metric: metric.name)
+
+
+# 백그라운드 작업 큐 길이 (대기 + 실행 중). 큐를 가진 모듈에서 queue 라벨로 기록
+QUEUE_DEPTH = gauge(
+    "background_queue_depth", "백그라운드 작업 큐 길이 (대기 + 실행 중)", ["queue"]
+)
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_text(metrics: Iterable[Metric] | None = None) -> str:
+    """Prometheus 텍스트 형식(0.0.4)으로 변환"""
+    lines = []
+    for metric in get_registry() if metrics is None else metrics:
+        lines.append(f"# HELP {metric.name} {_escape(metric.documentation)}")
+        lines.append(f"# TYPE {metric.name} {metric.type}")
+        for name, key, value in metric.samples():
+            labelnames = metric.labelnames
+            if name.endswith("_bucket"):
+                labelnames = (*labelnames, "le")
+            labels = ",".join(
+                f'{label}="{_escape(str(label_value))}"'
+                for label, label_value in zip(labelnames, key)
+            )
+            lines.append(
+                f"{name}{{{labels}}} {_format_value(value)}"
+                if labels
+                else f"{name} {_format_value(value)}"
+            )
+    return "\n".join(lines) + "\n"
+
+
+HTTP_REQUESTS = counter(
+    "http_requests_total", "API 요청 수", ["view", "method", "status"]
+)
+HTTP_REQUEST_DURATION = histogram(
+    "http_request_duration_seconds", "API 응답 시간", ["view", "method"]
+)
+
+
+class RequestMetricsMiddleware:
+    """URL 이름(view)별 요청 수와 응답 시간을 기록 (동기/비동기 요청 모두 지원)"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        started_at = time.perf_counter()
+        response = self.get_response(request)
+        self._record(request, response, started_at)
+        return response
+
+    async def __acall__(self, request):
+        started_at = time.perf_counter()
+        response = await self.get_response(request)
+        self._record(request, response, started_at)
+        return response
+
+    def _record(self, request, response, started_at: float) -> None:
+        match = request.resolver_match
+        view = match.view_name if match else "<unresolved>"
+        if view != "metrics":
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started_at, view=view, method=request.method
+            )
+            HTTP_REQUESTS.inc(
+                view=view, method=request.method, status=response.status_code
+            )
+
+
+def metrics_view(request):
+    """메트릭 조회 (Prometheus 스크레이프용, 이 워커 프로세스의 값만)"""
+    return HttpResponse(
+        render_text(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -0,0 +1,281 @@
+"""
+요청별 SQL/응답 프로파일링 미들웨어
+
+요청마다 다음을 측정합니다. (django.db.backends DEBUG 로그 대신 사용)
+
+- SQL 쿼리 수와 전체 실행 시간 (connection.execute_wrappers, DEBUG가 아니어도 동작)
+- 같은 SQL이 반복 실행된 경우(N+1 의심)
+- 뷰 실행 시간(SQL 시간 제외, 대부분 Serializer 변환)과 응답 렌더링 시간
+
+결과는 Server-Timing 헤더로 내보내고(브라우저 개발자 도구의 Timing 탭에서 확인),
+느린 요청/N+1 의심 요청/샘플링된 요청은 JSON 한 줄로 로그에 남깁니다.
+
+settings.QUERY_PROFILING(기본 꺼짐)을 켜야 측정합니다. 테스트에서는 conftest.py에서 켭니다.
+
+뷰에 query_budget을 지정하면 쿼리 수가 그보다 많을 때 경고하고,
+settings.QUERY_BUDGET_STRICT가 True면(테스트) QueryBudgetExceeded를 발생시킵니다.
+
+    class EpisodeSentimentStatsView(APIView):
+        query_budget = 3
+
+동기(WSGI)/비동기(ASGI) 요청을 모두 지원합니다. 비동기 뷰의 ORM 호출은 sync_to_async 스레드의
+연결에서 실행되므로, 모든 연결에 쿼리 기록 래퍼를 한 번 걸어 두고 현재 요청의 프로파일(ContextVar)에 기록합니다.
+"""
+
+import json
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging import getLogger
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = getLogger(__name__)
+
+_current_profile: ContextVar["RequestProfile | None"] = ContextVar(
+    "request_profile", default=None
+)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """뷰의 query_budget보다 많은 쿼리를 실행했을 때 발생하는 에러 (QUERY_BUDGET_STRICT)"""
+
+
+class RequestProfile:
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.query_count = 0
+        self.query_time = 0.0
+        self.sections: dict[str, float] = {}
+        self.view_name = ""
+        self.query_budget: int | None = None
+        # 뷰 실행 시작 시각과 그때까지의 SQL 시간 (process_view)
+        self.view_started_at: float | None = None
+        self.view_query_time = 0.0
+        # SQL(파라미터 자리표시자 그대로) -> [실행 횟수, 전체 시간]
+        self._queries: dict[str, list] = {}
+        self._active_sections: set[str] = set()
+
+    def record_query(self, sql: str, duration: float) -> None:
+        self.query_count += 1
+        self.query_time += duration
+        stats = self._queries.get(sql)
+        if stats is None:
+            self._queries[sql] = [1, duration]
+        else:
+            stats[0] += 1
+            stats[1] += duration
+
+    @contextmanager
+    def section(self, name: str):
+        """name 구간 시간을 누적. 같은 이름의 중첩 구간(중첩 Serializer 등)은 바깥 구간만 측정"""
+        if name in self._active_sections:
+            yield
+            return
+        self._active_sections.add(name)
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._active_sections.discard(name)
+            self.sections[name] = self.sections.get(name, 0.0) + (
+                time.perf_counter() - started_at
+            )
+
+    def get_duplicates(self, threshold: int) -> list[dict]:
+        """threshold번 이상 실행된 같은 SQL (N+1 의심), 실행 횟수가 많은 순"""
+        duplicates = [
+            {"sql": sql[:300], "count": count, "duration_ms": round(duration * 1000, 2)}
+            for sql, (count, duration) in self._queries.items()
+            if count >= threshold
+        ]
+        return sorted(duplicates, key=lambda item: -item["count"])
+
+    def start_view(self) -> None:
+        self.view_started_at = time.perf_counter()
+        self.view_query_time = self.query_time
+
+    def finish_view(self) -> None:
+        """뷰 실행 시간에서 그동안의 SQL 시간을 뺀 값을 view 구간으로 기록"""
+        if self.view_started_at is None or "view" in self.sections:
+            return
+        elapsed = time.perf_counter() - self.view_started_at
+        self.sections["view"] = max(
+            0.0, elapsed - (self.query_time - self.view_query_time)
+        )
+
+    @property
+    def total_time(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def server_timing(self) -> str:
+        metrics = [
+            f'db;dur={self.query_time * 1000:.1f};desc="{self.query_count} queries"'
+        ]
+        metrics += [
+            f"{name};dur={duration * 1000:.1f}"
+            for name, duration in self.sections.items()
+        ]
+        metrics.append(f"total;dur={self.total_time * 1000:.1f}")
+        return ", ".join(metrics)
+
+    def as_dict(self, request, response, duplicates: list[dict]) -> dict:
+        return {
+            "method": request.method,
+            "path": request.path,
+            "view": self.view_name,
+            "status": response.status_code,
+            "total_ms": round(self.total_time * 1000, 2),
+            "query_count": self.query_count,
+            "query_ms": round(self.query_time * 1000, 2),
+            **{
+                f"{name}_ms": round(duration * 1000, 2)
+                for name, duration in self.sections.items()
+            },
+            "query_budget": self.query_budget,
+            "duplicates": duplicates,
+        }
+
+
+def get_current_profile() -> RequestProfile | None:
+    return _current_profile.get()
+
+
+@contextmanager
+def profile_section(name: str):
+    """현재 요청 프로파일에 name 구간 시간을 기록 (프로파일링 중이 아니면 아무것도 안 함)"""
+    profile = _current_profile.get()
+    if profile is None:
+        yield
+        return
+    with profile.section(name):
+        yield
+
+
+def _record_query(execute, sql, params, many, context):
+    profile = _current_profile.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    started_at = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.record_query(sql, time.perf_counter() - started_at)
+
+
+def install_query_recording(connection, **kwargs) -> None:
+    """
+    연결에 쿼리 기록 래퍼를 한 번만 등록 (connection_created 시그널 핸들러)
+    connection.execute_wrapper()로 잠시 추가되는 래퍼는 끝에서 꺼내므로 맨 앞에 넣음
+    """
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _record_query)
+
+
+class QueryProfilingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        # 이미 열린 연결(현재 스레드)과 앞으로 열릴 모든 연결
+        connection_created.connect(
+            install_query_recording, dispatch_uid="utils.profiling"
+        )
+        for connection in connections.all(initialized_only=True):
+            install_query_recording(connection)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if not settings.QUERY_PROFILING:
+            return self.get_response(request)
+
+        profile = RequestProfile()
+        token = _current_profile.set(profile)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_profile.reset(token)
+
+        self._finish(request, response, profile)
+        return response
+
+    async def __acall__(self, request):
+        if not settings.QUERY_PROFILING:
+            return await self.get_response(request)
+
+        profile = RequestProfile()
+        token = _current_profile.set(profile)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_profile.reset(token)
+
+        self._finish(request, response, profile)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        profile = _current_profile.get()
+        if profile is None:
+            return None
+        view_class = getattr(view_func, "cls", None) or getattr(
+            view_func, "view_class", None
+        )
+        view = view_class or view_func
+        profile.view_name = f"{view.__module__}.{view.__qualname__}"
+        profile.query_budget = getattr(view, "query_budget", None)
+        profile.start_view()
+        return None
+
+    def process_template_response(self, request, response):
+        """
+        뷰가 반환한 직후 호출되므로 여기서 뷰 실행 시간을 view 구간으로 기록하고,
+        렌더링(DRF Response -> JSON 등) 시간을 render 구간으로 기록
+        """
+        profile = _current_profile.get()
+        if profile is None:
+            return response
+        profile.finish_view()
+        started_at = time.perf_counter()
+
+        def finish_render(response):
+            profile.sections["render"] = time.perf_counter() - started_at
+
+        response.add_post_render_callback(finish_render)
+        return response
+
+    def _finish(self, request, response, profile: RequestProfile) -> None:
+        # 렌더링 단계가 없는 응답(HttpResponse, StreamingHttpResponse 등)
+        profile.finish_view()
+        duplicates = profile.get_duplicates(settings.QUERY_PROFILE_DUPLICATE_THRESHOLD)
+        if settings.QUERY_PROFILE_SERVER_TIMING:
+            response["Server-Timing"] = profile.server_timing()
+
+        over_budget = (
+            profile.query_budget is not None
+            and profile.query_count > profile.query_budget
+        )
+        should_log = (
+            over_budget
+            or duplicates
+            or profile.total_time * 1000 >= settings.QUERY_PROFILE_SLOW_MS
+            or random.random() < settings.QUERY_PROFILE_SAMPLE_RATE
+        )
+        if should_log:
+            record = profile.as_dict(request, response, duplicates)
+            log = logger.warning if over_budget or duplicates else logger.info
+            log(json.dumps(record, ensure_ascii=False))
+
+        if over_budget and settings.QUERY_BUDGET_STRICT:
+            raise QueryBudgetExceeded(
+                f"{profile.view_name}: 쿼리 {profile.query_count}개 실행 "
+                f"(query_budget {profile.query_budget}개)"
+            )
@@ -0,0 +1,53 @@
+"""
+대용량 목록/내보내기 응답용 JSON 렌더러
+
+orjson이 설치되어 있으면 orjson으로, 없으면 표준 json으로 직렬화합니다.
+(orjson은 선택 의존성입니다: pip install orjson)
+"""
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson이 없는 환경
+    orjson = None
+
+ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson else 0
+)
+_drf_default = JSONEncoder().default
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    한글을 \\u 이스케이프 없이 UTF-8 그대로 출력하는 빠른 JSON 렌더러
+
+    datetime, Decimal, UUID 등 JSON 기본 타입이 아닌 값은 DRF JSONEncoder와 같은
+    규칙으로 변환합니다. indent가 요청된 경우(브라우저블 API 등)는 표준 json을 사용합니다.
+    뷰의 renderer_classes에 지정해서 사용합니다.
+    """
+
+    ensure_ascii = False
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+        if orjson is None or indent is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=_drf_default, option=ORJSON_OPTIONS)
+        # JSONRenderer와 동일하게 U+2028, U+2029는 이스케이프 (JS 문자열 호환)
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
+
+
+def dumps(data) -> bytes:
+    """FastJSONRenderer와 같은 규칙으로 직렬화 (뷰 밖에서 사용)"""
+    return FastJSONRenderer().render(data)
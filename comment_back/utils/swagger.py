@@ -2,6 +2,7 @@ from drf_yasg import openapi
 from typing import Optional
 
 DEFAULT_EPISODE_ID = "61823562"  # 기본 에피소드 ID
+DEFAULT_SERIES_ID = "61822163"  # 기본 시리즈 ID
 
 
 def get_fields_query_parameter(example: str = "id,name,image_src") -> openapi.Parameter:
@@ -41,6 +42,18 @@ def get_path_parameter(
     )
 
 
+def get_count_mode_parameter() -> openapi.Parameter:
+    return openapi.Parameter(
+        "count_mode",
+        openapi.IN_QUERY,
+        description="전체 개수 계산 방법 (exact: 정확한 개수, estimated: DB 통계로 추정, cached: 저장된 집계). "
+        "지정하면 include_count=true로 처리되고, 응답의 count_mode에 실제로 사용한 방법이 들어갑니다.",
+        type=openapi.TYPE_STRING,
+        enum=["exact", "estimated", "cached"],
+        required=False,
+    )
+
+
 def get_page_parameter() -> openapi.Parameter:
     return openapi.Parameter(
         "page_size",